@@ -0,0 +1,50 @@
+import typer
+from pathlib import Path
+from src.core.infrastructure import Configuration
+from src.core.infrastructure.settings import Settings
+
+app = typer.Typer()
+
+
+@app.command()
+def analyse_contingencies(
+    network_id: str = typer.Option(
+        ..., help="Id of the network to analyse, e.g. '<network>_simulated'."
+    ),
+    depth: int = typer.Option(1, help="Lines outaged per contingency, 1 or 2."),
+    line_ids: list[str] = typer.Option(
+        None, "--line-id", help="Lines to outage, all of them when not given."
+    ),
+    max_workers: int = typer.Option(1, help="Threads the analysis is spread over."),
+    output: Path = typer.Option(
+        None, help="CSV file the results are written to, compressed after its suffix."
+    ),
+):
+    """
+    Evaluate N-1, or N-2, contingencies in DC at every timestamp of a network, and summarise
+    the overloads of each timestamp and contingency.
+    """
+
+    with Configuration(s=Settings()) as use_cases:
+        overloads = use_cases.compute_contingency_analysis(
+            network_id=network_id,
+            depth=depth,
+            line_ids=line_ids or None,
+            max_workers=max_workers,
+        )
+
+    if output is not None:
+        overloads.to_csv(output, index=False)
+        typer.echo(f"{len(overloads)} overloading contingencies written to {output}.")
+    else:
+        typer.echo(
+            overloads.to_string(index=False) if len(overloads) else "No overload."
+        )
+    typer.echo(
+        f"{overloads['contingency_id'].nunique()} contingencies with overloads, over "
+        f"{overloads['timestamp'].nunique()} timestamps."
+    )
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,44 @@
+import typer
+from collections import Counter
+from src.core.domain.enums import LoadFlowType
+from src.core.infrastructure import Configuration
+from src.core.infrastructure.settings import Settings
+
+app = typer.Typer()
+
+
+@app.command()
+def compute_solved_network(
+    network_id: str = typer.Option(
+        ..., help="Id of the network to solve, e.g. '<network>_simulated'."
+    ),
+    loadflow_type: LoadFlowType = typer.Option(
+        LoadFlowType.AC, help="Type of the loadflows run."
+    ),
+    checkpoint_size: int = typer.Option(
+        24, help="Timestamps solved between two saves of the results."
+    ),
+):
+    """
+    Solve every timestamp of a network not solved yet, and save the results in the
+    '<network>_solved' network. Interrupted runs resume where they stopped. Timestamps are
+    solved in parallel as set by LOADFLOW_EXECUTOR and LOADFLOW_MAX_WORKERS.
+    """
+
+    with Configuration(s=Settings()) as use_cases:
+        loadflow_statuses = use_cases.compute_solved_network(
+            network_id=network_id,
+            loadflow_type=loadflow_type,
+            checkpoint_size=checkpoint_size,
+        )
+
+    counts = Counter(status.value for status in loadflow_statuses.values())
+    typer.echo(
+        f"{len(loadflow_statuses)} timestamps solved: "
+        + (", ".join(f"{n} {s}" for s, n in sorted(counts.items())) or "none")
+        + "."
+    )
+
+
+if __name__ == "__main__":
+    app()
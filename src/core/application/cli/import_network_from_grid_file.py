@@ -0,0 +1,29 @@
+from pathlib import Path
+import typer
+from src.core.infrastructure import Configuration
+from src.core.infrastructure.settings import Settings
+
+app = typer.Typer()
+
+
+@app.command()
+def import_network_from_grid_file(
+    file_path: Path = typer.Option(
+        ..., help="Path to the grid file (XIIDM, MATPOWER, CGMES, UCTE...)."
+    ),
+    network_id: str = typer.Option(
+        None, help="Id of the imported network, defaults to the file name."
+    ),
+):
+    """
+    Import a grid file supported by pypowsybl as a static network.
+    """
+
+    with Configuration(s=Settings()) as use_cases:
+        use_cases.import_network_from_grid_file(
+            file_path=file_path, network_id=network_id
+        )
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,43 @@
+import typer
+from pathlib import Path
+from src.core.infrastructure import Configuration
+from src.core.infrastructure.settings import Settings
+
+app = typer.Typer()
+
+
+@app.command()
+def report_congestions(
+    network_id: str = typer.Option(
+        ..., help="Id of the solved network to report on, e.g. '<network>_solved'."
+    ),
+    top: int = typer.Option(10, help="Worst offending constraints listed."),
+    output: Path = typer.Option(
+        None,
+        help="CSV file the summary and histogram of every constraint are written to, "
+        "compressed after its suffix.",
+    ),
+):
+    """
+    Summarise the overloads of the operational constraints of a solved network's lines
+    over its whole horizon, with their utilisation histograms.
+    """
+
+    with Configuration(s=Settings()) as use_cases:
+        report = use_cases.compute_congestion_report(network_id=network_id)
+
+    if output is not None:
+        report.summary().merge(report.histogram(), on=list(report.constraints)).to_csv(
+            output, index=False
+        )
+        typer.echo(f"{len(report.constraints)} constraints written to {output}.")
+    worst_offenders = report.worst_offenders(n=top)
+    typer.echo(
+        worst_offenders.to_string(index=False)
+        if len(worst_offenders)
+        else "No overload."
+    )
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,30 @@
+import typer
+from src.core.infrastructure import Configuration
+from src.core.infrastructure.settings import Settings
+
+app = typer.Typer()
+
+
+@app.command()
+def screen_dc_flows(
+    network_id: str = typer.Option(
+        ..., help="Id of the network to screen, e.g. '<network>_simulated'."
+    ),
+):
+    """
+    Compute DC flows of every timestamp of a network and list the overloaded lines.
+    """
+
+    with Configuration(s=Settings()) as use_cases:
+        dc_flows = use_cases.compute_dc_flows(network_id=network_id)
+
+    overloads = dc_flows.overloads()
+    typer.echo(overloads.to_string(index=False) if len(overloads) else "No overload.")
+    typer.echo(
+        f"{len(dc_flows.overloaded_timestamps())} / {len(dc_flows.timestamps)} "
+        "timestamps with overloads."
+    )
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,30 @@
+import typer
+from src.core.infrastructure import Configuration
+from src.core.infrastructure.settings import Settings
+
+app = typer.Typer()
+
+
+@app.command()
+def screen_n1(
+    network_id: str = typer.Option(
+        ..., help="Id of the network to screen, e.g. '<network>_simulated'."
+    ),
+):
+    """
+    Evaluate the outage of every line in DC, at every timestamp of a network, and list the
+    lines each outage overloads.
+    """
+
+    with Configuration(s=Settings()) as use_cases:
+        overloads = use_cases.compute_n1_screening(network_id=network_id)
+
+    typer.echo(overloads.to_string(index=False) if len(overloads) else "No overload.")
+    typer.echo(
+        f"{overloads['contingency_id'].nunique()} contingencies with overloads, over "
+        f"{overloads['timestamp'].nunique()} timestamps."
+    )
+
+
+if __name__ == "__main__":
+    app()
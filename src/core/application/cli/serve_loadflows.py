@@ -0,0 +1,35 @@
+import typer
+from src.core.infrastructure.adapters import Adapters
+from src.core.infrastructure.settings import Settings
+
+app = typer.Typer()
+
+
+@app.command()
+def serve_loadflows(
+    max_batch_size: int = typer.Option(64, help="Requests solved together at most."),
+    batch_window: float = typer.Option(
+        0.002, help="Seconds requests are gathered for, once one arrives."
+    ),
+):
+    """
+    Serve the loadflows of the processes of this host whose LOADFLOW_BACKEND is REMOTE,
+    on LOADFLOW_SERVICE_HOST and LOADFLOW_SERVICE_PORT. Loadflows are solved with the
+    backend set for this process, e.g. pypowsybl workers as set by LOADFLOW_EXECUTOR and
+    LOADFLOW_MAX_WORKERS, and cached as set by LOADFLOW_CACHE_SIZE.
+    """
+
+    service = Adapters(settings=Settings()).loadflow_service(
+        max_batch_size=max_batch_size, batch_window=batch_window
+    )
+    typer.echo(f"Serving loadflows on {service.address[0]}:{service.address[1]}.")
+    try:
+        service.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.shutdown()
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,57 @@
+import pandas as pd
+import typer
+from pathlib import Path
+from src.core.infrastructure import Configuration
+from src.core.infrastructure.settings import Settings
+
+app = typer.Typer()
+
+
+@app.command()
+def what_if_injections(
+    network_id: str = typer.Option(
+        ..., help="Id of the network to perturb, e.g. '<network>_simulated'."
+    ),
+    perturbations_file: Path = typer.Option(
+        ...,
+        help="CSV file with a row per perturbed element: perturbation_id, element_id "
+        "and change.",
+    ),
+    relative: bool = typer.Option(
+        True, help="Changes are shares of the elements' active power, else in MW."
+    ),
+    output: Path = typer.Option(
+        None, help="CSV file the overloads are written to, compressed after its suffix."
+    ),
+):
+    """
+    Compute the changes of DC flows, at every timestamp of a network, under a batch of
+    load and generator perturbations, and list the lines they overload.
+    """
+
+    rows = pd.read_csv(perturbations_file, dtype={"perturbation_id": str})
+    perturbations = {}
+    for row in rows.itertuples(index=False):
+        perturbations.setdefault(row.perturbation_id, {})[row.element_id] = row.change
+
+    with Configuration(s=Settings()) as use_cases:
+        what_if = use_cases.compute_injection_what_if(
+            network_id=network_id, perturbations=perturbations, relative=relative
+        )
+
+    overloads = what_if.overloads()
+    if output is not None:
+        overloads.to_csv(output, index=False)
+        typer.echo(f"{len(overloads)} overloads written to {output}.")
+    else:
+        typer.echo(
+            overloads.to_string(index=False) if len(overloads) else "No overload."
+        )
+    typer.echo(
+        f"{overloads['perturbation_id'].nunique()} / {len(perturbations)} "
+        "perturbations with overloads."
+    )
+
+
+if __name__ == "__main__":
+    app()
@@ -8,6 +8,9 @@ DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
 
 class SupportedBackends(str, Enum):
     PYPOWSYBL = "PYPOWSYBL"
+    NUMPY = "NUMPY"  # In process DC loadflows, AC ones going to pypowsybl.
+    NUMPY_AC = "NUMPY_AC"  # In process AC and DC loadflows.
+    REMOTE = "REMOTE"  # Loadflows sent to the loadflow service of this host.
 
 
 class LoadFlowType(str, Enum):
@@ -15,6 +18,22 @@ class LoadFlowType(str, Enum):
     DC = "DC"
 
 
+class LoadFlowExecutor(str, Enum):
+    """How the timestamps of a network are spread when solving."""
+
+    SEQUENTIAL = "SEQUENTIAL"
+    THREAD = "THREAD"
+    PROCESS = "PROCESS"
+
+
+class MetricsSinks(str, Enum):
+    """Where loadflow solvers report what each call cost."""
+
+    IN_MEMORY = "IN_MEMORY"
+    STRUCTLOG = "STRUCTLOG"
+    MLFLOW = "MLFLOW"
+
+
 class State(str, Enum):
     STATIC = "STATIC"
     DYNAMIC = "DYNAMIC"
@@ -1,7 +1,27 @@
 from src.core.domain.ports import Ports
 from src.core.domain.use_cases.import_network_from_json import ETLPipeline
 from src.core.domain.use_cases.compute_simulated_network import SimulationPipeline
+from src.core.domain.use_cases.compute_dc_flows import DCFlowsPipeline
+from src.core.domain.use_cases.compute_n1_screening import N1ScreeningPipeline
+from src.core.domain.use_cases.compute_contingency_analysis import (
+    ContingencyAnalysisPipeline,
+)
+from src.core.domain.use_cases.compute_solved_network import SolvedNetworkPipeline
+from src.core.domain.use_cases.compute_injection_what_if import (
+    InjectionWhatIfPipeline,
+)
+from src.core.domain.use_cases.compute_congestion_report import (
+    CongestionReportPipeline,
+)
+from src.core.domain.models.power_flow import DCFlows, WhatIfFlows
+from src.core.domain.models.congestion_report import CongestionReport
+from src.core.domain.enums import LoadFlowStatus, LoadFlowType
+from datetime import datetime
+from src.core.domain.use_cases.import_network_from_grid_file import (
+    GridFileETLPipeline,
+)
 from pathlib import Path
+import pandas as pd
 
 
 class UseCases:
@@ -15,6 +35,16 @@ class UseCases:
         )
         etl.run(file_path=file_path)
 
+    def import_network_from_grid_file(
+        self, file_path: Path, network_id: str | None = None
+    ) -> None:
+        etl = GridFileETLPipeline(
+            network_repository=self.ports.network_repository(),
+            network_builder=self.ports.network_builder(),
+            network_importer=self.ports.network_importer(),
+        )
+        etl.run(file_path=file_path, network_id=network_id)
+
     def compute_simulated_network(
         self, config_path: Path, start: str, end: str, time_step: int
     ) -> None:  # TODO: Change start and end to datetime
@@ -24,3 +54,70 @@ class UseCases:
             network_builder=self.ports.network_builder(),
         )
         pipeline.apply_pipeline(start=start, end=end, time_step=time_step)
+
+    def compute_dc_flows(self, network_id: str) -> DCFlows:
+        pipeline = DCFlowsPipeline(network_repository=self.ports.network_repository())
+        return pipeline.run(network_id=network_id)
+
+    def compute_n1_screening(self, network_id: str) -> pd.DataFrame:
+        pipeline = N1ScreeningPipeline(
+            network_repository=self.ports.network_repository()
+        )
+        return pipeline.run(network_id=network_id)
+
+    def compute_contingency_analysis(
+        self,
+        network_id: str,
+        depth: int = 1,
+        line_ids: list[str] | None = None,
+        max_workers: int = 1,
+    ) -> pd.DataFrame:
+        pipeline = ContingencyAnalysisPipeline(
+            network_repository=self.ports.network_repository()
+        )
+        return pipeline.run(
+            network_id=network_id,
+            depth=depth,
+            line_ids=line_ids,
+            max_workers=max_workers,
+        )
+
+    def compute_injection_what_if(
+        self,
+        network_id: str,
+        perturbations: dict[str, dict[str, float]],
+        relative: bool = True,
+    ) -> WhatIfFlows:
+        pipeline = InjectionWhatIfPipeline(
+            network_repository=self.ports.network_repository()
+        )
+        return pipeline.run(
+            network_id=network_id, perturbations=perturbations, relative=relative
+        )
+
+    def compute_congestion_report(self, network_id: str) -> CongestionReport:
+        pipeline = CongestionReportPipeline(
+            network_repository=self.ports.network_repository()
+        )
+        return pipeline.run(network_id=network_id)
+
+    def compute_solved_network(
+        self,
+        network_id: str,
+        loadflow_type: LoadFlowType = LoadFlowType.AC,
+        checkpoint_size: int = 24,
+    ) -> dict[datetime, LoadFlowStatus]:
+        loadflow_solver = self.ports.loadflow_solver_repository()
+        pipeline = SolvedNetworkPipeline(
+            network_repository=self.ports.network_repository(),
+            network_builder=self.ports.network_builder(),
+            loadflow_solver=loadflow_solver,
+        )
+        try:
+            return pipeline.run(
+                network_id=network_id,
+                loadflow_type=loadflow_type,
+                checkpoint_size=checkpoint_size,
+            )
+        finally:
+            loadflow_solver.shutdown()
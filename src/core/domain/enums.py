@@ -14,6 +14,15 @@ class LoadFlowType(str, Enum):
     DC = "DC"
 
 
+class LoadFlowStatus(str, Enum):
+    """Outcome of the loadflow for a timestamp, mirroring the solvers' component statuses."""
+
+    CONVERGED = "CONVERGED"
+    MAX_ITERATION_REACHED = "MAX_ITERATION_REACHED"
+    FAILED = "FAILED"
+    NO_CALCULATION = "NO_CALCULATION"
+
+
 class OperationalConstraintType(str, Enum):
     APPARENT_POWER = "APPARENT_POWER"
     ACTIVE_POWER = "ACTIVE_POWER"
@@ -24,3 +33,14 @@ class BranchSide(str, Enum):
     ONE = "ONE"
     TWO = "TWO"
     THREE = "THREE"
+
+
+class SolvePhase(str, Enum):
+    """Phases a loadflow solve is timed over."""
+
+    CONVERSION = "CONVERSION"  # Building or updating the solver's own network.
+    LOADFLOW = "LOADFLOW"
+    EXTRACTION = "EXTRACTION"  # Reading results back from the solver.
+    CONSTRUCTION = "CONSTRUCTION"  # Building the solved elements.
+    OFF_ELEMENTS = "OFF_ELEMENTS"  # Re-attaching elements that were not solved.
+    NETWORK_BUILDING = "NETWORK_BUILDING"
@@ -0,0 +1,190 @@
+import warnings
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+CONSTRAINT_COLUMNS = ["line_id", "side", "type", "acceptable_duration"]
+
+SUMMARY_COLUMNS = CONSTRAINT_COLUMNS + [
+    "limit",
+    "overloaded_timestamps",
+    "overloaded_seconds",
+    "longest_overload",
+    "violations",
+    "max_loading",
+    "mean_loading",
+]
+
+EPISODE_COLUMNS = CONSTRAINT_COLUMNS + [
+    "start",
+    "end",
+    "duration",
+    "max_loading",
+    "violation",
+]
+
+# Edges of the loading (measure over limit) bins of utilisation histograms.
+LOADING_BINS = (0.0, 0.5, 0.8, 0.9, 1.0, 1.1, 1.2, 1.5, np.inf)
+
+
+def timestamp_durations(timestamps: list[datetime]) -> np.ndarray:
+    """
+    Seconds each timestamp lasts: until the next one, the last one lasting as long as its
+    predecessor. A single timestamp lasts 0 seconds.
+    """
+
+    if not timestamps:
+        return np.zeros(0)
+    seconds = np.array([(t - timestamps[0]).total_seconds() for t in timestamps])
+    durations = np.diff(seconds, append=seconds[-1])
+    if len(durations) > 1:
+        durations[-1] = durations[-2]
+    return durations
+
+
+class CongestionReport:
+    """
+    Loadings of the operational constraints of the lines of a network, over all its
+    timestamps, with analytics computed at once over the whole horizon.
+
+    timestamps: Timestamps, in order.
+    constraints: One row per constraint, identified by its line, side and type, with its
+        acceptable duration in seconds, -1 for permanent limits.
+    loadings: [timestamp, constraint] measure constrained (|p|, i or |s| of the side) over
+        the limit. NaN where the line isn't solved, or hasn't the constraint.
+    limits: [timestamp, constraint] limits, NaN where the line hasn't the constraint.
+    durations: [timestamp] seconds each timestamp lasts.
+
+    An overload is a loading above 1. Consecutive overloaded timestamps form an episode,
+    which violates the constraint when it lasts longer than its acceptable duration, or at
+    all for permanent limits.
+    """
+
+    def __init__(
+        self,
+        timestamps: list[datetime],
+        constraints: pd.DataFrame,
+        loadings: np.ndarray,
+        limits: np.ndarray,
+        durations: np.ndarray,
+    ) -> None:
+        self.timestamps = timestamps
+        self.constraints = constraints
+        self.loadings = loadings
+        self.limits = limits
+        self.durations = durations
+
+    def overloaded(self) -> np.ndarray:
+        """[timestamp, constraint] mask of loadings above 1."""
+        with np.errstate(invalid="ignore"):
+            return self.loadings > 1
+
+    def _episodes(self) -> tuple[np.ndarray, ...]:
+        """
+        Overload episodes, ordered by constraint then start: their constraint, first and
+        last timestamp positions, duration, highest loading and whether it's a violation.
+        """
+
+        n_timestamps, n_constraints = self.loadings.shape
+        padded = np.zeros((n_constraints, n_timestamps + 2), dtype=np.int8)
+        padded[:, 1:-1] = self.overloaded().T
+        changes = np.diff(padded, axis=1)
+        constraints, starts = np.nonzero(changes == 1)
+        _, ends = np.nonzero(changes == -1)  # Exclusive.
+
+        edges = np.concatenate([[0.0], np.cumsum(self.durations)])
+        durations = edges[ends] - edges[starts]
+        # Highest loading of each episode, over the constraint-major loadings.
+        loadings = np.append(np.nan_to_num(self.loadings.T).reshape(-1), 0.0)
+        offsets = constraints * n_timestamps
+        bounds = np.stack([offsets + starts, offsets + ends], axis=1).reshape(-1)
+        max_loadings = (
+            np.maximum.reduceat(loadings, bounds)[::2] if len(bounds) else np.zeros(0)
+        )
+
+        acceptable = self.constraints["acceptable_duration"].to_numpy()[constraints]
+        violations = (acceptable < 0) | (durations > acceptable)
+        return constraints, starts, ends - 1, durations, max_loadings, violations
+
+    def episodes(self) -> pd.DataFrame:
+        """One row per overload episode, with its first and last timestamps."""
+
+        constraints, starts, ends, durations, max_loadings, violations = (
+            self._episodes()
+        )
+        timestamps = np.array(self.timestamps, dtype=object)
+        episodes = self.constraints.iloc[constraints].reset_index(drop=True)
+        episodes["start"] = timestamps[starts]
+        episodes["end"] = timestamps[ends]
+        episodes["duration"] = durations
+        episodes["max_loading"] = max_loadings.astype("float32")
+        episodes["violation"] = violations
+        return episodes[EPISODE_COLUMNS]
+
+    def summary(self) -> pd.DataFrame:
+        """
+        One row per constraint: its lowest limit, the timestamps and seconds it's overloaded,
+        its longest episode and number of violations, its highest and mean loadings. Worst
+        offenders come first, by violations, seconds overloaded and highest loading.
+        """
+
+        n_constraints = len(self.constraints)
+        overloaded = self.overloaded()
+        constraints, _, _, durations, _, violations = self._episodes()
+        longest = np.zeros(n_constraints)
+        np.maximum.at(longest, constraints, durations)
+
+        summary = self.constraints.copy()
+        # Constraints never solved have NaN statistics.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            summary["limit"] = np.nanmin(self.limits, axis=0)
+            summary["max_loading"] = np.nanmax(self.loadings, axis=0).astype("float32")
+            summary["mean_loading"] = np.nanmean(self.loadings, axis=0).astype(
+                "float32"
+            )
+        summary["overloaded_timestamps"] = overloaded.sum(axis=0).astype("int32")
+        summary["overloaded_seconds"] = overloaded.T @ self.durations
+        summary["longest_overload"] = longest
+        summary["violations"] = np.bincount(
+            constraints[violations], minlength=n_constraints
+        ).astype("int32")
+        return (
+            summary[SUMMARY_COLUMNS]
+            .sort_values(
+                ["violations", "overloaded_seconds", "max_loading"],
+                ascending=False,
+                kind="stable",
+            )
+            .reset_index(drop=True)
+        )
+
+    def worst_offenders(self, n: int = 10) -> pd.DataFrame:
+        """The 'n' constraints overloaded the most, among those overloaded."""
+        summary = self.summary()
+        return summary[summary["overloaded_timestamps"] > 0].head(n)
+
+    def histogram(self, bins: tuple[float, ...] = LOADING_BINS) -> pd.DataFrame:
+        """
+        Utilisation histogram of each constraint: the number of timestamps whose loading
+        falls in each bin, a column per bin, loadings over the last edge being counted in
+        the last bin.
+        """
+
+        edges = np.asarray(bins, dtype=float)
+        n_bins = len(edges) - 1
+        n_constraints = len(self.constraints)
+        solved = ~np.isnan(self.loadings)
+        positions = np.clip(np.digitize(self.loadings, edges) - 1, 0, n_bins - 1)
+        columns = np.broadcast_to(np.arange(n_constraints), self.loadings.shape)
+        counts = np.bincount(
+            (columns * n_bins + positions)[solved],
+            minlength=n_constraints * n_bins,
+        ).reshape(n_constraints, n_bins)
+
+        histogram = self.constraints.copy()
+        for k in range(n_bins):
+            histogram[f"[{edges[k]:g}, {edges[k + 1]:g})"] = counts[:, k].astype(
+                "int32"
+            )
+        return histogram
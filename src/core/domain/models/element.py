@@ -64,3 +64,46 @@ class NetworkElement(BaseModel):
             operational_constraints=operational_constraints,
         )
         return element
+
+
+def _same_static(a: BaseModel, b: BaseModel) -> bool:
+    """Whether two static attributes are the same object or equal, statuses aside."""
+
+    if a is b:
+        return True
+    attributes, other = vars(a), vars(b)
+    return attributes == other or (
+        type(a) is type(b)
+        and {**attributes, "status": None} == {**other, "status": None}
+    )
+
+
+def _same_constraints(
+    a: list[OperationalConstraint], b: list[OperationalConstraint]
+) -> bool:
+    """Whether two lists of operational constraints are the same, timestamps aside."""
+
+    return a is b or [(c.side, c.type, c.value) for c in a] == [
+        (c.side, c.type, c.value) for c in b
+    ]
+
+
+def same_grid(elements: list[NetworkElement], other: list[NetworkElement]) -> bool:
+    """
+    Whether elements of two timestamps form the same grid: same ids, types, static
+    attributes, statuses aside, and operational constraints, in the same order. Attributes
+    are compared by identity first, so that telling a grid apart costs far less than hashing
+    it. Static attributes are not expected to change in place, other than statuses.
+    """
+
+    return len(elements) == len(other) and all(
+        element.id == reference.id
+        and element.type == reference.type
+        and _same_static(
+            element.element_metadata.static, reference.element_metadata.static
+        )
+        and _same_constraints(
+            element.operational_constraints, reference.operational_constraints
+        )
+        for element, reference in zip(elements, other)
+    )
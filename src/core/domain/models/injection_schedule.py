@@ -0,0 +1,146 @@
+from datetime import datetime
+import numpy as np
+from src.core.constants import SupportedNetworkElementTypes
+from src.core.domain.models.base_model import BaseConfigModel
+from src.core.domain.models.network import Network
+from src.core.domain.models.network_delta import NetworkDelta
+
+INJECTION_TYPES = [
+    SupportedNetworkElementTypes.GENERATOR,
+    SupportedNetworkElementTypes.LOAD,
+]
+
+
+class InjectionSchedule:
+    """
+    Dynamic attributes of the injections of a network over its timestamps, as one dense
+    [timestamp, element, attribute] array per element type, for timestamps to be stepped
+    through by position rather than looked up in the network.
+
+    timestamps: Timestamps, in order.
+    element_ids: Ids of the elements of each type, in the order of their arrays' columns.
+    dynamic_classes: Dynamic attributes class of each type, whose fields are the attributes.
+    values: [timestamp, element, attribute] values of each type, NaN for unset attributes.
+        NaN of required attributes stay NaN, for solvers to fail on the missing injection.
+
+    Which elements change between consecutive timestamps is found once, so that the delta
+    leading to a timestamp costs what it changes, whatever the number of timestamps.
+    """
+
+    def __init__(
+        self,
+        timestamps: list[datetime],
+        element_ids: dict[SupportedNetworkElementTypes, list[str]],
+        dynamic_classes: dict[SupportedNetworkElementTypes, type[BaseConfigModel]],
+        values: dict[SupportedNetworkElementTypes, np.ndarray],
+    ) -> None:
+        self.timestamps = timestamps
+        self.element_ids = element_ids
+        self.dynamic_classes = dynamic_classes
+        self.values = values
+
+        # Per type, whether each attribute is optional, its NaN standing for None.
+        self._optional = {
+            element_type: [
+                not field.is_required() for field in dynamic_class.model_fields.values()
+            ]
+            for element_type, dynamic_class in dynamic_classes.items()
+        }
+        # [timestamp, element] whether an element changed since the previous timestamp.
+        self._changes = {}
+        for element_type, array in values.items():
+            previous, current = array[:-1], array[1:]
+            changed = ~(
+                (previous == current) | (np.isnan(previous) & np.isnan(current))
+            )
+            self._changes[element_type] = np.concatenate(
+                [np.zeros((1, array.shape[1]), dtype=bool), changed.any(axis=2)]
+            )
+
+    @classmethod
+    def from_network(
+        cls,
+        network: Network,
+        element_types: list[SupportedNetworkElementTypes] = INJECTION_TYPES,
+    ) -> "InjectionSchedule":
+        """
+        Schedule of the elements of 'element_types' having dynamic attributes, which must
+        have them at every timestamp of the network.
+        """
+
+        timestamps = network.list_timestamps()
+        positions = {timestamp: k for k, timestamp in enumerate(timestamps)}
+        element_ids, dynamic_classes, records = {}, {}, {}
+        for element in network.elements:
+            dynamic = element.element_metadata.dynamic
+            if element.type not in element_types or dynamic is None:
+                continue
+            columns = element_ids.setdefault(element.type, {})
+            columns.setdefault(element.id, len(columns))
+            dynamic_classes.setdefault(element.type, type(dynamic))
+            records.setdefault(element.type, []).append(
+                (positions[element.timestamp], columns[element.id], dynamic)
+            )
+
+        values = {}
+        for element_type, columns in element_ids.items():
+            fields = list(dynamic_classes[element_type].model_fields)
+            if len(records[element_type]) != len(timestamps) * len(columns):
+                m = f"{element_type.value} dynamic attributes are missing at some timestamps."
+                raise ValueError(m)
+            array = np.full((len(timestamps), len(columns), len(fields)), np.nan)
+            for position, column, dynamic in records[element_type]:
+                row = [getattr(dynamic, field) for field in fields]
+                array[position, column] = [np.nan if v is None else v for v in row]
+            values[element_type] = array
+
+        return cls(
+            timestamps=timestamps,
+            element_ids={t: list(columns) for t, columns in element_ids.items()},
+            dynamic_classes=dynamic_classes,
+            values=values,
+        )
+
+    def __len__(self) -> int:
+        """Number of timestamps."""
+        return len(self.timestamps)
+
+    def dynamic(
+        self, element_type: SupportedNetworkElementTypes, position: int, column: int
+    ) -> BaseConfigModel:
+        """Dynamic attributes of an element, by column, at the timestamp at 'position'."""
+
+        dynamic_class = self.dynamic_classes[element_type]
+        return dynamic_class(
+            **{
+                field: None if optional and np.isnan(value) else float(value)
+                for field, optional, value in zip(
+                    dynamic_class.model_fields,
+                    self._optional[element_type],
+                    self.values[element_type][position, column],
+                )
+            }
+        )
+
+    def delta(self, position: int) -> NetworkDelta:
+        """
+        Changes of the injections from the timestamp before 'position' to the one at
+        'position', reading a single row of the arrays.
+        """
+
+        if not 0 < position < len(self.timestamps):
+            m = f"No timestamp precedes position {position} of {len(self.timestamps)}."
+            raise IndexError(m)
+
+        dynamics = {}
+        for element_type, changes in self._changes.items():
+            for column in np.flatnonzero(changes[position]):
+                dynamics[self.element_ids[element_type][column]] = self.dynamic(
+                    element_type=element_type, position=position, column=int(column)
+                )
+        return NetworkDelta(
+            previous_timestamp=self.timestamps[position - 1],
+            timestamp=self.timestamps[position],
+            dynamics=dynamics,
+            statuses={},
+        )
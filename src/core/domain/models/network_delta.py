@@ -0,0 +1,76 @@
+from datetime import datetime
+from src.core.constants import ElementStatus
+from src.core.domain.models.base_model import BaseConfigModel
+from src.core.domain.models.element import NetworkElement
+
+
+class NetworkDelta:
+    """
+    Changes turning the elements of a timestamp into the ones of the next timestamp, for
+    consumers to do work proportional to what changed rather than to the grid's size.
+
+    previous_timestamp: Timestamp the changes apply to.
+    timestamp: Timestamp the changes lead to.
+    dynamics: Dynamic attributes of the elements whose dynamic attributes changed, by id.
+    statuses: Statuses of the elements whose status changed, by id.
+    """
+
+    def __init__(
+        self,
+        previous_timestamp: datetime,
+        timestamp: datetime,
+        dynamics: dict[str, BaseConfigModel],
+        statuses: dict[str, ElementStatus],
+    ) -> None:
+        self.previous_timestamp = previous_timestamp
+        self.timestamp = timestamp
+        self.dynamics = dynamics
+        self.statuses = statuses
+
+    @classmethod
+    def between(
+        cls, elements: list[NetworkElement], next_elements: list[NetworkElement]
+    ) -> "NetworkDelta":
+        """Changes between the elements of two timestamps of the same grid."""
+
+        previous = {element.id: element.element_metadata for element in elements}
+        if len(previous) != len(next_elements):
+            m = "Elements of both timestamps must be the same."
+            raise ValueError(m)
+
+        dynamics, statuses = {}, {}
+        for element in next_elements:
+            if element.id not in previous:
+                m = f"{element.id} isn't an element of the previous timestamp."
+                raise ValueError(m)
+            metadata, previous_metadata = element.element_metadata, previous[element.id]
+            if metadata.dynamic != previous_metadata.dynamic:
+                dynamics[element.id] = metadata.dynamic
+            status = getattr(metadata.static, "status", None)
+            if status != getattr(previous_metadata.static, "status", None):
+                statuses[element.id] = status
+
+        return cls(
+            previous_timestamp=elements[0].timestamp,
+            timestamp=next_elements[0].timestamp,
+            dynamics=dynamics,
+            statuses=statuses,
+        )
+
+    def __len__(self) -> int:
+        """Number of elements changed."""
+        return len(self.dynamics.keys() | self.statuses.keys())
+
+    def apply(self, elements: list[NetworkElement], statuses: bool = True) -> None:
+        """
+        Move elements of the previous timestamp to the next one, in place: only the
+        attributes of changed elements are replaced, statuses being left as they are
+        without 'statuses'. Dynamic attributes are shared with the delta, not copied.
+        """
+
+        for element in elements:
+            element.timestamp = self.timestamp
+            if element.id in self.dynamics:
+                element.element_metadata.dynamic = self.dynamics[element.id]
+            if statuses and element.id in self.statuses:
+                element.element_metadata.static.status = self.statuses[element.id]
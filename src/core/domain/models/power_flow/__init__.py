@@ -0,0 +1,34 @@
+from src.core.domain.models.power_flow.dc import (
+    SLACK_DISTRIBUTION_TOLERANCE,
+    DCPowerFlow,
+    distribute_slack,
+)
+from src.core.domain.models.power_flow.grid import GridIndex, GridState, grid_signature
+from src.core.domain.models.power_flow.ac import (
+    ACPowerFlow,
+    ACSolution,
+    solve_ac_power_flow,
+)
+from src.core.domain.models.power_flow.lodf import lodf, switched_flows
+from src.core.domain.models.power_flow.topology import TopologyIndex
+from src.core.domain.models.power_flow.cache import PowerFlowCache
+from src.core.domain.models.power_flow.dc_flows import DCFlows
+from src.core.domain.models.power_flow.what_if_flows import WhatIfFlows
+
+__all__ = [
+    "ACPowerFlow",
+    "ACSolution",
+    "SLACK_DISTRIBUTION_TOLERANCE",
+    "DCFlows",
+    "DCPowerFlow",
+    "GridIndex",
+    "GridState",
+    "PowerFlowCache",
+    "TopologyIndex",
+    "WhatIfFlows",
+    "distribute_slack",
+    "grid_signature",
+    "lodf",
+    "solve_ac_power_flow",
+    "switched_flows",
+]
@@ -0,0 +1,400 @@
+import numpy as np
+from scipy.sparse import bmat, csc_matrix, csr_matrix, diags
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+from scipy.sparse.linalg import splu
+from src.core.domain.enums import LoadFlowStatus
+from src.core.domain.models.power_flow.dc import main_component
+from src.core.domain.models.power_flow.grid import GridIndex, GridState
+
+# Base power of the per unit system equations are solved in, in MVA.
+BASE_POWER = 100.0
+# Largest power mismatch of a bus, in per unit, at which Newton-Raphson has converged.
+NEWTON_RAPHSON_TOLERANCE = 1e-8
+MAX_NEWTON_RAPHSON_ITERATIONS = 15
+# Voltage magnitudes, in per unit, beyond which Newton-Raphson is taken as diverging.
+MIN_REALISTIC_VOLTAGE = 0.5
+MAX_REALISTIC_VOLTAGE = 2.0
+# Generators with a target voltage out of this range, in per unit, don't control voltage,
+# as in pypowsybl's OpenLoadFlow.
+MIN_PLAUSIBLE_TARGET_VOLTAGE = 0.8
+MAX_PLAUSIBLE_TARGET_VOLTAGE = 1.2
+
+
+class ACPowerFlow:
+    """
+    AC power flow of one topology, solved by Newton-Raphson on the main connected component.
+
+    Bus and branch admittance matrices are built once, in per unit of BASE_POWER and of the
+    buses' nominal voltages. So is the symbolic analysis of the Jacobian, per set of voltage
+    controlled buses: its fill reducing ordering is computed on first use, each iteration
+    then only factorising the Jacobian numerically.
+
+    The active power mismatch is an unknown of the equations, spread over buses by their
+    participation factors, so that the slack is distributed once converged. The angle
+    reference is the component's first bus.
+    """
+
+    def __init__(
+        self,
+        n_buses: int,
+        from_bus: np.ndarray,
+        to_bus: np.ndarray,
+        series_admittance: np.ndarray,
+        shunt_admittance1: np.ndarray,
+        shunt_admittance2: np.ndarray,
+        ratio: np.ndarray,
+        bus_vnominal: np.ndarray,
+        in_service: np.ndarray,
+    ) -> None:
+        self.n_buses = n_buses
+        self.from_bus = from_bus
+        self.to_bus = to_bus
+        self.bus_vnominal = bus_vnominal
+        n_branches = len(from_bus)
+
+        self.bus_in_main = main_component(
+            n_buses=n_buses, from_bus=from_bus, to_bus=to_bus, in_service=in_service
+        )
+        self.branch_in_main = in_service & self.bus_in_main[from_bus]
+        self.reference_bus = np.flatnonzero(self.bus_in_main)[0]
+
+        # Pi models, the ratio being on side 1, scaled to per unit.
+        branches = np.flatnonzero(self.branch_in_main)
+        ends = np.concatenate([from_bus[branches], to_bus[branches]])
+        rows = np.concatenate([branches, branches])
+        y, t = series_admittance[branches], ratio[branches]
+        v1, v2 = bus_vnominal[from_bus[branches]], bus_vnominal[to_bus[branches]]
+        self.from_admittance = csr_matrix(
+            (
+                np.concatenate(
+                    [
+                        t**2 * (y + shunt_admittance1[branches]) * v1 * v1,
+                        -t * y * v1 * v2,
+                    ]
+                )
+                / BASE_POWER,
+                (rows, ends),
+            ),
+            shape=(n_branches, n_buses),
+        )
+        self.to_admittance = csr_matrix(
+            (
+                np.concatenate(
+                    [-t * y * v2 * v1, (y + shunt_admittance2[branches]) * v2 * v2]
+                )
+                / BASE_POWER,
+                (rows, ends),
+            ),
+            shape=(n_branches, n_buses),
+        )
+        from_incidence = csr_matrix(
+            (np.ones(len(branches)), (branches, from_bus[branches])),
+            shape=(n_branches, n_buses),
+        )
+        to_incidence = csr_matrix(
+            (np.ones(len(branches)), (branches, to_bus[branches])),
+            shape=(n_branches, n_buses),
+        )
+        self.admittance = (
+            from_incidence.T @ self.from_admittance
+            + to_incidence.T @ self.to_admittance
+        ).tocsr()
+        self._orderings: dict[bytes, np.ndarray] = {}
+
+    def _jacobian(
+        self,
+        v: np.ndarray,
+        angle_buses: np.ndarray,
+        magnitude_buses: np.ndarray,
+        participation: np.ndarray,
+    ) -> csc_matrix:
+        """
+        Derivatives of the active power mismatches of the main component's buses and of the
+        reactive ones of buses without voltage control, by the angles, the magnitudes and the
+        slack, in that order.
+        """
+
+        main_buses = np.flatnonzero(self.bus_in_main)
+        current = self.admittance @ v
+        normalised_v = diags(v / np.abs(v))
+        ds_dangle = (
+            1j * diags(v) @ (diags(current) - self.admittance @ diags(v)).conj()
+        ).tocsr()
+        ds_dmagnitude = (
+            diags(v) @ (self.admittance @ normalised_v).conj()
+            + diags(current.conj()) @ normalised_v
+        ).tocsr()
+        return bmat(
+            [
+                [
+                    ds_dangle.real[main_buses][:, angle_buses],
+                    ds_dmagnitude.real[main_buses][:, magnitude_buses],
+                    csr_matrix(-participation[main_buses][:, None]),
+                ],
+                [
+                    ds_dangle.imag[magnitude_buses][:, angle_buses],
+                    ds_dmagnitude.imag[magnitude_buses][:, magnitude_buses],
+                    None,
+                ],
+            ],
+            format="csc",
+        )
+
+    def _ordering(
+        self,
+        angle_buses: np.ndarray,
+        magnitude_buses: np.ndarray,
+        participation: np.ndarray,
+    ) -> np.ndarray:
+        """Fill reducing ordering of the Jacobian, computed once per structure."""
+
+        key = magnitude_buses.tobytes() + (participation != 0).tobytes()
+        if key not in self._orderings:
+            jacobian = self._jacobian(
+                v=np.ones(self.n_buses, dtype=complex),
+                angle_buses=angle_buses,
+                magnitude_buses=magnitude_buses,
+                participation=participation,
+            )
+            pattern = (abs(jacobian) + abs(jacobian.T)).tocsr()
+            self._orderings[key] = reverse_cuthill_mckee(pattern, symmetric_mode=True)
+        return self._orderings[key]
+
+    def newton_raphson(
+        self,
+        p: np.ndarray,
+        q: np.ndarray,
+        pv_buses: np.ndarray,
+        v_magnitude: np.ndarray,
+        participation: np.ndarray,
+        v0: np.ndarray | None = None,
+        slack: float | None = None,
+        tolerance: float = NEWTON_RAPHSON_TOLERANCE,
+        max_iterations: int = MAX_NEWTON_RAPHSON_ITERATIONS,
+    ) -> tuple[np.ndarray, float, int, LoadFlowStatus]:
+        """
+        Solve bus injections 'p' and 'q' ([bus], in MW and MVAr), the slack coming on top
+        of 'p' along 'participation' ([bus], summing to 1). Buses of 'pv_buses' have their
+        voltage magnitude held at 'v_magnitude' ([bus], in per unit), their reactive power
+        being free.
+
+        Starts from 'v0' ([bus] complex voltages, in per unit) where it is finite, from a
+        flat start elsewhere, and from the lossless slack unless given. Returns the complex
+        voltages, NaN out of the main component, the slack in MW, the iterations run and
+        whether they converged.
+        """
+
+        main = self.bus_in_main
+        pv_buses = pv_buses & main
+        angle_buses = np.flatnonzero(main)
+        angle_buses = angle_buses[angle_buses != self.reference_bus]
+        magnitude_buses = np.flatnonzero(main & ~pv_buses)
+        main_buses = np.flatnonzero(main)
+        n_angles, n_magnitudes = len(angle_buses), len(magnitude_buses)
+
+        v = np.ones(self.n_buses, dtype=complex)
+        if v0 is not None:
+            v = np.where(np.isfinite(v0), v0, v)
+        v[pv_buses] = v_magnitude[pv_buses] * np.exp(1j * np.angle(v[pv_buses]))
+        slack = -p[main].sum() / BASE_POWER if slack is None else slack / BASE_POWER
+        specified = (p + 1j * q) / BASE_POWER
+        ordering = self._ordering(
+            angle_buses=angle_buses,
+            magnitude_buses=magnitude_buses,
+            participation=participation,
+        )
+
+        def solution(status: LoadFlowStatus) -> tuple:
+            v[~main] = np.nan
+            return v, slack * BASE_POWER, iteration, status
+
+        for iteration in range(max_iterations + 1):
+            mismatch = (
+                v * (self.admittance @ v).conj() - specified - participation * slack
+            )
+            f = np.concatenate(
+                [mismatch.real[main_buses], mismatch.imag[magnitude_buses]]
+            )
+            if not np.isfinite(f).all():
+                return solution(status=LoadFlowStatus.FAILED)
+            if np.abs(f).max() < tolerance:
+                return solution(status=LoadFlowStatus.CONVERGED)
+            if iteration == max_iterations:
+                break
+
+            jacobian = self._jacobian(
+                v=v,
+                angle_buses=angle_buses,
+                magnitude_buses=magnitude_buses,
+                participation=participation,
+            )
+            try:
+                lu = splu(jacobian[ordering][:, ordering], permc_spec="NATURAL")
+            except RuntimeError:  # Singular Jacobian.
+                return solution(status=LoadFlowStatus.FAILED)
+            dx = np.empty_like(f)
+            dx[ordering] = lu.solve(-f[ordering])
+
+            angle, magnitude = np.angle(v), np.abs(v)
+            angle[angle_buses] += dx[:n_angles]
+            magnitude[magnitude_buses] += dx[n_angles : n_angles + n_magnitudes]
+            slack += dx[-1]
+            v = magnitude * np.exp(1j * angle)
+            if (
+                (magnitude[main] < MIN_REALISTIC_VOLTAGE)
+                | (magnitude[main] > MAX_REALISTIC_VOLTAGE)
+            ).any():
+                return solution(status=LoadFlowStatus.FAILED)
+
+        return solution(status=LoadFlowStatus.MAX_ITERATION_REACHED)
+
+    def bus_powers(self, v: np.ndarray) -> np.ndarray:
+        """Complex powers injected at buses by voltages 'v', in MVA."""
+        return v * (self.admittance @ v).conj() * BASE_POWER
+
+    def branch_powers(self, v: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Complex powers entering branches on side 1 and on side 2, in MVA, for voltages 'v'.
+        NaN for branches out of the main component.
+        """
+
+        s1 = v[self.from_bus] * (self.from_admittance @ v).conj() * BASE_POWER
+        s2 = v[self.to_bus] * (self.to_admittance @ v).conj() * BASE_POWER
+        s1[~self.branch_in_main] = np.nan
+        s2[~self.branch_in_main] = np.nan
+        return s1, s2
+
+
+class ACSolution:
+    """
+    AC power flow of a timestamp.
+
+    v: [bus] complex voltages, in per unit of the buses' nominal voltage, NaN out of the
+        main component.
+    p_generator, q_generator: [generator] active and reactive powers produced, in MW and
+        MVAr, slack included. NaN for generators off or out of the main component.
+    iterations: Newton-Raphson iterations run, over all rounds of slack distribution.
+    status: Whether the power flow converged.
+    """
+
+    def __init__(
+        self,
+        v: np.ndarray,
+        p_generator: np.ndarray,
+        q_generator: np.ndarray,
+        iterations: int,
+        status: LoadFlowStatus,
+    ) -> None:
+        self.v = v
+        self.p_generator = p_generator
+        self.q_generator = q_generator
+        self.iterations = iterations
+        self.status = status
+
+
+def solve_ac_power_flow(
+    grid: GridIndex,
+    state: GridState,
+    power_flow: ACPowerFlow,
+    v0: np.ndarray | None = None,
+    tolerance: float = NEWTON_RAPHSON_TOLERANCE,
+    max_iterations: int = MAX_NEWTON_RAPHSON_ITERATIONS,
+) -> ACSolution:
+    """
+    Solve the AC power flow of a timestamp, distributing the slack as the DC power flow
+    does: over participating generators, proportionally to their Pmax. Generators the slack
+    pushes beyond their active power bounds are clipped and the power flow solved again
+    without them, warm started. The timestamp FAILED once no generator is left to take the
+    slack.
+
+    Generators controlling voltage, with a plausible target, hold the voltage of their bus
+    and share its reactive power equally. Others produce their Qtarget.
+    """
+
+    bus_in_main = power_flow.bus_in_main
+    generator_in_main = state.generator_on & bus_in_main[grid.generator_bus]
+    load_in_main = bus_in_main[grid.load_bus]
+    generator_incidence, load_incidence = grid.generator_incidence, grid.load_incidence
+
+    v_target = state.v_target / grid.bus_vnominal[grid.generator_bus]
+    regulating = (
+        generator_in_main
+        & grid.generator_regulating
+        & (v_target >= MIN_PLAUSIBLE_TARGET_VOLTAGE)
+        & (v_target <= MAX_PLAUSIBLE_TARGET_VOLTAGE)
+    )
+    pv_buses = np.zeros(grid.n_buses, dtype=bool)
+    pv_buses[grid.generator_bus[regulating]] = True
+    # The first generator of a bus sets its target.
+    v_magnitude = np.ones(grid.n_buses)
+    v_magnitude[grid.generator_bus[regulating][::-1]] = v_target[regulating][::-1]
+
+    q_fixed = np.where(generator_in_main & ~regulating, state.q_target, 0.0)
+    load_p = np.where(load_in_main, state.load_p, 0.0)
+    load_q = np.where(load_in_main, state.load_q, 0.0)
+    q_bus = generator_incidence.T @ q_fixed - load_incidence.T @ load_q
+
+    lower, upper = grid.active_power_bounds(state=state)
+    factors = np.where(
+        generator_in_main & grid.participating_generators(state=state), grid.p_max, 0.0
+    )
+    p_generator = np.where(generator_in_main, state.p_target, 0.0)
+    active = factors > 0
+    v, slack, iterations = v0, None, 0
+    failed = ACSolution(
+        v=np.full(grid.n_buses, np.nan, dtype=complex),
+        p_generator=np.full(len(p_generator), np.nan),
+        q_generator=np.full(len(p_generator), np.nan),
+        iterations=0,
+        status=LoadFlowStatus.FAILED,
+    )
+
+    while True:
+        if not active.any():
+            failed.iterations = iterations
+            return failed
+        shares = np.where(active, factors, 0.0) / factors[active].sum()
+        v, slack, round_iterations, status = power_flow.newton_raphson(
+            p=generator_incidence.T @ p_generator - load_incidence.T @ load_p,
+            q=q_bus,
+            pv_buses=pv_buses,
+            v_magnitude=v_magnitude,
+            participation=generator_incidence.T @ shares,
+            v0=v,
+            slack=slack,
+            tolerance=tolerance,
+            max_iterations=max_iterations,
+        )
+        iterations += round_iterations
+        if status != LoadFlowStatus.CONVERGED:
+            failed.iterations, failed.status = iterations, status
+            return failed
+
+        shifted = p_generator + shares * slack
+        clipped = np.clip(shifted, lower, upper)
+        violating = active & (clipped != shifted)
+        if not violating.any():
+            p_generator = shifted
+            break
+        slack -= (clipped - p_generator)[violating].sum()
+        p_generator = np.where(violating, clipped, p_generator)
+        active &= ~violating
+
+    # Reactive power of voltage controlled buses, shared by their controlling generators.
+    bus_q = power_flow.bus_powers(v=v).imag + load_incidence.T @ load_q
+    bus_q -= generator_incidence.T @ q_fixed
+    n_regulating = np.bincount(
+        grid.generator_bus[regulating], minlength=grid.n_buses
+    ).astype(float)
+    q_generator = np.where(
+        regulating,
+        bus_q[grid.generator_bus] / np.maximum(n_regulating[grid.generator_bus], 1.0),
+        q_fixed,
+    )
+    return ACSolution(
+        v=v,
+        p_generator=np.where(generator_in_main, p_generator, np.nan),
+        q_generator=np.where(generator_in_main, q_generator, np.nan),
+        iterations=iterations,
+        status=LoadFlowStatus.CONVERGED,
+    )
@@ -0,0 +1,111 @@
+from collections import OrderedDict
+import numpy as np
+from src.core.domain.models.element import NetworkElement
+from src.core.domain.models.power_flow.ac import ACPowerFlow
+from src.core.domain.models.power_flow.dc import DCPowerFlow
+from src.core.domain.models.power_flow.grid import GridIndex, grid_signature
+from src.core.domain.models.power_flow.topology import TopologyIndex
+
+
+class PowerFlowCache:
+    """
+    Grid indexes and topology indexes, per grid, and factorised DC power flows and AC ones,
+    per topology of a grid. The 'max_power_flows' most recently used ones of each kind are
+    kept.
+    """
+
+    def __init__(self, max_power_flows: int = 64) -> None:
+        self.max_power_flows = max_power_flows
+        self._grid_indexes: OrderedDict[tuple, GridIndex] = OrderedDict()
+        self._topology_indexes: OrderedDict[tuple, TopologyIndex] = OrderedDict()
+        self._power_flows: OrderedDict[tuple, DCPowerFlow] = OrderedDict()
+        self._ac_power_flows: OrderedDict[tuple, ACPowerFlow] = OrderedDict()
+
+    def grid_index(self, elements: list[NetworkElement]) -> GridIndex:
+        """Index of the grid formed by the elements of a timestamp, built on first use."""
+
+        return self._cached(
+            entries=self._grid_indexes,
+            key=grid_signature(elements=elements),
+            build=lambda: GridIndex(elements=elements),
+        )
+
+    def topology_index(
+        self, grid: GridIndex, branch_in_service: np.ndarray
+    ) -> TopologyIndex:
+        """
+        Connectivity of a grid, built on first use, then switched to 'branch_in_service'
+        incrementally.
+        """
+
+        topology = self._cached(
+            entries=self._topology_indexes,
+            key=grid.signature,
+            build=lambda: TopologyIndex(
+                n_buses=grid.n_buses,
+                from_bus=grid.from_bus,
+                to_bus=grid.to_bus,
+                in_service=branch_in_service,
+            ),
+        )
+        topology.update(in_service=branch_in_service)
+        return topology
+
+    def _cached(self, entries: OrderedDict, key: tuple, build) -> object:
+        if key in entries:
+            entries.move_to_end(key)
+            return entries[key]
+
+        entry = build()
+        entries[key] = entry
+        while len(entries) > self.max_power_flows:
+            entries.popitem(last=False)
+        return entry
+
+    def dc_power_flow(
+        self, grid: GridIndex, branch_in_service: np.ndarray
+    ) -> DCPowerFlow:
+        """Factorised DC power flow of a topology, shared by timestamps having it."""
+
+        return self._cached(
+            entries=self._power_flows,
+            key=(grid.signature, branch_in_service.tobytes()),
+            build=lambda: DCPowerFlow(
+                n_buses=grid.n_buses,
+                from_bus=grid.from_bus,
+                to_bus=grid.to_bus,
+                susceptance=grid.susceptance,
+                in_service=branch_in_service,
+            ),
+        )
+
+    def ac_power_flow(
+        self, grid: GridIndex, branch_in_service: np.ndarray
+    ) -> ACPowerFlow:
+        """AC power flow of a topology, shared by timestamps having it."""
+
+        return self._cached(
+            entries=self._ac_power_flows,
+            key=(grid.signature, branch_in_service.tobytes()),
+            build=lambda: ACPowerFlow(
+                n_buses=grid.n_buses,
+                from_bus=grid.from_bus,
+                to_bus=grid.to_bus,
+                series_admittance=grid.series_admittance,
+                shunt_admittance1=grid.shunt_admittance1,
+                shunt_admittance2=grid.shunt_admittance2,
+                ratio=grid.ratio,
+                bus_vnominal=grid.bus_vnominal,
+                in_service=branch_in_service,
+            ),
+        )
+
+    @property
+    def power_flows(self) -> list[DCPowerFlow]:
+        """Power flows kept, from the least to the most recently used."""
+        return list(self._power_flows.values())
+
+    @property
+    def ac_power_flows(self) -> list[ACPowerFlow]:
+        """AC power flows kept, from the least to the most recently used."""
+        return list(self._ac_power_flows.values())
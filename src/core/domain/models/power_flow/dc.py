@@ -0,0 +1,167 @@
+import numpy as np
+from scipy.sparse import csr_matrix, diags
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import splu
+
+# Remaining mismatch, in MW, below which slack distribution stops.
+SLACK_DISTRIBUTION_TOLERANCE = 1e-6
+
+
+def distribute_slack(
+    p_target: np.ndarray,
+    p_min: np.ndarray,
+    p_max: np.ndarray,
+    participation_factors: np.ndarray,
+    mismatch: float | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Spread an active power mismatch over generators, proportionally to their participation
+    factors, generators not taking part having a factor of 0. Generators reaching 'p_min' or
+    'p_max' are clipped and left out of the next round. Returns the generators' active
+    powers, with the part of the mismatch that couldn't be spread.
+
+    Generators are along the last axis, so that several timestamps, [timestamp, generator]
+    with a [timestamp] mismatch, are distributed at once.
+    """
+
+    p = np.array(p_target, dtype=float)
+    remaining = np.array(mismatch, dtype=float)
+    active = participation_factors > 0
+    while True:
+        pending = (np.abs(remaining) > SLACK_DISTRIBUTION_TOLERANCE) & active.any(
+            axis=-1
+        )
+        if not pending.any():
+            return p, remaining
+        factors = np.where(active & pending[..., None], participation_factors, 0.0)
+        total = factors.sum(axis=-1, keepdims=True)
+        shifted = p + remaining[..., None] * factors / np.where(total > 0, total, 1.0)
+        clipped = np.clip(shifted, p_min, p_max)
+        moved = np.where(factors > 0, clipped - p, 0.0)
+        remaining = remaining - moved.sum(axis=-1)
+        p = p + moved
+        active &= clipped == shifted
+
+
+def main_component(
+    n_buses: int, from_bus: np.ndarray, to_bus: np.ndarray, in_service: np.ndarray
+) -> np.ndarray:
+    """
+    Buses of the largest connected component formed by the branches in service, ties going
+    to the component of the lowest bus.
+    """
+
+    adjacency = csr_matrix(
+        (np.ones(in_service.sum()), (from_bus[in_service], to_bus[in_service])),
+        shape=(n_buses, n_buses),
+    )
+    _, labels = connected_components(adjacency, directed=False)
+    # Labels follow bus order, so argmax picks the lowest bus' component on ties.
+    return labels == np.argmax(np.bincount(labels))
+
+
+class DCPowerFlow:
+    """
+    DC power flow of one topology. The susceptance matrix of the main connected component is
+    factorised once, then solved for as many injection vectors as needed.
+
+    Buses out of the main component, and branches out of service or out of the main
+    component, get NaN angles and flows. The angle reference is the component's first bus.
+    """
+
+    def __init__(
+        self,
+        n_buses: int,
+        from_bus: np.ndarray,
+        to_bus: np.ndarray,
+        susceptance: np.ndarray,
+        in_service: np.ndarray,
+    ) -> None:
+        self.n_buses = n_buses
+        self.from_bus = from_bus
+        self.to_bus = to_bus
+        self.susceptance = susceptance
+        n_branches = len(from_bus)
+
+        self.bus_in_main = main_component(
+            n_buses=n_buses, from_bus=from_bus, to_bus=to_bus, in_service=in_service
+        )
+        self.branch_in_main = in_service & self.bus_in_main[from_bus]
+
+        main_buses = np.flatnonzero(self.bus_in_main)
+        self.slack_bus = main_buses[0]
+        self.reduced_buses = main_buses[1:]
+
+        # Branch-bus incidence, weighted by susceptance, for branches of the main component.
+        branches = np.flatnonzero(self.branch_in_main)
+        incidence = csr_matrix(
+            (
+                np.concatenate([np.ones(len(branches)), -np.ones(len(branches))]),
+                (
+                    np.concatenate([branches, branches]),
+                    np.concatenate([from_bus[branches], to_bus[branches]]),
+                ),
+            ),
+            shape=(n_branches, n_buses),
+        )
+        self.branch_matrix = (diags(susceptance * self.branch_in_main) @ incidence)[
+            :, self.reduced_buses
+        ].tocsr()
+        bus_matrix = (
+            incidence.T @ diags(susceptance * self.branch_in_main) @ incidence
+        )[self.reduced_buses][:, self.reduced_buses]
+        self._lu = splu(bus_matrix.tocsc()) if len(self.reduced_buses) else None
+        self._impedance: np.ndarray | None = None
+        self._ptdf: np.ndarray | None = None
+
+    def impedance(self) -> np.ndarray:
+        """
+        Inverse of the susceptance matrix, [bus, bus] in rad/MW: the angles of 1 MW injected
+        at a bus and withdrawn at the slack bus. Computed once, on first use. Rows and columns
+        of the slack bus and of buses out of the main component are 0.
+        """
+
+        if self._impedance is None:
+            impedance = np.zeros((self.n_buses, self.n_buses))
+            if self._lu is not None:
+                impedance[np.ix_(self.reduced_buses, self.reduced_buses)] = (
+                    self._lu.solve(np.eye(len(self.reduced_buses)))
+                )
+            self._impedance = impedance
+        return self._impedance
+
+    def ptdf(self) -> np.ndarray:
+        """
+        Power transfer distribution factors, [branch, bus]: the flow on each branch of 1 MW
+        injected at a bus and withdrawn at the slack bus. Computed once, on first use. Rows of
+        branches out of the main component are NaN, columns of buses out of it are 0.
+        """
+
+        if self._ptdf is None:
+            ptdf = np.zeros((len(self.branch_in_main), self.n_buses))
+            ptdf[:, self.reduced_buses] = (
+                self.branch_matrix
+                @ self.impedance()[np.ix_(self.reduced_buses, self.reduced_buses)]
+            )
+            ptdf[~self.branch_in_main] = np.nan
+            self._ptdf = ptdf
+        return self._ptdf
+
+    def angles(self, p: np.ndarray) -> np.ndarray:
+        """Bus voltage angles, in radians, of injections 'p' ([bus] or [bus, k], in MW)."""
+
+        theta = np.zeros(p.shape, dtype=float)
+        if self._lu is not None:
+            theta[self.reduced_buses] = self._lu.solve(
+                np.ascontiguousarray(p[self.reduced_buses], dtype=float)
+            )
+        theta[~self.bus_in_main] = np.nan
+        return theta
+
+    def flows(self, p: np.ndarray) -> np.ndarray:
+        """Active power flows from side 1 to side 2 of branches, in MW, of injections 'p'."""
+
+        theta = self.angles(p=p)
+        flows = self.branch_matrix @ theta[self.reduced_buses]
+        flows[~self.branch_in_main] = np.nan
+        return flows
@@ -0,0 +1,58 @@
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+
+class DCFlows:
+    """
+    DC active power flows of the lines of a network, over all its timestamps.
+
+    timestamps: Timestamps, in order.
+    line_ids: Ids of the lines, in order.
+    flows: [timestamp, line] flows from side 1 to side 2, in MW. NaN for lines out of service
+        or out of the main component, and for timestamps that couldn't be balanced.
+    limits: [line] lowest active power limit of each line, inf for lines without any.
+    """
+
+    def __init__(
+        self,
+        timestamps: list[datetime],
+        line_ids: list[str],
+        flows: np.ndarray,
+        limits: np.ndarray,
+    ) -> None:
+        self.timestamps = timestamps
+        self.line_ids = line_ids
+        self.flows = flows
+        self.limits = limits
+
+    def overloaded(self) -> np.ndarray:
+        """[timestamp, line] mask of flows above the line's limit."""
+        with np.errstate(invalid="ignore"):
+            return np.abs(self.flows) > self.limits
+
+    def overloaded_timestamps(self) -> list[datetime]:
+        """Timestamps with at least one overloaded line, worth an AC loadflow."""
+        mask = self.overloaded().any(axis=1)
+        return [t for t, overloaded in zip(self.timestamps, mask) if overloaded]
+
+    def overloads(self) -> pd.DataFrame:
+        """One row per overloaded line and timestamp, with its flow and limit."""
+
+        rows, columns = np.nonzero(self.overloaded())
+        return pd.DataFrame(
+            {
+                "timestamp": [self.timestamps[k] for k in rows],
+                "line_id": [self.line_ids[k] for k in columns],
+                "p1": self.flows[rows, columns],
+                "limit": self.limits[columns],
+            }
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Flows with a timestamp index and a column per line."""
+        return pd.DataFrame(
+            self.flows,
+            index=pd.DatetimeIndex(self.timestamps, name="timestamp"),
+            columns=self.line_ids,
+        )
@@ -0,0 +1,304 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+from src.core.constants import ElementStatus, SupportedNetworkElementTypes
+from src.core.domain.enums import OperationalConstraintType
+from src.core.domain.models.element import NetworkElement
+from src.core.domain.models.power_flow.dc import distribute_slack
+
+# Generators above this Pmax, or with a target below this, don't take part in slack
+# distribution, as in pypowsybl's OpenLoadFlow.
+PLAUSIBLE_MAX_ACTIVE_POWER = 10_000.0
+MIN_PARTICIPATING_TARGET_P = 1e-4
+
+
+def grid_signature(elements: list[NetworkElement]) -> tuple[tuple, ...]:
+    """
+    Identifies the grid formed by the elements of a timestamp, in their order: their ids,
+    static attributes and operational constraints. Statuses are left out, as they're part
+    of the GridState.
+    """
+    return tuple(
+        (
+            element.type,
+            element.id,
+            tuple(
+                value
+                for name, value in vars(element.element_metadata.static).items()
+                if name != "status"
+            ),
+            tuple(
+                (constraint.side, constraint.type, constraint.value)
+                for constraint in element.operational_constraints
+            ),
+        )
+        for element in elements
+    )
+
+
+class GridState:
+    """
+    Per timestamp inputs of a power flow, as arrays ordered like the ones of a GridIndex.
+
+    branch_in_service: Whether each branch (lines, then transformers) is ON.
+    generator_on: Whether each generator is ON.
+    p_target, v_target, q_target: Generators' targets, Qtarget defaulting to 0.
+    load_p, load_q: Loads' consumptions.
+    """
+
+    def __init__(
+        self,
+        branch_in_service: np.ndarray,
+        generator_on: np.ndarray,
+        p_target: np.ndarray,
+        v_target: np.ndarray,
+        q_target: np.ndarray,
+        load_p: np.ndarray,
+        load_q: np.ndarray,
+    ) -> None:
+        self.branch_in_service = branch_in_service
+        self.generator_on = generator_on
+        self.p_target = p_target
+        self.v_target = v_target
+        self.q_target = q_target
+        self.load_p = load_p
+        self.load_q = load_q
+
+    @classmethod
+    def stack(cls, states: list["GridState"]) -> "GridState":
+        """Several timestamps' states as one, with a leading timestamp axis."""
+        return cls(
+            **{
+                name: np.stack([getattr(state, name) for state in states])
+                for name in vars(states[0])
+            }
+        )
+
+
+class GridIndex:
+    """
+    Numbering of the buses, branches, generators and loads of a grid, with their static
+    attributes as arrays. It is built once from the elements of a timestamp and can then be
+    used for any timestamp whose elements have the same signature.
+
+    Branches are the lines followed by the 2-windings transformers. Their DC susceptance, in
+    MW/rad, is Vnom1 * Vnom2 / x, scaled by rated_u2 / rated_u1 for transformers. For AC, they
+    are pi models, in S: a series admittance with a shunt admittance on each side, behind an
+    ideal ratio of rated_u2 / rated_u1 on side 1 for transformers, whose shunt admittance is
+    all on side 1. Lines' active power limit is the lowest of their ACTIVE_POWER
+    constraints, inf without any.
+    """
+
+    def __init__(self, elements: list[NetworkElement]) -> None:
+        self.signature = grid_signature(elements=elements)
+
+        vnominal = {
+            element.id: element.element_metadata.static.Vnominal
+            for element in elements
+            if element.type == SupportedNetworkElementTypes.VOLTAGE_LEVEL
+        }
+        self.bus_ids: list[str] = []
+        self.bus_index: dict[str, int] = {}
+        bus_vnominal = []
+
+        def bus(bus_id: str, voltage_level_id: str) -> int:
+            if bus_id not in self.bus_index:
+                self.bus_index[bus_id] = len(self.bus_ids)
+                self.bus_ids.append(bus_id)
+                bus_vnominal.append(vnominal[voltage_level_id])
+            return self.bus_index[bus_id]
+
+        for element in elements:
+            if element.type == SupportedNetworkElementTypes.BUS:
+                bus(element.id, element.element_metadata.static.voltage_level_id)
+
+        lines, transformers, generators, loads = [], [], [], []
+        for position, element in enumerate(elements):
+            if element.type == SupportedNetworkElementTypes.LINE:
+                lines.append(position)
+            elif element.type == SupportedNetworkElementTypes.TWO_WINDINGS_TRANSFORMERS:
+                transformers.append(position)
+            elif element.type == SupportedNetworkElementTypes.GENERATOR:
+                generators.append(position)
+            elif element.type == SupportedNetworkElementTypes.LOAD:
+                loads.append(position)
+
+        self.line_positions = np.array(lines, dtype=int)
+        self.line_ids = [elements[position].id for position in lines]
+        self.line_limits = np.array(
+            [
+                min(
+                    (
+                        constraint.value
+                        for constraint in elements[position].operational_constraints
+                        if constraint.type == OperationalConstraintType.ACTIVE_POWER
+                    ),
+                    default=np.inf,
+                )
+                for position in lines
+            ],
+            dtype=float,
+        )
+        self.branch_positions = np.array(lines + transformers, dtype=int)
+        self.generator_positions = np.array(generators, dtype=int)
+        self.generator_ids = [elements[position].id for position in generators]
+        self.load_positions = np.array(loads, dtype=int)
+        self.load_ids = [elements[position].id for position in loads]
+
+        from_bus, to_bus, susceptance = [], [], []
+        series, shunt1, shunt2, ratio = [], [], [], []
+        for position in self.branch_positions:
+            static = elements[position].element_metadata.static
+            from_bus.append(bus(static.bus1_id, static.voltage_level1_id))
+            to_bus.append(bus(static.bus2_id, static.voltage_level2_id))
+            b = vnominal[static.voltage_level1_id] * vnominal[static.voltage_level2_id]
+            series.append(1 / complex(static.r, static.x))
+            if elements[position].type == SupportedNetworkElementTypes.LINE:
+                susceptance.append(b / static.x)
+                shunt1.append(complex(static.g1, static.b1))
+                shunt2.append(complex(static.g2, static.b2))
+                ratio.append(1.0)
+            else:
+                susceptance.append(b * static.rated_u2 / static.rated_u1 / static.x)
+                shunt1.append(complex(static.g, static.b))
+                shunt2.append(0j)
+                ratio.append(static.rated_u2 / static.rated_u1)
+        self.from_bus = np.array(from_bus, dtype=int)
+        self.to_bus = np.array(to_bus, dtype=int)
+        self.susceptance = np.array(susceptance, dtype=float)
+        self.series_admittance = np.array(series, dtype=complex)
+        self.shunt_admittance1 = np.array(shunt1, dtype=complex)
+        self.shunt_admittance2 = np.array(shunt2, dtype=complex)
+        self.ratio = np.array(ratio, dtype=float)
+
+        generator_statics = [
+            elements[position].element_metadata.static
+            for position in self.generator_positions
+        ]
+        self.generator_bus = np.array(
+            [bus(s.bus_id, s.voltage_level_id) for s in generator_statics], dtype=int
+        )
+        self.p_min = np.array([s.Pmin for s in generator_statics], dtype=float)
+        self.p_max = np.array([s.Pmax for s in generator_statics], dtype=float)
+        self.generator_regulating = np.array(
+            [s.is_voltage_regulator for s in generator_statics], dtype=bool
+        )
+        self.load_bus = np.array(
+            [
+                bus(
+                    elements[position].element_metadata.static.bus_id,
+                    elements[position].element_metadata.static.voltage_level_id,
+                )
+                for position in self.load_positions
+            ],
+            dtype=int,
+        )
+        self.bus_vnominal = np.array(bus_vnominal, dtype=float)
+
+        # Generator-bus and load-bus incidences, summing injections per bus.
+        self.generator_incidence = csr_matrix(
+            (
+                np.ones(len(self.generator_bus)),
+                (np.arange(len(self.generator_bus)), self.generator_bus),
+            ),
+            shape=(len(self.generator_bus), self.n_buses),
+        )
+        self.load_incidence = csr_matrix(
+            (
+                np.ones(len(self.load_bus)),
+                (np.arange(len(self.load_bus)), self.load_bus),
+            ),
+            shape=(len(self.load_bus), self.n_buses),
+        )
+
+    @property
+    def n_buses(self) -> int:
+        return len(self.bus_ids)
+
+    @property
+    def n_lines(self) -> int:
+        return len(self.line_positions)
+
+    def read_state(self, elements: list[NetworkElement]) -> GridState:
+        """Gather the per timestamp inputs from elements having this index' signature."""
+
+        # Transformers have no status, so are always in service.
+        branch_in_service = np.ones(len(self.branch_positions), dtype=bool)
+        branch_in_service[: self.n_lines] = [
+            elements[position].element_metadata.static.status == ElementStatus.ON
+            for position in self.line_positions
+        ]
+
+        generator_metadata = [
+            elements[position].element_metadata for position in self.generator_positions
+        ]
+        generator_on = np.array(
+            [m.static.status == ElementStatus.ON for m in generator_metadata],
+            dtype=bool,
+        )
+        dynamics = [m.dynamic for m in generator_metadata]
+        load_dynamics = [
+            elements[position].element_metadata.dynamic
+            for position in self.load_positions
+        ]
+        return GridState(
+            branch_in_service=branch_in_service,
+            generator_on=generator_on,
+            p_target=np.array([d.Ptarget for d in dynamics], dtype=float),
+            v_target=np.array([d.Vtarget for d in dynamics], dtype=float),
+            q_target=np.array([d.Qtarget or 0.0 for d in dynamics], dtype=float),
+            load_p=np.array([d.Pd for d in load_dynamics], dtype=float),
+            load_q=np.array([d.Qd for d in load_dynamics], dtype=float),
+        )
+
+    def participating_generators(self, state: GridState) -> np.ndarray:
+        """Generators that the active power mismatch can be distributed over."""
+        return (
+            state.generator_on
+            & (np.abs(state.p_target) >= MIN_PARTICIPATING_TARGET_P)
+            & (self.p_max < PLAUSIBLE_MAX_ACTIVE_POWER)
+            & (self.p_max > self.p_min)
+            & (state.p_target >= self.p_min)
+            & (state.p_target <= self.p_max)
+        )
+
+    def active_power_bounds(self, state: GridState) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Range generators can be moved within by slack distribution: their [Pmin, Pmax],
+        without changing sign, so that producers don't turn into consumers and vice versa.
+        """
+
+        lower = np.where(state.p_target > 0, np.maximum(self.p_min, 0.0), self.p_min)
+        upper = np.where(state.p_target < 0, np.minimum(self.p_max, 0.0), self.p_max)
+        return lower, upper
+
+    def dc_injections(
+        self, state: GridState, bus_in_main: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Active power of generators once the mismatch of the main component is distributed,
+        the resulting bus injections, and the mismatch that couldn't be distributed.
+        Elements out of the main component inject nothing.
+
+        The state's arrays may have a leading timestamp axis, as may the results then.
+        """
+
+        generator_in_main = state.generator_on & bus_in_main[self.generator_bus]
+        load_p = np.where(bus_in_main[self.load_bus], state.load_p, 0.0)
+        p_target = np.where(generator_in_main, state.p_target, 0.0)
+        p_min, p_max = self.active_power_bounds(state=state)
+
+        p_generator, remaining = distribute_slack(
+            p_target=p_target,
+            p_min=p_min,
+            p_max=p_max,
+            participation_factors=np.where(
+                generator_in_main & self.participating_generators(state=state),
+                self.p_max,
+                0.0,
+            ),
+            mismatch=load_p.sum(axis=-1) - p_target.sum(axis=-1),
+        )
+        p_bus = (self.generator_incidence.T @ p_generator.T).T - (
+            self.load_incidence.T @ load_p.T
+        ).T
+        return p_generator, p_bus, remaining
@@ -0,0 +1,93 @@
+import numpy as np
+from src.core.domain.models.power_flow.dc import DCPowerFlow
+
+# Branches whose outage leaves less than this of the flow in the rest of the grid would
+# split it: their outage distribution factors are NaN.
+ISLANDING_TOLERANCE = 1e-9
+
+
+def _transfer_factors(
+    power_flow: DCPowerFlow, branches: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    For each branch k of 'branches', going from bus i to bus j: the flows on every branch of
+    1 MW injected at i and withdrawn at j, [branch, k], and the angle difference it creates
+    across k itself, as a share of the flow k would carry, [k].
+    """
+
+    ptdf = power_flow.ptdf()
+    impedance = power_flow.impedance()
+    from_bus, to_bus = power_flow.from_bus[branches], power_flow.to_bus[branches]
+    transfer = ptdf[:, from_bus] - ptdf[:, to_bus]
+    self_transfer = power_flow.susceptance[branches] * (
+        impedance[from_bus, from_bus]
+        + impedance[to_bus, to_bus]
+        - 2 * impedance[from_bus, to_bus]
+    )
+    return transfer, self_transfer
+
+
+def lodf(power_flow: DCPowerFlow) -> np.ndarray:
+    """
+    Line outage distribution factors, [branch, outaged branch]: the share of the flow of an
+    outaged branch moving onto each other branch. The diagonal is -1. Columns of branches
+    out of service, or whose outage would split the main component, are NaN.
+    """
+
+    branches = np.arange(len(power_flow.from_bus))
+    transfer, self_transfer = _transfer_factors(
+        power_flow=power_flow, branches=branches
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        factors = transfer / (1 - self_transfer)
+    splitting = ~power_flow.branch_in_main | (
+        np.abs(1 - self_transfer) < ISLANDING_TOLERANCE
+    )
+    factors[:, splitting] = np.nan
+    factors[branches, branches] = np.where(splitting, np.nan, -1.0)
+    return factors
+
+
+def switched_flows(
+    power_flow: DCPowerFlow, p: np.ndarray, branches: np.ndarray
+) -> np.ndarray:
+    """
+    Flows on every branch, [branch, k], once the status of branch k of 'branches' is
+    switched, for injections 'p' ([bus], in MW), without refactorising the topology.
+
+    Branches in service are opened: their flow spreads onto the others through rank-1 LODF
+    updates. Branches out of service are closed, carrying the flow their angle difference
+    drives through the grid they close on. Switches that would split the main component,
+    or close a branch reaching out of it, get NaN flows.
+    """
+
+    branches = np.asarray(branches, dtype=int)
+    transfer, self_transfer = _transfer_factors(
+        power_flow=power_flow, branches=branches
+    )
+    flows = power_flow.flows(p=p)
+    theta = power_flow.angles(p=p)
+
+    opened = power_flow.branch_in_main[branches]
+    from_bus, to_bus = power_flow.from_bus[branches], power_flow.to_bus[branches]
+    prospective_flows = power_flow.susceptance[branches] * (
+        theta[from_bus] - theta[to_bus]
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Flow moved from bus i to bus j of each switched branch, through the others.
+        moved = np.where(
+            opened,
+            flows[branches] / (1 - self_transfer),
+            -prospective_flows / (1 + self_transfer),
+        )
+        new_flows = flows[:, None] + transfer * moved[None, :]
+
+    columns = np.arange(len(branches))
+    new_flows[branches, columns] = np.where(opened, np.nan, -moved)
+    invalid = np.where(
+        opened,
+        np.abs(1 - self_transfer) < ISLANDING_TOLERANCE,
+        ~(power_flow.bus_in_main[from_bus] & power_flow.bus_in_main[to_bus]),
+    )
+    new_flows[:, invalid] = np.nan
+    return new_flows
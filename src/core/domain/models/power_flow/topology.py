@@ -0,0 +1,189 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+
+class TopologyIndex:
+    """
+    Connectivity of the buses of a grid through its branches in service, to find islanded
+    buses and islanding switches without solving the grid.
+
+    The CSR adjacency of buses, over all branches, is built once. Branch statuses are then
+    updated incrementally: closing a branch merges components in a union-find, in O(α),
+    while opening one only marks the components stale, for them to be recomputed on the
+    next query. Branches whose opening would split their component, the bridges, are found
+    once per topology, on first use.
+    """
+
+    def __init__(
+        self,
+        n_buses: int,
+        from_bus: np.ndarray,
+        to_bus: np.ndarray,
+        in_service: np.ndarray,
+    ) -> None:
+        self.n_buses = n_buses
+        self.from_bus = from_bus
+        self.to_bus = to_bus
+        self.in_service = np.array(in_service, dtype=bool)
+
+        # Both directions of each branch, by bus, keeping parallel branches apart.
+        rows = np.concatenate([from_bus, to_bus])
+        order = np.argsort(rows, kind="stable")
+        self._rows = rows[order]
+        self.indices = np.concatenate([to_bus, from_bus])[order]
+        self.branches = np.concatenate([np.arange(len(from_bus))] * 2)[order]
+        self.indptr = np.concatenate(
+            [[0], np.cumsum(np.bincount(rows, minlength=n_buses))]
+        )
+
+        self._parent = np.arange(n_buses)
+        self._size = np.ones(n_buses, dtype=int)
+        self._stale = True
+        self._bridges: np.ndarray | None = None
+
+    def _rebuild(self) -> None:
+        """Components of the branches in service, from scratch."""
+
+        in_service = self.in_service[self.branches]
+        adjacency = csr_matrix(
+            (
+                np.ones(in_service.sum()),
+                (self._rows[in_service], self.indices[in_service]),
+            ),
+            shape=(self.n_buses, self.n_buses),
+        )
+        _, labels = connected_components(adjacency, directed=False)
+        # Each component's root is its lowest bus.
+        roots = np.full(labels.max() + 1, self.n_buses)
+        np.minimum.at(roots, labels, np.arange(self.n_buses))
+        self._parent = roots[labels]
+        self._size = np.zeros(self.n_buses, dtype=int)
+        np.add.at(self._size, self._parent, 1)
+        self._stale = False
+
+    def _find(self, bus: int) -> int:
+        if self._stale:
+            self._rebuild()
+        root = bus
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[bus] != root:
+            self._parent[bus], bus = root, self._parent[bus]
+        return root
+
+    def set_status(self, branch: int, in_service: bool) -> None:
+        """Switch a branch, keeping the components up to date."""
+
+        if self.in_service[branch] == in_service:
+            return
+        self.in_service[branch] = in_service
+        self._bridges = None
+        if not in_service:
+            self._stale = True
+            return
+        if self._stale:
+            return
+        root1 = self._find(int(self.from_bus[branch]))
+        root2 = self._find(int(self.to_bus[branch]))
+        if root1 == root2:
+            return
+        # The larger component absorbs the smaller one.
+        if self._size[root1] < self._size[root2]:
+            root1, root2 = root2, root1
+        self._parent[root2] = root1
+        self._size[root1] += self._size[root2]
+
+    def update(self, in_service: np.ndarray) -> None:
+        """Switch the branches whose status differs from 'in_service'."""
+
+        for branch in np.flatnonzero(self.in_service != in_service):
+            self.set_status(branch=int(branch), in_service=bool(in_service[branch]))
+
+    def connected(self, bus1: int, bus2: int) -> bool:
+        return self._find(bus1) == self._find(bus2)
+
+    def labels(self) -> np.ndarray:
+        """[bus] root of each bus' component, its lowest bus after a rebuild."""
+
+        if self._stale:
+            self._rebuild()
+        parent = self._parent
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+        self._parent = parent
+        return parent.copy()
+
+    @property
+    def n_components(self) -> int:
+        return len(np.unique(self.labels()))
+
+    def main_component(self) -> np.ndarray:
+        """
+        Buses of the largest component, ties going to the component of the lowest bus, as
+        for power flows.
+        """
+
+        labels = self.labels()
+        sizes = np.bincount(labels, minlength=self.n_buses)
+        lowest_bus = np.full(self.n_buses, self.n_buses)
+        np.minimum.at(lowest_bus, labels, np.arange(self.n_buses))
+        # Largest size first, then lowest bus.
+        main = np.lexsort((lowest_bus, -sizes))[0]
+        return labels == main
+
+    def islanded_buses(self) -> np.ndarray:
+        """Buses out of the main component."""
+        return np.flatnonzero(~self.main_component())
+
+    def bridges(self) -> np.ndarray:
+        """
+        [branch] mask of the branches in service whose opening would split their component,
+        by an iterative depth first search. Parallel branches aren't bridges.
+        """
+
+        if self._bridges is not None:
+            return self._bridges
+
+        order = np.full(self.n_buses, -1)
+        low = np.zeros(self.n_buses, dtype=int)
+        bridges = np.zeros(len(self.in_service), dtype=bool)
+        counter = 0
+        for root in range(self.n_buses):
+            if order[root] >= 0:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            # Bus, branch it was reached by, next adjacency position to explore.
+            stack = [[root, -1, self.indptr[root]]]
+            while stack:
+                bus, parent_branch, position = stack[-1]
+                if position < self.indptr[bus + 1]:
+                    stack[-1][2] += 1
+                    branch = self.branches[position]
+                    if not self.in_service[branch] or branch == parent_branch:
+                        continue
+                    neighbour = self.indices[position]
+                    if order[neighbour] < 0:
+                        order[neighbour] = low[neighbour] = counter
+                        counter += 1
+                        stack.append([neighbour, branch, self.indptr[neighbour]])
+                    else:
+                        low[bus] = min(low[bus], order[neighbour])
+                    continue
+                stack.pop()
+                if stack:
+                    parent = stack[-1][0]
+                    low[parent] = min(low[parent], low[bus])
+                    if low[bus] > order[parent]:
+                        bridges[parent_branch] = True
+
+        self._bridges = bridges
+        return bridges
+
+    def splits(self, branches: np.ndarray) -> np.ndarray:
+        """Whether opening each of 'branches' would split its component."""
+        return self.bridges()[np.asarray(branches, dtype=int)]
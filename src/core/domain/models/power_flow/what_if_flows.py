@@ -0,0 +1,79 @@
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+
+class WhatIfFlows:
+    """
+    DC active power flows of the lines of a network, over all its timestamps, with their
+    changes under each of a batch of injection perturbations.
+
+    timestamps: Timestamps, in order.
+    perturbation_ids: Ids of the perturbations, in order.
+    line_ids: Ids of the lines, in order.
+    base_flows: [timestamp, line] flows from side 1 to side 2 without perturbation, in MW.
+    deltas: [timestamp, perturbation, line] changes of the flows under each perturbation,
+        in MW. NaN, as the flows, for lines out of service or out of the main component, and
+        for timestamps that couldn't be balanced.
+    limits: [line] lowest active power limit of each line, inf for lines without any.
+    """
+
+    def __init__(
+        self,
+        timestamps: list[datetime],
+        perturbation_ids: list[str],
+        line_ids: list[str],
+        base_flows: np.ndarray,
+        deltas: np.ndarray,
+        limits: np.ndarray,
+    ) -> None:
+        self.timestamps = timestamps
+        self.perturbation_ids = perturbation_ids
+        self.line_ids = line_ids
+        self.base_flows = base_flows
+        self.deltas = deltas
+        self.limits = limits
+
+    def flows(self) -> np.ndarray:
+        """[timestamp, perturbation, line] flows under each perturbation."""
+        return self.base_flows[:, None, :] + self.deltas
+
+    def overloaded(self) -> np.ndarray:
+        """[timestamp, perturbation, line] mask of flows above the line's limit."""
+        with np.errstate(invalid="ignore"):
+            return np.abs(self.flows()) > self.limits
+
+    def overloads(self) -> pd.DataFrame:
+        """
+        One row per line overloaded under a perturbation at a timestamp, with its flow, the
+        change of its flow and its limit.
+        """
+
+        rows, perturbations, columns = np.nonzero(self.overloaded())
+        deltas = self.deltas[rows, perturbations, columns]
+        return pd.DataFrame(
+            {
+                "timestamp": [self.timestamps[k] for k in rows],
+                "perturbation_id": [self.perturbation_ids[k] for k in perturbations],
+                "line_id": [self.line_ids[k] for k in columns],
+                "p1": self.base_flows[rows, columns] + deltas,
+                "delta_p1": deltas,
+                "limit": self.limits[columns],
+            }
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Changes of the flows with a (timestamp, perturbation_id) index and a column per line.
+        """
+
+        return pd.DataFrame(
+            self.deltas.reshape(-1, len(self.line_ids)),
+            index=pd.MultiIndex.from_product(
+                [
+                    pd.DatetimeIndex(self.timestamps, name="timestamp"),
+                    pd.Index(self.perturbation_ids, name="perturbation_id"),
+                ]
+            ),
+            columns=self.line_ids,
+        )
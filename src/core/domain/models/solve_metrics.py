@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+from src.core.domain.enums import LoadFlowStatus, LoadFlowType, SolvePhase
+
+
+class SolveMetrics(BaseModel):
+    """
+    What a single call to a loadflow solver cost.
+
+    solver: Name of the solver.
+    network_id: Network solved.
+    loadflow_type: Type of the loadflow run.
+    seconds: Wall time of the whole call.
+    phase_seconds: Wall time spent in each phase, summed over workers when solved in parallel.
+    n_timestamps: Timestamps solved.
+    n_elements: Elements solved, over all timestamps.
+    iterations: Loadflow iterations run, over all timestamps.
+    statuses: Timestamps per convergence status.
+    warm_starts: AC timestamps solved from the voltages of the previous one.
+    warm_start_fallbacks: AC timestamps whose warm start failed, solved from a flat start.
+    """
+
+    solver: str
+    network_id: str
+    loadflow_type: LoadFlowType
+    seconds: float
+    phase_seconds: dict[SolvePhase, float]
+    n_timestamps: int
+    n_elements: int
+    iterations: int
+    statuses: dict[LoadFlowStatus, int]
+    warm_starts: int = 0
+    warm_start_fallbacks: int = 0
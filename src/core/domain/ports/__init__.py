@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from src.core.domain.ports.network_repository import DatabaseNetworkRepository
 from src.core.domain.ports.loadflow_solver import LoadFlowSolver
 from src.core.domain.ports.network_builder import NetworkBuilder
+from src.core.domain.ports.network_importer import NetworkImporter
 
 
 class Ports(ABC):
@@ -18,3 +19,7 @@ class Ports(ABC):
     @abstractmethod
     def network_builder(self) -> NetworkBuilder:
         pass
+
+    @abstractmethod
+    def network_importer(self) -> NetworkImporter:
+        pass
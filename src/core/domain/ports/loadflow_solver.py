@@ -1,11 +1,45 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from src.core.domain.models.network import Network
-from src.core.domain.enums import LoadFlowType
+from src.core.domain.models.network_delta import NetworkDelta
+from src.core.domain.models.solve_metrics import SolveMetrics
+from src.core.domain.enums import LoadFlowStatus, LoadFlowType
 
 
 class LoadFlowSolver(ABC):
     @abstractmethod
     def solve(
         self, network: Network, loadflow_type: LoadFlowType
-    ) -> Network:  # NOTE: Should it take a DynamicNetwork and return a SolvedNetwork? Being more precise here in typing
+    ) -> (
+        Network
+    ):  # NOTE: Should it take a DynamicNetwork and return a SolvedNetwork? Being more precise here in typing
         pass
+
+    def solve_delta(
+        self, network: Network, delta: NetworkDelta, loadflow_type: LoadFlowType
+    ) -> Network:
+        """
+        Solve a single timestamp network reached by 'delta' from the one solved last, its
+        statuses aside. Solvers keeping state between solves may only update what changed.
+        """
+        return self.solve(network=network, loadflow_type=loadflow_type)
+
+    def reset(self) -> None:
+        """Drop any state kept between solves, e.g. at the start of an episode."""
+        pass
+
+    def shutdown(self) -> None:
+        """Release the workers or connections kept between solves, once done solving."""
+        pass
+
+    def get_loadflow_statuses(self) -> dict[datetime, LoadFlowStatus]:
+        """Convergence status per timestamp of the last solve, empty if not reported."""
+        return {}
+
+    def get_iterations(self) -> dict[datetime, int]:
+        """Iterations run for each timestamp of the last AC solve, empty if not reported."""
+        return {}
+
+    def get_metrics(self) -> SolveMetrics | None:
+        """What the last solve cost, None if not reported."""
+        return None
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from src.core.domain.models.solve_metrics import SolveMetrics
+
+
+class MetricsSink(ABC):
+    """Where loadflow solvers report what each call cost."""
+
+    @abstractmethod
+    def record(self, metrics: SolveMetrics) -> None:
+        pass
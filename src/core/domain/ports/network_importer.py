@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from src.core.domain.models.element import NetworkElement
+
+
+class NetworkImporter(ABC):
+    @abstractmethod
+    def import_elements(self, file_path: Path, network_id: str) -> list[NetworkElement]:
+        """Read a grid file and return its elements as static NetworkElement s."""
+        pass
@@ -18,6 +18,11 @@ class DatabaseNetworkRepository(ABC):
     def list_available_networks(self) -> list[str]:
         pass
 
+    def list_timestamps(self, network_id: str) -> list[datetime]:
+        """Timestamps the network has elements at, in order."""
+        elements = self.get_elements(network_id=network_id) or []
+        return sorted({element.timestamp for element in elements})
+
     @abstractmethod
     def add(self, network: Network) -> None:
         pass
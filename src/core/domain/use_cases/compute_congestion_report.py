@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+from src.core.constants import SupportedNetworkElementTypes
+from src.core.domain.enums import BranchSide, OperationalConstraintType
+from src.core.domain.models.congestion_report import (
+    CONSTRAINT_COLUMNS,
+    CongestionReport,
+    timestamp_durations,
+)
+from src.core.domain.models.elements_metadata.line import LineSolvedAttributes
+from src.core.domain.models.network import Network
+from src.core.domain.ports.network_repository import DatabaseNetworkRepository
+
+# Solved attributes of each side of a line: active, reactive powers and current.
+SIDE_ATTRIBUTES = {
+    BranchSide.ONE: ("p1", "q1", "i1"),
+    BranchSide.TWO: ("p2", "q2", "i2"),
+}
+
+
+def _measure(
+    solved: LineSolvedAttributes | None,
+    side: BranchSide,
+    type: OperationalConstraintType,
+) -> float:
+    """The solved quantity a constraint of 'type' limits on a side of a line."""
+
+    if solved is None:
+        return np.nan
+    p, q, i = (getattr(solved, name) for name in SIDE_ATTRIBUTES[side])
+    if type == OperationalConstraintType.ACTIVE_POWER:
+        return abs(p)
+    if type == OperationalConstraintType.CURRENT:
+        return i
+    return float(np.hypot(p, q))
+
+
+class CongestionReportPipeline:
+    """
+    Congestion analytics of a solved network, e.g. '<network>_solved', over its whole
+    horizon: the operational constraints of its lines are gathered once into
+    [timestamp, constraint] loadings, which overload masks, episodes against acceptable
+    durations, worst offenders and utilisation histograms are computed on with numpy.
+    """
+
+    def __init__(self, network_repository: DatabaseNetworkRepository) -> None:
+        self.network_repository = network_repository
+
+    def compute(self, network: Network) -> CongestionReport:
+        """
+        Report on the constraints of the network's lines. Lines without solved attributes,
+        e.g. OFF ones, have NaN loadings. Constraints on side THREE are left out.
+        """
+
+        timestamps = sorted({element.timestamp for element in network.elements})
+        rows = {timestamp: k for k, timestamp in enumerate(timestamps)}
+
+        columns, acceptable_durations = {}, []
+        positions, limits, measures = [], [], []
+        for element in network.elements:
+            if element.type != SupportedNetworkElementTypes.LINE:
+                continue
+            for constraint in element.operational_constraints:
+                if constraint.side not in SIDE_ATTRIBUTES:
+                    continue
+                key = (element.id, constraint.side.value, constraint.type.value)
+                if key not in columns:
+                    columns[key] = len(columns)
+                    acceptable_durations.append(constraint.acceptable_duration)
+                positions.append((rows[element.timestamp], columns[key]))
+                limits.append(constraint.value)
+                measures.append(
+                    _measure(
+                        solved=element.element_metadata.solved,
+                        side=constraint.side,
+                        type=constraint.type,
+                    )
+                )
+
+        shape = (len(timestamps), len(columns))
+        limit_array, loadings = np.full(shape, np.nan), np.full(shape, np.nan)
+        if positions:
+            k, j = np.array(positions).T
+            limit_array[k, j] = limits
+            with np.errstate(divide="ignore", invalid="ignore"):
+                loadings[k, j] = np.array(measures) / np.array(limits)
+
+        constraints = pd.DataFrame(
+            [key + (duration,) for key, duration in zip(columns, acceptable_durations)],
+            columns=CONSTRAINT_COLUMNS,
+        )
+        constraints["acceptable_duration"] = constraints["acceptable_duration"].astype(
+            "int64"
+        )
+        return CongestionReport(
+            timestamps=timestamps,
+            constraints=constraints,
+            loadings=loadings,
+            limits=limit_array,
+            durations=timestamp_durations(timestamps=timestamps),
+        )
+
+    def run(self, network_id: str) -> CongestionReport:
+        return self.compute(network=self.network_repository.get(network_id=network_id))
@@ -0,0 +1,225 @@
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations
+from src.core.domain.models.network import Network
+from src.core.domain.models.power_flow import GridIndex, GridState, lodf
+from src.core.domain.models.power_flow.lodf import ISLANDING_TOLERANCE
+from src.core.domain.use_cases.compute_dc_flows import (
+    MAX_CHUNK_SIZE,
+    DCFlowsPipeline,
+    _chunks,
+)
+
+CONTINGENCY_COLUMNS = [
+    "timestamp",
+    "contingency_id",
+    "n_overloads",
+    "max_loading",
+    "worst_line_id",
+]
+
+# Ids of N-2 contingencies join the ids of their two lines.
+CONTINGENCY_SEPARATOR = "+"
+
+
+class ContingencyAnalysisPipeline(DCFlowsPipeline):
+    """
+    Batch N-1, or N-2, contingency analysis of every timestamp of a network in DC.
+
+    Outages are evaluated with line outage distribution factors, computed once per topology,
+    rather than solving the grid once per outage: the flows of the outaged lines are spread
+    onto the others, two outages being combined by solving their 2x2 interaction. Timestamps
+    are processed by chunks, spread over 'max_workers' threads.
+
+    Results are summarised per timestamp and contingency, only those overloading a line being
+    kept. Outages that would split the main component can't be evaluated this way and aren't
+    analysed.
+    """
+
+    def compute(
+        self,
+        network: Network,
+        depth: int = 1,
+        line_ids: list[str] | None = None,
+        max_workers: int = 1,
+    ) -> pd.DataFrame:
+        """
+        One row per timestamp and contingency overloading at least one line: the number of
+        lines overloaded, the highest loading (post-contingency flow over limit) and the line
+        reaching it. Contingencies are the outages of one line, or of two with a 'depth' of
+        2, among 'line_ids' when given, or all lines.
+        """
+
+        if depth not in (1, 2):
+            m = f"Contingencies are outages of 1 or 2 lines, not {depth}."
+            raise ValueError(m)
+
+        timestamps, grid, states = self._read_states(network=network)
+        candidates = (
+            np.arange(grid.n_lines)
+            if line_ids is None
+            else np.array([grid.line_ids.index(i) for i in line_ids], dtype=int)
+        )
+        tasks = self._tasks(
+            grid=grid, states=states, depth=depth, candidates=candidates
+        )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                executor.map(
+                    lambda task: self._analyse(*task, limits=grid.line_limits), tasks
+                )
+            )
+        if results:
+            timestamp_rows, first, second, n_overloads, max_loading, worst = (
+                np.concatenate(arrays) for arrays in zip(*results)
+            )
+        else:
+            timestamp_rows = first = second = n_overloads = worst = np.zeros(0, int)
+            max_loading = np.zeros(0)
+
+        # Ids are only built once per contingency met, as categories.
+        contingencies, contingency_codes = np.unique(
+            np.stack([first, second], axis=1), axis=0, return_inverse=True
+        )
+        contingency_ids = [
+            (
+                grid.line_ids[k]
+                if depth == 1
+                else f"{grid.line_ids[k]}{CONTINGENCY_SEPARATOR}{grid.line_ids[l]}"
+            )
+            for k, l in contingencies
+        ]
+        # Categories are ordered by id, for rows to be sorted by id.
+        order = np.argsort(np.array(contingency_ids, dtype=object))
+        ranks = np.empty_like(order)
+        ranks[order] = np.arange(len(order))
+        overloads = pd.DataFrame(
+            {
+                "timestamp": np.array(timestamps, dtype=object)[timestamp_rows],
+                "contingency_id": pd.Categorical.from_codes(
+                    ranks[contingency_codes.reshape(-1)],
+                    categories=[contingency_ids[k] for k in order],
+                ),
+                "n_overloads": n_overloads.astype("int32"),
+                "max_loading": max_loading.astype("float32"),
+                "worst_line_id": pd.Categorical.from_codes(
+                    worst, categories=grid.line_ids
+                ),
+            },
+            columns=CONTINGENCY_COLUMNS,
+        )
+        return overloads.sort_values(["timestamp", "contingency_id"]).reset_index(
+            drop=True
+        )
+
+    def _tasks(
+        self,
+        grid: GridIndex,
+        states: list[GridState],
+        depth: int,
+        candidates: np.ndarray,
+    ) -> list[tuple]:
+        """
+        Chunks of work, per topology: the timestamp positions of a chunk, their [timestamp,
+        line] pre-contingency flows, the topology's LODFs and a chunk of outages among the
+        'candidates' lines, given by their first line and, for N-2, their second one.
+        """
+
+        n_lines = grid.n_lines
+        tasks = []
+        for rows, power_flow, p_bus in self._topologies(grid=grid, states=states):
+            factors = lodf(power_flow=power_flow)[:n_lines, :n_lines]
+            flows = p_bus @ power_flow.ptdf()[:n_lines].T
+            valid = candidates[~np.isnan(np.diag(factors)[candidates])]
+            if depth == 1:
+                outages = (valid, None)
+            else:
+                pairs = np.array(list(combinations(valid, 2)), dtype=int).reshape(-1, 2)
+                outages = (pairs[:, 0], pairs[:, 1])
+
+            n_outages = len(outages[0])
+            if n_outages == 0:
+                continue
+            outage_chunk = max(1, min(n_outages, MAX_CHUNK_SIZE // n_lines))
+            row_chunk = max(1, MAX_CHUNK_SIZE // (n_lines * outage_chunk))
+            for outage_slice in _chunks(n_outages, outage_chunk):
+                chunk_outages = tuple(
+                    outage[outage_slice] if outage is not None else None
+                    for outage in outages
+                )
+                for row_slice in _chunks(len(rows), row_chunk):
+                    tasks.append(
+                        (
+                            np.asarray(rows[row_slice], dtype=int),
+                            flows[row_slice],
+                            factors,
+                            chunk_outages,
+                        )
+                    )
+        return tasks
+
+    @staticmethod
+    def _analyse(
+        rows: np.ndarray,
+        flows: np.ndarray,
+        factors: np.ndarray,
+        outages: tuple[np.ndarray, np.ndarray | None],
+        limits: np.ndarray,
+    ) -> tuple[np.ndarray, ...]:
+        """
+        Find the overloads of a chunk of [timestamp, line] pre-contingency flows, at timestamp
+        positions 'rows', after each outage of a chunk, given by its first line and, for N-2,
+        its second one. Returns, per timestamp and outage overloading a line: the timestamp's
+        position, the outage's lines (the first one twice for N-1), the number of lines
+        overloaded, the highest loading and the line reaching it.
+        """
+
+        first, second = outages
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Operations are made in place, on the [timestamp, line, contingency] flows.
+            if second is None:
+                # Flow moved from each outaged line, [timestamp, contingency].
+                loading = factors[None, :, first] * flows[:, first][:, None]
+                interacting = None
+            else:
+                factor_12, factor_21 = factors[first, second], factors[second, first]
+                determinant = 1 - factor_12 * factor_21
+                moved_1 = (flows[:, first] + factor_12 * flows[:, second]) / determinant
+                moved_2 = (flows[:, second] + factor_21 * flows[:, first]) / determinant
+                loading = factors[None, :, first] * moved_1[:, None]
+                loading += factors[None, :, second] * moved_2[:, None]
+                interacting = np.abs(determinant) >= ISLANDING_TOLERANCE
+            loading += flows[:, :, None]
+            np.abs(loading, out=loading)
+            loading /= limits[None, :, None]
+            if interacting is not None and not interacting.all():
+                loading[:, :, ~interacting] = np.nan
+            n_overloads = (loading > 1).sum(axis=1)
+
+        timestamp_rows, columns = np.nonzero(n_overloads)
+        loading = np.nan_to_num(loading[timestamp_rows, :, columns], nan=0.0)
+        worst = loading.argmax(axis=1)
+        return (
+            rows[timestamp_rows],
+            first[columns],
+            (first if second is None else second)[columns],
+            n_overloads[timestamp_rows, columns],
+            loading[np.arange(len(worst)), worst],
+            worst,
+        )
+
+    def run(
+        self,
+        network_id: str,
+        depth: int = 1,
+        line_ids: list[str] | None = None,
+        max_workers: int = 1,
+    ) -> pd.DataFrame:
+        return self.compute(
+            network=self.network_repository.get(network_id=network_id),
+            depth=depth,
+            line_ids=line_ids,
+            max_workers=max_workers,
+        )
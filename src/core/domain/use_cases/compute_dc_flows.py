@@ -0,0 +1,107 @@
+import numpy as np
+from datetime import datetime
+from typing import Iterator
+from src.core.domain.models.network import Network
+from src.core.domain.models.power_flow import (
+    SLACK_DISTRIBUTION_TOLERANCE,
+    DCFlows,
+    DCPowerFlow,
+    GridIndex,
+    GridState,
+    PowerFlowCache,
+    grid_signature,
+)
+from src.core.domain.ports.network_repository import DatabaseNetworkRepository
+
+# Values computed at once by the pipelines, e.g. [timestamp, line, contingency]
+# post-contingency flows, bounding memory.
+MAX_CHUNK_SIZE = 2**22
+
+
+def _chunks(n: int, size: int) -> list[slice]:
+    return [slice(start, min(start + size, n)) for start in range(0, n, size)]
+
+
+class DCFlowsPipeline:
+    """
+    Computes the DC flows of every timestamp of a network at once, for a fast screening of
+    congestions before running AC loadflows.
+
+    DC flows are linear in the injections, so timestamps sharing a topology are solved
+    together: their [timestamp, bus] injections are multiplied by the topology's PTDF. The
+    PTDF is only computed once per topology, and kept across runs.
+    """
+
+    def __init__(
+        self,
+        network_repository: DatabaseNetworkRepository,
+        max_topologies: int = 64,
+    ) -> None:
+        self.network_repository = network_repository
+        self.cache = PowerFlowCache(max_power_flows=max_topologies)
+
+    def compute(self, network: Network) -> DCFlows:
+        """
+        Compute DC flows of the network's lines, with the same slack distribution as the DC
+        loadflow solvers. Every timestamp must be made of the same elements.
+        """
+
+        timestamps, grid, states = self._read_states(network=network)
+
+        flows = np.full((len(timestamps), grid.n_lines), np.nan)
+        for rows, power_flow, p_bus in self._topologies(grid=grid, states=states):
+            flows[rows] = p_bus @ power_flow.ptdf()[: grid.n_lines].T
+
+        return DCFlows(
+            timestamps=timestamps,
+            line_ids=grid.line_ids,
+            flows=flows,
+            limits=grid.line_limits,
+        )
+
+    def _read_states(
+        self, network: Network
+    ) -> tuple[list[datetime], GridIndex, list[GridState]]:
+        """The network's timestamps, in order, their grid and their states."""
+
+        elements_by_timestamp = {}
+        for element in network.elements:
+            elements_by_timestamp.setdefault(element.timestamp, []).append(element)
+        timestamps = sorted(elements_by_timestamp.keys())
+
+        grid = self.cache.grid_index(elements=elements_by_timestamp[timestamps[0]])
+        states = []
+        for timestamp in timestamps:
+            elements = elements_by_timestamp[timestamp]
+            if grid_signature(elements=elements) != grid.signature:
+                m = f"Elements at {timestamp} differ from the ones at {timestamps[0]}."
+                raise ValueError(m)
+            states.append(grid.read_state(elements=elements))
+        return timestamps, grid, states
+
+    def _topologies(
+        self, grid: GridIndex, states: list[GridState]
+    ) -> Iterator[tuple[list[int], DCPowerFlow, np.ndarray]]:
+        """
+        Group states by topology, yielding the positions of each group's states, their DC
+        power flow and their [state, bus] injections. Injections of states whose mismatch
+        couldn't be distributed are NaN.
+        """
+
+        topologies = {}
+        for k, state in enumerate(states):
+            topologies.setdefault(state.branch_in_service.tobytes(), []).append(k)
+
+        for rows in topologies.values():
+            power_flow = self.cache.dc_power_flow(
+                grid=grid, branch_in_service=states[rows[0]].branch_in_service
+            )
+            _, p_bus, remaining = grid.dc_injections(
+                state=GridState.stack(states=[states[k] for k in rows]),
+                bus_in_main=power_flow.bus_in_main,
+            )
+            p_bus[np.abs(remaining) > SLACK_DISTRIBUTION_TOLERANCE] = np.nan
+            yield rows, power_flow, p_bus
+
+    def run(self, network_id: str) -> DCFlows:
+        return self.compute(network=self.network_repository.get(network_id=network_id))
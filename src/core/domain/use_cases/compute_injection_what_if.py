@@ -0,0 +1,150 @@
+import numpy as np
+from src.core.domain.models.network import Network
+from src.core.domain.models.power_flow import GridState, WhatIfFlows
+from src.core.domain.use_cases.compute_dc_flows import (
+    MAX_CHUNK_SIZE,
+    DCFlowsPipeline,
+    _chunks,
+)
+
+
+class InjectionWhatIfPipeline(DCFlowsPipeline):
+    """
+    Changes of the DC flows of every timestamp of a network under a batch of injection
+    perturbations, e.g. "load X rising by 20%", without solving the grid once per
+    perturbation.
+
+    DC flows are linear in the injections, so a perturbation changes the flows by the PTDF of
+    the perturbed elements' buses, times their change of injection, less the PTDF of the
+    generators compensating it through slack distribution. All the perturbations of all the
+    timestamps sharing a topology are computed at once, from the topology's PTDF.
+
+    Compensation follows the participation factors of the DC loadflow solvers, over the
+    generators within their active power limits at each timestamp. Limits aren't enforced on
+    the compensation itself: flows match a re-solve as long as the perturbation brings no
+    generator to its limits.
+    """
+
+    def compute(
+        self,
+        network: Network,
+        perturbations: dict[str, dict[str, float]],
+        relative: bool = True,
+    ) -> WhatIfFlows:
+        """
+        Compute the flows of the network's lines, with their changes under 'perturbations':
+        for each perturbation id, the change of active power of some loads or generators,
+        by id. With 'relative' changes, 0.2 is a 20% rise of the element's consumption, or
+        production, at each timestamp. Otherwise, changes are in MW. Elements OFF, or out of
+        the main component, aren't perturbed.
+        """
+
+        timestamps, grid, states = self._read_states(network=network)
+        perturbation_ids = list(perturbations)
+        load_changes = np.zeros((len(perturbation_ids), len(grid.load_ids)))
+        generator_changes = np.zeros((len(perturbation_ids), len(grid.generator_ids)))
+        load_index = {i: k for k, i in enumerate(grid.load_ids)}
+        generator_index = {i: k for k, i in enumerate(grid.generator_ids)}
+        for row, perturbation_id in enumerate(perturbation_ids):
+            for element_id, change in perturbations[perturbation_id].items():
+                if element_id in load_index:
+                    load_changes[row, load_index[element_id]] = change
+                elif element_id in generator_index:
+                    generator_changes[row, generator_index[element_id]] = change
+                else:
+                    m = f"{element_id} of {perturbation_id} is no load nor generator."
+                    raise ValueError(m)
+
+        n_lines = grid.n_lines
+        base_flows = np.full((len(timestamps), n_lines), np.nan)
+        deltas = np.full((len(timestamps), len(perturbation_ids), n_lines), np.nan)
+        for rows, power_flow, p_bus in self._topologies(grid=grid, states=states):
+            ptdf = power_flow.ptdf()[:n_lines]
+            base_flows[rows] = p_bus @ ptdf.T
+            state = GridState.stack(states=[states[k] for k in rows])
+
+            # Injection, in MW, added to each element by a change of 1, [state, element].
+            load_in_main = np.broadcast_to(
+                power_flow.bus_in_main[grid.load_bus], state.load_p.shape
+            )
+            load_scale = np.where(
+                load_in_main, -state.load_p if relative else -1.0, 0.0
+            )
+            generator_in_main = (
+                state.generator_on & power_flow.bus_in_main[grid.generator_bus]
+            )
+            generator_scale = np.where(
+                generator_in_main, state.p_target if relative else 1.0, 0.0
+            )
+
+            # Flows, [state, line], of 1 MW injected at participating generators, the
+            # injection being withdrawn from the perturbed elements' buses.
+            # Generators the base mismatch brought to their limits don't move anymore.
+            p_generator, _, _ = grid.dc_injections(
+                state=state, bus_in_main=power_flow.bus_in_main
+            )
+            p_min, p_max = grid.active_power_bounds(state=state)
+            participation = np.where(
+                generator_in_main
+                & grid.participating_generators(state=state)
+                & (p_generator > p_min)
+                & (p_generator < p_max),
+                grid.p_max,
+                0.0,
+            )
+            total = participation.sum(axis=1, keepdims=True)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                participation = np.where(total > 0, participation / total, np.nan)
+            compensation = participation @ ptdf[:, grid.generator_bus].T
+
+            # [state, perturbation, line], by chunks of states and perturbations: the
+            # changes of injection of a chunk, [state, perturbation, element], are
+            # contracted with the elements' PTDF columns, [element, line].
+            load_ptdf = ptdf[:, grid.load_bus].T
+            generator_ptdf = ptdf[:, grid.generator_bus].T
+            width = max(n_lines, len(grid.load_ids), len(grid.generator_ids), 1)
+            perturbation_chunk = max(
+                1, min(len(perturbation_ids), MAX_CHUNK_SIZE // width)
+            )
+            row_chunk = max(1, MAX_CHUNK_SIZE // (width * perturbation_chunk))
+            balanced = ~np.isnan(p_bus).any(axis=1)
+            for row_slice in _chunks(len(rows), row_chunk):
+                chunk_rows = rows[row_slice]
+                for perturbation_slice in _chunks(
+                    len(perturbation_ids), perturbation_chunk
+                ):
+                    loads = (
+                        load_changes[None, perturbation_slice]
+                        * load_scale[row_slice, None]
+                    )
+                    generators = (
+                        generator_changes[None, perturbation_slice]
+                        * generator_scale[row_slice, None]
+                    )
+                    delta = loads @ load_ptdf
+                    delta += generators @ generator_ptdf
+                    injected = loads.sum(axis=2) + generators.sum(axis=2)
+                    delta -= injected[:, :, None] * compensation[row_slice, None]
+                    delta[~balanced[row_slice]] = np.nan
+                    deltas[chunk_rows, perturbation_slice] = delta
+
+        return WhatIfFlows(
+            timestamps=timestamps,
+            perturbation_ids=perturbation_ids,
+            line_ids=grid.line_ids,
+            base_flows=base_flows,
+            deltas=deltas,
+            limits=grid.line_limits,
+        )
+
+    def run(
+        self,
+        network_id: str,
+        perturbations: dict[str, dict[str, float]],
+        relative: bool = True,
+    ) -> WhatIfFlows:
+        return self.compute(
+            network=self.network_repository.get(network_id=network_id),
+            perturbations=perturbations,
+            relative=relative,
+        )
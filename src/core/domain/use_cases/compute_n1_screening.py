@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+from src.core.domain.models.network import Network
+from src.core.domain.use_cases.compute_contingency_analysis import (
+    ContingencyAnalysisPipeline,
+)
+
+OVERLOAD_COLUMNS = ["timestamp", "contingency_id", "line_id", "p1", "limit"]
+
+
+class N1ScreeningPipeline(ContingencyAnalysisPipeline):
+    """
+    Screens the N-1 security of every timestamp of a network in DC: the outage of each line
+    in service is evaluated with line outage distribution factors, without solving the grid
+    once per outage.
+
+    Contingencies are those of a ContingencyAnalysisPipeline of depth 1, but every line
+    they overload is reported rather than a summary. Outages that would split the main
+    component can't be evaluated this way and aren't screened.
+    """
+
+    def compute(self, network: Network) -> pd.DataFrame:
+        """
+        One row per timestamp, line outage (the contingency) and line overloaded after it,
+        with the line's post-contingency flow and limit.
+        """
+
+        timestamps, grid, states = self._read_states(network=network)
+        tasks = self._tasks(
+            grid=grid, states=states, depth=1, candidates=np.arange(grid.n_lines)
+        )
+        overloads = [self._screen(*task, limits=grid.line_limits) for task in tasks]
+        if overloads:
+            timestamp_rows, contingencies, lines, post_flows = (
+                np.concatenate(arrays) for arrays in zip(*overloads)
+            )
+        else:
+            timestamp_rows = contingencies = lines = np.zeros(0, int)
+            post_flows = np.zeros(0)
+
+        return (
+            pd.DataFrame(
+                {
+                    "timestamp": np.array(timestamps, dtype=object)[timestamp_rows],
+                    "contingency_id": np.array(grid.line_ids, dtype=object)[
+                        contingencies
+                    ],
+                    "line_id": np.array(grid.line_ids, dtype=object)[lines],
+                    "p1": post_flows,
+                    "limit": grid.line_limits[lines],
+                },
+                columns=OVERLOAD_COLUMNS,
+            )
+            .sort_values(["timestamp", "contingency_id", "line_id"])
+            .reset_index(drop=True)
+        )
+
+    @staticmethod
+    def _screen(
+        rows: np.ndarray,
+        flows: np.ndarray,
+        factors: np.ndarray,
+        outages: tuple[np.ndarray, None],
+        limits: np.ndarray,
+    ) -> tuple[np.ndarray, ...]:
+        """
+        Find the overloads of a chunk of [timestamp, line] pre-contingency flows, at timestamp
+        positions 'rows', after each line outage of a chunk. Returns, per overload, the
+        timestamp's position, the outaged line, the line overloaded and its flow.
+        """
+
+        first, _ = outages
+        # [timestamp, line, contingency] flows once each contingency's flow is spread.
+        post_flows = (
+            flows[:, :, None] + factors[None, :, first] * flows[:, first][:, None]
+        )
+        with np.errstate(invalid="ignore"):
+            timestamp_rows, lines, columns = np.nonzero(
+                np.abs(post_flows) > limits[None, :, None]
+            )
+        return (
+            rows[timestamp_rows],
+            first[columns],
+            lines,
+            post_flows[timestamp_rows, lines, columns],
+        )
+
+    def run(self, network_id: str) -> pd.DataFrame:
+        return self.compute(network=self.network_repository.get(network_id=network_id))
@@ -0,0 +1,158 @@
+import structlog
+from datetime import datetime
+from src.core.domain.enums import LoadFlowStatus, LoadFlowType
+from src.core.domain.models.element import NetworkElement
+from src.core.domain.ports.loadflow_solver import LoadFlowSolver
+from src.core.domain.ports.network_builder import NetworkBuilder
+from src.core.domain.ports.network_repository import DatabaseNetworkRepository
+from src.core.utils import generate_hash
+
+logger = structlog.get_logger(__name__)
+
+SIMULATED_SUFFIX = "_simulated"
+SOLVED_SUFFIX = "_solved"
+
+
+def solved_network_id(network_id: str) -> str:
+    """Id of the network holding the solved states of a '<network>_simulated' one."""
+    return f"{network_id.removesuffix(SIMULATED_SUFFIX)}{SOLVED_SUFFIX}"
+
+
+def _with_network_id(element: NetworkElement, network_id: str) -> NetworkElement:
+    """
+    Copy of an element belonging to another network. Uids of elements and of their
+    constraints only depend on ids and timestamps, so they are made unique to the network.
+    """
+
+    uid = generate_hash(s=f"{element.uid}_{network_id}")
+    return element.model_copy(
+        update={
+            "uid": uid,
+            "network_id": network_id,
+            "operational_constraints": [
+                constraint.model_copy(
+                    update={
+                        "uid": generate_hash(
+                            f"{uid}_{constraint.side.value}_{constraint.type.value}"
+                        ),
+                        "element_uid": uid,
+                    }
+                )
+                for constraint in element.operational_constraints
+            ],
+        }
+    )
+
+
+class SolvedNetworkPipeline:
+    """
+    Solves every timestamp of a simulated network offline, and persists the solved states as
+    a new network, '<network>_solved', for training and analytics to read instead of solving.
+
+    Timestamps are solved by checkpoints of 'checkpoint_size', each persisted once solved, so
+    that an interrupted run resumes where it stopped: timestamps already in the solved network
+    are skipped. Only converged timestamps are persisted, others being tried again on the next
+    run. Timestamps of a checkpoint are spread over workers as the solver is configured to.
+    Elements the solver doesn't return, e.g. buses, are persisted as they are.
+    """
+
+    def __init__(
+        self,
+        network_repository: DatabaseNetworkRepository,
+        network_builder: NetworkBuilder,
+        loadflow_solver: LoadFlowSolver,
+    ) -> None:
+        self.network_repository = network_repository
+        self.network_builder = network_builder
+        self.loadflow_solver = loadflow_solver
+
+    def run(
+        self,
+        network_id: str,
+        loadflow_type: LoadFlowType = LoadFlowType.AC,
+        checkpoint_size: int = 24,
+    ) -> dict[datetime, LoadFlowStatus]:
+        """
+        Solve the timestamps of the network not solved yet. Returns the convergence status of
+        each timestamp solved by this run.
+        """
+
+        elements = self.network_repository.get_elements(network_id=network_id)
+        if not elements:
+            m = f"Network {network_id} has no elements to solve."
+            raise ValueError(m)
+        elements_by_timestamp = {}
+        for element in elements:
+            elements_by_timestamp.setdefault(element.timestamp, []).append(element)
+
+        solved_id = solved_network_id(network_id=network_id)
+        if solved_id in self.network_repository.list_available_networks():
+            solved_timestamps = set(
+                self.network_repository.list_timestamps(network_id=solved_id)
+            )
+        else:
+            self.network_repository.add(
+                network=self.network_builder.from_elements(id=solved_id, elements=[])
+            )
+            solved_timestamps = set()
+        timestamps = sorted(set(elements_by_timestamp) - solved_timestamps)
+        logger.info(
+            "Solving network.",
+            network_id=network_id,
+            solved_network_id=solved_id,
+            timestamps=len(timestamps),
+            skipped_timestamps=len(elements_by_timestamp) - len(timestamps),
+        )
+
+        loadflow_statuses = {}
+        for start in range(0, len(timestamps), checkpoint_size):
+            checkpoint = timestamps[start : start + checkpoint_size]
+            solved_network = self.loadflow_solver.solve(
+                network=self.network_builder.from_elements(
+                    id=network_id,
+                    elements=[e for t in checkpoint for e in elements_by_timestamp[t]],
+                ),
+                loadflow_type=loadflow_type,
+            )
+            statuses = self.loadflow_solver.get_loadflow_statuses()
+            # Timestamps the solver doesn't report the convergence of are kept.
+            converged = {
+                t
+                for t in checkpoint
+                if statuses.get(t, LoadFlowStatus.CONVERGED) == LoadFlowStatus.CONVERGED
+            }
+            solved_elements = [
+                element
+                for element in solved_network.elements
+                if element.timestamp in converged
+            ]
+            # Elements the solver doesn't return, e.g. buses, are kept as is.
+            solved_keys = {
+                (element.id, element.timestamp) for element in solved_elements
+            }
+            solved_elements.extend(
+                element
+                for t in sorted(converged)
+                for element in elements_by_timestamp[t]
+                if (element.id, t) not in solved_keys
+            )
+            self.network_repository.add_elements(
+                elements=[
+                    _with_network_id(element=element, network_id=solved_id)
+                    for element in solved_elements
+                ]
+            )
+            loadflow_statuses.update(
+                {t: statuses[t] for t in checkpoint if t in statuses}
+            )
+            logger.info(
+                "Checkpoint solved.",
+                solved_network_id=solved_id,
+                first_timestamp=checkpoint[0],
+                last_timestamp=checkpoint[-1],
+                converged=len(converged),
+                failed=len(checkpoint) - len(converged),
+                progress=f"{start + len(checkpoint)}/{len(timestamps)}",
+            )
+
+        return loadflow_statuses
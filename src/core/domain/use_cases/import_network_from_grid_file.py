@@ -0,0 +1,57 @@
+from pathlib import Path
+from src.core.domain.models.network import Network
+from src.core.domain.ports.network_repository import DatabaseNetworkRepository
+from src.core.domain.ports.network_builder import NetworkBuilder
+from src.core.domain.ports.network_importer import NetworkImporter
+
+
+class GridFileETLPipeline:
+    """
+    This pipeline ingests a grid file, in any format supported by the NetworkImporter
+    (XIIDM, MATPOWER, CGMES, UCTE...), into the NetworkElement table in the database.
+    Elements are imported as 'STATIC', as a layout ready to be simulated.
+    """
+
+    def __init__(
+        self,
+        network_repository: DatabaseNetworkRepository,
+        network_builder: NetworkBuilder,
+        network_importer: NetworkImporter,
+    ) -> None:
+        self.network_repository = network_repository
+        self.network_builder = network_builder
+        self.network_importer = network_importer
+
+    def extract_and_transform(self, file_path: Path, network_id: str) -> Network:
+        """
+        Read the grid file and build a Network from its elements.
+
+        Args:
+            file_path (Path): Path to the grid file.
+            network_id (str): The id to give to the imported network.
+
+        Returns:
+            Network: The imported network.
+        """
+        elements = self.network_importer.import_elements(
+            file_path=file_path, network_id=network_id
+        )
+        return self.network_builder.from_elements(id=network_id, elements=elements)
+
+    def run(self, file_path: Path, network_id: str | None = None) -> None:
+        """
+        Run the pipeline.
+
+        Args:
+            file_path (Path): Path to the grid file.
+            network_id (str | None): Id of the network, defaults to the file name.
+        """
+        print("Starting grid file import...")
+        network = self.extract_and_transform(
+            file_path=file_path,
+            network_id=network_id if network_id is not None else Path(file_path).stem,
+        )
+        print(f"Extracted {len(network.elements)} records.")
+
+        self.network_repository.add(network=network)
+        print("Grid file import completed successfully.")
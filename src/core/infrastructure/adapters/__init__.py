@@ -2,22 +2,27 @@ from src.core.domain.ports.network_repository import DatabaseNetworkRepository
 from src.core.domain.ports.loadflow_solver import LoadFlowSolver
 from src.core.domain.ports.visualiser import Visualiser
 from src.core.domain.ports.network_builder import NetworkBuilder
+from src.core.domain.ports.network_importer import NetworkImporter
 from src.core.infrastructure.adapters.sqlite_network_repository import (
     SQLiteNetworkRepository,
 )
-from src.core.infrastructure.adapters.pypowsybl_loadflow_solver import (
-    PyPowSyblLoadFlowSolver,
-)
 from src.core.infrastructure.adapters.network_builder import DefaultNetworkBuilder
+from src.core.infrastructure.adapters.pypowsybl_network_importer import (
+    PyPowSyblNetworkImporter,
+)
 from src.core.domain.ports import Ports
 from src.core.infrastructure.settings import Settings
+from src.core.infrastructure.loadflow_solver_factory import LoadFlowSolverFactory
 from src.core.infrastructure.services import PyPowsyblCompatService
+from src.core.infrastructure.services.loadflow_service import LoadFlowService
 
 
 class Adapters(Ports):
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
         self.to_pypowsybl_converter_service = PyPowsyblCompatService()
+        self.loadflow_solver_factory = LoadFlowSolverFactory(settings=settings)
+        self.metrics_sink = self.loadflow_solver_factory.metrics_sink
 
     def network_repository(self) -> DatabaseNetworkRepository:
         return SQLiteNetworkRepository(
@@ -29,7 +34,16 @@ class Adapters(Ports):
         return DefaultNetworkBuilder()
 
     def loadflow_solver_repository(self) -> LoadFlowSolver:
-        return PyPowSyblLoadFlowSolver(
+        return self.loadflow_solver_factory.loadflow_solver()
+
+    def loadflow_service(
+        self, max_batch_size: int = 64, batch_window: float = 0.002
+    ) -> LoadFlowService:
+        return self.loadflow_solver_factory.loadflow_service(
+            max_batch_size=max_batch_size, batch_window=batch_window
+        )
+
+    def network_importer(self) -> NetworkImporter:
+        return PyPowSyblNetworkImporter(
             to_pypowsybl_converter_service=self.to_pypowsybl_converter_service,
-            network_builder=DefaultNetworkBuilder(),
         )
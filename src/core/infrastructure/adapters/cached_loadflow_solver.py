@@ -0,0 +1,341 @@
+import pickle
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from pydantic import BaseModel
+from src.core.constants import State, SupportedNetworkElementTypes
+from src.core.domain.enums import LoadFlowStatus, LoadFlowType
+from src.core.domain.models.element import NetworkElement, same_grid
+from src.core.domain.models.network import Network
+from src.core.domain.models.network_delta import NetworkDelta
+from src.core.domain.models.solve_metrics import SolveMetrics
+from src.core.domain.ports.loadflow_solver import LoadFlowSolver
+from src.core.domain.ports.network_builder import NetworkBuilder
+from src.core.utils import generate_hash
+
+# What is kept per solved timestamp: its status, and per output element its id with, when
+# solved, its solved attributes class and values. Unsolved elements are returned as given.
+CacheEntry = tuple[
+    LoadFlowStatus | None, list[tuple[str, type[BaseModel] | None, tuple | None]]
+]
+
+
+class LoadFlowCacheStats(BaseModel):
+    """Counters of a loadflow cache, per timestamp looked up."""
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def grid_key(elements: list[NetworkElement]) -> str:
+    """
+    Content hash of the grid formed by the elements of a timestamp: their static attributes,
+    statuses aside, and operational constraints, for grids re-imported or sharing element
+    ids with another one not to share results. Statuses are part of 'loadflow_key'.
+    """
+
+    items = []
+    for element in elements:
+        static = element.element_metadata.static.model_dump(
+            mode="json", exclude={"status"}
+        )
+        items.append(
+            (
+                element.type.value,
+                element.id,
+                sorted(static.items()),
+                sorted(
+                    (c.element_id, c.side.value, c.type.value, c.value)
+                    for c in element.operational_constraints
+                ),
+            )
+        )
+    return generate_hash(s=repr(sorted(items)))
+
+
+class GridKeys:
+    """
+    Grid keys, see 'grid_key', of the 'max_grids' grids met most recently, so that the
+    timestamps of a known grid are only compared with it, see 'same_grid', rather than
+    hashed again.
+    """
+
+    def __init__(self, max_grids: int = 8) -> None:
+        self.max_grids = max_grids
+        self._grids: list[tuple[list[NetworkElement], str]] = []
+
+    def get(self, elements: list[NetworkElement]) -> str:
+        for i, (grid_elements, key) in enumerate(self._grids):
+            if same_grid(elements=elements, other=grid_elements):
+                del self._grids[i]
+                break
+        else:
+            key = grid_key(elements=elements)
+        # Latest elements are kept, for the next timestamps to be compared by identity.
+        self._grids.insert(0, (elements, key))
+        del self._grids[self.max_grids :]
+        return key
+
+
+def loadflow_key(
+    elements: list[NetworkElement],
+    loadflow_type: LoadFlowType,
+    solver: str,
+    grid: str,
+) -> str:
+    """
+    Canonical hash of what a loadflow result depends on for a timestamp: the solver giving
+    it, e.g. its class name, the loadflow type, the grid, see 'grid_key', the statuses of
+    lines and generators and the injections of loads and generators.
+    """
+
+    items = []
+    for element in elements:
+        metadata = element.element_metadata
+        if element.type == SupportedNetworkElementTypes.LOAD:
+            item = (metadata.dynamic.Pd, metadata.dynamic.Qd)
+        elif element.type == SupportedNetworkElementTypes.GENERATOR:
+            item = (
+                metadata.static.status.value,
+                metadata.dynamic.Ptarget,
+                metadata.dynamic.Vtarget,
+                metadata.dynamic.Qtarget,
+                metadata.dynamic.Srated,
+            )
+        elif element.type == SupportedNetworkElementTypes.LINE:
+            item = (metadata.static.status.value,)
+        else:
+            continue
+        items.append((element.type.value, element.id, item))
+
+    return generate_hash(s=repr((solver, loadflow_type.value, grid, sorted(items))))
+
+
+def to_entry(
+    elements: list[NetworkElement], status: LoadFlowStatus | None
+) -> CacheEntry:
+    return (
+        status,
+        [
+            (
+                (
+                    element.id,
+                    type(element.element_metadata.solved),
+                    tuple(element.element_metadata.solved.model_dump().values()),
+                )
+                if element.element_metadata.state == State.SOLVED
+                else (element.id, None, None)
+            )
+            for element in elements
+        ],
+    )
+
+
+def from_entry(
+    entry: CacheEntry, elements: list[NetworkElement], network_id: str
+) -> list[NetworkElement]:
+    """Rebuild the solved elements of a timestamp from the given, unsolved, ones."""
+
+    elements_by_id = {element.id: element for element in elements}
+    solved_elements = []
+    for element_id, solved_cls, values in entry[1]:
+        element = elements_by_id[element_id]
+        if solved_cls is None:
+            solved_elements.append(element)
+            continue
+        solved_elements.append(
+            NetworkElement(
+                uid=element.uid,
+                id=element.id,
+                timestamp=element.timestamp,
+                type=element.type,
+                element_metadata=type(element.element_metadata)(
+                    state=State.SOLVED,
+                    static=element.element_metadata.static,
+                    dynamic=element.element_metadata.dynamic,
+                    solved=solved_cls(**dict(zip(solved_cls.model_fields, values))),
+                ),
+                network_id=network_id,
+                operational_constraints=element.operational_constraints,
+            )
+        )
+    return solved_elements
+
+
+class CachedLoadFlowSolver(LoadFlowSolver):
+    """
+    Memoizing loadflow solver, in front of another LoadFlowSolver. Results are cached per
+    timestamp, so that only timestamps never seen before reach the solver. The most recently
+    used 'max_entries' results are kept in memory; with a 'cache_dir', every result is also
+    written to disk and looked up there on a memory miss.
+    """
+
+    def __init__(
+        self,
+        loadflow_solver: LoadFlowSolver,
+        network_builder: NetworkBuilder,
+        max_entries: int = 10_000,
+        cache_dir: Path | None = None,
+    ) -> None:
+        self.loadflow_solver = loadflow_solver
+        self.network_builder = network_builder
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._stats = LoadFlowCacheStats()
+        self._loadflow_statuses: dict[datetime, LoadFlowStatus] = {}
+        self._grid_keys = GridKeys()
+        self._delta: NetworkDelta | None = None
+
+    def reset(self) -> None:
+        """Reset the underlying solver, cached results being kept across episodes."""
+        self.loadflow_solver.reset()
+
+    def shutdown(self) -> None:
+        self.loadflow_solver.shutdown()
+
+    def get_loadflow_statuses(self) -> dict[datetime, LoadFlowStatus]:
+        return dict(self._loadflow_statuses)
+
+    def get_iterations(self) -> dict[datetime, int]:
+        """Iterations of the timestamps the last solve didn't find in the cache."""
+        return self.loadflow_solver.get_iterations()
+
+    def get_metrics(self) -> SolveMetrics | None:
+        """What the underlying solver's last solve, of cache misses only, cost."""
+        return self.loadflow_solver.get_metrics()
+
+    def get_stats(self) -> LoadFlowCacheStats:
+        return self._stats.model_copy()
+
+    def clear(self) -> None:
+        """Empty the in memory tier and the counters. The disk tier is left as is."""
+        self._entries.clear()
+        self._stats = LoadFlowCacheStats()
+
+    def _get(self, key: str) -> CacheEntry | None:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        if self.cache_dir is not None and (self.cache_dir / f"{key}.pkl").exists():
+            with open(self.cache_dir / f"{key}.pkl", "rb") as f:
+                entry = pickle.load(f)
+            self._stats.disk_hits += 1
+            self._put(key=key, entry=entry, write_to_disk=False)
+            return entry
+
+        return None
+
+    def _put(self, key: str, entry: CacheEntry, write_to_disk: bool = True) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+        if write_to_disk and self.cache_dir is not None:
+            with open(self.cache_dir / f"{key}.pkl", "wb") as f:
+                pickle.dump(entry, f)
+
+    def solve_delta(
+        self, network: Network, delta: NetworkDelta, loadflow_type: LoadFlowType
+    ) -> Network:
+        """
+        Solve a single timestamp network reached by 'delta' from the one solved last, the
+        underlying solver being given the delta on a cache miss.
+        """
+
+        self._delta = delta
+        try:
+            return self.solve(network=network, loadflow_type=loadflow_type)
+        finally:
+            self._delta = None
+
+    def solve(self, network: Network, loadflow_type: LoadFlowType) -> Network:
+        """
+        Return cached results for the timestamps already seen, solving the others at once
+        through the underlying solver, and timestamps sharing the same inputs only once.
+        Only converged results, or results of solvers not reporting a status, are cached.
+        """
+
+        elements_by_timestamp = {}
+        for element in network.elements:
+            elements_by_timestamp.setdefault(element.timestamp, []).append(element)
+
+        keys, entries, missed_keys, missed_elements = {}, {}, set(), []
+        for timestamp, timestamp_elements in elements_by_timestamp.items():
+            keys[timestamp] = loadflow_key(
+                elements=timestamp_elements,
+                loadflow_type=loadflow_type,
+                solver=type(self.loadflow_solver).__name__,
+                grid=self._grid_keys.get(elements=timestamp_elements),
+            )
+            if keys[timestamp] in missed_keys:
+                self._stats.hits += 1
+                continue
+            entry = self._get(key=keys[timestamp])
+            if entry is None:
+                self._stats.misses += 1
+                missed_keys.add(keys[timestamp])
+                missed_elements.extend(timestamp_elements)
+            else:
+                self._stats.hits += 1
+                entries[timestamp] = entry
+
+        solved_entries, self._loadflow_statuses = {}, {}
+        if missed_elements:
+            missed_network = self.network_builder.from_elements(
+                id=network.id, elements=missed_elements
+            )
+            if self._delta is not None:
+                solved_network = self.loadflow_solver.solve_delta(
+                    network=missed_network,
+                    delta=self._delta,
+                    loadflow_type=loadflow_type,
+                )
+            else:
+                solved_network = self.loadflow_solver.solve(
+                    network=missed_network, loadflow_type=loadflow_type
+                )
+            statuses = self.loadflow_solver.get_loadflow_statuses()
+            solved_by_timestamp = {}
+            for element in solved_network.elements:
+                solved_by_timestamp.setdefault(element.timestamp, []).append(element)
+            for timestamp, solved_elements in solved_by_timestamp.items():
+                entry = to_entry(
+                    elements=solved_elements, status=statuses.get(timestamp)
+                )
+                solved_entries[keys[timestamp]] = entry
+                if entry[0] in [None, LoadFlowStatus.CONVERGED]:
+                    self._put(key=keys[timestamp], entry=entry)
+
+        elements = []
+        for timestamp in sorted(elements_by_timestamp.keys()):
+            entry = entries.get(timestamp) or solved_entries.get(keys[timestamp])
+            if entry is None:
+                # Nothing returned by the solver for the timestamp: no result, nor status.
+                entry = (
+                    None,
+                    [(e.id, None, None) for e in elements_by_timestamp[timestamp]],
+                )
+            elements.extend(
+                from_entry(
+                    entry=entry,
+                    elements=elements_by_timestamp[timestamp],
+                    network_id=network.id,
+                )
+            )
+            if entry[0] is not None:
+                self._loadflow_statuses[timestamp] = entry[0]
+
+        return self.network_builder.from_elements(id=network.id, elements=elements)
@@ -0,0 +1,69 @@
+import pandas as pd
+
+from src.core.domain.enums import LoadFlowType, SolvePhase
+from src.core.domain.models.solve_metrics import SolveMetrics
+from src.core.domain.ports.metrics_sink import MetricsSink
+
+SUMMARY_COLUMNS = [
+    "calls",
+    "total_seconds",
+    "mean_seconds",
+    "max_seconds",
+    "seconds_per_timestamp",
+    "share",
+]
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """
+    Keeps the metrics of solver calls in memory, the 'max_records' most recent ones when
+    given, and aggregates them per phase through 'summary'.
+    """
+
+    def __init__(self, max_records: int | None = None) -> None:
+        self.max_records = max_records
+        self.records: list[SolveMetrics] = []
+
+    def record(self, metrics: SolveMetrics) -> None:
+        self.records.append(metrics)
+        if self.max_records is not None and len(self.records) > self.max_records:
+            del self.records[: len(self.records) - self.max_records]
+
+    def clear(self) -> None:
+        self.records = []
+
+    def summary(self, loadflow_type: LoadFlowType | None = None) -> pd.DataFrame:
+        """
+        Wall time per phase over the recorded calls, of 'loadflow_type' only when given: total,
+        mean and max per call, per timestamp solved, and share of the time of all phases.
+        """
+
+        records = [
+            metrics
+            for metrics in self.records
+            if loadflow_type is None or metrics.loadflow_type == loadflow_type
+        ]
+        n_timestamps = sum(metrics.n_timestamps for metrics in records)
+        seconds = pd.DataFrame(
+            [
+                [metrics.phase_seconds.get(phase, 0.0) for phase in SolvePhase]
+                for metrics in records
+            ],
+            columns=[phase.value for phase in SolvePhase],
+            dtype=float,
+        )
+
+        total = seconds.sum()
+        summary = pd.DataFrame(
+            {
+                "calls": len(records),
+                "total_seconds": total,
+                "mean_seconds": seconds.mean(),
+                "max_seconds": seconds.max(),
+                "seconds_per_timestamp": total / n_timestamps if n_timestamps else 0.0,
+                "share": total / total.sum() if total.sum() > 0 else 0.0,
+            },
+            columns=SUMMARY_COLUMNS,
+        )
+        summary.index.name = "phase"
+        return summary
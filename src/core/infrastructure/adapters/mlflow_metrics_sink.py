@@ -0,0 +1,41 @@
+import mlflow
+
+from src.core.domain.models.solve_metrics import SolveMetrics
+from src.core.domain.ports.metrics_sink import MetricsSink
+
+
+class MLflowMetricsSink(MetricsSink):
+    """
+    Logs the metrics of each solver call to the active MLflow run, one step per call, under
+    keys prefixed with 'prefix'.
+    """
+
+    def __init__(self, prefix: str = "loadflow") -> None:
+        self.prefix = prefix
+        self._step = 0
+
+    def record(self, metrics: SolveMetrics) -> None:
+        values = {
+            "seconds": metrics.seconds,
+            "n_timestamps": metrics.n_timestamps,
+            "n_elements": metrics.n_elements,
+            "iterations": metrics.iterations,
+            "warm_starts": metrics.warm_starts,
+            "warm_start_fallbacks": metrics.warm_start_fallbacks,
+            **{
+                f"{phase.value.lower()}_seconds": seconds
+                for phase, seconds in metrics.phase_seconds.items()
+            },
+            **{
+                f"{status.value.lower()}_timestamps": count
+                for status, count in metrics.statuses.items()
+            },
+        }
+        mlflow.log_metrics(
+            {
+                f"{self.prefix}.{metrics.loadflow_type.value.lower()}.{key}": value
+                for key, value in values.items()
+            },
+            step=self._step,
+        )
+        self._step += 1
@@ -0,0 +1,208 @@
+from collections import OrderedDict
+from datetime import datetime
+import numpy as np
+
+from src.core.domain.enums import LoadFlowStatus, LoadFlowType
+from src.core.domain.models.element import NetworkElement
+from src.core.domain.models.elements_metadata.generator import (
+    GeneratorSolvedAttributes,
+)
+from src.core.domain.models.elements_metadata.line import LineSolvedAttributes
+from src.core.domain.models.elements_metadata.load import LoadSolvedAttributes
+from src.core.domain.models.network import Network
+from src.core.domain.models.power_flow import PowerFlowCache, solve_ac_power_flow
+from src.core.domain.models.power_flow.ac import (
+    MAX_NEWTON_RAPHSON_ITERATIONS,
+    NEWTON_RAPHSON_TOLERANCE,
+)
+from src.core.domain.ports.loadflow_solver import LoadFlowSolver
+from src.core.domain.ports.network_builder import NetworkBuilder
+from src.core.infrastructure.adapters.numpy_dc_loadflow_solver import (
+    NAN,
+    _solved_element,
+)
+
+
+def _current(s: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Current, in A, of apparent powers 's' (MVA) at voltages 'v' (kV)."""
+    return np.abs(s) / (np.sqrt(3) * np.abs(v)) * 1000
+
+
+class NumpyACLoadFlowSolver(LoadFlowSolver):
+    """
+    In process AC loadflow solver, by Newton-Raphson on numpy and scipy.
+
+    The grid is indexed once per set of elements, and its admittance matrices, with the
+    symbolic analysis of the Jacobian, are built once per topology. The 'max_factorisations'
+    most recently used topologies are kept. With 'warm_start', each timestamp starts from
+    the voltages of the previous timestamp solved on the same grid, which usually saves
+    iterations over a flat start. 'reset' forgets them.
+
+    Results follow pypowsybl's AC loadflow: the mismatch is distributed over generators
+    proportionally to their Pmax, and only the main connected component is solved. DC
+    solves are delegated to 'dc_loadflow_solver'.
+    """
+
+    def __init__(
+        self,
+        network_builder: NetworkBuilder,
+        dc_loadflow_solver: LoadFlowSolver | None = None,
+        max_factorisations: int = 64,
+        warm_start: bool = True,
+        tolerance: float = NEWTON_RAPHSON_TOLERANCE,
+        max_iterations: int = MAX_NEWTON_RAPHSON_ITERATIONS,
+    ) -> None:
+        self.network_builder = network_builder
+        self.dc_loadflow_solver = dc_loadflow_solver
+        self.cache = PowerFlowCache(max_power_flows=max_factorisations)
+        self.warm_start = warm_start
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        # Voltages of the last solve of each grid, as many as the power flows kept.
+        self._voltages: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        self._loadflow_statuses: dict[datetime, LoadFlowStatus] = {}
+        self._iterations: dict[datetime, int] = {}
+
+    def reset(self) -> None:
+        """Forget the voltages kept for warm starts."""
+        self._voltages = OrderedDict()
+        if self.dc_loadflow_solver is not None:
+            self.dc_loadflow_solver.reset()
+
+    def shutdown(self) -> None:
+        if self.dc_loadflow_solver is not None:
+            self.dc_loadflow_solver.shutdown()
+
+    def get_loadflow_statuses(self) -> dict[datetime, LoadFlowStatus]:
+        return dict(self._loadflow_statuses)
+
+    def get_iterations(self) -> dict[datetime, int]:
+        """Newton-Raphson iterations run for each timestamp of the last AC solve."""
+        return dict(self._iterations)
+
+    def _solve_timestamp(
+        self, elements: list[NetworkElement], network_id: str
+    ) -> tuple[list[NetworkElement], LoadFlowStatus, int]:
+        """
+        Solve the elements of a timestamp. Those with non finite injections are returned
+        unsolved, as FAILED. Timestamps that don't converge, or whose mismatch can't be
+        distributed, get NaN results, as with pypowsybl.
+        """
+
+        grid = self.cache.grid_index(elements=elements)
+        state = grid.read_state(elements=elements)
+        generator_on = state.generator_on
+        if not (
+            np.isfinite(state.p_target[generator_on]).all()
+            and np.isfinite(state.v_target[generator_on]).all()
+            and np.isfinite(state.q_target[generator_on]).all()
+            and np.isfinite(state.load_p).all()
+            and np.isfinite(state.load_q).all()
+        ):
+            return elements, LoadFlowStatus.FAILED, 0
+        power_flow = self.cache.ac_power_flow(
+            grid=grid, branch_in_service=state.branch_in_service
+        )
+
+        solution = solve_ac_power_flow(
+            grid=grid,
+            state=state,
+            power_flow=power_flow,
+            v0=self._voltages.get(grid.signature) if self.warm_start else None,
+            tolerance=self.tolerance,
+            max_iterations=self.max_iterations,
+        )
+        converged = solution.status == LoadFlowStatus.CONVERGED
+        if converged:
+            self._voltages[grid.signature] = solution.v
+            self._voltages.move_to_end(grid.signature)
+            while len(self._voltages) > self.cache.max_power_flows:
+                self._voltages.popitem(last=False)
+
+        v = solution.v * grid.bus_vnominal  # kV
+        s1, s2 = power_flow.branch_powers(v=solution.v)
+        s_generator = solution.p_generator + 1j * solution.q_generator
+        load_in_main = power_flow.bus_in_main[grid.load_bus] & converged
+        s_load = np.where(load_in_main, state.load_p + 1j * state.load_q, np.nan)
+
+        solved_elements, off_elements = [], []
+        for k, position in enumerate(grid.generator_positions):
+            if not generator_on[k]:
+                off_elements.append(elements[position])
+                continue
+            solved_elements.append(
+                _solved_element(
+                    element=elements[position],
+                    solved=GeneratorSolvedAttributes(
+                        p=-s_generator[k].real,
+                        q=-s_generator[k].imag,
+                        i=_current(s=s_generator[k], v=v[grid.generator_bus[k]]),
+                        connected=True,
+                    ),
+                    network_id=network_id,
+                )
+            )
+        for k, position in enumerate(grid.line_positions):
+            if not state.branch_in_service[k]:
+                off_elements.append(elements[position])
+                continue
+            solved_elements.append(
+                _solved_element(
+                    element=elements[position],
+                    solved=LineSolvedAttributes(
+                        p1=s1[k].real,
+                        q1=s1[k].imag,
+                        i1=_current(s=s1[k], v=v[grid.from_bus[k]]),
+                        p2=s2[k].real,
+                        q2=s2[k].imag,
+                        i2=_current(s=s2[k], v=v[grid.to_bus[k]]),
+                    ),
+                    network_id=network_id,
+                )
+            )
+        for k, position in enumerate(grid.load_positions):
+            solved_elements.append(
+                _solved_element(
+                    element=elements[position],
+                    solved=LoadSolvedAttributes(
+                        p=s_load[k].real if load_in_main[k] else NAN,
+                        q=s_load[k].imag if load_in_main[k] else NAN,
+                        i=_current(s=s_load[k], v=v[grid.load_bus[k]]),
+                    ),
+                    network_id=network_id,
+                )
+            )
+        return solved_elements + off_elements, solution.status, solution.iterations
+
+    def solve(self, network: Network, loadflow_type: LoadFlowType) -> Network:
+        """
+        Solve each timestamp of the network, in order, convergence of each timestamp being
+        available through 'get_loadflow_statuses' afterwards.
+        """
+
+        if loadflow_type != LoadFlowType.AC:
+            if self.dc_loadflow_solver is None:
+                m = f"{type(self).__name__} only solves {LoadFlowType.AC} loadflows."
+                raise ValueError(m)
+            solved_network = self.dc_loadflow_solver.solve(
+                network=network, loadflow_type=loadflow_type
+            )
+            self._loadflow_statuses = self.dc_loadflow_solver.get_loadflow_statuses()
+            return solved_network
+
+        elements_by_timestamp = {}
+        for element in network.elements:
+            elements_by_timestamp.setdefault(element.timestamp, []).append(element)
+
+        elements, self._loadflow_statuses, self._iterations = [], {}, {}
+        for timestamp in sorted(elements_by_timestamp.keys()):
+            (
+                solved_elements,
+                self._loadflow_statuses[timestamp],
+                self._iterations[timestamp],
+            ) = self._solve_timestamp(
+                elements=elements_by_timestamp[timestamp], network_id=network.id
+            )
+            elements.extend(solved_elements)
+
+        return self.network_builder.from_elements(id=network.id, elements=elements)
@@ -0,0 +1,191 @@
+from datetime import datetime
+import numpy as np
+
+from src.core.constants import State
+from src.core.domain.enums import LoadFlowStatus, LoadFlowType
+from src.core.domain.models.element import NetworkElement
+from src.core.domain.models.elements_metadata.generator import (
+    GeneratorSolvedAttributes,
+)
+from src.core.domain.models.elements_metadata.line import LineSolvedAttributes
+from src.core.domain.models.elements_metadata.load import LoadSolvedAttributes
+from src.core.domain.models.network import Network
+from src.core.domain.models.power_flow import (
+    SLACK_DISTRIBUTION_TOLERANCE,
+    PowerFlowCache,
+)
+from src.core.domain.ports.loadflow_solver import LoadFlowSolver
+from src.core.domain.ports.network_builder import NetworkBuilder
+
+NAN = float("nan")
+
+
+def _solved_element(
+    element: NetworkElement, solved: object, network_id: str
+) -> NetworkElement:
+    return NetworkElement(
+        uid=element.uid,
+        id=element.id,
+        timestamp=element.timestamp,
+        type=element.type,
+        element_metadata=type(element.element_metadata)(
+            state=State.SOLVED,
+            static=element.element_metadata.static,
+            dynamic=element.element_metadata.dynamic,
+            solved=solved,
+        ),
+        network_id=network_id,
+        operational_constraints=element.operational_constraints,
+    )
+
+
+class NumpyDCLoadFlowSolver(LoadFlowSolver):
+    """
+    In process DC loadflow solver, on numpy and scipy.
+
+    The grid is indexed once per set of elements, and the susceptance matrix factorised once
+    per topology, i.e. set of lines in service. The 'max_factorisations' most recently used
+    factorisations are kept, so that each timestamp only costs a pair of triangular solves.
+
+    Results follow pypowsybl's DC loadflow: the mismatch is distributed over generators
+    proportionally to their Pmax, only the main connected component is solved, and reactive
+    powers and currents are not computed. AC solves are delegated to 'ac_loadflow_solver'.
+    """
+
+    def __init__(
+        self,
+        network_builder: NetworkBuilder,
+        ac_loadflow_solver: LoadFlowSolver | None = None,
+        max_factorisations: int = 64,
+    ) -> None:
+        self.network_builder = network_builder
+        self.ac_loadflow_solver = ac_loadflow_solver
+        self.cache = PowerFlowCache(max_power_flows=max_factorisations)
+        self._loadflow_statuses: dict[datetime, LoadFlowStatus] = {}
+
+    def reset(self) -> None:
+        if self.ac_loadflow_solver is not None:
+            self.ac_loadflow_solver.reset()
+
+    def shutdown(self) -> None:
+        if self.ac_loadflow_solver is not None:
+            self.ac_loadflow_solver.shutdown()
+
+    def get_loadflow_statuses(self) -> dict[datetime, LoadFlowStatus]:
+        return dict(self._loadflow_statuses)
+
+    def _solve_timestamp(
+        self, elements: list[NetworkElement], network_id: str
+    ) -> tuple[list[NetworkElement], LoadFlowStatus]:
+        """
+        Solve the elements of a timestamp. Those with non finite injections are returned
+        unsolved, as FAILED. When the mismatch can't be fully distributed over generators,
+        the timestamp is FAILED too, with NaN results, as pypowsybl does.
+        """
+
+        grid = self.cache.grid_index(elements=elements)
+        state = grid.read_state(elements=elements)
+        if not (
+            np.isfinite(state.p_target[state.generator_on]).all()
+            and np.isfinite(state.load_p).all()
+        ):
+            return elements, LoadFlowStatus.FAILED
+        power_flow = self.cache.dc_power_flow(
+            grid=grid, branch_in_service=state.branch_in_service
+        )
+
+        generator_in_main = (
+            state.generator_on & power_flow.bus_in_main[grid.generator_bus]
+        )
+        load_in_main = power_flow.bus_in_main[grid.load_bus]
+        p_generator, p_bus, remaining = grid.dc_injections(
+            state=state, bus_in_main=power_flow.bus_in_main
+        )
+        flows = power_flow.flows(p=p_bus)
+
+        status = LoadFlowStatus.CONVERGED
+        if abs(remaining) > SLACK_DISTRIBUTION_TOLERANCE:
+            status = LoadFlowStatus.FAILED
+            generator_in_main[:] = False
+            load_in_main[:] = False
+            flows[:] = np.nan
+
+        solved_elements, off_elements = [], []
+        for k, position in enumerate(grid.generator_positions):
+            if not state.generator_on[k]:
+                off_elements.append(elements[position])
+                continue
+            in_main = generator_in_main[k]
+            solved_elements.append(
+                _solved_element(
+                    element=elements[position],
+                    solved=GeneratorSolvedAttributes(
+                        p=-p_generator[k] if in_main else NAN,
+                        q=-state.q_target[k] if in_main else NAN,
+                        i=NAN,
+                        connected=True,
+                    ),
+                    network_id=network_id,
+                )
+            )
+        for k, position in enumerate(grid.line_positions):
+            if not state.branch_in_service[k]:
+                off_elements.append(elements[position])
+                continue
+            solved_elements.append(
+                _solved_element(
+                    element=elements[position],
+                    solved=LineSolvedAttributes(
+                        p1=flows[k],
+                        q1=NAN,
+                        i1=NAN,
+                        p2=-flows[k],
+                        q2=NAN,
+                        i2=NAN,
+                    ),
+                    network_id=network_id,
+                )
+            )
+        for k, position in enumerate(grid.load_positions):
+            in_main = load_in_main[k]
+            solved_elements.append(
+                _solved_element(
+                    element=elements[position],
+                    solved=LoadSolvedAttributes(
+                        p=state.load_p[k] if in_main else NAN,
+                        q=state.load_q[k] if in_main else NAN,
+                        i=NAN,
+                    ),
+                    network_id=network_id,
+                )
+            )
+        return solved_elements + off_elements, status
+
+    def solve(self, network: Network, loadflow_type: LoadFlowType) -> Network:
+        """
+        Solve each timestamp of the network, convergence of each timestamp being available
+        through 'get_loadflow_statuses' afterwards.
+        """
+
+        if loadflow_type != LoadFlowType.DC:
+            if self.ac_loadflow_solver is None:
+                m = f"{type(self).__name__} only solves {LoadFlowType.DC} loadflows."
+                raise ValueError(m)
+            solved_network = self.ac_loadflow_solver.solve(
+                network=network, loadflow_type=loadflow_type
+            )
+            self._loadflow_statuses = self.ac_loadflow_solver.get_loadflow_statuses()
+            return solved_network
+
+        elements_by_timestamp = {}
+        for element in network.elements:
+            elements_by_timestamp.setdefault(element.timestamp, []).append(element)
+
+        elements, self._loadflow_statuses = [], {}
+        for timestamp in sorted(elements_by_timestamp.keys()):
+            solved_elements, self._loadflow_statuses[timestamp] = self._solve_timestamp(
+                elements=elements_by_timestamp[timestamp], network_id=network.id
+            )
+            elements.extend(solved_elements)
+
+        return self.network_builder.from_elements(id=network.id, elements=elements)
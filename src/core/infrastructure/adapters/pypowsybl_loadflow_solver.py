@@ -1,113 +1,427 @@
-from src.core.utils import parse_datetime
+import multiprocessing
+import time
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
 from src.core.domain.models.network import Network
 from src.core.domain.models.element import NetworkElement
+from src.core.domain.models.network_delta import NetworkDelta
+import numpy as np
 import pypowsybl as pp
-import pandas as pd
 
-from src.core.constants import SupportedNetworkElementTypes
-from src.core.domain.enums import LoadFlowType
+from src.core.constants import ElementStatus, LoadFlowExecutor
+from src.core.domain.enums import LoadFlowStatus, LoadFlowType, SolvePhase
+from src.core.domain.models.solve_metrics import SolveMetrics
 from src.core.infrastructure.services import PyPowsyblCompatService
+from src.core.infrastructure.services.converters.pypowsybl_methods.network import (
+    STATUS_ELEMENT_TYPES,
+)
+from src.core.infrastructure.services.converters.pypowsybl_methods.models.pypowsybl_network_session import (
+    PyPowSyblNetworkSession,
+)
 from src.core.domain.ports.loadflow_solver import LoadFlowSolver
+from src.core.domain.ports.metrics_sink import MetricsSink
 from src.core.domain.ports.network_builder import NetworkBuilder
 
+# A shard is a run of consecutive timestamps, with their elements, solved by one worker.
+Shard = list[tuple[datetime, list[NetworkElement]]]
+ShardResult = tuple[
+    list[NetworkElement],
+    dict[datetime, LoadFlowStatus],
+    dict[datetime, int],
+    dict[SolvePhase, float],
+    tuple[int, int],
+]
+
+# Solver living in each worker process, so that it keeps its pypowsybl network between shards.
+_WORKER_SOLVER = None
+# Resets of the pool's solver the worker's solver went through.
+_WORKER_RESETS = 0
+
+
+def _init_worker(
+    to_pypowsybl_converter_service: PyPowsyblCompatService,
+    network_builder: NetworkBuilder,
+    warm_start: bool,
+    max_variants: int,
+    base_case_dir: Path | None,
+) -> None:
+    global _WORKER_SOLVER
+    _WORKER_SOLVER = PyPowSyblLoadFlowSolver(
+        to_pypowsybl_converter_service=to_pypowsybl_converter_service,
+        network_builder=network_builder,
+        warm_start=warm_start,
+        max_variants=max_variants,
+        base_case_dir=base_case_dir,
+    )
+
+
+def _solve_shard_in_worker(
+    shard: Shard, loadflow_type: LoadFlowType, network_id: str, resets: int
+) -> ShardResult:
+    global _WORKER_RESETS
+    # Workers can't be reached one by one, so they catch up on resets with their shards.
+    if resets != _WORKER_RESETS:
+        _WORKER_SOLVER.reset()
+        _WORKER_RESETS = resets
+    return _WORKER_SOLVER._solve_shard(
+        shard=shard, loadflow_type=loadflow_type, network_id=network_id
+    )
+
 
 class PyPowSyblLoadFlowSolver(LoadFlowSolver):
-    """Pypowsybl implementation of a loadflow solver"""
+    """
+    Pypowsybl implementation of a loadflow solver.
+
+    Timestamps are solved in the calling process by default. With a THREAD or PROCESS executor,
+    they are split in up to 'max_workers' shards of consecutive timestamps, solved in parallel
+    by long-lived workers that each keep their own pypowsybl network.
+
+    The network holds a variant per topology met, the 'max_variants' most recently used
+    being kept, so that timestamps sharing a topology only update injections. With a
+    'base_case_dir', the network is saved there once built, and loaded on later starts
+    rather than built again, as long as static attributes of the grid are the same. With
+    'warm_start', an AC loadflow starts from the voltages of the previous converged one
+    on the same topology variant, rather than from a flat profile, and is run again from a
+    flat start when that doesn't converge. Iterations of each timestamp are logged, and
+    available through 'get_iterations'.
+
+    The wall time of each phase of a solve, with element, iteration and status counts, is
+    available through 'get_metrics' afterwards, and recorded into 'metrics_sink' when given.
+    """
 
     def __init__(
         self,
         to_pypowsybl_converter_service: PyPowsyblCompatService,
         network_builder: NetworkBuilder,
+        executor: LoadFlowExecutor = LoadFlowExecutor.SEQUENTIAL,
+        max_workers: int = 1,
+        warm_start: bool = False,
+        max_variants: int = 8,
+        base_case_dir: Path | None = None,
+        metrics_sink: MetricsSink | None = None,
     ) -> None:
         self.to_pypowsybl_converter_service = to_pypowsybl_converter_service
         self.network_builder = network_builder
+        self.executor = executor
+        self.max_workers = max_workers
+        self.warm_start = warm_start
+        self.max_variants = max_variants
+        self.base_case_dir = base_case_dir
+        self.metrics_sink = metrics_sink
+        self._session: PyPowSyblNetworkSession | None = None
+        self._pool: Executor | None = None
+        self._thread_workers: list[PyPowSyblLoadFlowSolver] = []
+        self._resets = 0
+        self._loadflow_statuses: dict[datetime, LoadFlowStatus] = {}
+        self._iterations: dict[datetime, int] = {}
+        self._metrics: SolveMetrics | None = None
+        self._delta: NetworkDelta | None = None
 
-    def solve(
-        self, network: Network, loadflow_type: LoadFlowType
-    ) -> Network:  # TODO: Better manage cases where the loadflow does not converge.
-        """This takes an obj 'Network', formats to a Pypowsybl network, queries the loadflow solver for a response and format back to 'Network'."""
-        pypowsybl_network_wrapper = (
-            self.to_pypowsybl_converter_service.network_to_pypowsybl(network=network)
-        )
+    def reset(self) -> None:
+        """
+        Drop the pypowsybl networks kept from previous solves, by this process and by the
+        workers. Worker processes drop theirs on their next shard.
+        """
+        self._session = None
+        self._resets += 1
+        for worker in self._thread_workers:
+            worker.reset()
+
+    def shutdown(self) -> None:
+        """Stop the workers, if any were started. They're started again on next solve."""
+        if self._pool is not None:
+            self._pool.shutdown()
+        self._pool = None
+        self._thread_workers = []
+        self._session = None
+
+    def get_loadflow_statuses(self) -> dict[datetime, LoadFlowStatus]:
+        return dict(self._loadflow_statuses)
+
+    def get_iterations(self) -> dict[datetime, int]:
+        """Iterations run for each timestamp of the last AC solve, fallbacks included."""
+        return dict(self._iterations)
 
-        pypowsybl_network = pypowsybl_network_wrapper.get_active_network()
+    def get_metrics(self) -> SolveMetrics | None:
+        """What the last solve cost, None before any."""
+        return self._metrics
 
-        loadflow_func = (
-            pp.loadflow.run_dc
-            if loadflow_type == LoadFlowType.DC
-            else pp.loadflow.run_ac
+    def _sync_session(self, elements: list[NetworkElement]) -> PyPowSyblNetworkSession:
+        """
+        Return the session's pypowsybl network updated with elements, building it only when
+        the elements belong to a different grid than the one of the previous solve. Only
+        the injections changed by the delta being solved, if any, are sent.
+        """
+
+        session = self._session
+        if session is None or not self.to_pypowsybl_converter_service.same_grid(
+            session=session, elements=elements
+        ):
+            self._session = (
+                self.to_pypowsybl_converter_service.pypowsybl_network_session(
+                    elements=elements,
+                    max_variants=self.max_variants,
+                    base_case_dir=self.base_case_dir,
+                )
+            )
+        else:
+            self.to_pypowsybl_converter_service.update_pypowsybl_network_session(
+                session=session, elements=elements, delta=self._delta
+            )
+        return self._session
+
+    def _run_ac(self, session: PyPowSyblNetworkSession) -> tuple[list, int, bool, bool]:
+        """
+        Run an AC loadflow on the session's network, from the voltages of the previous
+        converged one when warm starting, falling back to a flat start. Returns the results,
+        the iterations run, whether it was warm started and whether that fell back.
+        """
+
+        results, iterations, fell_back = None, 0, False
+        if self.warm_start and session.solved:
+            try:
+                results = pp.loadflow.run_ac(
+                    session.network,
+                    parameters=pp.loadflow.Parameters(
+                        voltage_init_mode=pp.loadflow.VoltageInitMode.PREVIOUS_VALUES
+                    ),
+                )
+                iterations = sum(result.iteration_count for result in results)
+            except pp.PyPowsyblError:
+                results = None
+            if (
+                not results
+                or results[0].status != pp.loadflow.ComponentStatus.CONVERGED
+            ):
+                results, fell_back = None, True
+
+        warm = results is not None
+        if results is None:
+            results = pp.loadflow.run_ac(session.network)
+            iterations += sum(result.iteration_count for result in results)
+        session.solved = bool(
+            results and results[0].status == pp.loadflow.ComponentStatus.CONVERGED
         )
+        return results, iterations, warm, fell_back
+
+    def _solve_shard(
+        self, shard: Shard, loadflow_type: LoadFlowType, network_id: str
+    ) -> ShardResult:
+        """
+        Solve timestamps one after the other on the session's network. A timestamp for which
+        pypowsybl raises is reported as FAILED, and its elements are returned unsolved.
+        """
+
+        elements, loadflow_statuses, iterations = [], {}, {}
+        phase_seconds = {phase: 0.0 for phase in SolvePhase}
+        warm_starts, fallbacks = 0, 0
 
-        constraint_lookup = {
-            (n.id, n.timestamp): n.operational_constraints for n in network.elements
-        }
-
-        elements = []
-
-        for timestamp, pypowsybl_net in pypowsybl_network.items():
-            parsed_timestamp = parse_datetime(d=timestamp)
-            loadflow_func(pypowsybl_net)
-
-            # TODO: Make more generic
-            # voltage_levels = pypowsybl_network[timestamp].get_voltage_levels()
-            # buses = pypowsybl_network[timestamp].get_buses()
-            loads = pypowsybl_net.get_loads()
-            lines = pypowsybl_net.get_lines()
-            generators = pypowsybl_net.get_generators()
-
-            # Helper function to process the elements
-            def process_elements(
-                elements: pd.DataFrame,
-                element_type: SupportedNetworkElementTypes,
-                network_id: str,
-            ) -> list[NetworkElement]:
-                return [
-                    self.to_pypowsybl_converter_service.element_from_pypowsybl(
-                        element_id=i,
-                        element_type=element_type,
-                        network_id=network_id,
-                        timestamp=parsed_timestamp,
-                        element_metadata_pypowsybl=row,
-                        operational_constraints=[],  # Will be updated later in pipeline
+        for timestamp, timestamp_elements in shard:
+            start = time.perf_counter()
+            try:
+                session = self._sync_session(elements=timestamp_elements)
+                pypowsybl_net = session.network
+                converted = time.perf_counter()
+                phase_seconds[SolvePhase.CONVERSION] += converted - start
+                if loadflow_type == LoadFlowType.DC:
+                    results = pp.loadflow.run_dc(pypowsybl_net)
+                    session.solved = False  # Voltages are now DC ones.
+                else:
+                    results, iterations[timestamp], warm, fell_back = self._run_ac(
+                        session=session
                     )
-                    for i, row in elements.iterrows()
-                ]
-
-            # Process loads, lines, and generators
-            solved_loads = process_elements(
-                elements=loads,
-                element_type=SupportedNetworkElementTypes.LOAD,
-                network_id=network.id,
+                    warm_starts += warm
+                    fallbacks += fell_back
+                phase_seconds[SolvePhase.LOADFLOW] += time.perf_counter() - converted
+            except pp.PyPowsyblError:
+                self._session = None  # The network may be half updated.
+                loadflow_statuses[timestamp] = LoadFlowStatus.FAILED
+                elements.extend(timestamp_elements)
+                continue
+
+            loadflow_statuses[timestamp] = (
+                LoadFlowStatus(results[0].status.name)
+                if results
+                else LoadFlowStatus.NO_CALCULATION
             )
-            solved_lines = process_elements(
-                elements=lines,
-                element_type=SupportedNetworkElementTypes.LINE,
-                network_id=network.id,
+
+            start = time.perf_counter()
+            solved_values = self.to_pypowsybl_converter_service.solved_values_from_pypowsybl_network(
+                pypowsybl_network=pypowsybl_net, elements=timestamp_elements
             )
-            solved_generators = process_elements(
-                elements=generators,
-                element_type=SupportedNetworkElementTypes.GENERATOR,
-                network_id=network.id,
+            extracted = time.perf_counter()
+            elements.extend(
+                self.to_pypowsybl_converter_service.solved_elements_from_values(
+                    solved_values=solved_values, network_id=network_id
+                )
             )
+            constructed = time.perf_counter()
 
-            for element in solved_generators + solved_lines + solved_loads:
-                constraints = constraint_lookup.get((element.id, parsed_timestamp), [])
-
-                elements.append(
-                    NetworkElement.from_metadata(
-                        id=element.id,
-                        timestamp=parsed_timestamp,
-                        element_metadata=element.element_metadata,
-                        type=element.type,
-                        network_id=network.id,
-                        operational_constraints=constraints,
-                    )
+            # Elements that are not ON are kept as is.
+            for element in timestamp_elements:
+                if (
+                    element.type in STATUS_ELEMENT_TYPES
+                    and element.element_metadata.static.status != ElementStatus.ON
+                ):
+                    elements.append(element)
+
+            phase_seconds[SolvePhase.EXTRACTION] += extracted - start
+            phase_seconds[SolvePhase.CONSTRUCTION] += constructed - extracted
+            phase_seconds[SolvePhase.OFF_ELEMENTS] += time.perf_counter() - constructed
+
+        return (
+            elements,
+            loadflow_statuses,
+            iterations,
+            phase_seconds,
+            (warm_starts, fallbacks),
+        )
+
+    def _map_shards(
+        self, shards: list[Shard], loadflow_type: LoadFlowType, network_id: str
+    ) -> list[ShardResult]:
+        """Solve shards on the workers, results being returned in the order of the shards."""
+
+        if self.executor == LoadFlowExecutor.PROCESS:
+            if self._pool is None:
+                # Workers are spawned, as pypowsybl's JVM does not survive a fork.
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(
+                        self.to_pypowsybl_converter_service,
+                        self.network_builder,
+                        self.warm_start,
+                        self.max_variants,
+                        self.base_case_dir,
+                    ),
+                )
+            return list(
+                self._pool.map(
+                    _solve_shard_in_worker,
+                    shards,
+                    [loadflow_type] * len(shards),
+                    [network_id] * len(shards),
+                    [self._resets] * len(shards),
                 )
+            )
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+            self._thread_workers = [
+                PyPowSyblLoadFlowSolver(
+                    to_pypowsybl_converter_service=self.to_pypowsybl_converter_service,
+                    network_builder=self.network_builder,
+                    warm_start=self.warm_start,
+                    max_variants=self.max_variants,
+                    base_case_dir=self.base_case_dir,
+                )
+                for _ in range(self.max_workers)
+            ]
+        return list(
+            self._pool.map(
+                lambda worker, shard: worker._solve_shard(
+                    shard=shard, loadflow_type=loadflow_type, network_id=network_id
+                ),
+                self._thread_workers[: len(shards)],
+                shards,
+            )
+        )
+
+    def solve_delta(
+        self, network: Network, delta: NetworkDelta, loadflow_type: LoadFlowType
+    ) -> Network:
+        """
+        Solve a single timestamp network reached by 'delta' from the one solved last,
+        sending pypowsybl only the injections the delta changed.
+        """
 
-            for element in pypowsybl_network_wrapper.data[parsed_timestamp][1]:
-                elements.append(element)
+        self._delta = delta
+        try:
+            return self.solve(network=network, loadflow_type=loadflow_type)
+        finally:
+            self._delta = None
 
-        return self.network_builder.from_elements(
+    def solve(self, network: Network, loadflow_type: LoadFlowType) -> Network:
+        """
+        This takes an obj 'Network', syncs it into a Pypowsybl network, queries the loadflow solver for a response and format back to 'Network'.
+        The Pypowsybl network is kept between calls, as long as the grid is the same, with a variant per topology only updated with injections.
+        Convergence of each timestamp is available through 'get_loadflow_statuses' afterwards,
+        and what the solve cost through 'get_metrics'.
+        """
+
+        start = time.perf_counter()
+        elements_by_timestamp = {}
+        for element in network.elements:
+            elements_by_timestamp.setdefault(element.timestamp, []).append(element)
+        timestamps = sorted(elements_by_timestamp.keys())
+
+        n_shards = (
+            1
+            if self.executor == LoadFlowExecutor.SEQUENTIAL
+            else max(1, min(self.max_workers, len(timestamps)))
+        )
+        shards = [
+            [(t, elements_by_timestamp[t]) for t in shard_timestamps]
+            for shard_timestamps in np.array_split(
+                np.array(timestamps, dtype=object), n_shards
+            )
+        ]
+
+        if n_shards == 1:
+            results = [
+                self._solve_shard(
+                    shard=shards[0], loadflow_type=loadflow_type, network_id=network.id
+                )
+            ]
+        else:
+            results = self._map_shards(
+                shards=shards, loadflow_type=loadflow_type, network_id=network.id
+            )
+
+        elements, self._loadflow_statuses, self._iterations = [], {}, {}
+        phase_seconds = {phase: 0.0 for phase in SolvePhase}
+        warm_starts, fallbacks = 0, 0
+        for (
+            shard_elements,
+            shard_statuses,
+            shard_iterations,
+            shard_seconds,
+            (shard_warm_starts, shard_fallbacks),
+        ) in results:
+            elements.extend(shard_elements)
+            warm_starts += shard_warm_starts
+            fallbacks += shard_fallbacks
+            self._loadflow_statuses.update(shard_statuses)
+            self._iterations.update(shard_iterations)
+            for phase, seconds in shard_seconds.items():
+                phase_seconds[phase] += seconds
+
+        built = time.perf_counter()
+        solved_network = self.network_builder.from_elements(
             id=network.id,
             elements=elements,
         )
+        end = time.perf_counter()
+        phase_seconds[SolvePhase.NETWORK_BUILDING] = end - built
+
+        self._metrics = SolveMetrics(
+            solver=type(self).__name__,
+            network_id=network.id,
+            loadflow_type=loadflow_type,
+            seconds=end - start,
+            phase_seconds=phase_seconds,
+            n_timestamps=len(timestamps),
+            n_elements=len(network.elements),
+            iterations=sum(self._iterations.values()),
+            statuses=dict(Counter(self._loadflow_statuses.values())),
+            warm_starts=warm_starts,
+            warm_start_fallbacks=fallbacks,
+        )
+        if self.metrics_sink is not None:
+            self.metrics_sink.record(metrics=self._metrics)
+
+        return solved_network
@@ -0,0 +1,24 @@
+from pathlib import Path
+import pypowsybl as pp
+from src.core.domain.models.element import NetworkElement
+from src.core.domain.ports.network_importer import NetworkImporter
+from src.core.infrastructure.services import PyPowsyblCompatService
+
+
+class PyPowSyblNetworkImporter(NetworkImporter):
+    """Pypowsybl implementation of a grid file importer (XIIDM, MATPOWER, CGMES, UCTE...)."""
+
+    def __init__(self, to_pypowsybl_converter_service: PyPowsyblCompatService) -> None:
+        self.to_pypowsybl_converter_service = to_pypowsybl_converter_service
+
+    def import_elements(self, file_path: Path, network_id: str) -> list[NetworkElement]:
+        """Load the file with pypowsybl, the format being inferred from the file itself."""
+        try:
+            pypowsybl_network = pp.network.load(str(file_path))
+        except pp.PyPowsyblError as e:
+            raise ValueError(f"Can't load grid file {file_path}: {e}") from e
+
+        return self.to_pypowsybl_converter_service.elements_from_pypowsybl_network(
+            pypowsybl_network=pypowsybl_network,
+            network_id=network_id,
+        )
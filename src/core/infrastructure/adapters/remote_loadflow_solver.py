@@ -0,0 +1,78 @@
+from datetime import datetime
+from multiprocessing.connection import Client, Connection
+from src.core.domain.enums import LoadFlowStatus, LoadFlowType
+from src.core.domain.models.network import Network
+from src.core.domain.ports.loadflow_solver import LoadFlowSolver
+from src.core.domain.ports.network_builder import NetworkBuilder
+from src.core.infrastructure.adapters.cached_loadflow_solver import from_entry
+
+
+class RemoteLoadFlowSolver(LoadFlowSolver):
+    """
+    Loadflow solver sending its solves to the LoadFlowService of this host, for processes to
+    share its workers rather than each running its own solver. The connection is opened on
+    the first solve, so that solvers can be built before being sent to subprocesses.
+    """
+
+    def __init__(
+        self,
+        network_builder: NetworkBuilder,
+        address: tuple[str, int],
+        authkey: bytes,
+    ) -> None:
+        if not authkey:
+            raise ValueError("An authkey is needed to use the loadflow service.")
+
+        self.network_builder = network_builder
+        self.address = address
+        self.authkey = authkey
+        self._connection: Connection | None = None
+        self._loadflow_statuses: dict[datetime, LoadFlowStatus] = {}
+
+    def __getstate__(self) -> dict:
+        # Connections aren't shared between processes.
+        return {**self.__dict__, "_connection": None}
+
+    def get_loadflow_statuses(self) -> dict[datetime, LoadFlowStatus]:
+        return dict(self._loadflow_statuses)
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+        self._connection = None
+
+    def shutdown(self) -> None:
+        self.close()
+
+    def solve(self, network: Network, loadflow_type: LoadFlowType) -> Network:
+        """
+        Send the elements of the network to the service, and rebuild the solved network from
+        the solved attributes it returns. Convergence of each timestamp is available through
+        'get_loadflow_statuses' afterwards.
+        """
+
+        if self._connection is None:
+            self._connection = Client(address=self.address, authkey=self.authkey)
+        self._connection.send((loadflow_type, network.elements))
+        success, result = self._connection.recv()
+        if not success:
+            m = f"The loadflow service failed to solve {network.id}:\n{result}"
+            raise RuntimeError(m)
+
+        elements_by_timestamp = {}
+        for element in network.elements:
+            elements_by_timestamp.setdefault(element.timestamp, []).append(element)
+        elements, self._loadflow_statuses = [], {}
+        for timestamp in sorted(elements_by_timestamp.keys()):
+            entry = result[timestamp]
+            elements.extend(
+                from_entry(
+                    entry=entry,
+                    elements=elements_by_timestamp[timestamp],
+                    network_id=network.id,
+                )
+            )
+            if entry[0] is not None:
+                self._loadflow_statuses[timestamp] = entry[0]
+
+        return self.network_builder.from_elements(id=network.id, elements=elements)
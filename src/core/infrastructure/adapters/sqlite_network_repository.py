@@ -7,6 +7,8 @@ from src.core.domain.models.element import NetworkElement
 from sqlalchemy import select, distinct
 from src.core.infrastructure.schemas import NetworkSchema, NetworkElementSchema
 from datetime import datetime
+from src.core.constants import DATETIME_FORMAT, DEFAULT_TIMEZONE
+from src.core.utils import parse_datetime
 from src.core.domain.ports.network_repository import DatabaseNetworkRepository
 
 
@@ -64,8 +66,22 @@ class SQLiteNetworkRepository(DatabaseNetworkRepository):
         List available network IDs.
         """
         statement = select(distinct(NetworkSchema.id))
+        # Scalars are returned, already a flat list of IDs.
+        return list(self.sql_client.query_with_statement(statement=statement))
+
+    def list_timestamps(self, network_id: str) -> list[datetime]:
+        """
+        List the timestamps a network has elements at, without loading the elements.
+        """
+        statement = select(distinct(NetworkElementSchema.timestamp)).where(
+            NetworkElementSchema.network_id == network_id,
+            NetworkElementSchema.timestamp.is_not(None),
+        )
         results = self.sql_client.query_with_statement(statement=statement)
-        return [row[0] for row in results]  # Ensure a flat list of IDs
+        return sorted(
+            parse_datetime(timestamp, format=DATETIME_FORMAT, tz=DEFAULT_TIMEZONE)
+            for timestamp in results
+        )
 
     def add(self, network: Network) -> None:
         """
@@ -84,10 +100,12 @@ class SQLiteNetworkRepository(DatabaseNetworkRepository):
         Add elements to the database by mapping the domain model to the schema.
         """
         try:
-            for element in elements:
-                self.sql_client.add_record(
-                    record=self.element_mapper.domain_to_schema(element)
-                )
+            self.sql_client.bulk_insert(
+                records=[
+                    self.element_mapper.domain_to_schema(element)
+                    for element in elements
+                ]
+            )
         except IntegrityError as e:
             print(f"Failed to add network: {e}")
             raise ValueError("A network with this ID already exists.") from e
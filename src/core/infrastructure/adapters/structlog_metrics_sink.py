@@ -0,0 +1,31 @@
+import structlog
+
+from src.core.domain.models.solve_metrics import SolveMetrics
+from src.core.domain.ports.metrics_sink import MetricsSink
+
+logger = structlog.get_logger(__name__)
+
+
+class StructlogMetricsSink(MetricsSink):
+    """Logs the metrics of each solver call, as a single event."""
+
+    def record(self, metrics: SolveMetrics) -> None:
+        logger.info(
+            "Loadflow solved.",
+            solver=metrics.solver,
+            network_id=metrics.network_id,
+            loadflow_type=metrics.loadflow_type.value,
+            seconds=metrics.seconds,
+            n_timestamps=metrics.n_timestamps,
+            n_elements=metrics.n_elements,
+            iterations=metrics.iterations,
+            warm_starts=metrics.warm_starts,
+            warm_start_fallbacks=metrics.warm_start_fallbacks,
+            statuses={
+                status.value: count for status, count in metrics.statuses.items()
+            },
+            **{
+                f"{phase.value.lower()}_seconds": seconds
+                for phase, seconds in metrics.phase_seconds.items()
+            },
+        )
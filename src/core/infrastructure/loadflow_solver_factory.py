@@ -0,0 +1,144 @@
+from src.core.constants import MetricsSinks, SupportedBackends
+from src.core.domain.ports.loadflow_solver import LoadFlowSolver
+from src.core.domain.ports.metrics_sink import MetricsSink
+from src.core.infrastructure.adapters.cached_loadflow_solver import (
+    CachedLoadFlowSolver,
+)
+from src.core.infrastructure.adapters.in_memory_metrics_sink import (
+    InMemoryMetricsSink,
+)
+from src.core.infrastructure.adapters.network_builder import DefaultNetworkBuilder
+from src.core.infrastructure.adapters.numpy_ac_loadflow_solver import (
+    NumpyACLoadFlowSolver,
+)
+from src.core.infrastructure.adapters.numpy_dc_loadflow_solver import (
+    NumpyDCLoadFlowSolver,
+)
+from src.core.infrastructure.adapters.pypowsybl_loadflow_solver import (
+    PyPowSyblLoadFlowSolver,
+)
+from src.core.infrastructure.adapters.remote_loadflow_solver import (
+    RemoteLoadFlowSolver,
+)
+from src.core.infrastructure.adapters.structlog_metrics_sink import (
+    StructlogMetricsSink,
+)
+from src.core.infrastructure.services.converters.pypowsybl_methods.service import (
+    PyPowsyblCompatService,
+)
+from src.core.infrastructure.services.loadflow_service import LoadFlowService
+from src.core.infrastructure.settings import Settings
+
+
+class LoadFlowSolverFactory:
+    """
+    Builds the loadflow solvers, and the loadflow service, the settings ask for, so that
+    every entrypoint solves alike.
+    The metrics sink is built once and given to every solver, for it to aggregate calls.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+        self.metrics_sink = self._metrics_sink()
+
+    def _metrics_sink(self) -> MetricsSink | None:
+        """The sink solvers report into, None when none is set."""
+
+        if self.settings.LOADFLOW_METRICS_SINK == MetricsSinks.IN_MEMORY:
+            return InMemoryMetricsSink()
+        if self.settings.LOADFLOW_METRICS_SINK == MetricsSinks.STRUCTLOG:
+            return StructlogMetricsSink()
+        if self.settings.LOADFLOW_METRICS_SINK == MetricsSinks.MLFLOW:
+            # Imported here, as mlflow is only needed when reporting to it.
+            from src.core.infrastructure.adapters.mlflow_metrics_sink import (
+                MLflowMetricsSink,
+            )
+
+            return MLflowMetricsSink()
+        return None
+
+    def _local_loadflow_solver(self) -> LoadFlowSolver:
+        """The solver of the backend set, solving in this process or its workers."""
+
+        loadflow_solver = PyPowSyblLoadFlowSolver(
+            to_pypowsybl_converter_service=PyPowsyblCompatService(),
+            network_builder=DefaultNetworkBuilder(),
+            executor=self.settings.LOADFLOW_EXECUTOR,
+            max_workers=self.settings.LOADFLOW_MAX_WORKERS,
+            warm_start=self.settings.LOADFLOW_WARM_START,
+            base_case_dir=self.settings.LOADFLOW_BASE_CASE_DIR,
+            metrics_sink=self.metrics_sink,
+        )
+        if self.settings.LOADFLOW_BACKEND == SupportedBackends.NUMPY:
+            loadflow_solver = NumpyDCLoadFlowSolver(
+                network_builder=DefaultNetworkBuilder(),
+                ac_loadflow_solver=loadflow_solver,
+            )
+        elif self.settings.LOADFLOW_BACKEND == SupportedBackends.NUMPY_AC:
+            loadflow_solver = NumpyACLoadFlowSolver(
+                network_builder=DefaultNetworkBuilder(),
+                dc_loadflow_solver=NumpyDCLoadFlowSolver(
+                    network_builder=DefaultNetworkBuilder()
+                ),
+                warm_start=self.settings.LOADFLOW_WARM_START,
+            )
+        return loadflow_solver
+
+    def _cached(self, loadflow_solver: LoadFlowSolver) -> LoadFlowSolver:
+
+        if self.settings.LOADFLOW_CACHE_SIZE > 0:
+            return CachedLoadFlowSolver(
+                loadflow_solver=loadflow_solver,
+                network_builder=DefaultNetworkBuilder(),
+                max_entries=self.settings.LOADFLOW_CACHE_SIZE,
+                cache_dir=self.settings.LOADFLOW_CACHE_DIR,
+            )
+        return loadflow_solver
+
+    def _loadflow_service_authkey(self) -> bytes:
+        if not self.settings.LOADFLOW_SERVICE_AUTHKEY:
+            m = "LOADFLOW_SERVICE_AUTHKEY must be set to serve or use the loadflow service."
+            raise ValueError(m)
+        return self.settings.LOADFLOW_SERVICE_AUTHKEY.encode()
+
+    def loadflow_solver(self) -> LoadFlowSolver:
+        """
+        The solver of the backend set behind a cache, when one is set. REMOTE solvers send
+        their loadflows to the loadflow service of this host.
+        """
+
+        if self.settings.LOADFLOW_BACKEND == SupportedBackends.REMOTE:
+            return self._cached(
+                loadflow_solver=RemoteLoadFlowSolver(
+                    network_builder=DefaultNetworkBuilder(),
+                    address=(
+                        self.settings.LOADFLOW_SERVICE_HOST,
+                        self.settings.LOADFLOW_SERVICE_PORT,
+                    ),
+                    authkey=self._loadflow_service_authkey(),
+                )
+            )
+        return self._cached(loadflow_solver=self._local_loadflow_solver())
+
+    def loadflow_service(
+        self, max_batch_size: int = 64, batch_window: float = 0.002
+    ) -> LoadFlowService:
+        """
+        The service solving the loadflows of the REMOTE solvers of this host. It solves
+        them with the solver of the backend set, as if it was local.
+        """
+
+        if self.settings.LOADFLOW_BACKEND == SupportedBackends.REMOTE:
+            m = "The loadflow service can't send its loadflows to itself."
+            raise ValueError(m)
+        return LoadFlowService(
+            loadflow_solver=self._cached(loadflow_solver=self._local_loadflow_solver()),
+            network_builder=DefaultNetworkBuilder(),
+            address=(
+                self.settings.LOADFLOW_SERVICE_HOST,
+                self.settings.LOADFLOW_SERVICE_PORT,
+            ),
+            authkey=self._loadflow_service_authkey(),
+            max_batch_size=max_batch_size,
+            batch_window=batch_window,
+        )
@@ -0,0 +1,391 @@
+import numpy as np
+import pandas as pd
+from pypowsybl.network import Network as PyPowSyblNetwork
+from src.core.domain.models.base_model import BaseConfigModel
+from src.core.domain.models.element import NetworkElement
+from src.core.domain.models.elements_metadata import MetadataRegistry
+from src.core.domain.models.elements_metadata.generator import (
+    GeneratorSolvedAttributes,
+)
+from src.core.domain.models.elements_metadata.line import LineSolvedAttributes
+from src.core.domain.models.elements_metadata.load import LoadSolvedAttributes
+from src.core.domain.models.operational_constraint import OperationalConstraint
+from src.core.domain.enums import State, BranchSide, OperationalConstraintType
+from src.core.constants import ElementStatus, SupportedNetworkElementTypes
+
+# Maps our static attribute names to the pypowsybl dataframe columns, per element type.
+# Buses are taken from the bus view, so that node-breaker voltage levels are flattened
+# to the buses electrically formed by their closed switches. Disconnected lines and
+# generators take the bus-view bus of the bus-breaker bus they would connect to.
+STATIC_COLUMNS_FROM_PYPOWSYBL = {
+    SupportedNetworkElementTypes.SUBSTATION: {
+        "name": "name",
+        "country": "country",
+        "tso": "TSO",
+    },
+    SupportedNetworkElementTypes.VOLTAGE_LEVEL: {
+        "name": "name",
+        "substation_id": "substation_id",
+        "Vnominal": "nominal_v",
+        "Vlimitlow": "low_voltage_limit",
+        "Vlimithigh": "high_voltage_limit",
+    },
+    SupportedNetworkElementTypes.BUS: {
+        "voltage_level_id": "voltage_level_id",
+    },
+    SupportedNetworkElementTypes.TWO_WINDINGS_TRANSFORMERS: {
+        "name": "name",
+        "voltage_level1_id": "voltage_level1_id",
+        "voltage_level2_id": "voltage_level2_id",
+        "bus1_id": "bus1_id",
+        "bus2_id": "bus2_id",
+        "rated_u1": "rated_u1",
+        "rated_u2": "rated_u2",
+        "rated_s": "rated_s",
+        "b": "b",
+        "g": "g",
+        "r": "r",
+        "x": "x",
+    },
+    SupportedNetworkElementTypes.LINE: {
+        "name": "name",
+        "voltage_level1_id": "voltage_level1_id",
+        "voltage_level2_id": "voltage_level2_id",
+        "bus1_id": "bus1_id",
+        "bus2_id": "bus2_id",
+        "b1": "b1",
+        "b2": "b2",
+        "g1": "g1",
+        "g2": "g2",
+        "r": "r",
+        "x": "x",
+    },
+    SupportedNetworkElementTypes.LOAD: {
+        "name": "name",
+        "voltage_level_id": "voltage_level_id",
+        "bus_id": "bus_id",
+        "type": "type",
+    },
+    SupportedNetworkElementTypes.GENERATOR: {
+        "voltage_level_id": "voltage_level_id",
+        "bus_id": "bus_id",
+        "Pmax": "max_p",
+        "Pmin": "min_p",
+        "is_voltage_regulator": "voltage_regulator_on",
+    },
+}
+
+PYPOWSYBL_GETTERS = {
+    SupportedNetworkElementTypes.SUBSTATION: "get_substations",
+    SupportedNetworkElementTypes.VOLTAGE_LEVEL: "get_voltage_levels",
+    SupportedNetworkElementTypes.BUS: "get_buses",
+    SupportedNetworkElementTypes.TWO_WINDINGS_TRANSFORMERS: "get_2_windings_transformers",
+    SupportedNetworkElementTypes.LINE: "get_lines",
+    SupportedNetworkElementTypes.LOAD: "get_loads",
+    SupportedNetworkElementTypes.GENERATOR: "get_generators",
+}
+
+# Maps our solved attribute names to the pypowsybl dataframe columns, per element type.
+SOLVED_COLUMNS_FROM_PYPOWSYBL = {
+    SupportedNetworkElementTypes.LOAD: {"p": "p", "q": "q", "i": "i"},
+    SupportedNetworkElementTypes.LINE: {
+        "p1": "p1",
+        "q1": "q1",
+        "i1": "i1",
+        "p2": "p2",
+        "q2": "q2",
+        "i2": "i2",
+    },
+    SupportedNetworkElementTypes.GENERATOR: {
+        "p": "p",
+        "q": "q",
+        "i": "i",
+        "connected": "connected",
+    },
+}
+
+SOLVED_ATTRIBUTES = {
+    SupportedNetworkElementTypes.GENERATOR: GeneratorSolvedAttributes,
+    SupportedNetworkElementTypes.LINE: LineSolvedAttributes,
+    SupportedNetworkElementTypes.LOAD: LoadSolvedAttributes,
+}
+
+# Columns needed on top of the static ones to derive statuses and drop unusable rows.
+_EXTRA_COLUMNS = {
+    SupportedNetworkElementTypes.LINE: [
+        "connected1",
+        "connected2",
+        "bus_breaker_bus1_id",
+        "bus_breaker_bus2_id",
+    ],
+    SupportedNetworkElementTypes.GENERATOR: ["connected", "bus_breaker_bus_id"],
+}
+
+# Bus-breaker columns of the elements that can be imported disconnected, as OFF, per bus
+# column of the bus view.
+_BUS_BREAKER_COLUMNS = {
+    SupportedNetworkElementTypes.LINE: {
+        "bus1_id": "bus_breaker_bus1_id",
+        "bus2_id": "bus_breaker_bus2_id",
+    },
+    SupportedNetworkElementTypes.GENERATOR: {"bus_id": "bus_breaker_bus_id"},
+}
+
+# Bus columns that must be filled for an element to be representable.
+_BUS_COLUMNS = {
+    SupportedNetworkElementTypes.TWO_WINDINGS_TRANSFORMERS: ["bus1_id", "bus2_id"],
+    SupportedNetworkElementTypes.LINE: ["bus1_id", "bus2_id"],
+    SupportedNetworkElementTypes.LOAD: ["bus_id"],
+    SupportedNetworkElementTypes.GENERATOR: ["bus_id"],
+}
+
+
+def _to_records(df: pd.DataFrame) -> list[dict]:
+    """Turn a dataframe into records, missing values (NaN or '') being mapped to None."""
+    df = df.replace({"": None})
+    return df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+
+def _static_dataframe_from_pypowsybl(
+    pypowsybl_network: PyPowSyblNetwork,
+    element_type: SupportedNetworkElementTypes,
+) -> pd.DataFrame:
+    """Fetch the static attributes of all elements of a type, renamed to our attribute names."""
+
+    columns = STATIC_COLUMNS_FROM_PYPOWSYBL[element_type]
+    df = getattr(pypowsybl_network, PYPOWSYBL_GETTERS[element_type])(
+        attributes=list(columns.values()) + _EXTRA_COLUMNS.get(element_type, [])
+    )
+
+    bus_breaker_columns = _BUS_BREAKER_COLUMNS.get(element_type, {})
+    if bus_breaker_columns:
+        # Bus-view bus of each bus-breaker bus, '' for buses that are isolated too.
+        bus_view_ids = pypowsybl_network.get_bus_breaker_view_buses(
+            attributes=["bus_id"]
+        )["bus_id"]
+        df = df.assign(
+            **{
+                column: df[column].mask(
+                    df[column] == "",
+                    df[bus_breaker_column].map(bus_view_ids).fillna(""),
+                )
+                for column, bus_breaker_column in bus_breaker_columns.items()
+            }
+        )
+
+    bus_columns = _BUS_COLUMNS.get(element_type, [])
+    if bus_columns:
+        df = df[(df[bus_columns] != "").all(axis=1)]
+
+    if element_type == SupportedNetworkElementTypes.LINE:
+        df = df.assign(
+            status=np.where(
+                df["connected1"] & df["connected2"],
+                ElementStatus.ON.value,
+                ElementStatus.OFF.value,
+            )
+        )
+    elif element_type == SupportedNetworkElementTypes.GENERATOR:
+        df = df.assign(
+            status=np.where(
+                df["connected"], ElementStatus.ON.value, ElementStatus.OFF.value
+            )
+        )
+    elif element_type == SupportedNetworkElementTypes.VOLTAGE_LEVEL:
+        df = df.assign(topology_kind="BUS_BREAKER")
+
+    df = df.drop(columns=_EXTRA_COLUMNS.get(element_type, []))
+    return df.rename(columns={v: k for k, v in columns.items()})
+
+
+def _line_constraints_from_pypowsybl(
+    pypowsybl_network: PyPowSyblNetwork,
+    line_ids: set[str],
+) -> dict[str, list[OperationalConstraint]]:
+    """
+    Map the permanent limits of lines to OperationalConstraint s. Temporary limits are left
+    out, as a constraint is identified by its element, side and type.
+    """
+
+    limits = pypowsybl_network.get_operational_limits(all_attributes=True).reset_index()
+    if limits.empty:
+        return {}
+
+    limits = limits[
+        limits["element_id"].isin(line_ids)
+        & np.isfinite(limits["value"])
+        & (limits["value"] < np.finfo(np.float64).max)
+        & (limits["acceptable_duration"] == -1)
+        & limits["type"].isin([i.value for i in OperationalConstraintType])
+        & limits["side"].isin([i.value for i in BranchSide])
+    ]
+    if "selected" in limits.columns:
+        limits = limits[limits["selected"]]
+
+    constraints = {}
+    for row in limits.itertuples(index=False):
+        constraints.setdefault(row.element_id, []).append(
+            OperationalConstraint.from_element(
+                element_id=row.element_id,
+                timestamp=None,
+                element_type=SupportedNetworkElementTypes.LINE,
+                side=BranchSide(row.side),
+                name=row.name,
+                type=OperationalConstraintType(row.type),
+                value=float(row.value),
+                acceptable_duration=int(row.acceptable_duration),
+            )
+        )
+    return constraints
+
+
+def elements_from_pypowsybl_network(
+    pypowsybl_network: PyPowSyblNetwork,
+    network_id: str,
+) -> list[NetworkElement]:
+    """
+    Convert a whole pypowsybl network into STATIC NetworkElement s, reading one dataframe
+    per element type rather than querying elements one by one. Disconnected lines and
+    generators are imported OFF, on the buses they would connect to. Other elements that
+    are not connected to a bus on one of their sides can't be represented and are left
+    out.
+    """
+
+    static_dataframes = {
+        element_type: _static_dataframe_from_pypowsybl(
+            pypowsybl_network=pypowsybl_network, element_type=element_type
+        )
+        for element_type in STATIC_COLUMNS_FROM_PYPOWSYBL.keys()
+    }
+
+    constraints = _line_constraints_from_pypowsybl(
+        pypowsybl_network=pypowsybl_network,
+        line_ids=set(static_dataframes[SupportedNetworkElementTypes.LINE].index),
+    )
+
+    elements = []
+    for element_type, df in static_dataframes.items():
+        metadata_cls = MetadataRegistry[element_type]
+        for element_id, static in zip(df.index, _to_records(df)):
+            elements.append(
+                NetworkElement.from_metadata(
+                    id=element_id,
+                    timestamp=None,
+                    type=element_type,
+                    element_metadata=metadata_cls.model_validate(
+                        {"state": State.STATIC, "static": static}
+                    ),
+                    operational_constraints=constraints.get(element_id, []),
+                    network_id=network_id,
+                )
+            )
+
+    return elements
+
+
+def solved_values_from_pypowsybl_network(
+    pypowsybl_network: PyPowSyblNetwork,
+    elements: list[NetworkElement],
+) -> dict[SupportedNetworkElementTypes, tuple[list[NetworkElement], list[tuple]]]:
+    """
+    Read the results of the loadflow run on the pypowsybl network for elements of a single
+    timestamp, once per element type and restricted to the solved columns. Returns, per type,
+    the elements to solve and their rows of solved values, in the order of
+    'SOLVED_COLUMNS_FROM_PYPOWSYBL'.
+
+    Only loads, and lines and generators that are ON, are read, as in the solver's output.
+    """
+
+    elements_by_type = {element_type: [] for element_type in SOLVED_ATTRIBUTES.keys()}
+    for element in elements:
+        if element.type not in elements_by_type:
+            continue
+        if (
+            element.type != SupportedNetworkElementTypes.LOAD
+            and element.element_metadata.static.status != ElementStatus.ON
+        ):
+            continue
+        elements_by_type[element.type].append(element)
+
+    solved_values = {}
+    for element_type, type_elements in elements_by_type.items():
+        if not type_elements:
+            continue
+
+        columns = SOLVED_COLUMNS_FROM_PYPOWSYBL[element_type]
+        df = getattr(pypowsybl_network, PYPOWSYBL_GETTERS[element_type])(
+            attributes=list(columns.values())
+        ).loc[[element.id for element in type_elements]]
+        solved_values[element_type] = (
+            type_elements,
+            list(zip(*(df[column].tolist() for column in columns.values()))),
+        )
+
+    return solved_values
+
+
+def _copy(attributes: BaseConfigModel | None) -> BaseConfigModel | None:
+    return attributes.model_copy() if attributes is not None else None
+
+
+def solved_elements_from_values(
+    solved_values: dict[
+        SupportedNetworkElementTypes, tuple[list[NetworkElement], list[tuple]]
+    ],
+    network_id: str,
+) -> list[NetworkElement]:
+    """
+    Turn elements into SOLVED ones, given their rows of solved values as read by
+    'solved_values_from_pypowsybl_network'. Solved elements keep the uid of the given
+    elements and shallow copies of their static and dynamic attributes, rather than
+    rebuilding them, so that elements moved in place afterwards (see 'NetworkDelta.apply')
+    leave the results as solved.
+    """
+
+    solved_elements = []
+    for element_type, (type_elements, values) in solved_values.items():
+        columns = SOLVED_COLUMNS_FROM_PYPOWSYBL[element_type]
+        solved_cls = SOLVED_ATTRIBUTES[element_type]
+        metadata_cls = MetadataRegistry[element_type]
+        for element, row in zip(type_elements, values):
+            solved_elements.append(
+                NetworkElement(
+                    uid=element.uid,
+                    id=element.id,
+                    timestamp=element.timestamp,
+                    type=element_type,
+                    element_metadata=metadata_cls(
+                        state=State.SOLVED,
+                        static=element.element_metadata.static.model_copy(),
+                        dynamic=_copy(element.element_metadata.dynamic),
+                        solved=solved_cls(**dict(zip(columns.keys(), row))),
+                    ),
+                    network_id=network_id,
+                    operational_constraints=element.operational_constraints,
+                )
+            )
+
+    return solved_elements
+
+
+def solved_elements_from_pypowsybl_network(
+    pypowsybl_network: PyPowSyblNetwork,
+    elements: list[NetworkElement],
+    network_id: str,
+) -> list[NetworkElement]:
+    """
+    Turn elements of a single timestamp into SOLVED ones, with the results of the loadflow
+    run on the pypowsybl network. Results are read once per element type, restricted to the
+    solved columns, while static and dynamic attributes are carried over from the elements.
+
+    Only loads, and lines and generators that are ON, are returned, as in the solver's output.
+    Solved elements keep the uid of the given elements and copies of their static and
+    dynamic attributes, rather than rebuilding them from pypowsybl.
+    """
+
+    return solved_elements_from_values(
+        solved_values=solved_values_from_pypowsybl_network(
+            pypowsybl_network=pypowsybl_network, elements=elements
+        ),
+        network_id=network_id,
+    )
@@ -0,0 +1,44 @@
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict
+from pypowsybl.network import Network as PyPowSyblNetwork
+from src.core.constants import SupportedNetworkElementTypes
+from src.core.domain.models.element import NetworkElement
+
+
+class PyPowSyblNetworkSession(BaseModel):
+    """
+    A pypowsybl network built once and then kept in sync with successive snapshots of the
+    same grid. Each topology met gets its own variant of the network, so that switching
+    between known topologies only means changing the working variant and applying injections.
+
+    signature: Identifies the grid the network was built from, by its static content.
+    elements: Elements last synced, for later timestamps to be told apart from another
+        grid without hashing them.
+    network: The pypowsybl network, holding every element, including disconnected ones.
+    connected: Connection status applied in the working variant, for elements having a status.
+    base_variant: Variant holding every element connected, topology variants are cloned from.
+    status_element_ids: Ids of elements having a status, per type, in the order of the
+        topology bitmasks.
+    solved: Whether the working variant holds the voltages of a converged AC loadflow, which
+        the next one can start from.
+    variants: Variant of each topology bitmask, from the least to the most recently used.
+    solved_variants: Variants, other than the working one, holding converged voltages.
+    max_variants: Topology variants kept at most.
+    injection_timestamps: Timestamp whose injections each variant holds, for updates to only
+        send the ones a NetworkDelta changed.
+    """
+
+    signature: str
+    elements: list[NetworkElement]
+    network: PyPowSyblNetwork
+    connected: dict[str, bool]
+    base_variant: str
+    status_element_ids: dict[SupportedNetworkElementTypes, list[str]]
+    solved: bool = False
+    variants: dict[tuple[bool, ...], str] = {}
+    solved_variants: set[str] = set()
+    max_variants: int = 8
+    injection_timestamps: dict[str, datetime | None] = {}
+
+    # Can't generate pydantic model for the pp object
+    model_config = ConfigDict(arbitrary_types_allowed=True)
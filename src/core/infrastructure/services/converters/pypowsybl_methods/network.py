@@ -1,7 +1,11 @@
+import os
+from pathlib import Path
 import pypowsybl as pp
 import pandas as pd
 from src.core.domain.models.network import Network
 from src.core.domain.models.element import NetworkElement
+from src.core.domain.models.element import same_grid as same_elements_grid
+from src.core.domain.models.network_delta import NetworkDelta
 from src.core.constants import ElementStatus, SupportedNetworkElementTypes
 from src.core.infrastructure.services.converters.pypowsybl_methods.element import (
     element_to_pypowsybl,
@@ -9,8 +13,55 @@ from src.core.infrastructure.services.converters.pypowsybl_methods.element impor
 from src.core.infrastructure.services.converters.pypowsybl_methods.models.pypowsybl_network_wrapper import (
     PyPowSyblNetworkWrapper,
 )
+from src.core.infrastructure.services.converters.pypowsybl_methods.models.pypowsybl_network_session import (
+    PyPowSyblNetworkSession,
+)
+from src.core.utils import generate_hash
 from pypowsybl.network import Network as Pypowsyblnetwork
 
+# Creation methods, in the order elements have to be created.
+PYPOWSYBL_CREATION_METHODS = {
+    SupportedNetworkElementTypes.SUBSTATION: "create_substations",
+    SupportedNetworkElementTypes.VOLTAGE_LEVEL: "create_voltage_levels",
+    SupportedNetworkElementTypes.BUS: "create_buses",
+    SupportedNetworkElementTypes.TWO_WINDINGS_TRANSFORMERS: "create_2_windings_transformers",
+    SupportedNetworkElementTypes.LINE: "create_lines",
+    SupportedNetworkElementTypes.LOAD: "create_loads",
+    SupportedNetworkElementTypes.GENERATOR: "create_generators",
+}
+
+# Elements having a status, which maps to their connection in pypowsybl.
+STATUS_ELEMENT_TYPES = [
+    SupportedNetworkElementTypes.LINE,
+    SupportedNetworkElementTypes.GENERATOR,
+]
+
+
+def _create_elements(
+    network: Pypowsyblnetwork,
+    data: dict[SupportedNetworkElementTypes, list[dict]],
+) -> None:
+    """
+    Create elements, given as pypowsybl compatible dicts per type, in the PyPowSybl network.
+    Each type is created from a single dataframe, or one per set of filled attributes when
+    optional attributes are only given for some elements, so that no NaN is sent.
+    """
+
+    for element_type, method_name in PYPOWSYBL_CREATION_METHODS.items():
+        element_data = data.get(element_type, None)
+        if not element_data:
+            continue
+
+        records_by_columns = {}
+        for record in element_data:
+            records_by_columns.setdefault(tuple(record.keys()), []).append(record)
+
+        create_method = getattr(network, method_name)
+        for columns, records in records_by_columns.items():
+            create_method(
+                pd.DataFrame.from_records(records, columns=columns, index="id")
+            )
+
 
 def network_to_pypowsybl(network: Network) -> PyPowSyblNetworkWrapper:
     """
@@ -24,64 +75,296 @@ def network_to_pypowsybl(network: Network) -> PyPowSyblNetworkWrapper:
     ) -> tuple[Pypowsyblnetwork, list[NetworkElement]]:
         """This helper deals with converting a list of network elements into a PyPowSybl network."""
 
-        PYPOWSYBL_CREATION_METHODS = {
-            SupportedNetworkElementTypes.SUBSTATION: ("create_substations", True),
-            SupportedNetworkElementTypes.VOLTAGE_LEVEL: (
-                "create_voltage_levels",
-                True,
-            ),
-            SupportedNetworkElementTypes.BUS: ("create_buses", False),
-            SupportedNetworkElementTypes.TWO_WINDINGS_TRANSFORMERS: (
-                "create_2_windings_transformers",
-                True,
-            ),
-            SupportedNetworkElementTypes.LINE: ("create_lines", False),
-            SupportedNetworkElementTypes.LOAD: ("create_loads", False),
-            SupportedNetworkElementTypes.GENERATOR: ("create_generators", False),
-        }
-
         network = pp.network.create_empty()
         data = {etype: [] for etype in SupportedNetworkElementTypes}
         off_elements = []
         for element in elements:
-            element_dict = element_to_pypowsybl(element=element)
-            if element.type in [
-                SupportedNetworkElementTypes.LINE,
-                SupportedNetworkElementTypes.GENERATOR,
-            ]:  # Those elements have a status attribute.
-                if element.element_metadata.static.status == ElementStatus.ON:
-                    data[element.type].append(element_dict)
-                else:
-                    off_elements.append(element)
-                    continue
-            else:
-                data[element.type].append(element_dict)
-
-        # Create elements in the PyPowSybl network
-        for element_type, (
-            method_name,
-            use_dataframe,
-        ) in PYPOWSYBL_CREATION_METHODS.items():
-            element_data = data.get(element_type, None)
-            if element_data:
-                create_method = getattr(network, method_name)
-                if use_dataframe:
-                    create_method(pd.DataFrame.from_records(element_data, index="id"))
-                else:
-                    for item in element_data:
-                        create_method(**item)
+            # Those elements have a status attribute.
+            if (
+                element.type in STATUS_ELEMENT_TYPES
+                and element.element_metadata.static.status != ElementStatus.ON
+            ):
+                off_elements.append(element)
+                continue
+            data[element.type].append(element_to_pypowsybl(element=element))
+
+        _create_elements(network=network, data=data)
 
         return network, off_elements
 
-    result = {}
-    unique_timestamps = sorted(set([i.timestamp for i in network.elements]))
-    unique_timestamps = sorted({i.timestamp for i in network.elements})
+    elements_by_timestamp = {}
+    for element in network.elements:
+        elements_by_timestamp.setdefault(element.timestamp, []).append(element)
 
     result = {
-        t: _create_network_from_elements(
-            [i for i in network.elements if i.timestamp == t]
-        )
-        for t in unique_timestamps
+        t: _create_network_from_elements(elements_by_timestamp[t])
+        for t in sorted(elements_by_timestamp.keys())
     }
 
     return PyPowSyblNetworkWrapper(data=result)
+
+
+def same_grid(session: PyPowSyblNetworkSession, elements: list[NetworkElement]) -> bool:
+    """
+    Whether elements of a single timestamp belong to the grid the session was built from,
+    without hashing them: they're compared with the elements the session last met, see
+    'same_grid' of elements, which are replaced by them when equal, for the next comparison
+    to be by identity.
+    """
+
+    if not same_elements_grid(elements=elements, other=session.elements):
+        return False
+    session.elements = elements
+    return True
+
+
+def _update_elements(update_method, records: list[dict]) -> None:
+    """
+    Apply records, holding an 'id' and the attributes to update, through a pypowsybl update
+    method. Attributes set to None are left untouched rather than being sent as NaN.
+    """
+
+    if not records:
+        return
+
+    ids = [record["id"] for record in records]
+    columns = [column for column in records[0].keys() if column != "id"]
+    complete_columns = [
+        column
+        for column in columns
+        if all(record[column] is not None for record in records)
+    ]
+    if complete_columns:
+        update_method(
+            pd.DataFrame(
+                {
+                    column: [record[column] for record in records]
+                    for column in complete_columns
+                },
+                index=ids,
+            )
+        )
+    for column in columns:
+        if column in complete_columns:
+            continue
+        values = {
+            record["id"]: record[column]
+            for record in records
+            if record[column] is not None
+        }
+        if values:
+            update_method(pd.DataFrame({column: values}))
+
+
+def _topology_variant_id(topology: tuple[bool, ...]) -> str:
+    """Name the variant of a topology after its bitmask of connected elements."""
+    return f"topology-{int(''.join('1' if c else '0' for c in topology) or '0', 2):x}"
+
+
+def _use_topology_variant(
+    session: PyPowSyblNetworkSession, connected: dict[str, bool]
+) -> None:
+    """
+    Make the variant of the topology formed by 'connected' the working one, cloning it from
+    the base variant, and disconnecting what is not connected, when it isn't cached yet. The
+    least recently used variant is removed once more than 'max_variants' are kept.
+    """
+
+    network = session.network
+    topology = tuple(
+        connected[element_id]
+        for ids in session.status_element_ids.values()
+        for element_id in ids
+    )
+    working_variant = network.get_working_variant_id()
+    variant = session.variants.pop(topology, None)
+    if variant is None:
+        variant = _topology_variant_id(topology=topology)
+        network.clone_variant(session.base_variant, variant)
+        network.set_working_variant(variant)
+        disconnected = {
+            element_type: [i for i in ids if not connected[i]]
+            for element_type, ids in session.status_element_ids.items()
+        }
+        _update_elements(
+            update_method=network.update_lines,
+            records=[
+                {"id": i, "connected1": False, "connected2": False}
+                for i in disconnected[SupportedNetworkElementTypes.LINE]
+            ],
+        )
+        _update_elements(
+            update_method=network.update_generators,
+            records=[
+                {"id": i, "connected": False}
+                for i in disconnected[SupportedNetworkElementTypes.GENERATOR]
+            ],
+        )
+    session.variants[topology] = variant  # Now the most recently used.
+
+    if variant != working_variant:
+        # Voltages of a converged loadflow stay with the variant they were computed on.
+        if session.solved:
+            session.solved_variants.add(working_variant)
+        else:
+            session.solved_variants.discard(working_variant)
+        network.set_working_variant(variant)
+        session.solved = variant in session.solved_variants
+    session.connected.update(connected)
+
+    while len(session.variants) > session.max_variants:
+        evicted = session.variants.pop(next(iter(session.variants)))
+        network.remove_variant(evicted)
+        session.solved_variants.discard(evicted)
+        session.injection_timestamps.pop(evicted, None)
+
+
+def update_pypowsybl_network_session(
+    session: PyPowSyblNetworkSession,
+    elements: list[NetworkElement],
+    delta: NetworkDelta | None = None,
+) -> None:
+    """
+    Bring the session's network in line with elements of a single timestamp. The variant of
+    their topology, the on/off bitmask of lines and generators, is made the working one, so
+    that only injections of loads and generators are sent, in one call per type.
+
+    With the 'delta' leading to the elements, only the injections it changed are sent when
+    the variant holds the ones of its previous timestamp. Elements must belong to the grid
+    the session was built from, see 'same_grid'.
+    """
+
+    connected = {
+        element.id: element.element_metadata.static.status == ElementStatus.ON
+        for element in elements
+        if element.type in STATUS_ELEMENT_TYPES
+    }
+    _use_topology_variant(session=session, connected=connected)
+
+    variant = session.network.get_working_variant_id()
+    if (
+        delta is not None
+        and session.injection_timestamps.get(variant) == delta.previous_timestamp
+    ):
+        elements = [element for element in elements if element.id in delta.dynamics]
+    loads, generators = [], []
+    for element in elements:
+        if element.type == SupportedNetworkElementTypes.LOAD:
+            loads.append(
+                {
+                    "id": element.id,
+                    "p0": element.element_metadata.dynamic.Pd,
+                    "q0": element.element_metadata.dynamic.Qd,
+                }
+            )
+        elif element.type == SupportedNetworkElementTypes.GENERATOR:
+            generators.append(
+                {
+                    "id": element.id,
+                    "target_p": element.element_metadata.dynamic.Ptarget,
+                    "target_v": element.element_metadata.dynamic.Vtarget,
+                    "target_q": element.element_metadata.dynamic.Qtarget,
+                    "rated_s": element.element_metadata.dynamic.Srated,
+                }
+            )
+
+    _update_elements(update_method=session.network.update_loads, records=loads)
+    _update_elements(
+        update_method=session.network.update_generators, records=generators
+    )
+    session.injection_timestamps[variant] = (
+        delta.timestamp if delta is not None else elements[0].timestamp
+    )
+
+
+def base_case_key(elements: list[NetworkElement]) -> str:
+    """
+    Content hash of the base network built from elements of a single timestamp: their static
+    attributes, statuses aside as every element is connected in it, and which dynamic
+    attributes are set, injections being sent on each update anyway.
+    """
+
+    items = []
+    for element in elements:
+        metadata = element.element_metadata
+        static = metadata.static.model_dump(mode="json", exclude={"status"})
+        dynamic = metadata.dynamic.model_dump() if metadata.dynamic is not None else {}
+        items.append(
+            (
+                element.type.value,
+                element.id,
+                sorted(static.items()),
+                sorted(key for key, value in dynamic.items() if value is None),
+            )
+        )
+    return generate_hash(s=repr(sorted(items)))
+
+
+def _load_base_case(path: Path) -> Pypowsyblnetwork | None:
+    """Load a base network saved by '_save_base_case', None if missing or unreadable."""
+
+    if not path.exists():
+        return None
+    try:
+        return pp.network.load(str(path))
+    except pp.PyPowsyblError:
+        return None
+
+
+def _save_base_case(network: Pypowsyblnetwork, path: Path) -> None:
+    """Save a base network in binary IIDM, through a temporary file read by no one."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp{path.suffix}")
+    network.save(str(tmp_path), format="BIIDM")
+    os.replace(tmp_path, path)
+
+
+def pypowsybl_network_session(
+    elements: list[NetworkElement],
+    max_variants: int = 8,
+    base_case_dir: Path | None = None,
+) -> PyPowSyblNetworkSession:
+    """
+    Build a PyPowSybl network from elements of a single timestamp, to be kept in sync with later
+    timestamps through 'update_pypowsybl_network_session'. Contrary to 'network_to_pypowsybl',
+    elements that are not ON are created too, connected, in the base variant, from which a
+    variant is cloned for each topology met, up to 'max_variants' of them.
+
+    With a 'base_case_dir', the base network is saved there, keyed by 'base_case_key', and
+    loaded from there rather than built when it was saved before.
+    """
+
+    status_element_ids = {etype: [] for etype in STATUS_ELEMENT_TYPES}
+    for element in elements:
+        if element.type in STATUS_ELEMENT_TYPES:
+            status_element_ids[element.type].append(element.id)
+
+    signature = base_case_key(elements=elements)
+    path = base_case_dir / f"{signature}.biidm" if base_case_dir is not None else None
+    network = _load_base_case(path=path) if path is not None else None
+    if network is None:
+        network = pp.network.create_empty()
+        data = {etype: [] for etype in SupportedNetworkElementTypes}
+        for element in elements:
+            data[element.type].append(element_to_pypowsybl(element=element))
+        _create_elements(network=network, data=data)
+        if path is not None:
+            _save_base_case(network=network, path=path)
+
+    session = PyPowSyblNetworkSession(
+        signature=signature,
+        elements=elements,
+        network=network,
+        connected={
+            element.id: True  # Base networks have every element connected.
+            for element in elements
+            if element.type in STATUS_ELEMENT_TYPES
+        },
+        base_variant=network.get_working_variant_id(),
+        status_element_ids=status_element_ids,
+        max_variants=max_variants,
+    )
+    update_pypowsybl_network_session(session=session, elements=elements)
+
+    return session
@@ -1,18 +1,34 @@
 from datetime import datetime
+from pathlib import Path
 from src.core.infrastructure.services.converters.pypowsybl_methods.element import (
     element_to_pypowsybl,
     element_from_pypowsybl,
 )
 from src.core.infrastructure.services.converters.pypowsybl_methods.network import (
     network_to_pypowsybl,
+    same_grid,
+    base_case_key,
+    pypowsybl_network_session,
+    update_pypowsybl_network_session,
+)
+from src.core.infrastructure.services.converters.pypowsybl_methods.dataframe import (
+    elements_from_pypowsybl_network,
+    solved_elements_from_pypowsybl_network,
+    solved_elements_from_values,
+    solved_values_from_pypowsybl_network,
 )
 from src.core.domain.models.network import Network
 from src.core.domain.models.element import NetworkElement
+from src.core.domain.models.network_delta import NetworkDelta
 from src.core.constants import SupportedNetworkElementTypes
 from src.core.domain.models.operational_constraint import OperationalConstraint
 from src.core.infrastructure.services.converters.pypowsybl_methods.models.pypowsybl_network_wrapper import (
     PyPowSyblNetworkWrapper,
 )
+from src.core.infrastructure.services.converters.pypowsybl_methods.models.pypowsybl_network_session import (
+    PyPowSyblNetworkSession,
+)
+from pypowsybl.network import Network as PyPowSyblNetwork
 
 
 class PyPowsyblCompatService:  # TODO: The reverse, pypowsybl_to_network
@@ -20,6 +36,36 @@ class PyPowsyblCompatService:  # TODO: The reverse, pypowsybl_to_network
     def network_to_pypowsybl(network: Network) -> PyPowSyblNetworkWrapper:
         return network_to_pypowsybl(network=network)
 
+    @staticmethod
+    def same_grid(
+        session: PyPowSyblNetworkSession, elements: list[NetworkElement]
+    ) -> bool:
+        return same_grid(session=session, elements=elements)
+
+    @staticmethod
+    def base_case_key(elements: list[NetworkElement]) -> str:
+        return base_case_key(elements=elements)
+
+    @staticmethod
+    def pypowsybl_network_session(
+        elements: list[NetworkElement],
+        max_variants: int = 8,
+        base_case_dir: Path | None = None,
+    ) -> PyPowSyblNetworkSession:
+        return pypowsybl_network_session(
+            elements=elements, max_variants=max_variants, base_case_dir=base_case_dir
+        )
+
+    @staticmethod
+    def update_pypowsybl_network_session(
+        session: PyPowSyblNetworkSession,
+        elements: list[NetworkElement],
+        delta: NetworkDelta | None = None,
+    ) -> None:
+        return update_pypowsybl_network_session(
+            session=session, elements=elements, delta=delta
+        )
+
     @staticmethod
     def element_to_pypowsybl(element: NetworkElement) -> dict:
         return element_to_pypowsybl(element=element)
@@ -41,3 +87,45 @@ class PyPowsyblCompatService:  # TODO: The reverse, pypowsybl_to_network
             element_metadata_pypowsybl=element_metadata_pypowsybl,
             operational_constraints=operational_constraints,
         )
+
+    @staticmethod
+    def elements_from_pypowsybl_network(
+        pypowsybl_network: PyPowSyblNetwork,
+        network_id: str,
+    ) -> list[NetworkElement]:
+        return elements_from_pypowsybl_network(
+            pypowsybl_network=pypowsybl_network,
+            network_id=network_id,
+        )
+
+    @staticmethod
+    def solved_elements_from_pypowsybl_network(
+        pypowsybl_network: PyPowSyblNetwork,
+        elements: list[NetworkElement],
+        network_id: str,
+    ) -> list[NetworkElement]:
+        return solved_elements_from_pypowsybl_network(
+            pypowsybl_network=pypowsybl_network,
+            elements=elements,
+            network_id=network_id,
+        )
+
+    @staticmethod
+    def solved_values_from_pypowsybl_network(
+        pypowsybl_network: PyPowSyblNetwork,
+        elements: list[NetworkElement],
+    ) -> dict[SupportedNetworkElementTypes, tuple[list[NetworkElement], list[tuple]]]:
+        return solved_values_from_pypowsybl_network(
+            pypowsybl_network=pypowsybl_network, elements=elements
+        )
+
+    @staticmethod
+    def solved_elements_from_values(
+        solved_values: dict[
+            SupportedNetworkElementTypes, tuple[list[NetworkElement], list[tuple]]
+        ],
+        network_id: str,
+    ) -> list[NetworkElement]:
+        return solved_elements_from_values(
+            solved_values=solved_values, network_id=network_id
+        )
@@ -0,0 +1,249 @@
+import multiprocessing
+import queue
+import threading
+import time
+import traceback
+import structlog
+from datetime import datetime
+from multiprocessing.connection import Connection, Listener
+from typing import NamedTuple
+from src.core.domain.enums import LoadFlowType
+from src.core.domain.models.element import NetworkElement
+from src.core.domain.ports.loadflow_solver import LoadFlowSolver
+from src.core.domain.ports.network_builder import NetworkBuilder
+from src.core.infrastructure.adapters.cached_loadflow_solver import (
+    CacheEntry,
+    GridKeys,
+    loadflow_key,
+    to_entry,
+)
+
+logger = structlog.get_logger(__name__)
+
+# Id of the networks the service solves, gathering the timestamps of several clients.
+SERVICE_NETWORK_ID = "loadflow_service"
+
+
+class SolveRequest(NamedTuple):
+    connection: Connection
+    loadflow_type: LoadFlowType
+    elements: list[NetworkElement]
+
+
+class LoadFlowService:
+    """
+    Loadflow solver shared by the processes of a host, e.g. the environments of many
+    learners, so that a single solver and its warm workers serve them all, rather than each
+    process starting its own pypowsybl runtime.
+
+    Clients, see RemoteLoadFlowSolver, connect on localhost and send the elements of the
+    networks to solve. Requests arriving within 'batch_window' seconds of each other, up to
+    'max_batch_size', are solved together: timestamps with the same inputs are solved once,
+    and the others gathered into as few networks of a single grid as possible, for the
+    solver to spread their timestamps over its workers. Only the solved attributes are sent
+    back, in the compact format of the loadflow cache, for clients to rebuild their solved
+    networks.
+
+    Connections unpickle what they receive, so only clients with the 'authkey' are served,
+    and one is required.
+    """
+
+    def __init__(
+        self,
+        loadflow_solver: LoadFlowSolver,
+        network_builder: NetworkBuilder,
+        authkey: bytes,
+        address: tuple[str, int] = ("localhost", 0),
+        max_batch_size: int = 64,
+        batch_window: float = 0.002,
+    ) -> None:
+        if not authkey:
+            raise ValueError("An authkey is needed to serve loadflows.")
+
+        self.loadflow_solver = loadflow_solver
+        self.network_builder = network_builder
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        # Clients of a batch connect at once, beyond the default backlog of a single one.
+        self._listener = Listener(
+            address=address, authkey=authkey, backlog=max_batch_size
+        )
+        # The port actually bound, when asked for any free one.
+        self.address = self._listener.address
+        self._requests: queue.Queue[SolveRequest] = queue.Queue()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        # Clients of a batch may each have their own grid.
+        self._grid_keys = GridKeys(max_grids=max_batch_size)
+
+    def _accept(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                connection = self._listener.accept()
+            except (OSError, EOFError, multiprocessing.AuthenticationError):
+                # The listener was closed, or a client failed to authenticate.
+                if not self._stopped.is_set():
+                    logger.warning("Connection refused.", exc_info=True)
+                continue
+            threading.Thread(
+                target=self._receive, args=(connection,), daemon=True
+            ).start()
+
+    def _receive(self, connection: Connection) -> None:
+        """Queue the requests of a client, until it disconnects."""
+
+        try:
+            while not self._stopped.is_set():
+                loadflow_type, elements = connection.recv()
+                self._requests.put(
+                    SolveRequest(
+                        connection=connection,
+                        loadflow_type=loadflow_type,
+                        elements=elements,
+                    )
+                )
+        except (EOFError, OSError):
+            connection.close()
+
+    def _next_batch(self) -> list[SolveRequest]:
+        """Requests received within the batch window of the first one."""
+
+        try:
+            batch = [self._requests.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+        deadline = time.perf_counter() + self.batch_window
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(
+                    self._requests.get(timeout=max(0.0, deadline - time.perf_counter()))
+                )
+            except queue.Empty:
+                break
+        return batch
+
+    def _solve(
+        self,
+        timestamps: dict[str, tuple[str, datetime, list[NetworkElement]]],
+        loadflow_type: LoadFlowType,
+    ) -> dict[str, CacheEntry]:
+        """
+        Solve timestamps, by key, with their grid key, returning their results by key. A
+        network holds a single grid, and a single set of elements per timestamp, so
+        timestamps of other grids, or sharing a timestamp, are solved in turns.
+        """
+
+        rounds: list[tuple[str, dict[datetime, tuple[str, list[NetworkElement]]]]] = []
+        for key, (grid, timestamp, elements) in timestamps.items():
+            for round_grid, solve_round in rounds:
+                if round_grid == grid and timestamp not in solve_round:
+                    solve_round[timestamp] = (key, elements)
+                    break
+            else:
+                rounds.append((grid, {timestamp: (key, elements)}))
+
+        entries = {}
+        for _, solve_round in rounds:
+            solved_network = self.loadflow_solver.solve(
+                network=self.network_builder.from_elements(
+                    id=SERVICE_NETWORK_ID,
+                    elements=[
+                        e for _, elements in solve_round.values() for e in elements
+                    ],
+                ),
+                loadflow_type=loadflow_type,
+            )
+            statuses = self.loadflow_solver.get_loadflow_statuses()
+            solved_by_timestamp = {}
+            for element in solved_network.elements:
+                solved_by_timestamp.setdefault(element.timestamp, []).append(element)
+            for timestamp, (key, elements) in solve_round.items():
+                if timestamp in solved_by_timestamp:
+                    entries[key] = to_entry(
+                        elements=solved_by_timestamp[timestamp],
+                        status=statuses.get(timestamp),
+                    )
+                else:
+                    # Nothing solved for the timestamp: its elements are sent back as given.
+                    entries[key] = (None, [(e.id, None, None) for e in elements])
+        return entries
+
+    def _solve_batch(self, batch: list[SolveRequest]) -> None:
+        """Solve a batch of requests, replying to each with its results by timestamp."""
+
+        for loadflow_type in {request.loadflow_type for request in batch}:
+            requests = [r for r in batch if r.loadflow_type == loadflow_type]
+            timestamps, request_keys = {}, []
+            for request in requests:
+                elements_by_timestamp = {}
+                for element in request.elements:
+                    elements_by_timestamp.setdefault(element.timestamp, []).append(
+                        element
+                    )
+                keys = {}
+                for timestamp, elements in elements_by_timestamp.items():
+                    # Keys hold the grid, for clients of other grids sharing element
+                    # ids not to share solutions.
+                    grid = self._grid_keys.get(elements=elements)
+                    keys[timestamp] = loadflow_key(
+                        elements=elements,
+                        loadflow_type=loadflow_type,
+                        solver=type(self.loadflow_solver).__name__,
+                        grid=grid,
+                    )
+                    timestamps.setdefault(keys[timestamp], (grid, timestamp, elements))
+                request_keys.append(keys)
+
+            start = time.perf_counter()
+            try:
+                entries = self._solve(
+                    timestamps=timestamps, loadflow_type=loadflow_type
+                )
+                replies = [
+                    (True, {t: entries[key] for t, key in keys.items()})
+                    for keys in request_keys
+                ]
+            except Exception:
+                logger.error("Batch failed.", exc_info=True)
+                replies = [(False, traceback.format_exc())] * len(requests)
+            logger.debug(
+                "Batch solved.",
+                loadflow_type=loadflow_type.value,
+                requests=len(requests),
+                timestamps=sum(len(keys) for keys in request_keys),
+                solved_timestamps=len(timestamps),
+                seconds=time.perf_counter() - start,
+            )
+
+            for request, reply in zip(requests, replies):
+                try:
+                    request.connection.send(reply)
+                except OSError:
+                    # The client disconnected meanwhile.
+                    pass
+
+    def serve_forever(self) -> None:
+        """Solve the requests of clients, until shut down."""
+
+        threading.Thread(target=self._accept, daemon=True).start()
+        logger.info("Serving loadflows.", address=self.address)
+        while not self._stopped.is_set():
+            batch = self._next_batch()
+            if batch:
+                self._solve_batch(batch=batch)
+
+    def start(self) -> "LoadFlowService":
+        """Serve in a background thread."""
+
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def shutdown(self) -> None:
+        """Stop serving, then stop the solver's workers."""
+        self._stopped.set()
+        self._listener.close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.loadflow_solver.shutdown()
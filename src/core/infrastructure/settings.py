@@ -2,6 +2,7 @@ import dotenv
 from pathlib import Path
 from dotenv import find_dotenv
 from pydantic_settings import BaseSettings
+from src.core.constants import LoadFlowExecutor, MetricsSinks, SupportedBackends
 
 dotenv.load_dotenv(find_dotenv(".env"))
 
@@ -13,3 +14,15 @@ class Settings(BaseSettings):
     ARTIFACTS_LOCATION: Path
     MLFLOW_TRACKING_URI: str
     LOG_LEVEL: str
+    LOADFLOW_BACKEND: SupportedBackends = SupportedBackends.PYPOWSYBL
+    LOADFLOW_EXECUTOR: LoadFlowExecutor = LoadFlowExecutor.SEQUENTIAL
+    LOADFLOW_MAX_WORKERS: int = 1
+    LOADFLOW_WARM_START: bool = True  # AC loadflows start from the previous voltages.
+    LOADFLOW_CACHE_SIZE: int = 0  # Cached timestamps kept in memory, 0 to disable.
+    LOADFLOW_CACHE_DIR: Path | None = None
+    LOADFLOW_BASE_CASE_DIR: Path | None = None  # Built pypowsybl networks, reused.
+    LOADFLOW_METRICS_SINK: MetricsSinks | None = None
+    LOADFLOW_SERVICE_HOST: str = "localhost"  # Where the loadflow service listens.
+    LOADFLOW_SERVICE_PORT: int = 6100
+    # Required to serve or use the loadflow service, whose connections unpickle requests.
+    LOADFLOW_SERVICE_AUTHKEY: str | None = None
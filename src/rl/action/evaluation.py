@@ -0,0 +1,106 @@
+import numpy as np
+from src.core.domain.models.network import Network
+from src.core.domain.models.power_flow import (
+    SLACK_DISTRIBUTION_TOLERANCE,
+    PowerFlowCache,
+    switched_flows,
+)
+from src.rl.action.switch import SwitchAction
+
+
+class SwitchActionEvaluator:
+    """
+    This class predicts the effect of SwitchActions on a single timestamp Network
+    in DC, without solving the network once per action: all switches are
+    evaluated at once from the network's current topology, with rank-1 updates
+    of its flows.
+
+    Factorisations of the topologies met are kept, so that evaluating actions
+    on the next timestamps of an episode is cheap too.
+    """
+
+    def __init__(self, max_topologies: int = 64) -> None:
+        self.cache = PowerFlowCache(max_power_flows=max_topologies)
+
+    def predict_flows(
+        self, network: Network, actions: list[SwitchAction]
+    ) -> dict[SwitchAction, dict[str, float] | None]:
+        """
+        Predict the DC flow of every line once each action is executed. Lines out of
+        service get NaN. Actions whose effect can't be predicted this way, because
+        they would split the grid, close a line reaching out of it, or because the
+        network can't be balanced, get None.
+        """
+
+        elements = network.list_elements(timestamp=network.list_timestamps()[0])
+        grid = self.cache.grid_index(elements=elements)
+        state = grid.read_state(elements=elements)
+        power_flow = self.cache.dc_power_flow(
+            grid=grid, branch_in_service=state.branch_in_service
+        )
+        _, p_bus, remaining = grid.dc_injections(
+            state=state, bus_in_main=power_flow.bus_in_main
+        )
+        if abs(remaining) > SLACK_DISTRIBUTION_TOLERANCE:
+            return {action: None for action in actions}
+
+        line_index = {line_id: k for k, line_id in enumerate(grid.line_ids)}
+        branches = np.array([line_index[a.element_id] for a in actions], dtype=int)
+        # Switches splitting the grid are known from its connectivity, and not computed.
+        splitting = self.cache.topology_index(
+            grid=grid, branch_in_service=state.branch_in_service
+        ).splits(branches=branches)
+        flows = np.full((grid.n_lines, len(actions)), np.nan)
+        flows[:, ~splitting] = switched_flows(
+            power_flow=power_flow, p=p_bus, branches=branches[~splitting]
+        )[: grid.n_lines]
+
+        predictions = {}
+        for action, action_flows in zip(actions, flows.T):
+            if np.isnan(action_flows).all():
+                predictions[action] = None
+            else:
+                predictions[action] = dict(zip(grid.line_ids, action_flows.tolist()))
+        return predictions
+
+    def splits_grid(
+        self, network: Network, actions: list[SwitchAction]
+    ) -> dict[SwitchAction, bool]:
+        """
+        Whether each action would split the grid of a single timestamp Network, from its
+        connectivity only, so that islanding actions can be rejected without solving it.
+        """
+
+        elements = network.list_elements(timestamp=network.list_timestamps()[0])
+        grid = self.cache.grid_index(elements=elements)
+        state = grid.read_state(elements=elements)
+        line_index = {line_id: k for k, line_id in enumerate(grid.line_ids)}
+        splitting = self.cache.topology_index(
+            grid=grid, branch_in_service=state.branch_in_service
+        ).splits(
+            branches=np.array([line_index[a.element_id] for a in actions], dtype=int)
+        )
+        return dict(zip(actions, splitting.tolist()))
+
+    def predict_overloads(
+        self, network: Network, actions: list[SwitchAction]
+    ) -> dict[SwitchAction, int | None]:
+        """
+        Predict the number of lines whose flow would exceed their active power
+        limit once each action is executed, None when it can't be predicted.
+        """
+
+        elements = network.list_elements(timestamp=network.list_timestamps()[0])
+        grid = self.cache.grid_index(elements=elements)
+        limits = dict(zip(grid.line_ids, grid.line_limits))
+        overloads = {}
+        for action, flows in self.predict_flows(
+            network=network, actions=actions
+        ).items():
+            if flows is None:
+                overloads[action] = None
+            else:
+                overloads[action] = int(
+                    sum(abs(flow) > limits[line_id] for line_id, flow in flows.items())
+                )
+        return overloads
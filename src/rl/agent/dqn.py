@@ -157,6 +157,23 @@ class DQNAgent(BaseAgent):
         slope = (end_e - start_e) / num_timesteps
         return max(slope * current_timestep + start_e, end_e)
 
+    def _epsilon(
+        self, current_timestep: int, num_timesteps: int, episode: int
+    ) -> float:
+        """Probability of exploring at a timestep of an episode, 0 past exploration."""
+
+        return (
+            self.linear_schedule(
+                start_e=self.hyperparameters.get("start_e"),
+                end_e=self.hyperparameters.get("end_e"),
+                num_timesteps=self.hyperparameters.get("exploration_fraction")
+                * num_timesteps,
+                current_timestep=current_timestep,
+            )
+            if episode < 150  # TODO: Take this as an argument.
+            else 0
+        )
+
     def act(
         self,
         network_observation: NetworkObservation,
@@ -177,16 +194,10 @@ class DQNAgent(BaseAgent):
             - BaseAction: The chosen action.
         """
 
-        epsilon = (
-            self.linear_schedule(
-                start_e=self.hyperparameters.get("start_e"),
-                end_e=self.hyperparameters.get("end_e"),
-                num_timesteps=self.hyperparameters.get("exploration_fraction")
-                * num_timesteps,
-                current_timestep=current_timestep,
-            )
-            if episode < 150  # TODO: Take this as an argument.
-            else 0
+        epsilon = self._epsilon(
+            current_timestep=current_timestep,
+            num_timesteps=num_timesteps,
+            episode=episode,
         )
 
         if self.rng.random() < epsilon:
@@ -230,6 +241,56 @@ class DQNAgent(BaseAgent):
 
         return self.env_variables.get("action_space").valid_actions[action_idx]
 
+    def act_batch(
+        self,
+        observations: np.ndarray,
+        action_masks: np.ndarray,
+        current_timestep: int,
+        num_timesteps: int,
+        episode: int,
+    ) -> np.ndarray:
+        """
+        Select an action for each env of a batch based on the epsilon-greedy policy, among
+        the actions valid in their action masks.
+
+        Params:
+        - observations (np.ndarray): [env, feature] observations, as arrays.
+        - action_masks (np.ndarray): [env, action] whether each action is valid.
+        - current_timestep (int): The current timestep, used for epsilon decaying.
+        - num_timesteps (int): The total number of timesteps in the episode, used for epsilon decaying.
+
+        Returns:
+            - np.ndarray: The position of the chosen action in the action space, per env.
+        """
+
+        epsilon = self._epsilon(
+            current_timestep=current_timestep,
+            num_timesteps=num_timesteps,
+            episode=episode,
+        )
+
+        # Exploitation, the highest q_value among valid actions.
+        q_values = np.asarray(self.q_network(jnp.array(observations)))
+        action_idx = np.where(action_masks, q_values, -np.inf).argmax(axis=1)
+
+        # Exploration, with the weights of the augmented action space.
+        valid_actions = self.env_variables.get("action_space").valid_actions
+        weights = np.array(
+            [
+                self.env_variables.get("discrete_actions").count(action)
+                for action in valid_actions
+            ],
+            dtype=float,
+        )
+        for k in np.flatnonzero(self.rng.random(len(observations)) < epsilon):
+            probabilities = weights * action_masks[k]
+            if probabilities.sum() > 0:
+                action_idx[k] = self.rng.choice(
+                    len(valid_actions), p=probabilities / probabilities.sum()
+                )
+
+        return action_idx
+
     @staticmethod
     # @nnx.jit
     def update(
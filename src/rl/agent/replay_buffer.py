@@ -30,7 +30,7 @@ class ReplayBuffer:
         self.observation_space = observation_space
         self.action_space = action_space
         self.one_hot_map = one_hot_map
-        self.obs_shape = observation_space.shape[0] #* 2 # TODO: Deal with
+        self.obs_shape = observation_space.shape[0]  # * 2 # TODO: Deal with
         self.action_dim = action_space.to_gym().n
         self.pos = 0
         self.full = False
@@ -78,6 +78,42 @@ class ReplayBuffer:
             self.full = True
             self.pos = 0
 
+    def add_batch(
+        self,
+        observations: np.ndarray,
+        next_observations: np.ndarray,
+        actions: np.ndarray,
+        rewards: np.ndarray,
+        dones: np.ndarray,
+        infos: list[dict] | None = None,
+    ) -> None:
+        """
+        Add the transitions of a batch of envs, as arrays: actions are given by position in
+        the action space. Observation and action objects aren't kept for them.
+
+        Envs done being reset on the spot by vector envs, the next observation of their
+        transition is the 'final_observation' of their info, when given.
+        """
+
+        for k in range(len(actions)):
+            next_observation = next_observations[k]
+            if dones[k] and infos is not None and "final_observation" in infos[k]:
+                next_observation = infos[k]["final_observation"]
+            self.observations_objects.append(None)
+            self.observations[self.pos] = observations[k]
+            self.next_observations_objects.append(None)
+            self.next_observations[self.pos] = next_observation
+            self.actions_objects.append(None)
+            self.actions[self.pos] = 0
+            self.actions[self.pos, actions[k]] = 1
+            self.rewards[self.pos] = rewards[k]
+            self.dones[self.pos] = float(dones[k])
+
+            self.pos += 1
+            if self.pos == self.buffer_size:
+                self.full = True
+                self.pos = 0
+
     def sample(self, batch_size: int) -> ReplayBufferSamples:
         """Sample from the buffer."""
 
@@ -1,14 +1,18 @@
+from functools import partial
 from pathlib import Path
 import typer
 import mlflow
 from src.rl.config_loaders.environment.config_loader import EnvironmentConfig
-from src.rl.environment import make_env
-from src.rl.train import train
+from src.rl.environment import NetworkEnvironment, make_env
+from src.rl.enums import VectorMode
+from src.rl.train import train, train_vectorized
+from src.rl.vector_environment import VectorNetworkEnvironment
 from src.rl.repositories import Repositories
 from src.core.constants import LoadFlowType
 from src.core.infrastructure.settings import Settings
 from src.rl.config_loaders.agent.config_loader import AgentConfig
 from src.rl import agent as agent_module
+from src.rl.agent import DQNAgent
 from src.rl.logger.logger import logger
 
 app = typer.Typer()
@@ -17,6 +21,53 @@ settings = Settings()
 mlflow.set_tracking_uri(settings.MLFLOW_TRACKING_URI)
 
 
+def _make_env(
+    network_id: str,
+    agent_config_path: Path,
+    environment_config_path: Path,
+    loadflow_type: LoadFlowType,
+) -> NetworkEnvironment:
+    """
+    Build the environment of an experiment from its configs, in this process or in the
+    subprocess of a VectorNetworkEnvironment.
+    """
+
+    agent_config = AgentConfig.from_yaml(config_path=agent_config_path)
+    environment_config = EnvironmentConfig.from_yaml(
+        config_path=environment_config_path
+    )
+    repositories = Repositories(s=settings)
+    return make_env(
+        network_id=network_id,
+        network_repository=repositories.get_network_repository(),
+        environment_config=environment_config,
+        loadflow_solver=repositories.get_solver(),
+        network_builder=repositories.get_network_builder(),
+        network_snapshot_observation_builder=repositories.get_network_snapshot_observation_builder(
+            class_name=environment_config.network_snapshot_builder
+        ),
+        action_space_builder=repositories.get_action_space_builder(),
+        one_hot_map_builder=repositories.get_one_hot_map_builder(
+            class_name=environment_config.one_hot_map_builder
+        ),
+        network_observation_handler=repositories.get_network_observation_handler(),
+        network_transition_handler=repositories.get_network_transition_handler(
+            class_name=environment_config.network_transition_handler
+        ),
+        loadflow_type=loadflow_type,
+        reward_handler=repositories.get_reward_handler(
+            aggregator_name=agent_config.rewards.get("rewards_aggregator"),
+            rewards=agent_config.rewards.get("rewards"),
+        ),
+        action_types=agent_config.action_types,
+        observation_memory_length=agent_config.hyperparameters.get(
+            "observation_memory_length"
+        ),
+        outage_handler_builder=repositories.get_outage_handler_builder(),
+        network_element_outage_handler_builder=repositories.get_network_element_outage_handler_builder(),
+    )
+
+
 @app.command()
 def train_experiment(
     experiment_name: str = typer.Option(..., help="Name of the MLflow experiment."),
@@ -52,6 +103,13 @@ def train_experiment(
         None, help="The name of the model in the registry."
     ),
     seed: int = typer.Option(42, help="Seed for reproducibility."),
+    num_envs: int = typer.Option(
+        1, help="Number of environments a DQN agent is trained on at once."
+    ),
+    vector_mode: VectorMode = typer.Option(
+        VectorMode.IN_PROCESS,
+        help="Whether the environments run in this process or in subprocesses.",
+    ),
 ) -> None:
     """
     Train an RL agent in a specified environment.
@@ -59,42 +117,25 @@ def train_experiment(
 
     try:
         agent_config = AgentConfig.from_yaml(config_path=agent_config_path)
-        environment_config = EnvironmentConfig.from_yaml(
-            config_path=environment_config_path
-        )
         repositories = Repositories(s=settings)
 
-        logger.info(event="Initialising environment.", id=network_id)
+        logger.info(event="Initialising environment.", id=network_id, num_envs=num_envs)
 
-        env = make_env(
+        env_fn = partial(
+            _make_env,
             network_id=network_id,
-            network_repository=repositories.get_network_repository(),
-            environment_config=environment_config,
-            loadflow_solver=repositories.get_solver(),
-            network_builder=repositories.get_network_builder(),
-            network_snapshot_observation_builder=repositories.get_network_snapshot_observation_builder(
-                class_name=environment_config.network_snapshot_builder
-            ),
-            action_space_builder=repositories.get_action_space_builder(),
-            one_hot_map_builder=repositories.get_one_hot_map_builder(
-                class_name=environment_config.one_hot_map_builder
-            ),
-            network_observation_handler=repositories.get_network_observation_handler(),
-            network_transition_handler=repositories.get_network_transition_handler(
-                class_name=environment_config.network_transition_handler
-            ),
+            agent_config_path=agent_config_path,
+            environment_config_path=environment_config_path,
             loadflow_type=loadflow_type,
-            reward_handler=repositories.get_reward_handler(
-                aggregator_name=agent_config.rewards.get("rewards_aggregator"),
-                rewards=agent_config.rewards.get("rewards"),
-            ),
-            action_types=agent_config.action_types,
-            observation_memory_length=agent_config.hyperparameters.get(
-                "observation_memory_length"
-            ),
-            outage_handler_builder=repositories.get_outage_handler_builder(),
-            network_element_outage_handler_builder=repositories.get_network_element_outage_handler_builder(),
         )
+        if num_envs > 1:
+            env = VectorNetworkEnvironment(
+                env_fns=[env_fn] * num_envs,
+                action_space_builder=repositories.get_action_space_builder(),
+                mode=vector_mode,
+            )
+        else:
+            env = env_fn()
 
         logger.info(event="Initialising the agent.", config_path=agent_config_path)
 
@@ -113,23 +154,47 @@ def train_experiment(
 
         logger.info(event="Starting training.")
 
-        train(
-            experiment_name=experiment_name,
-            env=env,
-            agent=agent,
-            action_space_builder=repositories.get_action_space_builder(),
-            num_episodes=num_episodes,
-            num_timesteps=num_timesteps,
-            timestep_to_start_updating=timestep_to_start_updating,
-            timestep_update_freq=timestep_update_freq,
-            artifacts_location=artifacts_location,
-            loss_tracker=repositories.get_loss_tracker(),
-            reward_tracker=repositories.get_reward_tracker(),
-            log_model=log_model,
-            log_rollout_freq=log_rollout_freq,
-            registered_model_name=registered_model_name,
-            seed=seed,
-        )
+        if num_envs > 1:
+            if not isinstance(agent, DQNAgent):
+                m = f"Only a DQNAgent can be trained on {num_envs} environments."
+                raise ValueError(m)
+            with env:
+                train_vectorized(
+                    experiment_name=experiment_name,
+                    vector_env=env,
+                    agent=agent,
+                    num_episodes=num_episodes,
+                    num_timesteps=num_timesteps,
+                    timestep_to_start_updating=timestep_to_start_updating,
+                    timestep_update_freq=timestep_update_freq,
+                    artifacts_location=artifacts_location,
+                    loss_tracker=repositories.get_loss_tracker(),
+                    reward_tracker=repositories.get_reward_tracker(),
+                    log_model=log_model,
+                    registered_model_name=registered_model_name,
+                    seed=seed,
+                )
+        else:
+            try:
+                train(
+                    experiment_name=experiment_name,
+                    env=env,
+                    agent=agent,
+                    action_space_builder=repositories.get_action_space_builder(),
+                    num_episodes=num_episodes,
+                    num_timesteps=num_timesteps,
+                    timestep_to_start_updating=timestep_to_start_updating,
+                    timestep_update_freq=timestep_update_freq,
+                    artifacts_location=artifacts_location,
+                    loss_tracker=repositories.get_loss_tracker(),
+                    reward_tracker=repositories.get_reward_tracker(),
+                    log_model=log_model,
+                    log_rollout_freq=log_rollout_freq,
+                    registered_model_name=registered_model_name,
+                    seed=seed,
+                )
+            finally:
+                env.close()
 
         logger.info(event="Finished training.")
 
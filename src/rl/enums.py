@@ -24,3 +24,8 @@ class OutageType(Enum):
     @property
     def upper_duration(self):
         return self.value[1]
+
+
+class VectorMode(str, Enum):
+    IN_PROCESS = "IN_PROCESS"
+    SUBPROCESS = "SUBPROCESS"
@@ -8,8 +8,12 @@ from src.core.constants import SupportedNetworkElementTypes
 from src.rl.repositories.network_repository import NetworkRepository
 from src.core.constants import LoadFlowType
 from src.core.domain.models.network import Network
+from src.core.domain.models.injection_schedule import InjectionSchedule
 from src.rl.observation.network import NetworkObservation
+from src.rl.observation.layout import ObservationLayout
 from src.rl.action.base import BaseAction
+from src.rl.action.switch import SwitchAction
+from src.rl.action.evaluation import SwitchActionEvaluator
 from src.rl.action_space import ActionSpace
 from src.rl.one_hot_map import OneHotMap
 from src.rl.repositories import (
@@ -40,6 +44,7 @@ class NetworkEnvironment(gym.Env):
     def __init__(
         self,
         network: Network,
+        injection_schedule: InjectionSchedule,
         initial_observation: NetworkObservation,
         initial_network: Network,
         loadflow_solver: LoadFlowSolver,
@@ -55,6 +60,7 @@ class NetworkEnvironment(gym.Env):
         outage_handler: OutageHandler,
     ) -> None:
         self.network = network
+        self.injection_schedule = injection_schedule
         self.initial_observation = initial_observation
         self.initial_network = initial_network
         self.loadflow_solver = loadflow_solver
@@ -68,6 +74,7 @@ class NetworkEnvironment(gym.Env):
         self.network_transition_handler = network_transition_handler
         self.network_observation_handler = network_observation_handler
         self.outage_handler = outage_handler
+        self.switch_action_evaluator = SwitchActionEvaluator()
 
     @property
     def current_timestamp(self):
@@ -109,52 +116,59 @@ class NetworkEnvironment(gym.Env):
         self.current_timestamp = (
             self.initial_observation.list_network_snapshot_observations()[0].timestamp
         )
+        # Position of the current timestamp in the injection schedule.
+        self.cursor = self.injection_schedule.timestamps.index(self.current_timestamp)
         self.current_observation = copy.deepcopy(self.initial_observation)
         self.current_network = copy.deepcopy(self.initial_network)
         self.is_terminated = False
         self.episode_reward = 0.0
         self.outage_handler.reset()
+        self.loadflow_solver.reset()
 
         return self.initial_observation, {}
 
+    def splitting_actions(self, actions: list[BaseAction]) -> set[BaseAction]:
+        """
+        SwitchActions among 'actions' that would split the current network's grid, known
+        from its connectivity only, for them to be masked rather than solved.
+        """
+
+        splits = self.switch_action_evaluator.splits_grid(
+            network=self.current_network,
+            actions=[action for action in actions if isinstance(action, SwitchAction)],
+        )
+        return {action for action, split in splits.items() if split}
+
     def step(self, action: BaseAction) -> tuple[NetworkObservation, float, bool, dict]:
         """
         Rollout one step of the environment.
         """
 
-        # 1) Fetch next timesamp's Network.
-        all_timestamps = self.network.timestamps
-        next_timestamp = all_timestamps[
-            all_timestamps.index(self.current_timestamp) + 1
-        ]
-        if not hasattr(self, "current_timestamp"):
+        if not hasattr(self, "cursor"):
             raise ValueError("You need to reset the environment before taking actions.")
 
-        next_network = (
-            self.network_builder.from_elements(  # NOTE: Make a copy of elements or not?
-                id=f"{self.network.id}_{parse_datetime_to_str(next_timestamp)}",
-                elements=self.network.list_elements(
-                    timestamp=all_timestamps[
-                        all_timestamps.index(self.current_timestamp) + 1
-                    ]
-                ),
-            )
-        )
+        # 1) Read next timestamp's injections from the schedule.
+        next_cursor = self.cursor + 1
+        next_timestamp = self.injection_schedule.timestamps[next_cursor]
+        delta = self.injection_schedule.delta(position=next_cursor)
 
-        # 2) Update current network with the action & inplace dynamic attrs with next timestamp's values.
-        # Inplace maybe the self.current_network?
+        # 2) Update current network with the action & inplace dynamic attrs changed by the delta.
         self.current_network = self.network_transition_handler.build_next_network(
             outage_handler=self.outage_handler,
             current_network=self.current_network,
-            next_network_no_action=next_network,
+            delta=delta,
             action=action,
         )
+        self.current_network.id = (
+            f"{self.network.id}_{parse_datetime_to_str(next_timestamp)}"
+        )
 
         # 3) Observation comes from solving the next_network_with_action.
         next_snapshot_observation = (
             self.network_snapshot_observation_builder.from_network(
-                network=self.loadflow_solver.solve(
+                network=self.loadflow_solver.solve_delta(
                     network=self.current_network,
+                    delta=delta,
                     loadflow_type=self.loadflow_type,
                 ),
                 timestamp=self.current_network.list_timestamps()[0],
@@ -175,8 +189,9 @@ class NetworkEnvironment(gym.Env):
             )
         )
         self.current_timestamp = next_timestamp
+        self.cursor = next_cursor
 
-        if next_timestamp == list(reversed(all_timestamps))[0]:
+        if next_cursor == len(self.injection_schedule) - 1:
             self.is_terminated = True
 
         return (
@@ -186,6 +201,10 @@ class NetworkEnvironment(gym.Env):
             {},
         )
 
+    def close(self) -> None:
+        """Stop the workers of the loadflow solver, once done with the env."""
+        self.loadflow_solver.shutdown()
+
 
 def make_env(
     network_id: str,
@@ -252,6 +271,10 @@ def make_env(
     one_hot_map = one_hot_map_builder.from_network_snapshot_observation(
         network_snapshot_observation=initial_network_snapshot_observation
     )
+    one_hot_map.layout = ObservationLayout(
+        one_hot_map=one_hot_map,
+        network_snapshot_observation=initial_network_snapshot_observation,
+    )
     initial_observation_empty = network_observation_handler.init_network_observation(
         history_length=observation_memory_length,
     )
@@ -266,6 +289,7 @@ def make_env(
 
     return NetworkEnvironment(
         network=network,
+        injection_schedule=InjectionSchedule.from_network(network=network),
         initial_observation=initial_observation,
         initial_network=initial_network,
         loadflow_solver=loadflow_solver,
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from src.core.domain.models.network import Network
+from src.core.domain.models.network_delta import NetworkDelta
 from src.rl.action.base import BaseAction
 
 
@@ -8,7 +9,7 @@ class NetworkTransitionHandler(ABC):
     @abstractmethod
     def build_next_network(
         current_network: Network,
-        next_network_no_action: Network,
+        delta: NetworkDelta,
         action: BaseAction,
     ) -> Network:
         pass
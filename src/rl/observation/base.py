@@ -2,9 +2,10 @@ import numpy as np
 import pandas as pd
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Self
+from typing import Any, Self
 from src.core.domain.models.element import NetworkElement
 from src.core.constants import SupportedNetworkElementTypes, ElementStatus
+from src.rl.one_hot_map import OneHotMap
 
 
 class BaseElementObservation(ABC):
@@ -12,8 +13,15 @@ class BaseElementObservation(ABC):
     This is a base class for an element observation, that is what an agent can see.
     A NetworkObservation will derive from this, as a natural list of BaseElementObservation
     as well as optional network level observations.
+
+    Features and arrays are cached, and computed again only once an attribute of the
+    observation is set: attributes must be set, rather than changed in place, for the
+    change to be seen.
     """
 
+    # Attributes caching encodings, rather than observed.
+    _CACHES = ("_version", "_features_cache", "_array_cache")
+
     def __init__(
         self,
         id: str,
@@ -26,6 +34,19 @@ class BaseElementObservation(ABC):
         self.type = type
         self.status = status
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self.__dict__["_version"] = self.__dict__.get("_version", 0) + 1
+
+    def __getstate__(self) -> dict:
+        # Caches are dropped from copies, whose arrays would be keyed by copied maps.
+        return {k: v for k, v in self.__dict__.items() if k not in self._CACHES}
+
+    @property
+    def version(self) -> int:
+        """Number of attributes set on the observation, telling when it changed."""
+        return self.__dict__.get("_version", 0)
+
     @classmethod
     @abstractmethod
     def from_element(cls, element: NetworkElement) -> Self:
@@ -52,12 +73,47 @@ class BaseElementObservation(ABC):
         pass
 
     @abstractmethod
-    def to_array(self, one_hot_map: dict[str, dict[str, np.ndarray]]) -> np.ndarray:
+    def to_features(self) -> list[tuple[str | None, Any]]:
+        """
+        The attributes of the element observation, in the order of its array: the
+        OneHotMap field and the category of one-hot encoded attributes, None and the
+        value of numerical ones.
+        """
+        pass
+
+    def features(self) -> list[tuple[str | None, Any]]:
+        """'to_features', computed again only once the observation changed."""
+
+        cache = self.__dict__.get("_features_cache")
+        if cache is None or cache[0] != self.version:
+            cache = (self.version, self.to_features())
+            self.__dict__["_features_cache"] = cache
+        return cache[1]
+
+    def to_array(self, one_hot_map: OneHotMap) -> np.ndarray:
         """
         Convert the element observation to a flat array, one-hot encoding
         categorical attributes using the provided one-hot mappings.
+
+        The array is read-only, being cached until the observation changes.
         """
-        pass
+
+        cache = self.__dict__.get("_array_cache")
+        if cache is None or cache[0] != self.version or cache[1] is not one_hot_map:
+            array = np.concatenate(
+                [
+                    (
+                        getattr(one_hot_map, field).get(value)
+                        if field is not None
+                        else [value]
+                    )
+                    for field, value in self.features()
+                ]
+            )
+            array.flags.writeable = False
+            cache = (self.version, one_hot_map, array)
+            self.__dict__["_array_cache"] = cache
+        return cache[2]
 
     @abstractmethod
     def to_dataframe(self) -> pd.DataFrame:
@@ -1,11 +1,9 @@
-import numpy as np
 import pandas as pd
 from datetime import datetime
 from src.core.constants import State, SupportedNetworkElementTypes
 from src.core.domain.models.element import NetworkElement
-from typing import Self
+from typing import Any, Self
 from src.core.constants import ElementStatus
-from src.rl.one_hot_map import OneHotMap
 from src.rl.observation.base import BaseElementObservation
 from src.core.utils import parse_datetime_to_str
 
@@ -80,28 +78,19 @@ class GeneratorObservation(BaseElementObservation):
             "reactive_power": self.reactive_power,
         }
 
-    def to_array(self, one_hot_map: "OneHotMap") -> np.ndarray:
+    def to_features(self) -> list[tuple[str | None, Any]]:
         """
-        This method turns a 'GeneratorObservation' to an array. It relies
-        heavily on the one_hot_map, which allows to map a categorical attr to
-        its relevant one-hot encoding.
-
-        Params:
-        - one_hot_map (dict[str, dict[str, np.ndarray]]): A dict containing with
-        the type of mapping as a key and the category to array mapping as values.
-
-        Returns:
-            np.ndarray: The observation as an array.
+        The attributes of a 'GeneratorObservation', in the order of its array.
         """
-        return np.concatenate(
-            [
-                one_hot_map.types.get(self.type),
-                one_hot_map.buses.get(self.bus_id),
-                one_hot_map.voltage_levels.get(self.voltage_level_id),
-                one_hot_map.statuses.get(self.status),
-                np.array([self.active_power, self.reactive_power, self.Ptarget]),
-            ]
-        )
+        return [
+            ("types", self.type),
+            ("buses", self.bus_id),
+            ("voltage_levels", self.voltage_level_id),
+            ("statuses", self.status),
+            (None, self.active_power),
+            (None, self.reactive_power),
+            (None, self.Ptarget),
+        ]
 
     def to_dataframe(self) -> pd.DataFrame:
         """
@@ -128,6 +117,11 @@ class GeneratorObservationWithOutage(BaseElementObservation):
         self.base_observation = base_observation
         self.outage_probability = outage_probability
 
+    @property
+    def version(self) -> int:
+        # The base observation may change on its own.
+        return super().version + self.base_observation.version
+
     @property
     def is_switchable(self) -> bool:
         return self.base_observation.is_switchable
@@ -150,9 +144,8 @@ class GeneratorObservationWithOutage(BaseElementObservation):
         base_dict["outage_probability"] = self.outage_probability
         return base_dict
 
-    def to_array(self, one_hot_map: OneHotMap) -> np.ndarray:
-        base_array = self.base_observation.to_array(one_hot_map)
-        return np.concatenate([base_array, [self.outage_probability]])
+    def to_features(self) -> list[tuple[str | None, Any]]:
+        return self.base_observation.to_features() + [(None, self.outage_probability)]
 
     def to_dataframe(self) -> pd.DataFrame:
         df = self.base_observation.to_dataframe()
@@ -0,0 +1,112 @@
+import numpy as np
+from gym import spaces
+from typing import TYPE_CHECKING
+from src.rl.one_hot_map import OneHotMap
+
+if TYPE_CHECKING:
+    from src.rl.observation.network import NetworkSnapshotObservation
+
+
+class ObservationLayout:
+    """
+    Where each attribute of each element observation of a snapshot lies in its array,
+    compiled once from the OneHotMap and the initial snapshot, the observation space being
+    assumed unique across timestamps.
+
+    Arrays are then written straight into float32 buffers: numerical attributes with a
+    single scatter of their values at their offsets, one-hot encoded ones by clearing their
+    blocks and setting a single position per attribute, without building per-element
+    arrays. They match the concatenation of the elements' arrays.
+    """
+
+    def __init__(
+        self,
+        one_hot_map: OneHotMap,
+        network_snapshot_observation: "NetworkSnapshotObservation",
+    ) -> None:
+        # Position of each category within the one-hot blocks of a OneHotMap field.
+        self._categories: dict[str, dict] = {}
+        # Offsets of the one-hot blocks, and of the numerical attributes.
+        one_hot_offsets, value_offsets, one_hot_slots = [], [], []
+        # Number of features of each element observation, to check the snapshots written.
+        self._feature_counts = []
+
+        offset = 0
+        for observation in network_snapshot_observation.observations:
+            features = observation.features()
+            self._feature_counts.append(len(features))
+            for field, _ in features:
+                if field is None:
+                    value_offsets.append(offset)
+                    offset += 1
+                    continue
+                if field not in self._categories:
+                    self._categories[field] = {
+                        category: int(np.argmax(one_hot))
+                        for category, one_hot in getattr(one_hot_map, field).items()
+                    }
+                width = len(self._categories[field])
+                one_hot_offsets.append(offset)
+                one_hot_slots.extend(range(offset, offset + width))
+                offset += width
+
+        self.size = offset
+        self._one_hot_offsets = np.array(one_hot_offsets, dtype=np.int64)
+        self._value_offsets = np.array(value_offsets, dtype=np.int64)
+        self._one_hot_slots = np.array(one_hot_slots, dtype=np.int64)
+        self.buffer = np.zeros(self.size, dtype=np.float32)
+        self._spaces: dict[int, spaces.Box] = {}
+
+    def observation_space(self, history_length: int = 1) -> spaces.Box:
+        """Space of the observations of 'history_length' snapshots, built once."""
+
+        if history_length not in self._spaces:
+            self._spaces[history_length] = spaces.Box(
+                low=-np.inf,
+                high=np.inf,
+                shape=(self.size * history_length,),
+                dtype=np.float32,
+            )
+        return self._spaces[history_length]
+
+    def write(
+        self,
+        network_snapshot_observation: "NetworkSnapshotObservation",
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        Write the array of a snapshot into 'out', e.g. a slice of a bigger buffer, or
+        into the layout's own buffer, which is returned and overwritten by the next write.
+        """
+
+        observations = network_snapshot_observation.observations
+        if len(observations) != len(self._feature_counts):
+            m = (
+                f"{len(observations)} observations for a layout of "
+                f"{len(self._feature_counts)}."
+            )
+            raise ValueError(m)
+
+        positions, values = [], []
+        for k, (observation, feature_count) in enumerate(
+            zip(observations, self._feature_counts)
+        ):
+            features = observation.features()
+            if len(features) != feature_count:
+                m = f"Observation {k} has {len(features)} features, not {feature_count}."
+                raise ValueError(m)
+            for field, value in features:
+                if field is None:
+                    values.append(value)
+                else:
+                    try:
+                        positions.append(self._categories[field][value])
+                    except KeyError:
+                        m = f"{value} is not in the one-hot encodings of {field}."
+                        raise ValueError(m) from None
+
+        out = self.buffer if out is None else out
+        out[self._one_hot_slots] = 0
+        out[self._one_hot_offsets + np.array(positions, dtype=np.int64)] = 1
+        out[self._value_offsets] = values
+        return out
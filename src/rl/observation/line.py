@@ -1,13 +1,10 @@
-import numpy as np
 import pandas as pd
 from typing import Self, Any
 from datetime import datetime
 
-from numpy import ndarray
 from src.core.constants import SupportedNetworkElementTypes, ElementStatus
 from src.core.domain.models.element import NetworkElement
 from src.rl.observation.base import BaseElementObservation
-from src.rl.one_hot_map import OneHotMap
 from src.core.utils import parse_datetime_to_str
 
 
@@ -71,12 +68,16 @@ class LineObservation(BaseElementObservation):
             g2=element.element_metadata.static.g2,
             r=element.element_metadata.static.r,
             x=element.element_metadata.static.x,
-            p1=element.element_metadata.solved.p1
-            if element.element_metadata.solved is not None  # TODO: update tests
-            else 0,
-            p2=element.element_metadata.solved.p2
-            if element.element_metadata.solved is not None
-            else 0,
+            p1=(
+                element.element_metadata.solved.p1
+                if element.element_metadata.solved is not None  # TODO: update tests
+                else 0
+            ),
+            p2=(
+                element.element_metadata.solved.p2
+                if element.element_metadata.solved is not None
+                else 0
+            ),
             operational_constraints=[
                 {
                     "affected_element": constraint.element_id,
@@ -121,65 +122,32 @@ class LineObservation(BaseElementObservation):
             "operational_constraints": self.operational_constraints,
         }
 
-    def to_array(self, one_hot_map: OneHotMap) -> ndarray:
+    def to_features(self) -> list[tuple[str | None, Any]]:
         """
-        This method turns a 'LineObservation' to an array. It relies
-        heavily on the one_hot_map, which allows to map a categorical attr to
-        its relevant one-hot encoding.
-
-        Params:
-        - one_hot_map (dict[str, dict[str, np.ndarray]]): A dict containing with
-        the type of mapping as a key and the category to array mapping as values.
-
-        Returns:
-            np.ndarray: The observation as an array.
+        The attributes of a 'LineObservation', in the order of its array: its categories,
+        flows, then its operational constraints, gathered by attribute.
         """
-        base_array = np.concatenate(
-            [
-                one_hot_map.types.get(self.type),
-                one_hot_map.statuses.get(self.status),
-                one_hot_map.buses.get("11Kv_0"),
-                one_hot_map.buses.get("11Kv_1"), # TODO: Make this dynamic etcc...
-                one_hot_map.voltage_levels.get(self.voltage_level1_id),
-                one_hot_map.voltage_levels.get(self.voltage_level2_id),
-                [
-                    self.p1,
-                    self.p2,
-                ],
-            ]
-        )
-
-        if len(self.operational_constraints) > 0:
-            array = np.concatenate(
-                [
-                    base_array,
-                    np.concatenate(
-                        [
-                            one_hot_map.constraint_sides.get(i.get("side"))
-                            for i in self.operational_constraints
-                        ]
-                    ),
-                    np.concatenate(
-                        [
-                            one_hot_map.constraint_types.get(i.get("type"))
-                            for i in self.operational_constraints
-                        ]
-                    ),
-                    np.concatenate(
-                        [
-                            one_hot_map.affected_elements.get(i.get("affected_element"))
-                            for i in self.operational_constraints
-                        ]
-                    ),
-                    [
-                        constraint.get("value")
-                        for constraint in self.operational_constraints
-                    ],
-                ],
+        features = [
+            ("types", self.type),
+            ("statuses", self.status),
+            ("buses", self.bus1_id),
+            ("buses", self.bus2_id),
+            ("voltage_levels", self.voltage_level1_id),
+            ("voltage_levels", self.voltage_level2_id),
+            (None, self.p1),
+            (None, self.p2),
+        ]
+        for field, key in [
+            ("constraint_sides", "side"),
+            ("constraint_types", "type"),
+            ("affected_elements", "affected_element"),
+            (None, "value"),
+        ]:
+            features.extend(
+                (field, constraint.get(key))
+                for constraint in self.operational_constraints
             )
-        else:
-            array = base_array
-        return array
+        return features
 
     def to_dataframe(self) -> pd.DataFrame:
         """
@@ -213,6 +181,11 @@ class LineObservationWithOutage(BaseElementObservation):
         self.p1 = base_observation.p1
         self.p2 = base_observation.p2
 
+    @property
+    def version(self) -> int:
+        # The base observation may change on its own.
+        return super().version + self.base_observation.version
+
     @property
     def is_switchable(self) -> bool:
         return self.base_observation.is_switchable
@@ -235,9 +208,8 @@ class LineObservationWithOutage(BaseElementObservation):
         base_dict["outage_probability"] = self.outage_probability
         return base_dict
 
-    def to_array(self, one_hot_map: OneHotMap) -> ndarray:
-        base_array = self.base_observation.to_array(one_hot_map)
-        return np.concatenate([base_array, [self.outage_probability]])
+    def to_features(self) -> list[tuple[str | None, Any]]:
+        return self.base_observation.to_features() + [(None, self.outage_probability)]
 
     def to_dataframe(self) -> pd.DataFrame:
         df = self.base_observation.to_dataframe()
@@ -1,13 +1,11 @@
-import numpy as np
 import pandas as pd
 import math
 from datetime import datetime
 from src.core.constants import State, SupportedNetworkElementTypes
 from src.core.domain.models.element import NetworkElement
-from typing import Self
+from typing import Any, Self
 from src.core.constants import ElementStatus
 from src.rl.observation.base import BaseElementObservation
-from src.rl.one_hot_map import OneHotMap
 from src.core.utils import parse_datetime_to_str
 
 
@@ -51,12 +49,16 @@ class LoadObservation(BaseElementObservation):
             bus_id=element.element_metadata.static.bus_id,
             voltage_level_id=element.element_metadata.static.voltage_level_id,
             Pd=element.element_metadata.dynamic.Pd,
-            active_power=0
-            if math.isnan(element.element_metadata.solved.p)
-            else element.element_metadata.solved.p,
-            reactive_power=0
-            if math.isnan(element.element_metadata.solved.q)
-            else element.element_metadata.solved.q,
+            active_power=(
+                0
+                if math.isnan(element.element_metadata.solved.p)
+                else element.element_metadata.solved.p
+            ),
+            reactive_power=(
+                0
+                if math.isnan(element.element_metadata.solved.q)
+                else element.element_metadata.solved.q
+            ),
         )
 
     @property
@@ -88,33 +90,19 @@ class LoadObservation(BaseElementObservation):
             "reactive_power": self.reactive_power,
         }
 
-    def to_array(self, one_hot_map: OneHotMap) -> np.ndarray:
+    def to_features(self) -> list[tuple[str | None, Any]]:
         """
-        This method turns a 'LoadObservation' to an array. It relies
-        heavily on the one_hot_map, which allows to map a categorical attr to
-        its relevant one-hot encoding.
-
-        Params:
-        - one_hot_map (dict[str, dict[str, np.ndarray]]): A dict containing with
-        the type of mapping as a key and the category to array mapping as values.
-
-        Returns:
-            np.ndarray: The observation as an array.
+        The attributes of a 'LoadObservation', in the order of its array.
         """
-
-        return np.concatenate(
-            [
-                one_hot_map.types.get(self.type),
-                one_hot_map.buses.get(self.bus_id),
-                one_hot_map.voltage_levels.get(self.voltage_level_id),
-                one_hot_map.statuses.get(self.status),
-                [
-                    self.Pd,
-                    self.active_power,
-                    self.reactive_power,
-                ],
-            ]
-        )
+        return [
+            ("types", self.type),
+            ("buses", self.bus_id),
+            ("voltage_levels", self.voltage_level_id),
+            ("statuses", self.status),
+            (None, self.Pd),
+            (None, self.active_power),
+            (None, self.reactive_power),
+        ]
 
     def to_dataframe(self) -> pd.DataFrame:
         """
@@ -139,6 +127,11 @@ class LoadObservationWithOutage(BaseElementObservation):
         self.base_observation = base_observation
         self.outage_probability = outage_probability
 
+    @property
+    def version(self) -> int:
+        # The base observation may change on its own.
+        return super().version + self.base_observation.version
+
     @property
     def is_switchable(self) -> bool:
         return self.base_observation.is_switchable
@@ -161,9 +154,8 @@ class LoadObservationWithOutage(BaseElementObservation):
         base_dict["outage_probability"] = self.outage_probability
         return base_dict
 
-    def to_array(self, one_hot_map: OneHotMap) -> np.ndarray:
-        base_array = self.base_observation.to_array(one_hot_map)
-        return np.concatenate([base_array, [self.outage_probability]])
+    def to_features(self) -> list[tuple[str | None, Any]]:
+        return self.base_observation.to_features() + [(None, self.outage_probability)]
 
     def to_dataframe(self) -> pd.DataFrame:
         df = self.base_observation.to_dataframe()
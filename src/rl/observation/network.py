@@ -17,6 +17,9 @@ class NetworkSnapshotObservation:
 
     NOTE: BaseElementObservation objects in a NetworkSnapshotObservation are alphabetically sorted asc by their id.
     This allows to keep consistent arrays when applying to_array().
+
+    NOTE: The array of a snapshot is memoised, and encoded again only once one of its observations changed, as
+    it is asked for several times per step, e.g. to act, to store transitions and to record them.
     """
 
     def __init__(
@@ -25,19 +28,24 @@ class NetworkSnapshotObservation:
         self.observations = observations
         # TODO: "timestamp" might not be consistent with the observations?
         self.timestamp = timestamp
+        self._array_cache = None
+
+    def __getstate__(self) -> dict:
+        # The memoised array is dropped from copies, being keyed by the map encoding it.
+        return {**self.__dict__, "_array_cache": None}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update({"_array_cache": None, **state})
 
     def to_observation_space(self, one_hot_map: OneHotMap) -> Space:
         """
         Convert a NetworkSnapshotObservation into a gym Space.
         """
 
-        observation_array = np.concatenate(
-            [
-                observation.to_array(one_hot_map=one_hot_map)
-                for observation in self.observations
-            ]
-        )
+        if one_hot_map.layout is not None:
+            return one_hot_map.layout.observation_space()
 
+        observation_array = self.to_array(one_hot_map=one_hot_map)
         return spaces.Box(
             low=-np.inf,
             high=np.inf,
@@ -45,14 +53,40 @@ class NetworkSnapshotObservation:
             dtype=np.float32,
         )
 
-    def to_array(self, one_hot_map: OneHotMap) -> np.ndarray:
-        """
-        Convert a NetworkSnapshotObservation to np.ndarray.
-        """
-
-        return np.concatenate(
-            [obs.to_array(one_hot_map=one_hot_map) for obs in self.observations],
-        )
+    def to_array(
+        self, one_hot_map: OneHotMap, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Convert a NetworkSnapshotObservation to np.ndarray, float32 when written with the
+        layout of the one_hot_map. The array is copied into 'out' if given, else the
+        memoised array is returned, read-only.
+        """
+
+        # Observations don't define equality, so they are compared by identity.
+        versions = [(obs, obs.version) for obs in self.observations]
+        cache = self._array_cache
+        if cache is None or cache[0] is not one_hot_map or cache[1] != versions:
+            layout = one_hot_map.layout
+            if layout is not None:
+                array = layout.write(
+                    network_snapshot_observation=self,
+                    out=np.empty(layout.size, dtype=np.float32),
+                )
+            else:
+                array = np.concatenate(
+                    [
+                        obs.to_array(one_hot_map=one_hot_map)
+                        for obs in self.observations
+                    ],
+                )
+            array.flags.writeable = False
+            cache = (one_hot_map, versions, array)
+            self._array_cache = cache
+
+        if out is not None:
+            out[:] = cache[2]
+            return out
+        return cache[2]
 
     def to_dataframe(self) -> dict[SupportedNetworkElementTypes, pd.DataFrame]:
         """
@@ -116,6 +150,18 @@ class NetworkObservation:
         if len(self.network_snapshot_observations) == 0:
             raise ValueError("Can't convert to np.ndarray if no snapshots provided.")
 
+        layout = one_hot_map.layout
+        if layout is not None:
+            # Snapshots are written straight into their slice of the history.
+            array = np.zeros(layout.size * self.history_length, dtype=np.float32)
+            missing = self.history_length - len(self.network_snapshot_observations)
+            for k, obs in enumerate(self.network_snapshot_observations, start=missing):
+                obs.to_array(
+                    one_hot_map=one_hot_map,
+                    out=array[k * layout.size : (k + 1) * layout.size],
+                )
+            return array
+
         missing = self.history_length - len(self.network_snapshot_observations)
         empty_obs = np.zeros_like(
             self.network_snapshot_observations[0].to_array(one_hot_map)
@@ -141,23 +187,24 @@ class NetworkObservation:
         if not self.network_snapshot_observations:
             raise ValueError("Cannot infer observation space from an empty history.")
 
+        if one_hot_map.layout is not None:
+            return one_hot_map.layout.observation_space(
+                history_length=self.history_length
+            )
+
         # Ensure all snapshots have the same observation space
-        for snapshot in self.network_snapshot_observations:
-            snapshot_space = snapshot.to_observation_space(one_hot_map)
+        snapshot_spaces = [
+            snapshot.to_observation_space(one_hot_map)
+            for snapshot in self.network_snapshot_observations
+        ]
+        for snapshot_space in snapshot_spaces:
             assert (
-                snapshot_space.shape
-                == self.network_snapshot_observations[0]
-                .to_observation_space(one_hot_map)
-                .shape
+                snapshot_space.shape == snapshot_spaces[0].shape
             ), "Mismatch in observation space shape across snapshots."
 
         # Extend the the observation space * history_length
         return spaces.Box(
-            low=self.network_snapshot_observations[0]
-            .to_observation_space(one_hot_map)
-            .low.repeat(self.history_length, axis=0),
-            high=self.network_snapshot_observations[0]
-            .to_observation_space(one_hot_map)
-            .high.repeat(self.history_length, axis=0),
+            low=snapshot_spaces[0].low.repeat(self.history_length, axis=0),
+            high=snapshot_spaces[0].high.repeat(self.history_length, axis=0),
             dtype=np.float32,
         )
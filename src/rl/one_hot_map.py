@@ -1,9 +1,12 @@
 import numpy as np
-from typing import Self, Any
+from typing import TYPE_CHECKING, Self, Any
 from src.core.constants import SupportedNetworkElementTypes
 from src.core.constants import ElementStatus
 from src.core.domain.enums import BranchSide, OperationalConstraintType
 
+if TYPE_CHECKING:
+    from src.rl.observation.layout import ObservationLayout
+
 
 class OneHotMap:
     """
@@ -16,6 +19,9 @@ class OneHotMap:
     To build the map, you need to rely on a NetworkObservation, usually
     the initial obs when you assume the obs space is constant throughout
     timesteps.
+
+    The ObservationLayout compiled from the map and that initial obs, if
+    any, is used to write the arrays of snapshot observations.
     """
 
     def __init__(
@@ -35,3 +41,4 @@ class OneHotMap:
         self.constraint_sides = constraint_sides
         self.constraint_types = constraint_types
         self.affected_elements = affected_elements
+        self.layout: "ObservationLayout | None" = None
@@ -1,4 +1,6 @@
+from src.core.domain.ports.metrics_sink import MetricsSink
 from src.core.infrastructure.settings import Settings
+from src.core.infrastructure.loadflow_solver_factory import LoadFlowSolverFactory
 
 import src.rl.repositories.one_hot_map_builder as ohmb
 from src.rl.one_hot_map_builder import OneHotMapBuilder
@@ -31,13 +33,7 @@ from src.rl.reward.reward_handler import RewardHandler
 from src.rl.repositories.network_observation_handler import (
     DefaultNetworkObservationHandler,
 )
-from src.core.infrastructure.adapters.pypowsybl_loadflow_solver import (
-    PyPowSyblLoadFlowSolver,
-)
 from src.core.infrastructure.adapters.network_builder import DefaultNetworkBuilder
-from src.core.infrastructure.services.converters.pypowsybl_methods.service import (
-    PyPowsyblCompatService,
-)
 from src.rl.repositories.loss_tracker import LossTracker
 from src.rl.repositories.reward_tracker import RewardTracker
 from src.rl.observation.network_observation_handler import NetworkObservationHandler
@@ -57,6 +53,8 @@ from src.rl.repositories.network_element_outage_handler_builder import (
 class Repositories:
     def __init__(self, s: Settings) -> None:
         self.settings = s
+        self.loadflow_solver_factory = LoadFlowSolverFactory(settings=s)
+        self.metrics_sink = self.get_metrics_sink()
 
     def get_network_repository(self) -> NetworkRepository:
         return SQLiteNetworkRepository(
@@ -64,11 +62,11 @@ class Repositories:
             should_create_tables=False,
         )
 
+    def get_metrics_sink(self) -> MetricsSink | None:
+        return self.loadflow_solver_factory.metrics_sink
+
     def get_solver(self) -> LoadFlowSolverRepository:
-        return PyPowSyblLoadFlowSolver(
-            to_pypowsybl_converter_service=PyPowsyblCompatService(),
-            network_builder=DefaultNetworkBuilder(),
-        )
+        return self.loadflow_solver_factory.loadflow_solver()
 
     def get_loss_tracker(self) -> LossTrackerRepository:
         return LossTracker()
@@ -1,7 +1,7 @@
 from src.rl.outage.outage_handler import OutageHandler
 from src.core.domain.models.network import Network
 from src.rl.action.base import BaseAction
-from src.core.constants import SupportedNetworkElementTypes
+from src.core.domain.models.network_delta import NetworkDelta
 from src.rl.environment_helpers import NetworkTransitionHandler
 
 
@@ -9,23 +9,15 @@ class SimpleNetworkTransitionHandler(NetworkTransitionHandler):
     @staticmethod
     def build_next_network(
         current_network: Network,
-        next_network_no_action: Network,
+        delta: NetworkDelta,
         action: BaseAction,
         outage_handler: OutageHandler | None = None,
     ) -> Network:
         """
-        Build next Network by inplacing dynamic attributes of elements, and applying action.
+        Build next Network by applying action, and inplacing the dynamic attributes that
+        changed at the next timestamp.
         """
         out = action.execute(current_network)
-        next_timestamp = next_network_no_action.elements[0].timestamp
-        out.id = next_network_no_action.id
-        for element in out.elements:
-            element.timestamp = next_timestamp
-            if element.type in [
-                SupportedNetworkElementTypes.GENERATOR,
-                SupportedNetworkElementTypes.LOAD,
-            ]:
-                element.element_metadata.dynamic = next_network_no_action.get_element(
-                    id=element.id, timestamp=next_timestamp
-                ).element_metadata.dynamic
+        # Statuses follow actions and outages, not the next timestamp's ones.
+        delta.apply(elements=out.elements, statuses=False)
         return out
@@ -1,6 +1,7 @@
 from src.core.domain.models.network import Network
 from src.rl.action.base import BaseAction
-from src.core.constants import ElementStatus, SupportedNetworkElementTypes
+from src.core.constants import ElementStatus
+from src.core.domain.models.network_delta import NetworkDelta
 from src.rl.environment_helpers import NetworkTransitionHandler
 from src.rl.outage.outage_handler import OutageHandler
 
@@ -9,26 +10,19 @@ class WithOutageNetworkTransitionHandler(NetworkTransitionHandler):
     @staticmethod
     def build_next_network(
         current_network: Network,
-        next_network_no_action: Network,
+        delta: NetworkDelta,
         action: BaseAction,
         outage_handler: OutageHandler,
     ) -> Network:
         """
-        Build next Network by inplacing dynamic attributes of elements, and applying action.
+        Build next Network by applying action, inplacing the dynamic attributes that
+        changed at the next timestamp, and updating statuses with outages.
         """
         outage_handler.step()  # this updates the state of the outage handler
         out = action.execute(current_network)
-        next_timestamp = next_network_no_action.elements[0].timestamp
-        out.id = next_network_no_action.id
+        # Statuses follow actions and outages, not the next timestamp's ones.
+        delta.apply(elements=out.elements, statuses=False)
         for element in out.elements:
-            element.timestamp = next_timestamp
-            if element.type in [
-                SupportedNetworkElementTypes.GENERATOR,
-                SupportedNetworkElementTypes.LOAD,
-            ]:
-                element.element_metadata.dynamic = next_network_no_action.get_element(
-                    id=element.id, timestamp=next_timestamp
-                ).element_metadata.dynamic
             network_element_outage_handler = (
                 outage_handler.get_network_element_outage_handler(element_id=element.id)
             )
@@ -1,7 +1,9 @@
 from pathlib import Path
 from datetime import datetime
 import mlflow
+import numpy as np
 from src.rl.environment import NetworkEnvironment
+from src.rl.vector_environment import VectorNetworkEnvironment
 from src.rl.agent.base import BaseAgent
 from src.rl.action_space_builder import ActionSpaceBuilder
 from src.rl.artifacts.utils import create_experiment
@@ -22,6 +24,44 @@ from src.rl.artifacts.utils import (
 from src.rl.logger.logger import logger
 
 
+def _update_dqn(
+    agent: DQNAgent,
+    t: int,
+    episode: int,
+    timestep_to_start_updating: int,
+    timestep_update_freq: int,
+    loss_tracker: LossTrackerRepository,
+) -> None:
+    """
+    Update the q_network from a sample of the replay buffer, every 'timestep_update_freq'
+    timesteps once updating has started, and copy it to the target network at its own
+    frequency.
+    """
+
+    if t >= timestep_to_start_updating:
+        if t % timestep_update_freq == 0:
+            data = agent.replay_buffer.sample(agent.hyperparameters.get("batch_size"))
+            loss = agent.update(
+                q_network=agent.q_network,
+                target_network=agent.target_network,
+                optimizer=agent.optimizer,
+                gamma=agent.hyperparameters.get("gamma"),
+                current_observations=data.observations,
+                actions=data.actions,
+                next_observations=data.next_observations,
+                rewards=data.rewards,
+                dones=data.dones,
+            )
+            loss_tracker.add_loss(loss=loss, episode=episode, timestamp=t)
+            logger.debug(episode=episode, timestamp=t, loss=loss)
+
+    if agent.hyperparameters.get("timestep_target_network_update_freq"):
+        if t % agent.hyperparameters.get("timestep_target_network_update_freq") == 0:
+            # TODO: We need equivalent of the state_dict
+            agent.target_network.dense1 = agent.q_network.dense1
+            agent.target_network.dense2 = agent.q_network.dense2
+
+
 def train(
     experiment_name: str,
     env: NetworkEnvironment,
@@ -126,38 +166,15 @@ def train(
                         done=done,
                     )
 
-                if t >= timestep_to_start_updating:
-                    if t % timestep_update_freq == 0:
-                        if isinstance(agent, DQNAgent):
-                            data = agent.replay_buffer.sample(
-                                agent.hyperparameters.get("batch_size")
-                            )
-                            loss = agent.update(
-                                q_network=agent.q_network,
-                                target_network=agent.target_network,
-                                optimizer=agent.optimizer,
-                                gamma=agent.hyperparameters.get("gamma"),
-                                current_observations=data.observations,
-                                actions=data.actions,
-                                next_observations=data.next_observations,
-                                rewards=data.rewards,
-                                dones=data.dones,
-                            )
-                            loss_tracker.add_loss(loss=loss, episode=episode, timestamp=t)
-                            logger.debug(episode=episode, timestamp=t, loss=loss)
-
                 if isinstance(agent, DQNAgent):
-                    if agent.hyperparameters.get("timestep_target_network_update_freq"):
-                        if (
-                            t
-                            % agent.hyperparameters.get(
-                                "timestep_target_network_update_freq"
-                            )
-                            == 0
-                        ):
-                            # TODO: We need equivalent of the state_dict
-                            agent.target_network.dense1 = agent.q_network.dense1
-                            agent.target_network.dense2 = agent.q_network.dense2
+                    _update_dqn(
+                        agent=agent,
+                        t=t,
+                        episode=episode,
+                        timestep_to_start_updating=timestep_to_start_updating,
+                        timestep_update_freq=timestep_update_freq,
+                        loss_tracker=loss_tracker,
+                    )
 
                 observation = next_observation
 
@@ -198,7 +215,128 @@ def train(
             log_pytorch_model_as_artifact(
                 model=agent.q_network,
                 X=agent.replay_buffer.observations[0],
-                registered_model_name=registered_model_name
-                if registered_model_name
-                else experiment_name,
+                registered_model_name=(
+                    registered_model_name if registered_model_name else experiment_name
+                ),
+            )
+
+
+def train_vectorized(
+    experiment_name: str,
+    vector_env: VectorNetworkEnvironment,
+    agent: DQNAgent,
+    num_episodes: int,
+    num_timesteps: int,
+    seed: int,
+    timestep_to_start_updating: int,
+    timestep_update_freq: int,
+    artifacts_location: Path,
+    loss_tracker: LossTrackerRepository,
+    reward_tracker: RewardTrackerRepository,
+    log_model: bool,
+    registered_model_name: str | None,
+):
+    """
+    Train a DQN agent's policy on a batch of envs stepped together, acting on all of them
+    at once and storing all their transitions at each timestep.
+
+    Each episode resets every env and runs 'num_timesteps' timesteps. Envs done within it
+    are reset on the spot by the vector env and keep on running, their transition storing
+    the last observation of their episode as next observation. The reward of an episode is
+    the mean, over envs, of the rewards they got. Rollouts aren't logged, observations
+    being batched as arrays.
+
+    Params:
+    - experiment_name (str): The name for th mlflow experiment.
+    - vector_env (VectorNetworkEnvironment): The simulators the agent interacts with.
+    - agent (DQNAgent): The agent to train.
+    - num_episodes (int): Number of episodes to train for.
+    - num_timesteps (int): Number of timesteps to run within each episode.
+    - timestep_to_start_updating (int): At which timestep to start updating the agent's policy.
+    - timestep_update_freq (int): Once updating has started, the number of timesteps btw each update.
+    - artifacts_location (Path): The directory in which to store the mlflow artifacts.
+    """
+
+    tags = {"experiment_type": "training"}
+    logger.info(event="Creating experiment.", name=experiment_name)
+    experiment_id = create_experiment(
+        experiment_name=experiment_name,
+        artifacts_location=artifacts_location / experiment_name,
+        tags=tags,
+    )
+
+    with mlflow.start_run(
+        experiment_id=experiment_id,
+    ):
+        mlflow.log_params(
+            params={
+                "num_episodes": num_episodes,
+                "num_timesteps": num_timesteps,
+                "num_envs": vector_env.num_envs,
+                "seed": seed,
+                "timestep_to_start_updating": timestep_to_start_updating,
+                "timestep_update_freq": timestep_update_freq,
+            }
+        )
+
+        for episode in range(1, num_episodes + 1):
+            observations, action_masks = vector_env.reset()
+            total_rewards = np.zeros(vector_env.num_envs)
+
+            for t in range(num_timesteps):
+                actions = agent.act_batch(
+                    observations=observations,
+                    action_masks=action_masks,
+                    current_timestep=t,
+                    num_timesteps=num_timesteps,
+                    episode=episode,
+                )
+                next_observations, rewards, dones, action_masks, infos = (
+                    vector_env.step(actions)
+                )
+                total_rewards += rewards
+
+                agent.replay_buffer.add_batch(
+                    observations=observations,
+                    next_observations=next_observations,
+                    actions=actions,
+                    rewards=rewards,
+                    dones=dones,
+                    infos=infos,
+                )
+                _update_dqn(
+                    agent=agent,
+                    t=t,
+                    episode=episode,
+                    timestep_to_start_updating=timestep_to_start_updating,
+                    timestep_update_freq=timestep_update_freq,
+                    loss_tracker=loss_tracker,
+                )
+
+                observations = next_observations
+
+            episode_reward = float(total_rewards.mean())
+            reward_tracker.add_reward(episode=episode, reward=episode_reward)
+            logger.info(episode=episode, episode_reward=episode_reward)
+
+        log_fig_as_artifact(
+            fig=reward_tracker.generate_figure(),
+            file_name="reward_through_episodes.html",
+        )
+        log_fig_as_artifact(
+            fig=loss_tracker.generate_figure(),
+            file_name="loss_through_episodes.html",
+        )
+
+        if log_model:
+            logger.info(event="Logging the model.")
+            logger.info(
+                event="Registering the model.", model_name=registered_model_name
+            )
+            log_pytorch_model_as_artifact(
+                model=agent.q_network,
+                X=agent.replay_buffer.observations[0],
+                registered_model_name=(
+                    registered_model_name if registered_model_name else experiment_name
+                ),
             )
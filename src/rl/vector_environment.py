@@ -0,0 +1,309 @@
+import multiprocessing
+import traceback
+import numpy as np
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable
+from src.rl.action_space_builder import ActionSpaceBuilder
+from src.rl.enums import VectorMode
+from src.rl.environment import NetworkEnvironment
+
+
+def _action_mask(
+    env: NetworkEnvironment, action_space_builder: ActionSpaceBuilder
+) -> np.ndarray:
+    """
+    [action] whether each action of the env's action space is valid on its network, actions
+    that would split its grid being masked too.
+    """
+
+    current_action_space = action_space_builder.from_action_types(
+        action_types=env.action_space.action_types,
+        network=env.current_network,
+        outage_handler=env.outage_handler,
+    )
+    valid_actions = set(current_action_space.valid_actions) - env.splitting_actions(
+        actions=current_action_space.valid_actions
+    )
+    return np.array(
+        [action in valid_actions for action in env.action_space.valid_actions],
+        dtype=bool,
+    )
+
+
+def _reset_env(
+    env: NetworkEnvironment, action_space_builder: ActionSpaceBuilder
+) -> tuple[np.ndarray, np.ndarray]:
+    observation, _ = env.reset()
+    return (
+        observation.to_array(one_hot_map=env.one_hot_map),
+        _action_mask(env=env, action_space_builder=action_space_builder),
+    )
+
+
+def _step_env(
+    env: NetworkEnvironment, action_space_builder: ActionSpaceBuilder, action: int
+) -> tuple[np.ndarray, np.ndarray, float, bool, dict]:
+    """
+    Step an env with the action at position 'action' of its action space, resetting it
+    once done. The last observation of an episode is then given as 'final_observation'.
+    """
+
+    observation, reward, done, info = env.step(env.action_space.valid_actions[action])
+    observation = observation.to_array(one_hot_map=env.one_hot_map)
+    if done:
+        info = {**info, "final_observation": observation}
+        observation, action_mask = _reset_env(
+            env=env, action_space_builder=action_space_builder
+        )
+    else:
+        action_mask = _action_mask(env=env, action_space_builder=action_space_builder)
+    return observation, action_mask, reward, done, info
+
+
+def _worker(
+    index: int,
+    env_fn: Callable[[], NetworkEnvironment],
+    action_space_builder: ActionSpaceBuilder,
+    connection: Connection,
+) -> None:
+    """
+    Run an env in a subprocess: its observations and action masks are written to its row
+    of the shared buffers, the rest being sent back through the connection.
+    """
+
+    shared_memories, buffers = [], []
+    try:
+        env = env_fn()
+        connection.send(
+            (True, (env.observation_space, env.action_space, env.one_hot_map))
+        )
+        for name, shape, dtype in connection.recv():
+            shared_memories.append(SharedMemory(name=name))
+            buffers.append(
+                np.ndarray(shape, dtype=dtype, buffer=shared_memories[-1].buf)
+            )
+        observations, action_masks = buffers
+        while True:
+            command, action = connection.recv()
+            if command == "close":
+                env.close()
+                break
+            try:
+                if command == "reset":
+                    observations[index], action_masks[index] = _reset_env(
+                        env=env, action_space_builder=action_space_builder
+                    )
+                    connection.send((True, None))
+                else:
+                    observation, action_mask, reward, done, info = _step_env(
+                        env=env,
+                        action_space_builder=action_space_builder,
+                        action=action,
+                    )
+                    observations[index], action_masks[index] = observation, action_mask
+                    connection.send((True, (reward, done, info)))
+            except Exception:
+                connection.send((False, traceback.format_exc()))
+    except Exception:
+        connection.send((False, traceback.format_exc()))
+    finally:
+        # Views must be released before their shared memory is closed.
+        observations = action_masks = None
+        buffers.clear()
+        for shared_memory in shared_memories:
+            shared_memory.close()
+        connection.close()
+
+
+class VectorNetworkEnvironment:
+    """
+    N copies of a NetworkEnvironment stepped together, with batched observations, rewards,
+    dones and action masks, for agents to act on all of them at once.
+
+    Envs are built by 'env_fns', either in this process, for cheap solvers, or each in its
+    own subprocess, for envs to solve their networks in parallel. Subprocesses are spawned,
+    as for the solvers' process pools, so 'env_fns' must be picklable, e.g. partials of
+    module level functions. They write their observations and action masks straight into
+    buffers shared with this process, only rewards, dones and infos being sent back.
+
+    Actions are given by their position in the action space, the same for every env. Envs
+    done are reset on the spot: the observation returned is then the first one of the next
+    episode, the last one of the episode being given as 'final_observation' in its info.
+    Action masks tell which actions are valid on the current network of each env.
+    """
+
+    def __init__(
+        self,
+        env_fns: list[Callable[[], NetworkEnvironment]],
+        action_space_builder: ActionSpaceBuilder,
+        mode: VectorMode = VectorMode.IN_PROCESS,
+    ) -> None:
+        if not env_fns:
+            raise ValueError("At least one environment is needed.")
+
+        self.num_envs = len(env_fns)
+        self.action_space_builder = action_space_builder
+        self.mode = mode
+        self.envs: list[NetworkEnvironment] = []
+        self._processes: list[multiprocessing.Process] = []
+        self._connections: list[Connection] = []
+        self._shared_memories: list[SharedMemory] = []
+        self.closed = False
+
+        if mode == VectorMode.IN_PROCESS:
+            self.envs = [env_fn() for env_fn in env_fns]
+            self.observation_space = self.envs[0].observation_space
+            self.action_space = self.envs[0].action_space
+            self.one_hot_map = self.envs[0].one_hot_map
+            self._observations, self._action_masks = self._allocate()
+            return
+
+        context = multiprocessing.get_context("spawn")
+        for index, env_fn in enumerate(env_fns):
+            connection, worker_connection = context.Pipe()
+            process = context.Process(
+                target=_worker,
+                args=(index, env_fn, action_space_builder, worker_connection),
+                daemon=True,
+            )
+            process.start()
+            worker_connection.close()
+            self._processes.append(process)
+            self._connections.append(connection)
+        try:
+            spaces = self._receive()
+            self.observation_space, self.action_space, self.one_hot_map = spaces[0]
+            self._observations, self._action_masks = self._allocate()
+            for connection in self._connections:
+                connection.send(
+                    [
+                        (shared_memory.name, buffer.shape, buffer.dtype)
+                        for shared_memory, buffer in zip(
+                            self._shared_memories,
+                            (self._observations, self._action_masks),
+                        )
+                    ]
+                )
+        except Exception:
+            self.close()
+            raise
+
+    def _allocate(self) -> tuple[np.ndarray, np.ndarray]:
+        """[env, feature] observations and [env, action] action masks buffers."""
+
+        shapes = [
+            ((self.num_envs, self.observation_space.shape[0]), np.dtype(np.float32)),
+            ((self.num_envs, len(self.action_space.valid_actions)), np.dtype(bool)),
+        ]
+        if self.mode == VectorMode.IN_PROCESS:
+            return tuple(np.zeros(shape, dtype=dtype) for shape, dtype in shapes)
+
+        buffers = []
+        for shape, dtype in shapes:
+            self._shared_memories.append(
+                SharedMemory(
+                    create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize)
+                )
+            )
+            buffers.append(
+                np.ndarray(shape, dtype=dtype, buffer=self._shared_memories[-1].buf)
+            )
+        return tuple(buffers)
+
+    def _receive(self) -> list:
+        """Results of every worker, raising the first error met in a worker."""
+
+        results = [connection.recv() for connection in self._connections]
+        for success, result in results:
+            if not success:
+                m = f"An environment failed in its subprocess:\n{result}"
+                raise RuntimeError(m)
+        return [result for _, result in results]
+
+    def reset(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Reset every env. Returns the [env, feature] observations and [env, action] masks.
+        """
+
+        if self.mode == VectorMode.IN_PROCESS:
+            for index, env in enumerate(self.envs):
+                self._observations[index], self._action_masks[index] = _reset_env(
+                    env=env, action_space_builder=self.action_space_builder
+                )
+        else:
+            for connection in self._connections:
+                connection.send(("reset", None))
+            self._receive()
+        return self._observations.copy(), self._action_masks.copy()
+
+    def step(
+        self, actions: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[dict]]:
+        """
+        Step every env with its action, by position in the action space. Returns the
+        [env, feature] observations, [env] rewards and dones, [env, action] masks and the
+        infos of each env.
+        """
+
+        if len(actions) != self.num_envs:
+            m = f"{len(actions)} actions given for {self.num_envs} environments."
+            raise ValueError(m)
+
+        if self.mode == VectorMode.IN_PROCESS:
+            results = []
+            for index, (env, action) in enumerate(zip(self.envs, actions)):
+                observation, action_mask, reward, done, info = _step_env(
+                    env=env,
+                    action_space_builder=self.action_space_builder,
+                    action=int(action),
+                )
+                self._observations[index], self._action_masks[index] = (
+                    observation,
+                    action_mask,
+                )
+                results.append((reward, done, info))
+        else:
+            for connection, action in zip(self._connections, actions):
+                connection.send(("step", int(action)))
+            results = self._receive()
+
+        rewards, dones, infos = zip(*results)
+        return (
+            self._observations.copy(),
+            np.array(rewards, dtype=np.float32),
+            np.array(dones, dtype=bool),
+            self._action_masks.copy(),
+            list(infos),
+        )
+
+    def close(self) -> None:
+        """Close the envs, stop the subprocesses and free the shared buffers."""
+
+        if self.closed:
+            return
+        self.closed = True
+        for env in self.envs:
+            env.close()
+        for connection in self._connections:
+            try:
+                connection.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for connection in self._connections:
+            connection.close()
+        self._observations = self._action_masks = None
+        for shared_memory in self._shared_memories:
+            shared_memory.close()
+            shared_memory.unlink()
+        self._shared_memories = []
+
+    def __enter__(self) -> "VectorNetworkEnvironment":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
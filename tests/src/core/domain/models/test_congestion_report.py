@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import datetime, timedelta
+from src.core.domain.models.congestion_report import (
+    CONSTRAINT_COLUMNS,
+    EPISODE_COLUMNS,
+    SUMMARY_COLUMNS,
+    CongestionReport,
+    timestamp_durations,
+)
+
+TIMESTAMPS = [datetime(2024, 1, 1) + timedelta(hours=k) for k in range(6)]
+
+
+def _report() -> CongestionReport:
+    """A permanent active power limit on L1 and a 2 hours current limit on L2."""
+    loadings = np.array(
+        [
+            [0.5, 1.2, 1.3, 0.9, 1.1, np.nan],
+            [1.1, 1.2, 1.5, 0.2, 1.05, 1.01],
+        ]
+    ).T
+    return CongestionReport(
+        timestamps=TIMESTAMPS,
+        constraints=pd.DataFrame(
+            [("L1", "ONE", "ACTIVE_POWER", -1), ("L2", "TWO", "CURRENT", 7200)],
+            columns=CONSTRAINT_COLUMNS,
+        ),
+        loadings=loadings,
+        limits=np.where(np.isnan(loadings), np.nan, [[100.0, 400.0]]),
+        durations=timestamp_durations(timestamps=TIMESTAMPS),
+    )
+
+
+class TestCongestionReport:
+    """Tests for the `CongestionReport` model."""
+
+    def test_episodes_are_checked_against_acceptable_durations(self):
+        episodes = _report().episodes()
+
+        assert episodes.columns.tolist() == EPISODE_COLUMNS
+        assert episodes["line_id"].tolist() == ["L1", "L1", "L2", "L2"]
+        assert episodes["start"].tolist() == [TIMESTAMPS[k] for k in (1, 4, 0, 4)]
+        assert episodes["end"].tolist() == [TIMESTAMPS[k] for k in (2, 4, 2, 5)]
+        assert episodes["duration"].tolist() == [7200.0, 3600.0, 10800.0, 7200.0]
+        assert episodes["max_loading"].tolist() == pytest.approx([1.3, 1.1, 1.5, 1.05])
+        assert episodes["violation"].tolist() == [True, True, True, False]
+
+    def test_summary_puts_worst_offenders_first(self):
+        summary = _report().summary()
+
+        assert summary.columns.tolist() == SUMMARY_COLUMNS
+        assert summary["line_id"].tolist() == ["L1", "L2"]
+        assert summary["limit"].tolist() == [100.0, 400.0]
+        assert summary["overloaded_timestamps"].tolist() == [3, 5]
+        assert summary["overloaded_seconds"].tolist() == [10800.0, 18000.0]
+        assert summary["longest_overload"].tolist() == [7200.0, 10800.0]
+        assert summary["violations"].tolist() == [2, 1]
+        assert summary["max_loading"].tolist() == pytest.approx([1.3, 1.5])
+        assert summary["mean_loading"].tolist() == pytest.approx([1.0, 6.06 / 6])
+
+    def test_histogram_counts_solved_timestamps(self):
+        histogram = _report().histogram(bins=(0.0, 1.0, 1.2, 2.0))
+
+        assert histogram.columns.tolist() == CONSTRAINT_COLUMNS + [
+            "[0, 1)",
+            "[1, 1.2)",
+            "[1.2, 2)",
+        ]
+        assert histogram.iloc[:, -3:].values.tolist() == [[2, 1, 2], [1, 3, 2]]
+
+    def test_no_overload(self):
+        report = _report()
+        report.loadings = report.loadings / 10
+
+        assert len(report.episodes()) == 0
+        assert len(report.worst_offenders()) == 0
+        assert report.summary()["violations"].tolist() == [0, 0]
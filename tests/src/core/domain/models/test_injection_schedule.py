@@ -0,0 +1,142 @@
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+from src.core.constants import (
+    DEFAULT_TIMEZONE,
+    ElementStatus,
+    State,
+    SupportedNetworkElementTypes,
+)
+from src.core.domain.models.element import NetworkElement
+from src.core.domain.models.elements_metadata.generator import (
+    GeneratorDynamicAttributes,
+    GeneratorMetadata,
+    GeneratorStaticAttributes,
+)
+from src.core.domain.models.elements_metadata.load import (
+    LoadDynamicAttributes,
+    LoadMetadata,
+    LoadStaticAttributes,
+)
+from src.core.domain.models.injection_schedule import InjectionSchedule
+from src.core.domain.models.network_delta import NetworkDelta
+from src.core.domain.models.network import Network
+from src.core.domain.models.network_delta import NetworkDelta
+from src.core.utils import generate_hash
+
+TIMESTAMPS = [
+    datetime(2025, 1, 1, 0, 0, 0, tzinfo=DEFAULT_TIMEZONE) + timedelta(hours=k)
+    for k in range(4)
+]
+
+
+def _elements(timestamp: datetime, Pd: float, Ptarget: float) -> list[NetworkElement]:
+    return [
+        NetworkElement.from_metadata(
+            id="load_1",
+            timestamp=timestamp,
+            type=SupportedNetworkElementTypes.LOAD,
+            element_metadata=LoadMetadata(
+                state=State.DYNAMIC,
+                static=LoadStaticAttributes(voltage_level_id="VL1", bus_id="bus_1"),
+                dynamic=LoadDynamicAttributes(Pd=Pd, Qd=2.0),
+            ),
+            operational_constraints=[],
+            network_id="network_1",
+        ),
+        NetworkElement.from_metadata(
+            id="gen_1",
+            timestamp=timestamp,
+            type=SupportedNetworkElementTypes.GENERATOR,
+            element_metadata=GeneratorMetadata(
+                state=State.DYNAMIC,
+                static=GeneratorStaticAttributes(
+                    status=ElementStatus.ON,
+                    voltage_level_id="VL1",
+                    bus_id="bus_1",
+                    Pmax=100.0,
+                    Pmin=0.0,
+                    is_voltage_regulator=True,
+                ),
+                dynamic=GeneratorDynamicAttributes(Ptarget=Ptarget, Vtarget=11.0),
+            ),
+            operational_constraints=[],
+            network_id="network_1",
+        ),
+    ]
+
+
+@pytest.fixture
+def network():
+    loads = [7.0, 8.0, 8.0, 9.0]
+    targets = [10.0, 10.0, 10.0, 12.0]
+    return Network(
+        uid=generate_hash("network_1"),
+        id="network_1",
+        elements=[
+            element
+            for timestamp, Pd, Ptarget in zip(TIMESTAMPS, loads, targets)
+            for element in _elements(timestamp=timestamp, Pd=Pd, Ptarget=Ptarget)
+        ],
+    )
+
+
+class TestInjectionSchedule:
+    """Tests for the `InjectionSchedule` of the injections of a network."""
+
+    def test_from_network(self, network):
+        schedule = InjectionSchedule.from_network(network=network)
+
+        assert len(schedule) == len(TIMESTAMPS)
+        assert schedule.element_ids == {
+            SupportedNetworkElementTypes.LOAD: ["load_1"],
+            SupportedNetworkElementTypes.GENERATOR: ["gen_1"],
+        }
+        assert schedule.values[SupportedNetworkElementTypes.LOAD][:, 0, 0].tolist() == [
+            7.0,
+            8.0,
+            8.0,
+            9.0,
+        ]
+        # Unset attributes round trip as None.
+        dynamic = schedule.dynamic(
+            element_type=SupportedNetworkElementTypes.GENERATOR, position=0, column=0
+        )
+        assert dynamic == GeneratorDynamicAttributes(Ptarget=10.0, Vtarget=11.0)
+
+    def test_deltas_match_deltas_between_timestamps(self, network):
+        schedule = InjectionSchedule.from_network(network=network)
+
+        for position in range(1, len(TIMESTAMPS)):
+            delta = schedule.delta(position=position)
+            expected = NetworkDelta.between(
+                elements=network.list_elements(timestamp=TIMESTAMPS[position - 1]),
+                next_elements=network.list_elements(timestamp=TIMESTAMPS[position]),
+            )
+            assert delta.previous_timestamp == TIMESTAMPS[position - 1]
+            assert delta.timestamp == TIMESTAMPS[position]
+            assert delta.dynamics == expected.dynamics
+
+        assert set(schedule.delta(position=3).dynamics) == {"gen_1", "load_1"}
+        assert len(schedule.delta(position=2)) == 0
+
+    def test_missing_injections_stay_nan(self, network):
+        """A missing load is sent as NaN, for the solvers to fail the timestamp on it."""
+
+        load = network.get_element(id="load_1", timestamp=TIMESTAMPS[2])
+        load.element_metadata.dynamic = LoadDynamicAttributes(Pd=float("nan"), Qd=2.0)
+        schedule = InjectionSchedule.from_network(network=network)
+
+        assert np.isnan(schedule.delta(position=2).dynamics["load_1"].Pd)
+        assert schedule.delta(position=3).dynamics["load_1"].Pd == 9.0
+        assert schedule.delta(position=2).dynamics.keys() == {"load_1"}
+
+    @pytest.mark.parametrize("position", [0, len(TIMESTAMPS)])
+    def test_delta_needs_a_previous_timestamp(self, network, position):
+        with pytest.raises(IndexError):
+            InjectionSchedule.from_network(network=network).delta(position=position)
+
+    def test_injections_are_needed_at_every_timestamp(self, network):
+        network.elements = network.elements[:-1]
+        with pytest.raises(ValueError):
+            InjectionSchedule.from_network(network=network)
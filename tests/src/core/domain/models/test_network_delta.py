@@ -0,0 +1,101 @@
+import pytest
+from datetime import datetime, timedelta
+from src.core.constants import (
+    DEFAULT_TIMEZONE,
+    ElementStatus,
+    State,
+    SupportedNetworkElementTypes,
+)
+from src.core.domain.models.element import NetworkElement
+from src.core.domain.models.elements_metadata.generator import (
+    GeneratorDynamicAttributes,
+    GeneratorMetadata,
+    GeneratorStaticAttributes,
+)
+from src.core.domain.models.network_delta import NetworkDelta
+
+TIMESTAMP = datetime(2025, 1, 1, 12, 0, 0, tzinfo=DEFAULT_TIMEZONE)
+NEXT_TIMESTAMP = TIMESTAMP + timedelta(hours=1)
+
+
+def _generator(
+    id: str,
+    timestamp: datetime,
+    Ptarget: float = 80.0,
+    status: ElementStatus = ElementStatus.ON,
+) -> NetworkElement:
+    return NetworkElement.from_metadata(
+        id=id,
+        timestamp=timestamp,
+        type=SupportedNetworkElementTypes.GENERATOR,
+        element_metadata=GeneratorMetadata(
+            state=State.DYNAMIC,
+            static=GeneratorStaticAttributes(
+                status=status,
+                voltage_level_id="VL1",
+                bus_id="bus_1",
+                Pmax=100.0,
+                Pmin=0.0,
+                is_voltage_regulator=True,
+            ),
+            dynamic=GeneratorDynamicAttributes(Ptarget=Ptarget, Vtarget=11.0),
+        ),
+        operational_constraints=[],
+        network_id="network_1",
+    )
+
+
+@pytest.fixture
+def elements():
+    return [_generator(id=f"gen_{k}", timestamp=TIMESTAMP) for k in range(3)]
+
+
+@pytest.fixture
+def next_elements():
+    return [
+        _generator(id="gen_0", timestamp=NEXT_TIMESTAMP),
+        _generator(id="gen_1", timestamp=NEXT_TIMESTAMP, Ptarget=50.0),
+        _generator(id="gen_2", timestamp=NEXT_TIMESTAMP, status=ElementStatus.OFF),
+    ]
+
+
+class TestNetworkDelta:
+    """Tests for the `NetworkDelta` between two timestamps of a network."""
+
+    def test_between_keeps_changed_elements(self, elements, next_elements):
+        delta = NetworkDelta.between(elements=elements, next_elements=next_elements)
+
+        assert delta.previous_timestamp == TIMESTAMP
+        assert delta.timestamp == NEXT_TIMESTAMP
+        assert list(delta.dynamics) == ["gen_1"]
+        assert delta.dynamics["gen_1"].Ptarget == 50.0
+        assert delta.statuses == {"gen_2": ElementStatus.OFF}
+        assert len(delta) == 2
+
+    @pytest.mark.parametrize(
+        "next_ids", [["gen_0", "gen_1"], ["gen_0", "gen_1", "gen_3"]]
+    )
+    def test_between_requires_the_same_elements(self, elements, next_ids):
+        with pytest.raises(ValueError):
+            NetworkDelta.between(
+                elements=elements,
+                next_elements=[
+                    _generator(id=i, timestamp=NEXT_TIMESTAMP) for i in next_ids
+                ],
+            )
+
+    @pytest.mark.parametrize("statuses", [True, False])
+    def test_apply_moves_elements_to_the_next_timestamp(
+        self, elements, next_elements, statuses
+    ):
+        delta = NetworkDelta.between(elements=elements, next_elements=next_elements)
+
+        delta.apply(elements=elements, statuses=statuses)
+
+        assert all(element.timestamp == NEXT_TIMESTAMP for element in elements)
+        assert [e.element_metadata.dynamic for e in elements] == [
+            e.element_metadata.dynamic for e in next_elements
+        ]
+        assert elements[2].element_metadata.static.status == (
+            ElementStatus.OFF if statuses else ElementStatus.ON
+        )
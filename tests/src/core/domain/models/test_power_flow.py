@@ -0,0 +1,330 @@
+import numpy as np
+import pytest
+import pypowsybl as pp
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+from src.core.domain.enums import LoadFlowStatus
+from src.core.domain.models.power_flow import (
+    ACPowerFlow,
+    DCPowerFlow,
+    GridIndex,
+    TopologyIndex,
+    distribute_slack,
+    lodf,
+    switched_flows,
+)
+from tests.src.core.infrastructure.adapters.test_numpy_dc_loadflow_solver import (
+    TIMESTAMPS,
+    _generated_network,
+)
+
+
+def _triangle(in_service: list[bool]) -> DCPowerFlow:
+    """3 buses in a triangle, branches 0-1, 1-2 and 0-2, and an isolated 4th bus."""
+    return DCPowerFlow(
+        n_buses=4,
+        from_bus=np.array([0, 1, 0]),
+        to_bus=np.array([1, 2, 2]),
+        susceptance=np.array([10.0, 10.0, 20.0]),
+        in_service=np.array(in_service),
+    )
+
+
+class TestDCPowerFlow:
+    """Tests for the `DCPowerFlow` model."""
+
+    def test_flows_split_along_parallel_paths(self):
+        power_flow = _triangle(in_service=[True, True, True])
+
+        flows = power_flow.flows(p=np.array([10.0, 0.0, -10.0, 0.0]))
+
+        # The direct branch is 4 times stiffer than the 2 branches in series.
+        assert flows == pytest.approx([2.0, 2.0, 8.0])
+        assert not power_flow.bus_in_main[3]
+
+    def test_injections_can_be_solved_at_once(self):
+        power_flow = _triangle(in_service=[True, False, True])
+        injections = np.array([[10.0, 5.0], [-4.0, 0.0], [-6.0, -5.0], [0.0, 0.0]])
+
+        flows = power_flow.flows(p=injections)
+
+        assert flows.shape == (3, 2)
+        assert np.isnan(flows[1]).all()
+        for k in range(2):
+            assert flows[:, k] == pytest.approx(
+                power_flow.flows(p=injections[:, k]), nan_ok=True
+            )
+
+    def test_ptdf_gives_the_flows(self):
+        power_flow = _triangle(in_service=[True, True, False])
+        p = np.array([10.0, 0.0, -10.0, 0.0])
+
+        ptdf = power_flow.ptdf()
+
+        assert ptdf.shape == (3, 4)
+        assert ptdf[:2] @ p == pytest.approx(power_flow.flows(p=p)[:2])
+        assert np.isnan(ptdf[2]).all()
+        assert (ptdf[:2, 3] == 0).all()
+
+
+def _switched(power_flow: DCPowerFlow, k: int) -> DCPowerFlow:
+    """The same power flow, with branch k switched and refactorised."""
+    in_service = power_flow.branch_in_main.copy()
+    in_service[k] = not in_service[k]
+    return DCPowerFlow(
+        n_buses=len(power_flow.bus_in_main),
+        from_bus=power_flow.from_bus,
+        to_bus=power_flow.to_bus,
+        susceptance=power_flow.susceptance,
+        in_service=in_service,
+    )
+
+
+def _ac_triangle(resistance: float) -> ACPowerFlow:
+    """The triangle at 100 kV, the direct branch being twice as stiff."""
+    x = np.array([10.0, 10.0, 5.0])
+    return ACPowerFlow(
+        n_buses=4,
+        from_bus=np.array([0, 1, 0]),
+        to_bus=np.array([1, 2, 2]),
+        series_admittance=1 / (resistance + 1j * x),
+        shunt_admittance1=np.zeros(3, dtype=complex),
+        shunt_admittance2=np.zeros(3, dtype=complex),
+        ratio=np.ones(3),
+        bus_vnominal=np.full(4, 100.0),
+        in_service=np.array([True, True, True]),
+    )
+
+
+class TestACPowerFlow:
+    """Tests for the `ACPowerFlow` model."""
+
+    @pytest.mark.parametrize("resistance", [0.0, 1.0])
+    def test_solution_balances_injections(self, resistance):
+        power_flow = _ac_triangle(resistance=resistance)
+        p = np.array([0.0, 0.0, -10.0, 0.0])
+        q = np.array([0.0, -2.0, -3.0, 0.0])
+        participation = np.array([1.0, 0.0, 0.0, 0.0])
+        pv_buses = np.array([True, False, False, False])
+
+        v, slack, _, status = power_flow.newton_raphson(
+            p=p,
+            q=q,
+            pv_buses=pv_buses,
+            v_magnitude=np.full(4, 1.02),
+            participation=participation,
+        )
+
+        assert status == LoadFlowStatus.CONVERGED
+        assert np.abs(v[0]) == pytest.approx(1.02)
+        assert np.isnan(v[3])
+        s = power_flow.bus_powers(v=v)
+        assert s.real[:3] == pytest.approx(p[:3] + participation[:3] * slack, abs=1e-5)
+        assert s.imag[1:3] == pytest.approx(q[1:3], abs=1e-5)
+        # The slack covers the losses, in the resistances only.
+        if resistance == 0:
+            assert slack == pytest.approx(10.0, abs=1e-5)
+        else:
+            assert slack > 10.0
+        s1, s2 = power_flow.branch_powers(v=v)
+        assert (s1 + s2).real == pytest.approx(
+            resistance * np.abs(s1 / (v[[0, 1, 0]] * 100.0)) ** 2, abs=1e-9
+        )
+
+
+class TestLODF:
+    """Tests for `lodf` and `switched_flows`."""
+
+    def test_outage_flow_moves_onto_the_other_path(self):
+        power_flow = _triangle(in_service=[True, True, True])
+
+        factors = lodf(power_flow=power_flow)
+
+        assert np.diag(factors) == pytest.approx([-1.0] * 3)
+        # Flow of the direct branch fully goes through the 2 branches in series.
+        assert factors[:, 2] == pytest.approx([1.0, 1.0, -1.0])
+
+    def test_bridges_and_branches_out_of_service_have_no_factors(self):
+        factors = lodf(power_flow=_triangle(in_service=[True, True, False]))
+
+        assert np.isnan(factors[:, 0]).all()
+        assert np.isnan(factors[:, 2]).all()
+
+    @pytest.mark.parametrize(
+        "in_service", [[True, True, True], [True, False, True], [True, True, False]]
+    )
+    def test_switched_flows_match_refactorised_flows(self, in_service):
+        power_flow = _triangle(in_service=in_service)
+        p = np.array([10.0, -3.0, -7.0, 0.0])
+
+        flows = switched_flows(power_flow=power_flow, p=p, branches=np.arange(3))
+
+        for k in range(3):
+            switched = _switched(power_flow=power_flow, k=k)
+            if not switched.bus_in_main[:3].all():
+                assert np.isnan(flows[:, k]).all()
+            else:
+                assert flows[:, k] == pytest.approx(switched.flows(p=p), nan_ok=True)
+
+    @pytest.mark.parametrize(
+        "create_network, lines_off",
+        [(pp.network.create_ieee14, []), (pp.network.create_ieee57, ["L1-2-1"])],
+    )
+    def test_switched_flows_match_refactorised_flows_on_generated_grids(
+        self, create_network, lines_off
+    ):
+        network = _generated_network(
+            pypowsybl_network=create_network(), load_factors=[1.0], lines_off=lines_off
+        )
+        elements = network.list_elements(timestamp=TIMESTAMPS[0])
+        grid = GridIndex(elements=elements)
+        state = grid.read_state(elements=elements)
+        power_flow = DCPowerFlow(
+            n_buses=grid.n_buses,
+            from_bus=grid.from_bus,
+            to_bus=grid.to_bus,
+            susceptance=grid.susceptance,
+            in_service=state.branch_in_service,
+        )
+        _, p, _ = grid.dc_injections(state=state, bus_in_main=power_flow.bus_in_main)
+        branches = np.arange(len(grid.from_bus))
+
+        flows = switched_flows(power_flow=power_flow, p=p, branches=branches)
+
+        for k in branches:
+            switched = _switched(power_flow=power_flow, k=k)
+            if (switched.bus_in_main != power_flow.bus_in_main).any():
+                assert np.isnan(flows[:, k]).all()
+            else:
+                assert flows[:, k] == pytest.approx(
+                    switched.flows(p=p), abs=1e-9, nan_ok=True
+                )
+
+
+class TestTopologyIndex:
+    """Tests for the `TopologyIndex`."""
+
+    def test_triangle_components_and_bridges(self):
+        topology = TopologyIndex(
+            n_buses=4,
+            from_bus=np.array([0, 1, 0]),
+            to_bus=np.array([1, 2, 2]),
+            in_service=np.array([True, True, True]),
+        )
+
+        assert topology.n_components == 2
+        assert topology.islanded_buses().tolist() == [3]
+        assert not topology.bridges().any()
+
+        topology.set_status(branch=2, in_service=False)
+        assert topology.bridges().tolist() == [True, True, False]
+        topology.set_status(branch=0, in_service=False)
+        assert topology.connected(1, 2) and not topology.connected(0, 1)
+        assert topology.main_component().tolist() == [False, True, True, False]
+        topology.set_status(branch=2, in_service=True)
+        assert topology.connected(0, 1)
+        assert topology.n_components == 2
+
+    def test_parallel_branches_are_not_bridges(self):
+        topology = TopologyIndex(
+            n_buses=2,
+            from_bus=np.array([0, 0]),
+            to_bus=np.array([1, 1]),
+            in_service=np.array([True, True]),
+        )
+
+        assert topology.splits(branches=np.array([0, 1])).tolist() == [False, False]
+        topology.set_status(branch=1, in_service=False)
+        assert topology.splits(branches=np.array([0, 1])).tolist() == [True, False]
+
+    @pytest.mark.parametrize(
+        "create_network", [pp.network.create_ieee14, pp.network.create_ieee57]
+    )
+    def test_incremental_updates_match_power_flows(self, create_network):
+        network = _generated_network(
+            pypowsybl_network=create_network(), load_factors=[1.0]
+        )
+        grid = GridIndex(elements=network.list_elements(timestamp=TIMESTAMPS[0]))
+        n_branches = len(grid.from_bus)
+        topology = TopologyIndex(
+            n_buses=grid.n_buses,
+            from_bus=grid.from_bus,
+            to_bus=grid.to_bus,
+            in_service=np.ones(n_branches, dtype=bool),
+        )
+        generator = np.random.default_rng(0)
+
+        for _ in range(20):
+            in_service = generator.random(n_branches) > 0.2
+            topology.update(in_service=in_service)
+
+            power_flow = DCPowerFlow(
+                n_buses=grid.n_buses,
+                from_bus=grid.from_bus,
+                to_bus=grid.to_bus,
+                susceptance=grid.susceptance,
+                in_service=in_service,
+            )
+            assert np.array_equal(topology.main_component(), power_flow.bus_in_main)
+            # Bridges of the main component are the branches LODFs can't be computed of.
+            in_main = power_flow.branch_in_main
+            assert np.array_equal(
+                topology.bridges()[in_main],
+                np.isnan(np.diag(lodf(power_flow=power_flow)))[in_main],
+            )
+            # Same partition of the buses as a connected components search.
+            _, expected = connected_components(
+                csr_matrix(
+                    (
+                        np.ones(in_service.sum()),
+                        (grid.from_bus[in_service], grid.to_bus[in_service]),
+                    ),
+                    shape=(grid.n_buses, grid.n_buses),
+                ),
+                directed=False,
+            )
+            labels = topology.labels()
+            assert np.array_equal(
+                labels[:, None] == labels[None, :],
+                expected[:, None] == expected[None, :],
+            )
+
+
+class TestDistributeSlack:
+    """Tests for `distribute_slack`."""
+
+    def test_mismatch_is_spread_proportionally_then_clipped(self):
+        p, remaining = distribute_slack(
+            p_target=np.array([10.0, 10.0, 10.0]),
+            p_min=np.zeros(3),
+            p_max=np.array([12.0, 100.0, 100.0]),
+            participation_factors=np.array([100.0, 100.0, 0.0]),
+            mismatch=10.0,
+        )
+
+        assert p == pytest.approx([12.0, 18.0, 10.0])
+        assert remaining == pytest.approx(0.0)
+
+    def test_what_cant_be_spread_is_left(self):
+        p, remaining = distribute_slack(
+            p_target=np.array([10.0]),
+            p_min=np.zeros(1),
+            p_max=np.array([12.0]),
+            participation_factors=np.array([12.0]),
+            mismatch=10.0,
+        )
+
+        assert p == pytest.approx([12.0])
+        assert remaining == pytest.approx(8.0)
+
+    def test_timestamps_can_be_distributed_at_once(self):
+        p, remaining = distribute_slack(
+            p_target=np.array([[10.0, 10.0], [10.0, 10.0]]),
+            p_min=np.zeros(2),
+            p_max=np.array([12.0, 100.0]),
+            participation_factors=np.array([[100.0, 100.0], [100.0, 0.0]]),
+            mismatch=np.array([10.0, -4.0]),
+        )
+
+        assert p == pytest.approx(np.array([[12.0, 18.0], [6.0, 10.0]]))
+        assert remaining == pytest.approx([0.0, 0.0])
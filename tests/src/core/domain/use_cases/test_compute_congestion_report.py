@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from src.core.constants import LoadFlowType
+from src.core.domain.use_cases.compute_congestion_report import (
+    CongestionReportPipeline,
+)
+from src.core.domain.use_cases.compute_dc_flows import DCFlowsPipeline
+from tests.src.core.domain.use_cases.test_compute_contingency_analysis import (
+    LIMITS,
+    _limited_network,
+)
+from tests.src.core.infrastructure.adapters.test_numpy_dc_loadflow_solver import (
+    _numpy_solver,
+)
+
+
+class TestCongestionReportPipeline:
+    """Tests for the `CongestionReportPipeline` use case."""
+
+    @pytest.mark.parametrize("lines_off", [None, ["L2-4-1"]])
+    def test_loadings_follow_solved_flows(self, lines_off):
+        network = _limited_network(lines_off=lines_off)
+        # Limits below the flows, for some lines to be overloaded.
+        for element in network.elements:
+            for constraint in element.operational_constraints:
+                constraint.value *= 0.8
+        solved = _numpy_solver().solve(network=network, loadflow_type=LoadFlowType.DC)
+
+        report = CongestionReportPipeline(network_repository=None).compute(
+            network=solved
+        )
+
+        dc_flows = DCFlowsPipeline(network_repository=None).compute(network=network)
+        columns = [dc_flows.line_ids.index(i) for i in report.constraints["line_id"]]
+        expected = np.abs(dc_flows.flows[:, columns]) / dc_flows.limits[columns]
+        assert report.timestamps == dc_flows.timestamps
+        assert sorted(report.constraints["line_id"]) == sorted(LIMITS)
+        assert np.array_equal(np.isnan(report.loadings), np.isnan(expected))
+        assert np.nan_to_num(report.loadings) == pytest.approx(
+            np.nan_to_num(expected), rel=1e-9
+        )
+        overloaded = report.summary().set_index("line_id")["overloaded_timestamps"]
+        assert overloaded.sum() == int(report.overloaded().sum()) > 0
@@ -0,0 +1,146 @@
+import numpy as np
+import pandas as pd
+import pypowsybl as pp
+import pytest
+from itertools import combinations
+from src.core.constants import SupportedNetworkElementTypes
+from src.core.domain.enums import BranchSide, OperationalConstraintType
+from src.core.domain.models.network import Network
+from src.core.domain.models.operational_constraint import OperationalConstraint
+from src.core.domain.use_cases.compute_contingency_analysis import (
+    CONTINGENCY_COLUMNS,
+    CONTINGENCY_SEPARATOR,
+    ContingencyAnalysisPipeline,
+)
+from src.core.domain.use_cases.compute_dc_flows import DCFlowsPipeline
+from src.core.domain.use_cases.compute_n1_screening import N1ScreeningPipeline
+from tests.src.core.infrastructure.adapters.test_numpy_dc_loadflow_solver import (
+    TIMESTAMPS,
+    _generated_network,
+    _toy_network,
+)
+
+LOAD_FACTORS = [0.9, 1.0, 1.1]
+
+# Limits of the ieee14 lines, a bit above their flows without contingency.
+LIMITS = {
+    "L1-2-1": 160.0,
+    "L1-5-1": 80.0,
+    "L2-3-1": 80.0,
+    "L2-4-1": 60.0,
+    "L2-5-1": 45.0,
+    "L3-4-1": 30.0,
+    "L4-5-1": 70.0,
+}
+
+
+def _limited_network(lines_off: list[str] | None = None) -> Network:
+    """The ieee14 grid, with active power limits on some of its lines."""
+
+    network = _generated_network(
+        pypowsybl_network=pp.network.create_ieee14(),
+        load_factors=LOAD_FACTORS,
+        lines_off=lines_off,
+    )
+    for element in network.elements:
+        if element.id in LIMITS:
+            element.operational_constraints.append(
+                OperationalConstraint.from_element(
+                    element_id=element.id,
+                    timestamp=element.timestamp,
+                    element_type=SupportedNetworkElementTypes.LINE,
+                    side=BranchSide.ONE,
+                    name="limit",
+                    type=OperationalConstraintType.ACTIVE_POWER,
+                    value=LIMITS[element.id],
+                    acceptable_duration=-1,
+                )
+            )
+    return network
+
+
+def _pipeline() -> ContingencyAnalysisPipeline:
+    return ContingencyAnalysisPipeline(network_repository=None)
+
+
+class TestContingencyAnalysisPipeline:
+    """Tests for the `ContingencyAnalysisPipeline` use case."""
+
+    def test_n1_summarises_the_screening(self):
+        network = _limited_network()
+
+        overloads = _pipeline().compute(network=network)
+
+        screening = N1ScreeningPipeline(network_repository=None).compute(
+            network=network
+        )
+        screening["loading"] = screening["p1"].abs() / screening["limit"]
+        expected = (
+            screening.groupby(["timestamp", "contingency_id"])["loading"]
+            .agg(["count", "max"])
+            .reset_index()
+        )
+        assert len(expected) > 0
+        assert overloads.columns.tolist() == CONTINGENCY_COLUMNS
+        assert overloads["timestamp"].tolist() == expected["timestamp"].tolist()
+        assert overloads["contingency_id"].tolist() == (
+            expected["contingency_id"].tolist()
+        )
+        assert overloads["n_overloads"].tolist() == expected["count"].tolist()
+        assert overloads["max_loading"].tolist() == pytest.approx(
+            expected["max"].tolist(), rel=1e-6
+        )
+
+    def test_n2_matches_dc_flows_without_both_lines(self):
+        line_ids = ["L1-5-1", "L2-4-1", "L2-5-1", "L4-5-1"]
+
+        overloads = (
+            _pipeline()
+            .compute(network=_limited_network(), depth=2, line_ids=line_ids)
+            .set_index(["timestamp", "contingency_id"])
+        )
+
+        limits = np.array([LIMITS.get(i, np.inf) for i in LIMITS])
+        n_overloaded_rows = 0
+        for first, second in combinations(line_ids, 2):
+            dc_flows = DCFlowsPipeline(network_repository=None).compute(
+                network=_limited_network(lines_off=[first, second])
+            )
+            columns = [dc_flows.line_ids.index(i) for i in LIMITS]
+            # Outaged lines have no flow.
+            loading = np.nan_to_num(np.abs(dc_flows.flows[:, columns]) / limits)
+            for k, timestamp in enumerate(dc_flows.timestamps):
+                key = (timestamp, f"{first}{CONTINGENCY_SEPARATOR}{second}")
+                n_overloads = int((loading[k] > 1).sum())
+                if n_overloads == 0:
+                    assert key not in overloads.index
+                    continue
+                n_overloaded_rows += 1
+                row = overloads.loc[key]
+                assert row["n_overloads"] == n_overloads
+                assert row["max_loading"] == pytest.approx(loading[k].max(), rel=1e-5)
+                assert row["worst_line_id"] == list(LIMITS)[loading[k].argmax()]
+        assert n_overloaded_rows == len(overloads) > 0
+
+    def test_threads_give_the_same_results(self):
+        network = _limited_network()
+
+        overloads = _pipeline().compute(network=network, depth=2)
+
+        pd.testing.assert_frame_equal(
+            _pipeline().compute(network=network, depth=2, max_workers=3), overloads
+        )
+
+    def test_secure_network_has_no_overloads(self):
+        network = _toy_network(timestamps=TIMESTAMPS, loads=[5.0, 6.0, 7.0])
+
+        overloads = _pipeline().compute(network=network)
+
+        assert len(overloads) == 0
+        assert overloads.columns.tolist() == CONTINGENCY_COLUMNS
+
+    def test_depth_is_1_or_2(self):
+        network = _toy_network(timestamps=TIMESTAMPS, loads=[5.0, 6.0, 7.0])
+
+        with pytest.raises(ValueError):
+            _pipeline().compute(network=network, depth=3)
@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+import pypowsybl as pp
+from src.core.constants import ElementStatus, LoadFlowType
+from src.core.domain.use_cases.compute_dc_flows import DCFlowsPipeline
+from src.core.infrastructure.adapters.network_builder import DefaultNetworkBuilder
+from tests.src.core.infrastructure.adapters.test_numpy_dc_loadflow_solver import (
+    TIMESTAMPS,
+    _generated_network,
+    _solver,
+    _toy_network,
+)
+from tests.src.core.infrastructure.adapters.test_pypowsybl_loadflow_solver import (
+    _line_flows,
+)
+
+
+def _pipeline() -> DCFlowsPipeline:
+    return DCFlowsPipeline(network_repository=None)
+
+
+class TestDCFlowsPipeline:
+    """Tests for the `DCFlowsPipeline` use case."""
+
+    @pytest.mark.parametrize(
+        "network",
+        [
+            _toy_network(
+                timestamps=TIMESTAMPS,
+                loads=[7.0, 8.0, 9.0],
+                line_status=[ElementStatus.ON, ElementStatus.OFF, ElementStatus.ON],
+            ),
+            _generated_network(
+                pypowsybl_network=pp.network.create_ieee57(),
+                load_factors=[0.9, 1.0, 1.1],
+            ),
+            _generated_network(
+                pypowsybl_network=pp.network.create_ieee14(),
+                load_factors=[0.5, 1.0, 1.1],
+                Pmax=150.0,
+            ),
+        ],
+    )
+    def test_flows_match_loadflows(self, network):
+        dc_flows = _pipeline().compute(network=network)
+
+        expected = _line_flows(
+            _solver().solve(network=network, loadflow_type=LoadFlowType.DC)
+        )
+        for k, timestamp in enumerate(dc_flows.timestamps):
+            for j, line_id in enumerate(dc_flows.line_ids):
+                flow = expected[(line_id, timestamp)]
+                if flow is None or np.isnan(flow):
+                    assert np.isnan(dc_flows.flows[k, j])
+                else:
+                    assert dc_flows.flows[k, j] == pytest.approx(flow, abs=1e-9)
+
+    def test_ptdf_is_computed_once_per_topology(self):
+        pipeline = _pipeline()
+        statuses = [ElementStatus.ON, ElementStatus.OFF, ElementStatus.ON]
+
+        pipeline.compute(
+            network=_toy_network(
+                timestamps=TIMESTAMPS, loads=[7.0, 8.0, 9.0], line_status=statuses
+            )
+        )
+        power_flows = pipeline.cache.power_flows
+        pipeline.compute(network=_toy_network(timestamps=TIMESTAMPS, loads=[5.0] * 3))
+
+        assert len(power_flows) == 2
+        assert set(pipeline.cache.power_flows) == set(power_flows)
+
+    def test_grids_sharing_element_ids_are_told_apart(self):
+        pipeline = DCFlowsPipeline(network_repository=None, max_topologies=1)
+        network = _toy_network(timestamps=TIMESTAMPS, loads=[7.0, 8.0, 9.0])
+        other = _toy_network(timestamps=TIMESTAMPS, loads=[7.0, 8.0, 9.0])
+        for timestamp in TIMESTAMPS:
+            other.get_element(
+                id="line1", timestamp=timestamp
+            ).element_metadata.static.x *= 2
+
+        flows = pipeline.compute(network=network).flows
+        other_flows = pipeline.compute(network=other).flows
+
+        assert not np.allclose(flows, other_flows)
+        assert other_flows == pytest.approx(_pipeline().compute(network=other).flows)
+        # Indexes are bounded as the power flows.
+        assert len(pipeline.cache._grid_indexes) == 1
+        assert len(pipeline.cache._topology_indexes) <= 1
+
+    def test_overloads_are_screened(self):
+        network = _toy_network(
+            timestamps=TIMESTAMPS,
+            loads=[7.0, 10.0, 9.0],
+            line_status=[ElementStatus.ON, ElementStatus.ON, ElementStatus.OFF],
+        )
+
+        dc_flows = _pipeline().compute(network=network)
+
+        # Lines are limited to 8 MW, each carrying half the load when both are ON.
+        assert dc_flows.overloaded_timestamps() == [TIMESTAMPS[2]]
+        overloads = dc_flows.overloads()
+        assert overloads["line_id"].tolist() == ["line1"]
+        assert overloads["p1"].tolist() == pytest.approx([9.0])
+        assert dc_flows.to_dataframe().shape == (3, 2)
+
+    def test_timestamps_must_share_elements(self):
+        network = _toy_network(timestamps=TIMESTAMPS[:2], loads=[7.0, 8.0])
+        network = DefaultNetworkBuilder.from_elements(
+            id=network.id,
+            elements=[
+                e
+                for e in network.elements
+                if not (e.id == "load1" and e.timestamp == TIMESTAMPS[1])
+            ],
+        )
+
+        with pytest.raises(ValueError):
+            _pipeline().compute(network=network)
@@ -0,0 +1,129 @@
+import numpy as np
+import pypowsybl as pp
+import pytest
+import src.core.domain.use_cases.compute_injection_what_if as what_if_module
+from src.core.constants import SupportedNetworkElementTypes
+from src.core.domain.models.network import Network
+from src.core.domain.use_cases.compute_dc_flows import DCFlowsPipeline
+from src.core.domain.use_cases.compute_injection_what_if import (
+    InjectionWhatIfPipeline,
+)
+from tests.src.core.infrastructure.adapters.test_numpy_dc_loadflow_solver import (
+    _generated_network,
+)
+
+LOAD_FACTORS = [0.5, 1.0, 1.1]
+
+
+def _network(
+    load_factors: list[float] = LOAD_FACTORS, lines_off: list[str] | None = None
+) -> Network:
+    """The ieee14 grid, whose generators take part in slack distribution."""
+    return _generated_network(
+        pypowsybl_network=pp.network.create_ieee14(),
+        load_factors=load_factors,
+        lines_off=lines_off,
+        Pmax=1000.0,
+    )
+
+
+def _assert_same_flows(flows: np.ndarray, expected: np.ndarray) -> None:
+    assert np.array_equal(np.isnan(flows), np.isnan(expected))
+    assert np.nan_to_num(flows) == pytest.approx(np.nan_to_num(expected), abs=1e-6)
+
+
+class TestInjectionWhatIfPipeline:
+    """Tests for the `InjectionWhatIfPipeline` use case."""
+
+    @pytest.mark.parametrize("lines_off", [None, ["L2-4-1"]])
+    def test_relative_changes_match_dc_flows(self, lines_off):
+        network = _network(lines_off=lines_off)
+        load_ids = [
+            e.id
+            for e in network.elements
+            if e.type == SupportedNetworkElementTypes.LOAD
+        ]
+
+        what_if = InjectionWhatIfPipeline(network_repository=None).compute(
+            network=network,
+            perturbations={
+                "unchanged": {},
+                "loads +10%": {i: 0.1 for i in load_ids},
+                "loads -20%": {i: -0.2 for i in load_ids},
+            },
+        )
+
+        flows = what_if.flows()
+        for k, factor in enumerate([1.0, 1.1, 0.8]):
+            expected = (
+                DCFlowsPipeline(network_repository=None)
+                .compute(
+                    network=_network(
+                        load_factors=[f * factor for f in LOAD_FACTORS],
+                        lines_off=lines_off,
+                    )
+                )
+                .flows
+            )
+            _assert_same_flows(flows=flows[:, k], expected=expected)
+        assert what_if.perturbation_ids == ["unchanged", "loads +10%", "loads -20%"]
+        assert np.nan_to_num(what_if.deltas[:, 0]) == pytest.approx(0.0)
+
+    def test_changes_in_mw_match_dc_flows(self):
+        network = _network()
+        changes = {"B3-L": 15.0, "B1-G": -10.0}
+
+        what_if = InjectionWhatIfPipeline(network_repository=None).compute(
+            network=network, perturbations={"shift": changes}, relative=False
+        )
+
+        perturbed = _network()
+        for element in perturbed.elements:
+            if element.id == "B3-L":
+                element.element_metadata.dynamic.Pd += changes["B3-L"]
+            elif element.id == "B1-G":
+                element.element_metadata.dynamic.Ptarget += changes["B1-G"]
+        expected = DCFlowsPipeline(network_repository=None).compute(network=perturbed)
+        _assert_same_flows(flows=what_if.flows()[:, 0], expected=expected.flows)
+
+    def test_overloads_list_perturbed_flows_above_limits(self):
+        what_if = InjectionWhatIfPipeline(network_repository=None).compute(
+            network=_network(), perturbations={"B3-L +50%": {"B3-L": 0.5}}
+        )
+        # Limits that only perturbed flows can exceed.
+        what_if.limits = np.abs(what_if.base_flows).max(axis=0) + 1.0
+
+        overloads = what_if.overloads()
+
+        assert len(overloads) > 0
+        assert (overloads["perturbation_id"] == "B3-L +50%").all()
+        assert (overloads["p1"].abs() > overloads["limit"]).all()
+        for row in overloads.itertuples():
+            k = what_if.timestamps.index(row.timestamp)
+            j = what_if.line_ids.index(row.line_id)
+            assert row.p1 - row.delta_p1 == pytest.approx(what_if.base_flows[k, j])
+
+    def test_chunks_give_the_same_changes(self, monkeypatch):
+        network = _network(lines_off=["L2-4-1"])
+        perturbations = {
+            "B3-L +50%": {"B3-L": 0.5},
+            "B1-G -10%": {"B1-G": -0.1},
+            "both": {"B3-L": 0.2, "B1-G": 0.3},
+        }
+        expected = InjectionWhatIfPipeline(network_repository=None).compute(
+            network=network, perturbations=perturbations
+        )
+
+        # A single state and perturbation per chunk.
+        monkeypatch.setattr(what_if_module, "MAX_CHUNK_SIZE", 1)
+        what_if = InjectionWhatIfPipeline(network_repository=None).compute(
+            network=network, perturbations=perturbations
+        )
+
+        _assert_same_flows(flows=what_if.deltas, expected=expected.deltas)
+
+    def test_unknown_elements_are_rejected(self):
+        with pytest.raises(ValueError):
+            InjectionWhatIfPipeline(network_repository=None).compute(
+                network=_network(), perturbations={"typo": {"B3-X": 0.1}}
+            )
@@ -0,0 +1,47 @@
+import pytest
+from src.core.constants import ElementStatus
+from src.core.domain.use_cases.compute_n1_screening import N1ScreeningPipeline
+from tests.src.core.infrastructure.adapters.test_numpy_dc_loadflow_solver import (
+    TIMESTAMPS,
+    _toy_network,
+)
+
+
+def _pipeline() -> N1ScreeningPipeline:
+    return N1ScreeningPipeline(network_repository=None)
+
+
+class TestN1ScreeningPipeline:
+    """Tests for the `N1ScreeningPipeline` use case."""
+
+    def test_outages_overloading_the_parallel_line_are_listed(self):
+        network = _toy_network(
+            timestamps=TIMESTAMPS,
+            loads=[7.0, 10.0, 9.0],
+            line_status=[ElementStatus.ON, ElementStatus.ON, ElementStatus.OFF],
+        )
+
+        overloads = _pipeline().compute(network=network)
+
+        # Lines are limited to 8 MW, the remaining line carrying the whole load. The outage
+        # of line1 at the last timestamp would split the grid, so isn't screened.
+        assert list(
+            zip(
+                overloads["timestamp"],
+                overloads["contingency_id"],
+                overloads["line_id"],
+            )
+        ) == [
+            (TIMESTAMPS[1], "line1", "line2"),
+            (TIMESTAMPS[1], "line2", "line1"),
+        ]
+        assert overloads["p1"].abs().tolist() == pytest.approx([10.0, 10.0])
+        assert overloads["limit"].tolist() == pytest.approx([8.0, 8.0])
+
+    def test_secure_network_has_no_overloads(self):
+        network = _toy_network(timestamps=TIMESTAMPS, loads=[5.0, 6.0, 7.0])
+
+        overloads = _pipeline().compute(network=network)
+
+        assert len(overloads) == 0
+        assert "contingency_id" in overloads.columns
@@ -0,0 +1,142 @@
+import pytest
+from datetime import timedelta
+from src.core.constants import ElementStatus
+from src.core.domain.enums import LoadFlowStatus, LoadFlowType
+from src.core.domain.use_cases.compute_solved_network import (
+    SolvedNetworkPipeline,
+    _with_network_id,
+    solved_network_id,
+)
+from src.core.infrastructure.adapters.network_builder import DefaultNetworkBuilder
+from src.core.infrastructure.adapters.sqlite_network_repository import (
+    SQLiteNetworkRepository,
+)
+from tests.src.core.infrastructure.adapters.test_pypowsybl_loadflow_solver import (
+    TIMESTAMP,
+    _line_flows,
+    _solver,
+    _toy_network,
+)
+
+TIMESTAMPS = [TIMESTAMP + timedelta(hours=k) for k in range(5)]
+LOADS = [7.0, 8.0, 9.0, 6.0, 5.0]
+
+
+class InterruptedSolver:
+    """Solver failing once it solved 'n_solves' networks, as an interrupted run would."""
+
+    def __init__(self, n_solves: int) -> None:
+        self.solver = _solver()
+        self.n_solves = n_solves
+        self.solved_timestamps = []
+
+    def solve(self, network, loadflow_type):
+        if self.n_solves == 0:
+            raise KeyboardInterrupt
+        self.n_solves -= 1
+        self.solved_timestamps.extend(network.list_timestamps())
+        return self.solver.solve(network=network, loadflow_type=loadflow_type)
+
+    def get_loadflow_statuses(self):
+        return self.solver.get_loadflow_statuses()
+
+
+@pytest.fixture
+def network_repository(tmp_path) -> SQLiteNetworkRepository:
+    repository = SQLiteNetworkRepository(
+        db_url=f"sqlite:///{tmp_path / 'test.db'}", should_create_tables=True
+    )
+    network = _toy_network(
+        timestamps=TIMESTAMPS,
+        loads=LOADS,
+        line_status=[ElementStatus.ON, ElementStatus.OFF] + [ElementStatus.ON] * 3,
+    )
+    repository.add(
+        network=DefaultNetworkBuilder.from_elements(
+            id="toy_simulated",
+            # Constraints of the toy network share their uids across timestamps.
+            elements=[
+                _with_network_id(element=element, network_id="toy_simulated")
+                for element in network.elements
+            ],
+        )
+    )
+    return repository
+
+
+def _pipeline(network_repository, loadflow_solver=None) -> SolvedNetworkPipeline:
+    return SolvedNetworkPipeline(
+        network_repository=network_repository,
+        network_builder=DefaultNetworkBuilder(),
+        loadflow_solver=loadflow_solver or _solver(),
+    )
+
+
+class TestSolvedNetworkPipeline:
+    """Tests for the `SolvedNetworkPipeline` use case."""
+
+    def test_solved_network_is_persisted(self, network_repository):
+        loadflow_statuses = _pipeline(network_repository).run(
+            network_id="toy_simulated", checkpoint_size=2
+        )
+
+        assert solved_network_id("toy_simulated") == "toy_solved"
+        assert loadflow_statuses == {t: LoadFlowStatus.CONVERGED for t in TIMESTAMPS}
+        solved = network_repository.get(network_id="toy_solved")
+        expected = _solver().solve(
+            network=network_repository.get(network_id="toy_simulated"),
+            loadflow_type=LoadFlowType.AC,
+        )
+        assert _line_flows(solved) == pytest.approx(_line_flows(expected))
+        assert network_repository.list_timestamps(network_id="toy_solved") == TIMESTAMPS
+        assert len(network_repository.get(network_id="toy_simulated").elements) == len(
+            solved.elements
+        )
+
+    def test_interrupted_runs_resume(self, network_repository):
+        solver = InterruptedSolver(n_solves=2)
+        with pytest.raises(KeyboardInterrupt):
+            _pipeline(network_repository, loadflow_solver=solver).run(
+                network_id="toy_simulated", checkpoint_size=2
+            )
+        assert network_repository.list_timestamps(network_id="toy_solved") == (
+            TIMESTAMPS[:4]
+        )
+
+        solver = InterruptedSolver(n_solves=1)
+        loadflow_statuses = _pipeline(network_repository, loadflow_solver=solver).run(
+            network_id="toy_simulated", checkpoint_size=2
+        )
+
+        assert solver.solved_timestamps == TIMESTAMPS[4:]
+        assert list(loadflow_statuses) == TIMESTAMPS[4:]
+        assert network_repository.list_timestamps(network_id="toy_solved") == (
+            TIMESTAMPS
+        )
+
+    def test_failed_timestamps_are_solved_again(self, network_repository):
+        solver = _solver()
+        solve = solver._run_ac
+        calls = []
+
+        def _run_ac(session):
+            # Timestamps are solved in order, the 3rd one fails.
+            calls.append(session)
+            if len(calls) == 3:
+                raise __import__("pypowsybl").PyPowsyblError("Failed.")
+            return solve(session=session)
+
+        solver._run_ac = _run_ac
+        loadflow_statuses = _pipeline(network_repository, loadflow_solver=solver).run(
+            network_id="toy_simulated"
+        )
+
+        assert loadflow_statuses[TIMESTAMPS[2]] == LoadFlowStatus.FAILED
+        assert TIMESTAMPS[2] not in network_repository.list_timestamps(
+            network_id="toy_solved"
+        )
+        solver = InterruptedSolver(n_solves=1)
+        _pipeline(network_repository, loadflow_solver=solver).run(
+            network_id="toy_simulated"
+        )
+        assert solver.solved_timestamps == [TIMESTAMPS[2]]
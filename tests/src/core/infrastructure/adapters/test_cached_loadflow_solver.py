@@ -0,0 +1,223 @@
+import pytest
+from datetime import timedelta
+from src.core.constants import ElementStatus, LoadFlowType
+from src.core.domain.enums import LoadFlowStatus
+from src.core.domain.models.network_delta import NetworkDelta
+from src.core.infrastructure.adapters import cached_loadflow_solver as cached_module
+from src.core.infrastructure.adapters.cached_loadflow_solver import (
+    CachedLoadFlowSolver,
+)
+from src.core.infrastructure.adapters.network_builder import DefaultNetworkBuilder
+from src.core.infrastructure.adapters.pypowsybl_loadflow_solver import (
+    PyPowSyblLoadFlowSolver,
+)
+from src.core.infrastructure.services.converters.pypowsybl_methods.service import (
+    PyPowsyblCompatService,
+)
+from tests.src.core.infrastructure.adapters.test_pypowsybl_loadflow_solver import (
+    TIMESTAMP,
+    _line_flows,
+    _solver,
+    _toy_network,
+)
+
+TIMESTAMPS = [TIMESTAMP + timedelta(hours=k) for k in range(3)]
+
+
+def _cached_solver(**kwargs) -> CachedLoadFlowSolver:
+    return CachedLoadFlowSolver(
+        loadflow_solver=_solver(), network_builder=DefaultNetworkBuilder(), **kwargs
+    )
+
+
+class TestCachedLoadFlowSolver:
+    """Tests for the `CachedLoadFlowSolver` adapter."""
+
+    @pytest.mark.parametrize("loadflow_type", [LoadFlowType.AC, LoadFlowType.DC])
+    def test_cached_results_match_solved_ones(self, loadflow_type):
+        network = _toy_network(
+            timestamps=TIMESTAMPS,
+            loads=[7.0, 8.0, 7.0],
+            line_status=[ElementStatus.ON, ElementStatus.OFF, ElementStatus.ON],
+        )
+        expected = _solver().solve(network=network, loadflow_type=loadflow_type)
+        solver = _cached_solver()
+
+        first = solver.solve(network=network, loadflow_type=loadflow_type)
+        second = solver.solve(network=network, loadflow_type=loadflow_type)
+
+        for result in [first, second]:
+            assert sorted((e.id, e.timestamp) for e in result.elements) == sorted(
+                (e.id, e.timestamp) for e in expected.elements
+            )
+            assert _line_flows(result) == pytest.approx(_line_flows(expected))
+        assert solver.get_loadflow_statuses() == {
+            t: LoadFlowStatus.CONVERGED for t in TIMESTAMPS
+        }
+        # The 3rd timestamp repeats the 1st one, so it is a hit on the first solve too.
+        stats = solver.get_stats()
+        assert (stats.hits, stats.misses) == (4, 2)
+
+    def test_key_depends_on_injections_statuses_and_loadflow_type(self):
+        solver = _cached_solver()
+        network = _toy_network(timestamps=TIMESTAMPS[:1], loads=[7.0])
+
+        solver.solve(network=network, loadflow_type=LoadFlowType.DC)
+        solver.solve(network=network, loadflow_type=LoadFlowType.AC)
+        solver.solve(
+            network=_toy_network(timestamps=TIMESTAMPS[:1], loads=[7.5]),
+            loadflow_type=LoadFlowType.DC,
+        )
+        solver.solve(
+            network=_toy_network(
+                timestamps=TIMESTAMPS[:1],
+                loads=[7.0],
+                line_status=[ElementStatus.MAINTENANCE],
+            ),
+            loadflow_type=LoadFlowType.DC,
+        )
+
+        assert solver.get_stats().misses == 4
+
+    def test_key_depends_on_static_attributes_and_solver(self, tmp_path):
+        """Results of another grid, or of another solver, aren't shared through the disk."""
+        network = _toy_network(timestamps=TIMESTAMPS[:1], loads=[7.0])
+        _cached_solver(cache_dir=tmp_path).solve(
+            network=network, loadflow_type=LoadFlowType.DC
+        )
+
+        reimported = _toy_network(timestamps=TIMESTAMPS[:1], loads=[7.0])
+        line = reimported.get_element(id="line1", timestamp=TIMESTAMPS[0])
+        line.element_metadata.static.x *= 2
+        expected = _solver().solve(network=reimported, loadflow_type=LoadFlowType.DC)
+        solver = _cached_solver(cache_dir=tmp_path)
+        result = solver.solve(network=reimported, loadflow_type=LoadFlowType.DC)
+        assert _line_flows(result) == pytest.approx(_line_flows(expected))
+
+        class OtherSolver(PyPowSyblLoadFlowSolver):
+            pass
+
+        other_solver = CachedLoadFlowSolver(
+            loadflow_solver=OtherSolver(
+                to_pypowsybl_converter_service=PyPowsyblCompatService(),
+                network_builder=DefaultNetworkBuilder(),
+            ),
+            network_builder=DefaultNetworkBuilder(),
+            cache_dir=tmp_path,
+        )
+        other_solver.solve(network=network, loadflow_type=LoadFlowType.DC)
+
+        assert solver.get_stats().misses == 1
+        assert other_solver.get_stats().disk_hits == 0
+
+    def test_grid_is_hashed_once(self, monkeypatch):
+        """Timestamps of a grid already met are compared with it, not hashed again."""
+
+        hashed = []
+        grid_key = cached_module.grid_key
+        monkeypatch.setattr(
+            cached_module,
+            "grid_key",
+            lambda elements: hashed.append(elements) or grid_key(elements),
+        )
+        solver = _cached_solver()
+        network = _toy_network(
+            timestamps=TIMESTAMPS,
+            loads=[7.0, 8.0, 9.0],
+            line_status=[ElementStatus.ON, ElementStatus.OFF, ElementStatus.ON],
+        )
+
+        solver.solve(network=network, loadflow_type=LoadFlowType.DC)
+        solver.solve(network=network, loadflow_type=LoadFlowType.AC)
+        assert len(hashed) == 1
+
+        other = _toy_network(timestamps=TIMESTAMPS[:1], loads=[7.0])
+        line = other.get_element(id="line1", timestamp=TIMESTAMPS[0])
+        line.element_metadata.static.x *= 2
+        solver.solve(network=other, loadflow_type=LoadFlowType.DC)
+        assert len(hashed) == 2
+
+    def test_delta_solves_reach_the_solver_on_misses(self, monkeypatch):
+        networks = [
+            _toy_network(timestamps=[t], loads=[load])
+            for t, load in zip(TIMESTAMPS, [7.0, 8.0, 7.0])
+        ]
+        solver = _cached_solver()
+        deltas = []
+        solve_delta = solver.loadflow_solver.solve_delta
+
+        def _solve_delta(network, delta, loadflow_type):
+            deltas.append(delta)
+            return solve_delta(
+                network=network, delta=delta, loadflow_type=loadflow_type
+            )
+
+        monkeypatch.setattr(solver.loadflow_solver, "solve_delta", _solve_delta)
+        solver.solve(network=networks[0], loadflow_type=LoadFlowType.AC)
+        for k in range(1, len(networks)):
+            delta = NetworkDelta.between(
+                elements=networks[k - 1].elements, next_elements=networks[k].elements
+            )
+            result = solver.solve_delta(
+                network=networks[k], delta=delta, loadflow_type=LoadFlowType.AC
+            )
+            expected = _solver().solve(
+                network=networks[k], loadflow_type=LoadFlowType.AC
+            )
+            assert _line_flows(result) == pytest.approx(_line_flows(expected))
+
+        # The 3rd timestamp has the injections of the 1st one, so is a hit.
+        assert len(deltas) == 1 and deltas[0].timestamp == TIMESTAMPS[1]
+        assert solver.get_iterations() == solver.loadflow_solver.get_iterations()
+        assert solver.get_metrics() == solver.loadflow_solver.get_metrics()
+        assert solver.get_metrics().n_timestamps == 1
+
+    def test_timestamps_not_solved_are_returned_as_given(self, monkeypatch):
+        network = _toy_network(timestamps=TIMESTAMPS[:2], loads=[7.0, 8.0])
+        solver = _cached_solver()
+        solve = solver.loadflow_solver.solve
+
+        def _solve_first_timestamp(network, loadflow_type):
+            solved = solve(network=network, loadflow_type=loadflow_type)
+            return DefaultNetworkBuilder.from_elements(
+                id=solved.id,
+                elements=[e for e in solved.elements if e.timestamp == TIMESTAMPS[0]],
+            )
+
+        monkeypatch.setattr(solver.loadflow_solver, "solve", _solve_first_timestamp)
+        result = solver.solve(network=network, loadflow_type=LoadFlowType.DC)
+
+        assert len(result.list_elements(timestamp=TIMESTAMPS[1])) == len(
+            network.list_elements(timestamp=TIMESTAMPS[1])
+        )
+        assert set(solver.get_loadflow_statuses()) == {TIMESTAMPS[0]}
+        assert all(
+            e.element_metadata.solved is None
+            for e in result.elements
+            if e.timestamp == TIMESTAMPS[1]
+        )
+
+    def test_least_recently_used_results_are_evicted(self):
+        solver = _cached_solver(max_entries=2)
+
+        for load in [7.0, 8.0, 7.0, 9.0, 8.0]:
+            solver.solve(
+                network=_toy_network(timestamps=TIMESTAMPS[:1], loads=[load]),
+                loadflow_type=LoadFlowType.DC,
+            )
+
+        stats = solver.get_stats()
+        assert (stats.hits, stats.misses, stats.evictions) == (1, 4, 2)
+
+    def test_results_are_read_back_from_disk(self, tmp_path):
+        network = _toy_network(timestamps=TIMESTAMPS, loads=[7.0, 8.0, 9.0])
+        expected = _cached_solver(cache_dir=tmp_path).solve(
+            network=network, loadflow_type=LoadFlowType.AC
+        )
+
+        solver = _cached_solver(cache_dir=tmp_path, max_entries=1)
+        result = solver.solve(network=network, loadflow_type=LoadFlowType.AC)
+
+        assert _line_flows(result) == pytest.approx(_line_flows(expected))
+        stats = solver.get_stats()
+        assert (stats.hits, stats.disk_hits, stats.misses) == (3, 3, 0)
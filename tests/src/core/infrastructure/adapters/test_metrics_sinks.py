@@ -0,0 +1,86 @@
+import pytest
+from structlog.testing import capture_logs
+from src.core.domain.enums import LoadFlowStatus, LoadFlowType, SolvePhase
+from src.core.domain.models.solve_metrics import SolveMetrics
+from src.core.infrastructure.adapters.in_memory_metrics_sink import (
+    SUMMARY_COLUMNS,
+    InMemoryMetricsSink,
+)
+from src.core.infrastructure.adapters.structlog_metrics_sink import (
+    StructlogMetricsSink,
+)
+
+
+def _metrics(
+    loadflow_type: LoadFlowType = LoadFlowType.AC, loadflow_seconds: float = 3.0
+) -> SolveMetrics:
+    return SolveMetrics(
+        solver="solver",
+        network_id="network",
+        loadflow_type=loadflow_type,
+        seconds=loadflow_seconds + 2.0,
+        phase_seconds={
+            SolvePhase.CONVERSION: 1.0,
+            SolvePhase.LOADFLOW: loadflow_seconds,
+        },
+        n_timestamps=2,
+        n_elements=10,
+        iterations=4,
+        statuses={LoadFlowStatus.CONVERGED: 2},
+    )
+
+
+class TestInMemoryMetricsSink:
+    """Tests for the `InMemoryMetricsSink` adapter."""
+
+    def test_summary_aggregates_phases(self):
+        sink = InMemoryMetricsSink()
+        sink.record(metrics=_metrics(loadflow_seconds=3.0))
+        sink.record(metrics=_metrics(loadflow_seconds=5.0))
+
+        summary = sink.summary()
+
+        assert summary.columns.tolist() == SUMMARY_COLUMNS
+        assert summary.index.tolist() == [phase.value for phase in SolvePhase]
+        loadflow = summary.loc[SolvePhase.LOADFLOW.value]
+        assert loadflow["calls"] == 2
+        assert loadflow["total_seconds"] == pytest.approx(8.0)
+        assert loadflow["mean_seconds"] == pytest.approx(4.0)
+        assert loadflow["max_seconds"] == pytest.approx(5.0)
+        assert loadflow["seconds_per_timestamp"] == pytest.approx(2.0)
+        assert loadflow["share"] == pytest.approx(0.8)
+        assert summary.loc[SolvePhase.EXTRACTION.value, "total_seconds"] == 0.0
+
+    def test_summary_filters_loadflow_types(self):
+        sink = InMemoryMetricsSink()
+        sink.record(metrics=_metrics(loadflow_type=LoadFlowType.AC))
+        sink.record(metrics=_metrics(loadflow_type=LoadFlowType.DC))
+
+        summary = sink.summary(loadflow_type=LoadFlowType.DC)
+
+        assert (summary["calls"] == 1).all()
+        assert InMemoryMetricsSink().summary()["total_seconds"].sum() == 0.0
+
+    def test_only_recent_records_are_kept(self):
+        sink = InMemoryMetricsSink(max_records=2)
+        records = [_metrics(loadflow_seconds=float(k)) for k in range(3)]
+        for metrics in records:
+            sink.record(metrics=metrics)
+
+        assert sink.records == records[1:]
+        sink.clear()
+        assert sink.records == []
+
+
+class TestStructlogMetricsSink:
+    """Tests for the `StructlogMetricsSink` adapter."""
+
+    def test_metrics_are_logged(self):
+        with capture_logs() as logs:
+            StructlogMetricsSink().record(metrics=_metrics())
+
+        (log,) = logs
+        assert log["event"] == "Loadflow solved."
+        assert log["loadflow_type"] == "AC"
+        assert log["loadflow_seconds"] == 3.0
+        assert log["statuses"] == {"CONVERGED": 2}
@@ -0,0 +1,181 @@
+import math
+import pytest
+import pypowsybl as pp
+from src.core.constants import ElementStatus, LoadFlowType
+from src.core.domain.enums import LoadFlowStatus
+from src.core.domain.models.network import Network
+from src.core.infrastructure.adapters.network_builder import DefaultNetworkBuilder
+from src.core.infrastructure.adapters.numpy_ac_loadflow_solver import (
+    NumpyACLoadFlowSolver,
+)
+from tests.src.core.infrastructure.adapters.test_numpy_dc_loadflow_solver import (
+    TIMESTAMPS,
+    _assert_same_results,
+    _generated_network,
+    _numpy_solver,
+)
+from tests.src.core.infrastructure.adapters.test_pypowsybl_loadflow_solver import (
+    TIMESTAMP,
+    _solver,
+    _toy_network,
+)
+
+
+def _assert_close_results(result: Network, expected: Network) -> None:
+    """
+    Results within pypowsybl's own tolerances: it stops distributing the slack once less
+    than 1 MW is left on its slack bus, where Newton-Raphson here distributes all of it.
+    """
+
+    assert [(e.id, e.timestamp) for e in result.elements] == [
+        (e.id, e.timestamp) for e in expected.elements
+    ]
+    for element, expected_element in zip(result.elements, expected.elements):
+        solved = element.element_metadata.solved
+        expected_solved = expected_element.element_metadata.solved
+        if expected_solved is None:
+            assert solved is None
+            continue
+        for name, expected_value in expected_solved.model_dump().items():
+            value = getattr(solved, name)
+            if isinstance(expected_value, bool):
+                assert value == expected_value
+            elif math.isnan(expected_value):
+                assert math.isnan(value), (element.id, name)
+            else:
+                assert value == pytest.approx(expected_value, rel=1e-2, abs=1.0), (
+                    element.id,
+                    name,
+                )
+
+
+def _ac_solver(**kwargs) -> NumpyACLoadFlowSolver:
+    return NumpyACLoadFlowSolver(network_builder=DefaultNetworkBuilder(), **kwargs)
+
+
+class TestNumpyACLoadFlowSolver:
+    """Tests for the `NumpyACLoadFlowSolver` adapter, against pypowsybl's AC loadflow."""
+
+    @pytest.mark.parametrize(
+        "line_status",
+        [
+            [ElementStatus.ON] * 3,
+            [ElementStatus.ON, ElementStatus.OFF, ElementStatus.MAINTENANCE],
+        ],
+    )
+    def test_toy_grid_matches_pypowsybl(self, line_status):
+        network = _toy_network(
+            timestamps=TIMESTAMPS, loads=[7.0, 8.0, 12.0], line_status=line_status
+        )
+
+        result = _ac_solver().solve(network=network, loadflow_type=LoadFlowType.AC)
+
+        expected = _solver().solve(network=network, loadflow_type=LoadFlowType.AC)
+        _assert_close_results(result=result, expected=expected)
+
+    def test_islanded_buses_match_pypowsybl(self):
+        network = _toy_network(
+            timestamps=TIMESTAMPS[:1], loads=[7.0], line_status=[ElementStatus.OFF]
+        )
+        network.get_element(
+            id="line1", timestamp=TIMESTAMP
+        ).element_metadata.static.status = ElementStatus.OFF
+
+        solver = _ac_solver()
+        result = solver.solve(network=network, loadflow_type=LoadFlowType.AC)
+
+        expected_solver = _solver()
+        expected = expected_solver.solve(network=network, loadflow_type=LoadFlowType.AC)
+        _assert_close_results(result=result, expected=expected)
+        assert solver.get_loadflow_statuses() == expected_solver.get_loadflow_statuses()
+
+    @pytest.mark.parametrize(
+        "create_network, kwargs",
+        [
+            (pp.network.create_ieee14, {}),
+            (pp.network.create_ieee14, {"Pmax": 150.0}),
+            (pp.network.create_ieee57, {"lines_off": ["L1-2-1"]}),
+            (pp.network.create_ieee118, {}),
+            (pp.network.create_ieee118, {"lines_off": ["L1-2-1", "L5-6-1"]}),
+        ],
+    )
+    def test_generated_grids_match_pypowsybl(self, create_network, kwargs):
+        """Covers transformers, line shunts, and Pmax limits clipping generators."""
+
+        network = _generated_network(
+            pypowsybl_network=create_network(), load_factors=[0.5, 1.0, 1.1], **kwargs
+        )
+
+        solver = _ac_solver()
+        result = solver.solve(network=network, loadflow_type=LoadFlowType.AC)
+
+        expected_solver = _solver()
+        expected = expected_solver.solve(network=network, loadflow_type=LoadFlowType.AC)
+        _assert_close_results(result=result, expected=expected)
+        assert solver.get_loadflow_statuses() == expected_solver.get_loadflow_statuses()
+
+    def test_warm_starts_save_iterations(self):
+        network = _generated_network(
+            pypowsybl_network=pp.network.create_ieee57(), load_factors=[1.0, 1.0, 1.05]
+        )
+
+        solver = _ac_solver()
+        result = solver.solve(network=network, loadflow_type=LoadFlowType.AC)
+        cold_solver = _ac_solver(warm_start=False)
+        cold_result = cold_solver.solve(network=network, loadflow_type=LoadFlowType.AC)
+
+        iterations = list(solver.get_iterations().values())
+        cold_iterations = list(cold_solver.get_iterations().values())
+        assert iterations[0] == cold_iterations[0]
+        assert iterations[1] < cold_iterations[1]
+        assert iterations[2] < cold_iterations[2]
+        _assert_same_results(result=result, expected=cold_result)
+
+        solver.reset()
+        solver.solve(network=network, loadflow_type=LoadFlowType.AC)
+        assert list(solver.get_iterations().values()) == iterations
+
+    def test_power_flows_are_cached_per_topology(self):
+        solver = _ac_solver(max_factorisations=2)
+        statuses = [ElementStatus.ON, ElementStatus.OFF, ElementStatus.ON]
+
+        solver.solve(
+            network=_toy_network(
+                timestamps=TIMESTAMPS, loads=[7.0, 8.0, 9.0], line_status=statuses
+            ),
+            loadflow_type=LoadFlowType.AC,
+        )
+        power_flows = solver.cache.ac_power_flows
+        solver.solve(
+            network=_toy_network(timestamps=TIMESTAMPS[:1], loads=[5.0]),
+            loadflow_type=LoadFlowType.AC,
+        )
+
+        assert len(power_flows) == 2
+        assert solver.cache.ac_power_flows == power_flows
+
+    def test_failed_timestamps_are_reported_without_aborting(self):
+        network = _toy_network(timestamps=TIMESTAMPS[:2], loads=[7.0, 8.0])
+        load1 = network.get_element(id="load1", timestamp=TIMESTAMPS[1])
+        load1.element_metadata.dynamic.Pd = float("nan")
+
+        solver = _ac_solver()
+        result = solver.solve(network=network, loadflow_type=LoadFlowType.AC)
+
+        assert solver.get_loadflow_statuses() == {
+            TIMESTAMPS[0]: LoadFlowStatus.CONVERGED,
+            TIMESTAMPS[1]: LoadFlowStatus.FAILED,
+        }
+        assert result.get_element(id="load1", timestamp=TIMESTAMPS[1]) == load1
+
+    def test_dc_loadflows_are_delegated(self):
+        network = _toy_network(timestamps=TIMESTAMPS[:1], loads=[7.0])
+
+        with pytest.raises(ValueError):
+            _ac_solver().solve(network=network, loadflow_type=LoadFlowType.DC)
+
+        solver = _ac_solver(dc_loadflow_solver=_numpy_solver())
+        result = solver.solve(network=network, loadflow_type=LoadFlowType.DC)
+        expected = _solver().solve(network=network, loadflow_type=LoadFlowType.DC)
+        _assert_same_results(result=result, expected=expected)
+        assert solver.get_loadflow_statuses() == {TIMESTAMP: LoadFlowStatus.CONVERGED}
@@ -0,0 +1,220 @@
+import math
+import pytest
+import pypowsybl as pp
+from datetime import timedelta
+from src.core.constants import (
+    ElementStatus,
+    LoadFlowType,
+    State,
+    SupportedNetworkElementTypes,
+)
+from src.core.domain.enums import LoadFlowStatus
+from src.core.domain.models.element import NetworkElement
+from src.core.domain.models.elements_metadata import MetadataRegistry
+from src.core.domain.models.network import Network
+from src.core.infrastructure.adapters.network_builder import DefaultNetworkBuilder
+from src.core.infrastructure.adapters.numpy_dc_loadflow_solver import (
+    NumpyDCLoadFlowSolver,
+)
+from src.core.infrastructure.services.converters.pypowsybl_methods.service import (
+    PyPowsyblCompatService,
+)
+from tests.src.core.infrastructure.adapters.test_pypowsybl_loadflow_solver import (
+    TIMESTAMP,
+    _solver,
+    _toy_network,
+)
+
+TIMESTAMPS = [TIMESTAMP + timedelta(hours=k) for k in range(3)]
+
+
+def _generated_network(
+    pypowsybl_network: pp.network.Network,
+    load_factors: list[float],
+    lines_off: list[str] | None = None,
+    Pmax: float | None = None,
+) -> Network:
+    """Dynamic version of a pypowsybl test grid, with loads scaled by 'load_factors'."""
+
+    loads = pypowsybl_network.get_loads()
+    generators = pypowsybl_network.get_generators()
+    static_elements = PyPowsyblCompatService.elements_from_pypowsybl_network(
+        pypowsybl_network=pypowsybl_network, network_id="generated"
+    )
+
+    elements = []
+    for timestamp, load_factor in zip(TIMESTAMPS, load_factors):
+        for element in static_elements:
+            metadata = element.element_metadata.model_dump()
+            if element.type == SupportedNetworkElementTypes.LOAD:
+                metadata.update(
+                    state=State.DYNAMIC,
+                    dynamic={
+                        "Pd": loads.p0[element.id] * load_factor,
+                        "Qd": loads.q0[element.id],
+                    },
+                )
+            if element.type == SupportedNetworkElementTypes.GENERATOR:
+                metadata.update(
+                    state=State.DYNAMIC,
+                    dynamic={
+                        "Ptarget": generators.target_p[element.id],
+                        "Vtarget": generators.target_v[element.id],
+                    },
+                )
+                if Pmax is not None:
+                    metadata["static"].update(Pmax=Pmax, Pmin=0.0)
+            if element.id in (lines_off or []):
+                metadata["static"]["status"] = ElementStatus.OFF
+            elements.append(
+                NetworkElement.from_metadata(
+                    id=element.id,
+                    timestamp=timestamp,
+                    type=element.type,
+                    element_metadata=MetadataRegistry[element.type](**metadata),
+                    operational_constraints=element.operational_constraints,
+                    network_id="generated",
+                )
+            )
+    return DefaultNetworkBuilder.from_elements(id="generated", elements=elements)
+
+
+def _active_powers(network: Network) -> dict[tuple, float | None]:
+    powers = {}
+    for element in network.elements:
+        solved = element.element_metadata.solved
+        if solved is None:
+            powers[(element.id, element.timestamp)] = None
+        elif element.type == SupportedNetworkElementTypes.LINE:
+            powers[(element.id, element.timestamp)] = (solved.p1, solved.p2)
+        else:
+            powers[(element.id, element.timestamp)] = (solved.p, solved.q)
+    return powers
+
+
+def _assert_same_results(result: Network, expected: Network) -> None:
+    assert [(e.id, e.timestamp) for e in result.elements] == [
+        (e.id, e.timestamp) for e in expected.elements
+    ]
+    result_powers, expected_powers = _active_powers(result), _active_powers(expected)
+    for key, expected_power in expected_powers.items():
+        if expected_power is None:
+            assert result_powers[key] is None
+            continue
+        for value, expected_value in zip(result_powers[key], expected_power):
+            if math.isnan(expected_value):
+                assert math.isnan(value), key
+            else:
+                assert value == pytest.approx(expected_value, abs=1e-9), key
+
+
+def _numpy_solver(**kwargs) -> NumpyDCLoadFlowSolver:
+    return NumpyDCLoadFlowSolver(network_builder=DefaultNetworkBuilder(), **kwargs)
+
+
+class TestNumpyDCLoadFlowSolver:
+    """Tests for the `NumpyDCLoadFlowSolver` adapter, against pypowsybl's DC loadflow."""
+
+    @pytest.mark.parametrize(
+        "line_status",
+        [
+            [ElementStatus.ON] * 3,
+            [ElementStatus.ON, ElementStatus.OFF, ElementStatus.MAINTENANCE],
+        ],
+    )
+    def test_toy_grid_matches_pypowsybl(self, line_status):
+        network = _toy_network(
+            timestamps=TIMESTAMPS, loads=[7.0, 8.0, 12.0], line_status=line_status
+        )
+
+        result = _numpy_solver().solve(network=network, loadflow_type=LoadFlowType.DC)
+
+        expected = _solver().solve(network=network, loadflow_type=LoadFlowType.DC)
+        _assert_same_results(result=result, expected=expected)
+
+    def test_islanded_buses_match_pypowsybl(self):
+        network = _toy_network(
+            timestamps=TIMESTAMPS[:1], loads=[7.0], line_status=[ElementStatus.OFF]
+        )
+        network.get_element(
+            id="line1", timestamp=TIMESTAMP
+        ).element_metadata.static.status = ElementStatus.OFF
+
+        result = _numpy_solver().solve(network=network, loadflow_type=LoadFlowType.DC)
+
+        expected = _solver().solve(network=network, loadflow_type=LoadFlowType.DC)
+        _assert_same_results(result=result, expected=expected)
+
+    @pytest.mark.parametrize(
+        "create_network, kwargs",
+        [
+            (pp.network.create_ieee14, {}),
+            (pp.network.create_ieee14, {"Pmax": 150.0}),
+            (pp.network.create_ieee14, {"Pmax": 300.0}),
+            (pp.network.create_ieee57, {"lines_off": ["L1-2-1"]}),
+            (pp.network.create_ieee118, {}),
+            (pp.network.create_ieee118, {"lines_off": ["L1-2-1", "L5-6-1"]}),
+        ],
+    )
+    def test_generated_grids_match_pypowsybl(self, create_network, kwargs):
+        """
+        Covers transformers, distribution over negative targets, and Pmax limits, with which
+        some timestamps can't be balanced and fail.
+        """
+
+        network = _generated_network(
+            pypowsybl_network=create_network(), load_factors=[0.5, 1.0, 1.1], **kwargs
+        )
+
+        solver = _numpy_solver()
+        result = solver.solve(network=network, loadflow_type=LoadFlowType.DC)
+
+        expected_solver = _solver()
+        expected = expected_solver.solve(network=network, loadflow_type=LoadFlowType.DC)
+        _assert_same_results(result=result, expected=expected)
+        assert solver.get_loadflow_statuses() == expected_solver.get_loadflow_statuses()
+
+    def test_factorisations_are_cached_per_topology(self):
+        solver = _numpy_solver(max_factorisations=2)
+        statuses = [ElementStatus.ON, ElementStatus.OFF, ElementStatus.ON]
+
+        solver.solve(
+            network=_toy_network(
+                timestamps=TIMESTAMPS, loads=[7.0, 8.0, 9.0], line_status=statuses
+            ),
+            loadflow_type=LoadFlowType.DC,
+        )
+        power_flows = solver.cache.power_flows
+        solver.solve(
+            network=_toy_network(timestamps=TIMESTAMPS[:1], loads=[5.0]),
+            loadflow_type=LoadFlowType.DC,
+        )
+
+        assert len(power_flows) == 2
+        assert solver.cache.power_flows == power_flows
+
+    def test_failed_timestamps_are_reported_without_aborting(self):
+        network = _toy_network(timestamps=TIMESTAMPS[:2], loads=[7.0, 8.0])
+        load1 = network.get_element(id="load1", timestamp=TIMESTAMPS[1])
+        load1.element_metadata.dynamic.Pd = float("nan")
+
+        solver = _numpy_solver()
+        result = solver.solve(network=network, loadflow_type=LoadFlowType.DC)
+
+        assert solver.get_loadflow_statuses() == {
+            TIMESTAMPS[0]: LoadFlowStatus.CONVERGED,
+            TIMESTAMPS[1]: LoadFlowStatus.FAILED,
+        }
+        assert result.get_element(id="load1", timestamp=TIMESTAMPS[1]) == load1
+
+    def test_ac_loadflows_are_delegated(self):
+        network = _toy_network(timestamps=TIMESTAMPS[:1], loads=[7.0])
+
+        with pytest.raises(ValueError):
+            _numpy_solver().solve(network=network, loadflow_type=LoadFlowType.AC)
+
+        solver = _numpy_solver(ac_loadflow_solver=_solver())
+        result = solver.solve(network=network, loadflow_type=LoadFlowType.AC)
+        expected = _solver().solve(network=network, loadflow_type=LoadFlowType.AC)
+        _assert_same_results(result=result, expected=expected)
+        assert solver.get_loadflow_statuses() == {TIMESTAMP: LoadFlowStatus.CONVERGED}
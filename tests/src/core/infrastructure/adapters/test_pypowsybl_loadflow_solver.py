@@ -0,0 +1,475 @@
+import json
+import pytest
+from datetime import datetime, timedelta, timezone
+from src.core.constants import (
+    ElementStatus,
+    LoadFlowExecutor,
+    LoadFlowType,
+    State,
+    SupportedNetworkElementTypes,
+)
+from src.core.domain.enums import LoadFlowStatus, SolvePhase
+from src.core.domain.models.element import NetworkElement
+from src.core.domain.models.network import Network
+from src.core.domain.models.network_delta import NetworkDelta
+from src.core.domain.models.elements_metadata import MetadataRegistry
+from src.core.domain.use_cases.import_network_from_json import ETLPipeline
+from src.core.infrastructure.adapters.in_memory_metrics_sink import (
+    InMemoryMetricsSink,
+)
+from src.core.infrastructure.adapters.network_builder import DefaultNetworkBuilder
+from src.core.infrastructure.adapters import (
+    pypowsybl_loadflow_solver as solver_module,
+)
+from src.core.infrastructure.adapters.pypowsybl_loadflow_solver import (
+    PyPowSyblLoadFlowSolver,
+)
+from src.core.infrastructure.services.converters.pypowsybl_methods import (
+    network as network_module,
+)
+from src.core.infrastructure.services.converters.pypowsybl_methods.service import (
+    PyPowsyblCompatService,
+)
+
+TIMESTAMP = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+
+def _toy_network(
+    timestamps: list[datetime],
+    loads: list[float],
+    line_status: list[ElementStatus] | None = None,
+) -> Network:
+    """Dynamic version of the toy grid, with load1 at 'loads' and line2 at 'line_status'."""
+
+    etl = ETLPipeline(network_repository=None, network_builder=DefaultNetworkBuilder())
+    with open("configs/toy_grid_layout.json", "r") as f:
+        static_network = etl.validate_and_transform(json.load(f))
+
+    line_status = line_status or [ElementStatus.ON] * len(timestamps)
+    elements = []
+    for timestamp, load, status in zip(timestamps, loads, line_status):
+        for element in static_network.elements:
+            metadata = element.element_metadata.model_dump()
+            if element.type == SupportedNetworkElementTypes.LOAD:
+                metadata.update(state=State.DYNAMIC, dynamic={"Pd": load, "Qd": 2.0})
+            if element.type == SupportedNetworkElementTypes.GENERATOR:
+                metadata.update(
+                    state=State.DYNAMIC, dynamic={"Ptarget": 10.0, "Vtarget": 11.0}
+                )
+            if element.id == "line2":
+                metadata["static"]["status"] = status
+            elements.append(
+                NetworkElement.from_metadata(
+                    id=element.id,
+                    timestamp=timestamp,
+                    type=element.type,
+                    element_metadata=MetadataRegistry[element.type](**metadata),
+                    operational_constraints=element.operational_constraints,
+                    network_id="toy",
+                )
+            )
+    return DefaultNetworkBuilder.from_elements(id="toy", elements=elements)
+
+
+def _solver(**kwargs) -> PyPowSyblLoadFlowSolver:
+    return PyPowSyblLoadFlowSolver(
+        to_pypowsybl_converter_service=PyPowsyblCompatService(),
+        network_builder=DefaultNetworkBuilder(),
+        **kwargs,
+    )
+
+
+def _line_flows(network: Network) -> dict[tuple[str, datetime], float | None]:
+    return {
+        (e.id, e.timestamp): (
+            e.element_metadata.solved.p1 if e.element_metadata.solved else None
+        )
+        for e in network.elements
+        if e.type == SupportedNetworkElementTypes.LINE
+    }
+
+
+class TestPyPowSyblLoadFlowSolver:
+    """Tests for the `PyPowSyblLoadFlowSolver` adapter, and the network it keeps between solves."""
+
+    @pytest.mark.parametrize("loadflow_type", [LoadFlowType.AC, LoadFlowType.DC])
+    def test_successive_solves_match_fresh_solves(self, loadflow_type):
+        """Updating the kept network gives the same results as building a new one."""
+
+        statuses = [
+            ElementStatus.ON,
+            ElementStatus.OFF,
+            ElementStatus.OUTAGE,
+            ElementStatus.ON,
+        ]
+        loads = [7.0, 8.0, 9.0, 6.0]
+        solver = _solver()
+        for k, (load, status) in enumerate(zip(loads, statuses)):
+            timestamp = TIMESTAMP + timedelta(hours=k)
+            network = _toy_network(
+                timestamps=[timestamp], loads=[load], line_status=[status]
+            )
+
+            result = solver.solve(network=network, loadflow_type=loadflow_type)
+            expected = _solver().solve(network=network, loadflow_type=loadflow_type)
+
+            assert _line_flows(result) == pytest.approx(_line_flows(expected))
+            load1 = result.get_element(id="load1", timestamp=timestamp)
+            assert load1.element_metadata.solved.p == pytest.approx(load)
+
+        line2 = result.get_element(id="line2", timestamp=timestamp)
+        assert line2.element_metadata.state == State.SOLVED
+
+    def test_delta_solves_match_fresh_solves(self, monkeypatch):
+        """Only the injections a delta changed are sent, for the same results."""
+
+        statuses = [ElementStatus.ON] * 3 + [ElementStatus.OFF]
+        loads = [7.0, 8.0, 8.0, 8.0]
+        networks = [
+            _toy_network(
+                timestamps=[TIMESTAMP + timedelta(hours=k)],
+                loads=[load],
+                line_status=[status],
+            )
+            for k, (load, status) in enumerate(zip(loads, statuses))
+        ]
+        expected = [
+            _line_flows(_solver().solve(network=network, loadflow_type=LoadFlowType.DC))
+            for network in networks
+        ]
+
+        sent = []
+        update_elements = network_module._update_elements
+
+        def _update_elements(update_method, records):
+            if update_method.__name__ == "update_loads":
+                sent.append([record["id"] for record in records])
+            update_elements(update_method=update_method, records=records)
+
+        monkeypatch.setattr(network_module, "_update_elements", _update_elements)
+        solver = _solver()
+        solver.solve(network=networks[0], loadflow_type=LoadFlowType.DC)
+        for k in range(1, len(networks)):
+            delta = NetworkDelta.between(
+                elements=networks[k - 1].elements, next_elements=networks[k].elements
+            )
+            result = solver.solve_delta(
+                network=networks[k], delta=delta, loadflow_type=LoadFlowType.DC
+            )
+            assert _line_flows(result) == pytest.approx(expected[k])
+
+        # The load changed, then nothing did, then the new topology's variant got all.
+        assert sent[1:] == [["load1"], [], ["load1"]]
+        assert solver._delta is None
+
+    def test_off_elements_are_kept_as_is(self):
+        network = _toy_network(
+            timestamps=[TIMESTAMP], loads=[7.0], line_status=[ElementStatus.OFF]
+        )
+
+        result = _solver().solve(network=network, loadflow_type=LoadFlowType.DC)
+
+        line1 = result.get_element(id="line1", timestamp=TIMESTAMP)
+        line2 = result.get_element(id="line2", timestamp=TIMESTAMP)
+        assert line1.element_metadata.solved.p1 == pytest.approx(7.0)
+        assert line2 == network.get_element(id="line2", timestamp=TIMESTAMP)
+
+    def test_results_outlive_elements_moved_in_place(self):
+        """Moving the solved elements to the next timestamp leaves the results as solved."""
+
+        timestamps = [TIMESTAMP, TIMESTAMP + timedelta(hours=1)]
+        network = _toy_network(timestamps=timestamps[:1], loads=[7.0])
+        next_network = _toy_network(
+            timestamps=timestamps[1:], loads=[9.0], line_status=[ElementStatus.OFF]
+        )
+
+        result = _solver().solve(network=network, loadflow_type=LoadFlowType.DC)
+        NetworkDelta.between(
+            elements=network.elements, next_elements=next_network.elements
+        ).apply(elements=network.elements)
+
+        load1 = result.get_element(id="load1", timestamp=TIMESTAMP)
+        line2 = result.get_element(id="line2", timestamp=TIMESTAMP)
+        assert load1.element_metadata.dynamic.Pd == pytest.approx(7.0)
+        assert line2.element_metadata.static.status == ElementStatus.ON
+
+    def test_network_is_built_once_per_grid(self, monkeypatch):
+        """The grid is hashed when the network is built, not on every timestamp."""
+
+        hashes = []
+        base_case_key = network_module.base_case_key
+        monkeypatch.setattr(
+            network_module,
+            "base_case_key",
+            lambda elements: hashes.append(elements) or base_case_key(elements),
+        )
+        solver = _solver()
+        timestamps = [TIMESTAMP, TIMESTAMP + timedelta(hours=1)]
+
+        solver.solve(
+            network=_toy_network(timestamps=timestamps, loads=[7.0, 8.0]),
+            loadflow_type=LoadFlowType.DC,
+        )
+        session = solver._session
+        solver.solve(
+            network=_toy_network(
+                timestamps=timestamps[1:], loads=[9.0], line_status=[ElementStatus.OFF]
+            ),
+            loadflow_type=LoadFlowType.DC,
+        )
+        assert solver._session is session
+        assert len(hashes) == 1
+
+        solver.reset()
+        assert solver._session is None
+
+    def test_network_is_built_again_for_other_static_attributes(self):
+        """Grids sharing element ids, but not their parameters, don't share a network."""
+
+        network = _toy_network(timestamps=[TIMESTAMP], loads=[7.0])
+        variant = _toy_network(timestamps=[TIMESTAMP], loads=[7.0])
+        line = variant.get_element(id="line1", timestamp=TIMESTAMP)
+        line.element_metadata.static.x *= 2
+        solver = _solver()
+
+        for requested in [network, variant, network]:
+            result = solver.solve(network=requested, loadflow_type=LoadFlowType.DC)
+            expected = _solver().solve(network=requested, loadflow_type=LoadFlowType.DC)
+            assert _line_flows(result) == pytest.approx(_line_flows(expected))
+
+    @pytest.mark.parametrize("max_variants", [1, 8])
+    def test_topologies_get_their_own_variants(self, max_variants):
+        timestamps = [TIMESTAMP + timedelta(hours=k) for k in range(4)]
+        loads = [7.0, 8.0, 9.0, 6.0]
+        statuses = [ElementStatus.ON, ElementStatus.OFF] * 2
+        network = _toy_network(timestamps=timestamps, loads=loads, line_status=statuses)
+        expected = {}
+        for timestamp, load, status in zip(timestamps, loads, statuses):
+            expected.update(
+                _line_flows(
+                    _solver().solve(
+                        network=_toy_network(
+                            timestamps=[timestamp], loads=[load], line_status=[status]
+                        ),
+                        loadflow_type=LoadFlowType.AC,
+                    )
+                )
+            )
+
+        solver = _solver(warm_start=True, max_variants=max_variants)
+        result = solver.solve(network=network, loadflow_type=LoadFlowType.AC)
+
+        # Warm starts stop within pypowsybl's tolerance of a flat start's solution.
+        assert _line_flows(result) == pytest.approx(expected, rel=1e-2)
+        session = solver._session
+        assert len(session.variants) == min(2, max_variants)
+        assert set(session.network.get_variant_ids()) == {
+            session.base_variant,
+            *session.variants.values(),
+        }
+        # The base variant keeps every element connected.
+        session.network.set_working_variant(session.base_variant)
+        assert session.network.get_lines()["connected1"].all()
+
+    def test_base_case_is_reused_across_solvers(self, tmp_path, monkeypatch):
+        timestamps = [TIMESTAMP, TIMESTAMP + timedelta(hours=1)]
+        network = _toy_network(
+            timestamps=timestamps,
+            loads=[7.0, 8.0],
+            line_status=[ElementStatus.OFF, ElementStatus.ON],
+        )
+        expected = _solver().solve(network=network, loadflow_type=LoadFlowType.AC)
+        _solver(base_case_dir=tmp_path).solve(
+            network=network, loadflow_type=LoadFlowType.AC
+        )
+        (path,) = tmp_path.iterdir()
+
+        def _create_elements(**kwargs):
+            raise AssertionError("The base case should be loaded, not built.")
+
+        monkeypatch.setattr(network_module, "_create_elements", _create_elements)
+        # Statuses and injections don't change the base case.
+        other_network = _toy_network(timestamps=timestamps[:1], loads=[9.0])
+        _solver(base_case_dir=tmp_path).solve(
+            network=other_network, loadflow_type=LoadFlowType.AC
+        )
+        result = _solver(base_case_dir=tmp_path).solve(
+            network=network, loadflow_type=LoadFlowType.AC
+        )
+
+        assert _line_flows(result) == pytest.approx(_line_flows(expected))
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_base_case_key_follows_static_attributes(self):
+        elements = _toy_network(timestamps=[TIMESTAMP], loads=[7.0]).elements
+        key = PyPowsyblCompatService.base_case_key(elements=elements)
+        other_elements = _toy_network(
+            timestamps=[TIMESTAMP + timedelta(hours=1)],
+            loads=[8.0],
+            line_status=[ElementStatus.OFF],
+        ).elements
+        assert PyPowsyblCompatService.base_case_key(elements=other_elements) == key
+
+        line = next(e for e in elements if e.type == SupportedNetworkElementTypes.LINE)
+        line.element_metadata.static.r += 1.0
+        assert PyPowsyblCompatService.base_case_key(elements=elements) != key
+
+    def test_solved_elements_keep_static_and_dynamic_attributes(self):
+        network = _toy_network(timestamps=[TIMESTAMP], loads=[7.0])
+
+        result = _solver().solve(network=network, loadflow_type=LoadFlowType.AC)
+
+        for element in result.elements:
+            given = network.get_element(id=element.id, timestamp=TIMESTAMP)
+            assert element.uid == given.uid
+            assert element.element_metadata.state == State.SOLVED
+            assert element.element_metadata.static == given.element_metadata.static
+            assert element.operational_constraints == given.operational_constraints
+        gen1 = result.get_element(id="gen1", timestamp=TIMESTAMP)
+        assert gen1.element_metadata.dynamic.Qtarget is None
+        assert gen1.element_metadata.solved.connected
+
+    @pytest.mark.parametrize(
+        "executor, max_workers",
+        [
+            (LoadFlowExecutor.THREAD, 2),
+            (LoadFlowExecutor.PROCESS, 2),
+            (LoadFlowExecutor.THREAD, 8),
+        ],
+    )
+    def test_parallel_solves_match_sequential_solve(self, executor, max_workers):
+        timestamps = [TIMESTAMP + timedelta(hours=k) for k in range(5)]
+        network = _toy_network(
+            timestamps=timestamps,
+            loads=[5.0, 6.0, 7.0, 8.0, 9.0],
+            line_status=[ElementStatus.ON, ElementStatus.OFF] * 2 + [ElementStatus.ON],
+        )
+        expected = _solver().solve(network=network, loadflow_type=LoadFlowType.AC)
+
+        solver = PyPowSyblLoadFlowSolver(
+            to_pypowsybl_converter_service=PyPowsyblCompatService(),
+            network_builder=DefaultNetworkBuilder(),
+            executor=executor,
+            max_workers=max_workers,
+        )
+        try:
+            result = solver.solve(network=network, loadflow_type=LoadFlowType.AC)
+        finally:
+            solver.shutdown()
+
+        assert [(e.id, e.timestamp) for e in result.elements] == [
+            (e.id, e.timestamp) for e in expected.elements
+        ]
+        assert _line_flows(result) == pytest.approx(_line_flows(expected))
+        assert solver.get_loadflow_statuses() == {
+            t: LoadFlowStatus.CONVERGED for t in timestamps
+        }
+
+    def test_worker_processes_catch_up_on_resets(self, monkeypatch):
+        monkeypatch.setattr(solver_module, "_WORKER_SOLVER", None)
+        monkeypatch.setattr(solver_module, "_WORKER_RESETS", 0)
+        solver_module._init_worker(
+            PyPowsyblCompatService(), DefaultNetworkBuilder(), False, 8, None
+        )
+        shard = [
+            (TIMESTAMP, _toy_network(timestamps=[TIMESTAMP], loads=[7.0]).elements)
+        ]
+
+        solver_module._solve_shard_in_worker(shard, LoadFlowType.DC, "toy", 0)
+        session = solver_module._WORKER_SOLVER._session
+        solver_module._solve_shard_in_worker(shard, LoadFlowType.DC, "toy", 0)
+        assert solver_module._WORKER_SOLVER._session is session
+
+        # The pool's solver was reset since.
+        solver_module._solve_shard_in_worker(shard, LoadFlowType.DC, "toy", 1)
+        assert solver_module._WORKER_SOLVER._session is not session
+        assert solver_module._WORKER_RESETS == 1
+
+    def test_failed_timestamps_are_reported_without_aborting(self):
+        timestamps = [TIMESTAMP, TIMESTAMP + timedelta(hours=1)]
+        network = _toy_network(timestamps=timestamps, loads=[7.0, 8.0])
+        load1 = network.get_element(id="load1", timestamp=timestamps[1])
+        load1.element_metadata.dynamic.Pd = float("nan")
+
+        solver = _solver()
+        result = solver.solve(network=network, loadflow_type=LoadFlowType.DC)
+
+        assert solver.get_loadflow_statuses() == {
+            timestamps[0]: LoadFlowStatus.CONVERGED,
+            timestamps[1]: LoadFlowStatus.FAILED,
+        }
+        solved_load1 = result.get_element(id="load1", timestamp=timestamps[0])
+        assert solved_load1.element_metadata.state == State.SOLVED
+        assert result.get_element(id="load1", timestamp=timestamps[1]) == load1
+
+    def test_warm_starts_save_iterations(self):
+        timestamps = [TIMESTAMP + timedelta(hours=k) for k in range(3)]
+        network = _toy_network(timestamps=timestamps, loads=[7.0, 7.5, 8.0])
+        cold_solver = _solver()
+        expected = cold_solver.solve(network=network, loadflow_type=LoadFlowType.AC)
+
+        solver = _solver(warm_start=True)
+        result = solver.solve(network=network, loadflow_type=LoadFlowType.AC)
+
+        assert _line_flows(result) == pytest.approx(_line_flows(expected), rel=1e-4)
+        iterations = solver.get_iterations()
+        cold_iterations = cold_solver.get_iterations()
+        assert iterations[timestamps[0]] == cold_iterations[timestamps[0]]
+        for timestamp in timestamps[1:]:
+            assert iterations[timestamp] < cold_iterations[timestamp]
+        metrics = solver.get_metrics()
+        assert (metrics.warm_starts, metrics.warm_start_fallbacks) == (2, 0)
+        assert metrics.iterations == sum(iterations.values())
+
+    def test_warm_start_falls_back_to_a_flat_start(self):
+        timestamps = [TIMESTAMP, TIMESTAMP + timedelta(hours=1)]
+        network = _toy_network(timestamps=timestamps, loads=[7.0, 8.0])
+        expected = _solver().solve(network=network, loadflow_type=LoadFlowType.AC)
+
+        solver = _solver(warm_start=True)
+        solver.solve(
+            network=_toy_network(timestamps=timestamps[:1], loads=[7.0]),
+            loadflow_type=LoadFlowType.AC,
+        )
+        # Previous voltages no loadflow can start from.
+        buses = solver._session.network.get_buses()
+        solver._session.network.update_buses(
+            id=buses.index, v_mag=[1e-6] * len(buses), v_angle=[3.0] * len(buses)
+        )
+        result = solver.solve(
+            network=_toy_network(timestamps=timestamps[1:], loads=[8.0]),
+            loadflow_type=LoadFlowType.AC,
+        )
+
+        assert solver.get_loadflow_statuses() == {
+            timestamps[1]: LoadFlowStatus.CONVERGED
+        }
+        metrics = solver.get_metrics()
+        assert (metrics.warm_starts, metrics.warm_start_fallbacks) == (0, 1)
+        expected_flows = {
+            key: flow
+            for key, flow in _line_flows(expected).items()
+            if key[1] != TIMESTAMP
+        }
+        assert _line_flows(result) == pytest.approx(expected_flows)
+
+    def test_metrics_are_recorded(self):
+        timestamps = [TIMESTAMP + timedelta(hours=k) for k in range(3)]
+        network = _toy_network(timestamps=timestamps, loads=[7.0, 8.0, 9.0])
+        sink = InMemoryMetricsSink()
+        solver = _solver(metrics_sink=sink)
+
+        solver.solve(network=network, loadflow_type=LoadFlowType.AC)
+        solver.solve(network=network, loadflow_type=LoadFlowType.DC)
+
+        ac_metrics, dc_metrics = sink.records
+        assert solver.get_metrics() == dc_metrics
+        assert ac_metrics.loadflow_type == LoadFlowType.AC
+        assert ac_metrics.n_timestamps == 3
+        assert ac_metrics.n_elements == len(network.elements)
+        assert ac_metrics.iterations > 0
+        assert ac_metrics.statuses == {LoadFlowStatus.CONVERGED: 3}
+        assert dc_metrics.iterations == 0
+        assert set(ac_metrics.phase_seconds) == set(SolvePhase)
+        assert all(seconds > 0 for seconds in ac_metrics.phase_seconds.values())
+        assert sum(ac_metrics.phase_seconds.values()) <= ac_metrics.seconds
@@ -0,0 +1,218 @@
+import multiprocessing
+import pickle
+import pytest
+import threading
+from datetime import timedelta
+from src.core.constants import ElementStatus, LoadFlowExecutor, LoadFlowType
+from src.core.domain.enums import LoadFlowStatus
+from src.core.domain.models.network import Network
+from src.core.infrastructure.adapters.network_builder import DefaultNetworkBuilder
+from src.core.infrastructure.adapters.pypowsybl_loadflow_solver import (
+    PyPowSyblLoadFlowSolver,
+)
+from src.core.infrastructure.adapters.remote_loadflow_solver import (
+    RemoteLoadFlowSolver,
+)
+from src.core.infrastructure.services.loadflow_service import LoadFlowService
+from tests.src.core.infrastructure.adapters.test_pypowsybl_loadflow_solver import (
+    TIMESTAMP,
+    _line_flows,
+    _solver,
+    _toy_network,
+)
+
+TIMESTAMPS = [TIMESTAMP + timedelta(hours=k) for k in range(3)]
+AUTHKEY = b"test"
+
+
+class CountingSolver(PyPowSyblLoadFlowSolver):
+    """Pypowsybl solver counting the networks it solves."""
+
+    def solve(self, network: Network, loadflow_type: LoadFlowType) -> Network:
+        self.calls = getattr(self, "calls", 0) + 1
+        if network.elements and network.elements[0].timestamp.year == 2000:
+            raise ValueError("Not a year to solve.")
+        return super().solve(network=network, loadflow_type=loadflow_type)
+
+
+def _service(**kwargs) -> LoadFlowService:
+    return LoadFlowService(
+        loadflow_solver=CountingSolver(
+            to_pypowsybl_converter_service=_solver().to_pypowsybl_converter_service,
+            network_builder=DefaultNetworkBuilder(),
+        ),
+        network_builder=DefaultNetworkBuilder(),
+        authkey=AUTHKEY,
+        **kwargs,
+    ).start()
+
+
+def _client(service: LoadFlowService) -> RemoteLoadFlowSolver:
+    return RemoteLoadFlowSolver(
+        network_builder=DefaultNetworkBuilder(),
+        address=service.address,
+        authkey=AUTHKEY,
+    )
+
+
+class TestRemoteLoadFlowSolver:
+    """Tests for the `RemoteLoadFlowSolver` adapter, and the `LoadFlowService` it uses."""
+
+    @pytest.mark.parametrize("loadflow_type", [LoadFlowType.AC, LoadFlowType.DC])
+    def test_remote_results_match_local_ones(self, loadflow_type):
+        network = _toy_network(
+            timestamps=TIMESTAMPS,
+            loads=[7.0, 8.0, 7.0],
+            line_status=[ElementStatus.ON, ElementStatus.OFF, ElementStatus.ON],
+        )
+        expected = _solver().solve(network=network, loadflow_type=loadflow_type)
+        service = _service()
+        try:
+            solver = _client(service=service)
+            result = solver.solve(network=network, loadflow_type=loadflow_type)
+        finally:
+            service.shutdown()
+
+        assert sorted((e.id, e.timestamp) for e in result.elements) == sorted(
+            (e.id, e.timestamp) for e in expected.elements
+        )
+        assert _line_flows(result) == pytest.approx(_line_flows(expected))
+        assert solver.get_loadflow_statuses() == {
+            t: LoadFlowStatus.CONVERGED for t in TIMESTAMPS
+        }
+
+    def test_concurrent_requests_are_solved_together(self):
+        requests = [
+            (TIMESTAMPS[0], 7.0),
+            (TIMESTAMPS[0], 7.0),
+            (TIMESTAMPS[1], 8.0),
+            (TIMESTAMPS[0], 9.0),
+        ]
+        networks = [
+            _toy_network(timestamps=[timestamp], loads=[load])
+            for timestamp, load in requests
+        ]
+        service = _service(batch_window=1.0)
+        barrier = threading.Barrier(len(networks))
+        results = [None] * len(networks)
+
+        def _solve(k: int) -> None:
+            barrier.wait()
+            results[k] = _client(service=service).solve(
+                network=networks[k], loadflow_type=LoadFlowType.DC
+            )
+
+        try:
+            threads = [
+                threading.Thread(target=_solve, args=(k,)) for k in range(len(networks))
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            service.shutdown()
+
+        for network, result in zip(networks, results):
+            expected = _solver().solve(network=network, loadflow_type=LoadFlowType.DC)
+            assert _line_flows(result) == pytest.approx(_line_flows(expected))
+        # The repeated request is solved once, the 2nd load of TIMESTAMPS[0] on its own.
+        assert service.loadflow_solver.calls == 2
+
+    def test_service_failures_are_raised(self):
+        network = _toy_network(timestamps=[TIMESTAMP.replace(year=2000)], loads=[7.0])
+        service = _service()
+        try:
+            solver = _client(service=service)
+            with pytest.raises(RuntimeError, match="Not a year to solve"):
+                solver.solve(network=network, loadflow_type=LoadFlowType.DC)
+            # The service keeps serving.
+            solver.solve(
+                network=_toy_network(timestamps=[TIMESTAMP], loads=[7.0]),
+                loadflow_type=LoadFlowType.DC,
+            )
+        finally:
+            service.shutdown()
+
+        # Solvers are sent to subprocesses without their connection.
+        assert pickle.loads(pickle.dumps(solver))._connection is None
+
+    def test_shutdown_stops_the_solver_workers(self):
+        service = LoadFlowService(
+            loadflow_solver=CountingSolver(
+                to_pypowsybl_converter_service=_solver().to_pypowsybl_converter_service,
+                network_builder=DefaultNetworkBuilder(),
+                executor=LoadFlowExecutor.THREAD,
+                max_workers=2,
+            ),
+            network_builder=DefaultNetworkBuilder(),
+            authkey=AUTHKEY,
+        ).start()
+        try:
+            _client(service=service).solve(
+                network=_toy_network(timestamps=TIMESTAMPS[:2], loads=[7.0, 8.0]),
+                loadflow_type=LoadFlowType.DC,
+            )
+            assert service.loadflow_solver._pool is not None
+        finally:
+            service.shutdown()
+
+        assert service.loadflow_solver._pool is None
+
+    def test_clients_failing_to_authenticate_are_refused(self):
+        service = _service()
+        try:
+            with pytest.raises(multiprocessing.AuthenticationError):
+                RemoteLoadFlowSolver(
+                    network_builder=DefaultNetworkBuilder(),
+                    address=service.address,
+                    authkey=b"wrong",
+                ).solve(
+                    network=_toy_network(timestamps=[TIMESTAMP], loads=[7.0]),
+                    loadflow_type=LoadFlowType.DC,
+                )
+            # Other clients are still accepted.
+            _client(service=service).solve(
+                network=_toy_network(timestamps=[TIMESTAMP], loads=[7.0]),
+                loadflow_type=LoadFlowType.DC,
+            )
+        finally:
+            service.shutdown()
+
+    def test_an_authkey_is_required(self):
+        with pytest.raises(ValueError, match="authkey"):
+            LoadFlowService(
+                loadflow_solver=_solver(),
+                network_builder=DefaultNetworkBuilder(),
+                authkey=b"",
+            )
+
+    def test_grids_sharing_element_ids_are_solved_apart(self):
+        """Requests of grids differing only by their static attributes don't mix."""
+        network = _toy_network(timestamps=[TIMESTAMP], loads=[7.0])
+        variant = _toy_network(timestamps=[TIMESTAMP], loads=[7.0])
+        line = variant.get_element(id="line1", timestamp=TIMESTAMP)
+        line.element_metadata.static.x *= 2
+        service = _service(batch_window=1.0)
+        barrier = threading.Barrier(2)
+        results = [None, None]
+
+        def _solve(k: int) -> None:
+            barrier.wait()
+            results[k] = _client(service=service).solve(
+                network=[network, variant][k], loadflow_type=LoadFlowType.DC
+            )
+
+        try:
+            threads = [threading.Thread(target=_solve, args=(k,)) for k in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            service.shutdown()
+
+        for requested, result in zip([network, variant], results):
+            expected = _solver().solve(network=requested, loadflow_type=LoadFlowType.DC)
+            assert _line_flows(result) == pytest.approx(_line_flows(expected))
+        assert service.loadflow_solver.calls == 2
@@ -529,3 +529,169 @@ class TestNetworkToPypowsybl:
         assert list(result_active["2024-01-01T00:00:00+0000"].get_lines().index) == [
             "line_2"
         ]
+
+    def test_network_to_pypowsybl_with_partially_set_attributes(self):
+        """Elements of a type only setting some optional attributes are all created."""
+
+        def generator(id: str, Qtarget: float | None) -> NetworkElement:
+            return NetworkElement(
+                uid=f"uid_{id}",
+                id=id,
+                timestamp="2024-01-01T00:00:00+0000",
+                type=SupportedNetworkElementTypes.GENERATOR,
+                element_metadata=GeneratorMetadata(
+                    state=State.DYNAMIC,
+                    static=GeneratorStaticAttributes(
+                        status=ElementStatus.ON,
+                        voltage_level_id="VL1",
+                        bus_id="bus_1",
+                        Pmax=100.0,
+                        Pmin=0.0,
+                        is_voltage_regulator=True,
+                    ),
+                    dynamic=GeneratorDynamicAttributes(
+                        Ptarget=75.0, Vtarget=11.0, Qtarget=Qtarget
+                    ),
+                ),
+                network_id="network_1",
+                operational_constraints=[],
+            )
+
+        network = Network(
+            uid="some_uid",
+            id="test_network",
+            elements=[
+                NetworkElement(
+                    uid="uid_voltage",
+                    id="VL1",
+                    timestamp="2024-01-01T00:00:00+0000",
+                    type=SupportedNetworkElementTypes.VOLTAGE_LEVEL,
+                    element_metadata=VoltageLevelsMetadata(
+                        state=State.STATIC,
+                        static=VoltageLevelsStaticAttributes(
+                            topology_kind="BUS_BREAKER",
+                            Vnominal=11.0,
+                        ),
+                    ),
+                    network_id="network_1",
+                    operational_constraints=[],
+                ),
+                NetworkElement(
+                    uid="uid_bus",
+                    id="bus_1",
+                    timestamp="2024-01-01T00:00:00+0000",
+                    type=SupportedNetworkElementTypes.BUS,
+                    element_metadata=BusMetadata(
+                        state=State.STATIC,
+                        static=BusStaticAttributes(voltage_level_id="VL1"),
+                    ),
+                    network_id="network_1",
+                    operational_constraints=[],
+                ),
+                generator(id="gen_1", Qtarget=None),
+                generator(id="gen_2", Qtarget=5.0),
+                generator(id="gen_3", Qtarget=None),
+            ],
+        )
+        result = PyPowsyblCompatService.network_to_pypowsybl(network)
+
+        generators = result.get_active_network()[
+            "2024-01-01T00:00:00+0000"
+        ].get_generators()
+        assert sorted(generators.index) == ["gen_1", "gen_2", "gen_3"]
+        assert generators.loc["gen_2", "target_q"] == 5.0
+
+
+class TestElementsFromPypowsyblNetwork:
+    """Tests for the `elements_from_pypowsybl_network` function."""
+
+    def test_elements_from_pypowsybl_network(self):
+        import pypowsybl as pp
+
+        elements = PyPowsyblCompatService.elements_from_pypowsybl_network(
+            pypowsybl_network=pp.network.create_eurostag_tutorial_example1_network(),
+            network_id="eurostag",
+        )
+        elements_by_id = {e.id: e for e in elements}
+
+        assert all(e.element_metadata.state == State.STATIC for e in elements)
+        assert all(e.network_id == "eurostag" for e in elements)
+        assert sorted(
+            e.id for e in elements if e.type == SupportedNetworkElementTypes.BUS
+        ) == ["VLGEN_0", "VLHV1_0", "VLHV2_0", "VLLOAD_0"]
+
+        line = elements_by_id["NHV1_NHV2_1"]
+        assert line.type == SupportedNetworkElementTypes.LINE
+        assert line.element_metadata.static.status == ElementStatus.ON
+        assert line.element_metadata.static.bus1_id == "VLHV1_0"
+        assert line.element_metadata.static.x == 33.0
+        assert sorted(
+            (c.side.value, c.value) for c in line.operational_constraints
+        ) == [("ONE", 500.0), ("TWO", 1100.0)]
+
+        voltage_level = elements_by_id["VLGEN"]
+        assert voltage_level.element_metadata.static.Vnominal == 24.0
+        assert voltage_level.element_metadata.static.Vlimitlow is None
+
+        assert elements_by_id["GEN"].element_metadata.static.Pmax == 4999.0
+        assert elements_by_id["LOAD"].element_metadata.static.bus_id == "VLLOAD_0"
+
+    def test_disconnected_elements_are_imported_off(self):
+        import pypowsybl as pp
+
+        pypowsybl_network = pp.network.create_ieee14()
+        pypowsybl_network.disconnect("L1-2-1")
+        pypowsybl_network.disconnect("B2-G")
+
+        elements_by_id = {
+            e.id: e
+            for e in PyPowsyblCompatService.elements_from_pypowsybl_network(
+                pypowsybl_network=pypowsybl_network, network_id="ieee14"
+            )
+        }
+
+        line = elements_by_id["L1-2-1"].element_metadata.static
+        assert line.status == ElementStatus.OFF
+        assert (line.bus1_id, line.bus2_id) == ("VL1_0", "VL2_0")
+        generator = elements_by_id["B2-G"].element_metadata.static
+        assert generator.status == ElementStatus.OFF
+        assert generator.bus_id == "VL2_0"
+        assert elements_by_id["L1-5-1"].element_metadata.static.status == (
+            ElementStatus.ON
+        )
+
+    def test_imported_elements_can_be_converted_back(self):
+        """Once made dynamic, imported elements convert back to a pypowsybl network."""
+        import pypowsybl as pp
+        from src.core.domain.models.elements_metadata import MetadataRegistry
+
+        timestamp = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+        elements = []
+        for e in PyPowsyblCompatService.elements_from_pypowsybl_network(
+            pypowsybl_network=pp.network.create_eurostag_tutorial_example1_network(),
+            network_id="eurostag",
+        ):
+            metadata = e.element_metadata.model_dump()
+            if e.type == SupportedNetworkElementTypes.LOAD:
+                metadata.update(state=State.DYNAMIC, dynamic={"Pd": 600.0, "Qd": 200.0})
+            if e.type == SupportedNetworkElementTypes.GENERATOR:
+                metadata.update(
+                    state=State.DYNAMIC, dynamic={"Ptarget": 300.0, "Vtarget": 24.5}
+                )
+            elements.append(
+                NetworkElement.from_metadata(
+                    id=e.id,
+                    timestamp=timestamp,
+                    type=e.type,
+                    element_metadata=MetadataRegistry[e.type](**metadata),
+                    operational_constraints=[],
+                    network_id=e.network_id,
+                )
+            )
+
+        result = PyPowsyblCompatService.network_to_pypowsybl(
+            Network(uid="uid", id="eurostag", elements=elements)
+        ).get_active_network()["2024-01-01T00:00:00+0000"]
+
+        assert sorted(result.get_lines().index) == ["NHV1_NHV2_1", "NHV1_NHV2_2"]
+        assert len(result.get_2_windings_transformers()) == 2
@@ -0,0 +1,81 @@
+import pytest
+from src.core.constants import MetricsSinks, SupportedBackends
+from src.core.infrastructure.adapters.cached_loadflow_solver import (
+    CachedLoadFlowSolver,
+)
+from src.core.infrastructure.adapters.numpy_ac_loadflow_solver import (
+    NumpyACLoadFlowSolver,
+)
+from src.core.infrastructure.adapters.numpy_dc_loadflow_solver import (
+    NumpyDCLoadFlowSolver,
+)
+from src.core.infrastructure.adapters.pypowsybl_loadflow_solver import (
+    PyPowSyblLoadFlowSolver,
+)
+from src.core.infrastructure.adapters.remote_loadflow_solver import (
+    RemoteLoadFlowSolver,
+)
+from src.core.infrastructure.loadflow_solver_factory import LoadFlowSolverFactory
+from src.core.infrastructure.settings import Settings
+
+
+def _settings(**kwargs) -> Settings:
+    return Settings(
+        DB_URL="sqlite:///test.db",
+        SHOULD_CREATE_TABLES=False,
+        NETWORK_API_BASEURL="http://localhost",
+        ARTIFACTS_LOCATION="artifacts",
+        MLFLOW_TRACKING_URI="mlruns",
+        LOG_LEVEL="INFO",
+        **kwargs,
+    )
+
+
+class TestLoadFlowSolverFactory:
+    """Tests for the `LoadFlowSolverFactory`."""
+
+    @pytest.mark.parametrize(
+        "backend, solver_cls",
+        [
+            (SupportedBackends.PYPOWSYBL, PyPowSyblLoadFlowSolver),
+            (SupportedBackends.NUMPY, NumpyDCLoadFlowSolver),
+            (SupportedBackends.NUMPY_AC, NumpyACLoadFlowSolver),
+        ],
+    )
+    def test_backends_are_built_behind_a_cache_when_set(self, backend, solver_cls):
+        factory = LoadFlowSolverFactory(settings=_settings(LOADFLOW_BACKEND=backend))
+        assert isinstance(factory.loadflow_solver(), solver_cls)
+
+        factory = LoadFlowSolverFactory(
+            settings=_settings(LOADFLOW_BACKEND=backend, LOADFLOW_CACHE_SIZE=8)
+        )
+        solver = factory.loadflow_solver()
+        assert isinstance(solver, CachedLoadFlowSolver)
+        assert isinstance(solver.loadflow_solver, solver_cls)
+
+    def test_solvers_share_the_metrics_sink(self):
+        factory = LoadFlowSolverFactory(
+            settings=_settings(LOADFLOW_METRICS_SINK=MetricsSinks.IN_MEMORY)
+        )
+
+        solvers = [factory.loadflow_solver() for _ in range(2)]
+
+        assert factory.metrics_sink is not None
+        assert all(s.metrics_sink is factory.metrics_sink for s in solvers)
+
+    def test_remote_solvers_need_an_authkey(self):
+        factory = LoadFlowSolverFactory(
+            settings=_settings(LOADFLOW_BACKEND=SupportedBackends.REMOTE)
+        )
+        with pytest.raises(ValueError, match="LOADFLOW_SERVICE_AUTHKEY"):
+            factory.loadflow_solver()
+
+        factory = LoadFlowSolverFactory(
+            settings=_settings(
+                LOADFLOW_BACKEND=SupportedBackends.REMOTE,
+                LOADFLOW_SERVICE_AUTHKEY="test",
+            )
+        )
+        assert isinstance(factory.loadflow_solver(), RemoteLoadFlowSolver)
+        with pytest.raises(ValueError, match="itself"):
+            factory.loadflow_service()
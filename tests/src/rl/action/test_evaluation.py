@@ -0,0 +1,71 @@
+import copy
+import math
+import pytest
+from src.core.constants import ElementStatus, LoadFlowType
+from src.rl.action import SwitchAction
+from src.rl.action.evaluation import SwitchActionEvaluator
+from tests.src.core.infrastructure.adapters.test_numpy_dc_loadflow_solver import (
+    TIMESTAMPS,
+    _numpy_solver,
+    _toy_network,
+)
+from tests.src.core.infrastructure.adapters.test_pypowsybl_loadflow_solver import (
+    _line_flows,
+)
+
+ACTIONS = [SwitchAction(element_id="line1"), SwitchAction(element_id="line2")]
+
+
+class TestSwitchActionEvaluator:
+    """Tests for the `SwitchActionEvaluator`."""
+
+    @pytest.mark.parametrize("line2_status", [ElementStatus.ON, ElementStatus.OFF])
+    def test_predicted_flows_match_solved_flows(self, line2_status):
+        network = _toy_network(
+            timestamps=TIMESTAMPS[:1], loads=[10.0], line_status=[line2_status]
+        )
+
+        predictions = SwitchActionEvaluator().predict_flows(
+            network=network, actions=ACTIONS
+        )
+
+        for action in ACTIONS:
+            switched = action.execute(network=copy.deepcopy(network))
+            expected = _line_flows(
+                _numpy_solver().solve(network=switched, loadflow_type=LoadFlowType.DC)
+            )
+            if predictions[action] is None:
+                # Opening the only line in service splits the grid.
+                assert line2_status == ElementStatus.OFF
+                assert action.element_id == "line1"
+                continue
+            for line_id, flow in predictions[action].items():
+                expected_flow = expected[(line_id, TIMESTAMPS[0])]
+                if expected_flow is None or math.isnan(expected_flow):
+                    assert math.isnan(flow)
+                else:
+                    assert flow == pytest.approx(expected_flow)
+
+    def test_predicted_overloads(self):
+        network = _toy_network(timestamps=TIMESTAMPS[:1], loads=[10.0])
+
+        overloads = SwitchActionEvaluator().predict_overloads(
+            network=network, actions=ACTIONS
+        )
+
+        # Lines are limited to 8 MW, the remaining line carrying the whole load.
+        assert overloads == {ACTIONS[0]: 1, ACTIONS[1]: 1}
+
+    @pytest.mark.parametrize("line2_status", [ElementStatus.ON, ElementStatus.OFF])
+    def test_islanding_switches_are_found_without_solving(self, line2_status):
+        network = _toy_network(
+            timestamps=TIMESTAMPS[:1], loads=[10.0], line_status=[line2_status]
+        )
+
+        splits = SwitchActionEvaluator().splits_grid(network=network, actions=ACTIONS)
+
+        # Opening the only line in service splits the grid, closing a line never does.
+        assert splits == {
+            ACTIONS[0]: line2_status == ElementStatus.OFF,
+            ACTIONS[1]: False,
+        }
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("jax")
+pytest.importorskip("flax")
+pytest.importorskip("optax")
+
+import jax.numpy as jnp
+from src.rl.agent.dqn import DQNAgent
+from tests.src.rl.test_vector_environment import MockEnvironment
+
+
+def _agent(**kwargs) -> DQNAgent:
+    env = MockEnvironment(length=2)
+    hyperparameters = {
+        "seed": 0,
+        "action_space": env.action_space,
+        "observation_space": env.observation_space,
+        "one_hot_map": env.one_hot_map,
+        "learning_rate": 1e-3,
+        "buffer_size": 8,
+        "gamma": 0.9,
+        "tau": 1.0,
+        "batch_size": 2,
+        "start_e": 1.0,
+        "end_e": 0.1,
+        "exploration_fraction": 0.5,
+        "timestep_target_network_update_freq": 1,
+        "observation_memory_length": 1,
+    }
+    return DQNAgent(**{**hyperparameters, **kwargs})
+
+
+class TestDQNAgent:
+    """Tests for the `DQNAgent` batched action selection."""
+
+    def test_epsilon_decays_until_exploration_stops(self):
+        agent = _agent()
+
+        assert agent._epsilon(current_timestep=0, num_timesteps=10, episode=1) == 1.0
+        assert agent._epsilon(
+            current_timestep=5, num_timesteps=10, episode=1
+        ) == pytest.approx(0.1)
+        assert agent._epsilon(current_timestep=0, num_timesteps=10, episode=150) == 0
+
+    def test_act_batch_exploits_the_best_valid_action(self):
+        agent = _agent(start_e=0.0, end_e=0.0)
+        observations = np.stack([np.full(3, k, dtype=np.float32) for k in range(3)])
+        action_masks = np.array([[True, True], [True, False], [False, True]])
+
+        actions = agent.act_batch(
+            observations=observations,
+            action_masks=action_masks,
+            current_timestep=0,
+            num_timesteps=10,
+            episode=1,
+        )
+
+        q_values = np.asarray(agent.q_network(jnp.array(observations)))
+        assert actions.tolist() == [int(q_values[0].argmax()), 0, 1]
+
+    def test_act_batch_explores_among_valid_actions(self):
+        agent = _agent(start_e=1.0, end_e=1.0)
+        action_masks = np.array([[True, False], [False, True]] * 50)
+
+        actions = agent.act_batch(
+            observations=np.zeros((100, 3), dtype=np.float32),
+            action_masks=action_masks,
+            current_timestep=0,
+            num_timesteps=10,
+            episode=1,
+        )
+
+        assert actions.shape == (100,)
+        assert action_masks[np.arange(100), actions].all()
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+# The agent package imports the DQN agent, built on jax.
+pytest.importorskip("jax")
+pytest.importorskip("flax")
+pytest.importorskip("optax")
+
+from src.rl.agent.replay_buffer import ReplayBuffer
+from tests.src.rl.test_vector_environment import MockEnvironment
+
+
+def _replay_buffer(buffer_size: int) -> ReplayBuffer:
+    env = MockEnvironment(length=2)
+    return ReplayBuffer(
+        buffer_size=buffer_size,
+        observation_space=env.observation_space,
+        action_space=env.action_space,
+        one_hot_map=env.one_hot_map,
+        seed=0,
+    )
+
+
+class TestReplayBuffer:
+    """Tests for the `ReplayBuffer` batched transitions."""
+
+    def test_add_batch_stores_final_observations_of_envs_done(self):
+        replay_buffer = _replay_buffer(buffer_size=4)
+
+        replay_buffer.add_batch(
+            observations=np.array([[1.0] * 3, [2.0] * 3]),
+            # The first env was reset on the spot.
+            next_observations=np.array([[0.0] * 3, [3.0] * 3]),
+            actions=np.array([1, 0]),
+            rewards=np.array([1.0, 0.5]),
+            dones=np.array([True, False]),
+            infos=[{"final_observation": np.full(3, 2.0)}, {}],
+        )
+
+        assert replay_buffer.pos == 2
+        assert replay_buffer.observations[:2, 0].tolist() == [1.0, 2.0]
+        assert replay_buffer.next_observations[:2, 0].tolist() == [2.0, 3.0]
+        assert replay_buffer.actions[:2].tolist() == [[0, 1], [1, 0]]
+        assert replay_buffer.rewards[:2].tolist() == [1.0, 0.5]
+        assert replay_buffer.dones[:2].tolist() == [1.0, 0.0]
+
+    def test_add_batch_wraps_around(self):
+        replay_buffer = _replay_buffer(buffer_size=2)
+
+        replay_buffer.add_batch(
+            observations=np.array([[1.0] * 3, [2.0] * 3, [3.0] * 3]),
+            next_observations=np.array([[2.0] * 3, [3.0] * 3, [4.0] * 3]),
+            actions=np.array([0, 1, 1]),
+            rewards=np.zeros(3),
+            dones=np.zeros(3, dtype=bool),
+        )
+
+        assert replay_buffer.full
+        assert replay_buffer.pos == 1
+        assert replay_buffer.observations[:, 0].tolist() == [3.0, 2.0]
+        assert replay_buffer.actions.tolist() == [[0, 1], [0, 1]]
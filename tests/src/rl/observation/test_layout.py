@@ -0,0 +1,108 @@
+import copy
+import numpy as np
+import pytest
+from src.core.constants import ElementStatus
+from src.rl.observation.layout import ObservationLayout
+from src.rl.observation.network import NetworkObservation, NetworkSnapshotObservation
+from src.rl.one_hot_map import OneHotMap
+from tests.src.rl.observation.test_network import (
+    mock_elements_snapshot_observations,
+    mock_network_snapshot_observation,
+    mock_network_snapshot_observations,
+    mock_one_hot_map,
+)
+
+
+@pytest.fixture
+def layout(
+    mock_one_hot_map: OneHotMap,
+    mock_network_snapshot_observation: NetworkSnapshotObservation,
+) -> ObservationLayout:
+    return ObservationLayout(
+        one_hot_map=mock_one_hot_map,
+        network_snapshot_observation=mock_network_snapshot_observation,
+    )
+
+
+class TestObservationLayout:
+    """Test suite for ObservationLayout."""
+
+    def test_write_matches_element_arrays(
+        self,
+        layout: ObservationLayout,
+        mock_one_hot_map: OneHotMap,
+        mock_network_snapshot_observation: NetworkSnapshotObservation,
+    ):
+        """Arrays written by the layout are the concatenated arrays of the elements."""
+        snapshot = copy.deepcopy(mock_network_snapshot_observation)
+        expected = mock_network_snapshot_observation.to_array(mock_one_hot_map)
+        array = layout.write(network_snapshot_observation=snapshot)
+        assert array.dtype == np.float32
+        np.testing.assert_array_equal(array, expected)
+
+        # Categories and values of the previous write are overwritten.
+        snapshot.observations[1].status = ElementStatus.OFF
+        snapshot.observations[1].p1 = 3.0
+        expected = snapshot.to_array(mock_one_hot_map)
+        np.testing.assert_array_equal(
+            layout.write(network_snapshot_observation=snapshot), expected
+        )
+
+    def test_write_into_out(
+        self,
+        layout: ObservationLayout,
+        mock_one_hot_map: OneHotMap,
+        mock_network_snapshot_observation: NetworkSnapshotObservation,
+    ):
+        """Arrays can be written into slices of other buffers."""
+        out = np.full(layout.size * 2, -1.0, dtype=np.float32)
+        layout.write(
+            network_snapshot_observation=mock_network_snapshot_observation,
+            out=out[layout.size :],
+        )
+        assert (out[: layout.size] == -1.0).all()
+        np.testing.assert_array_equal(
+            out[layout.size :],
+            mock_network_snapshot_observation.to_array(mock_one_hot_map),
+        )
+
+    def test_mismatching_snapshots_raise(
+        self,
+        layout: ObservationLayout,
+        mock_network_snapshot_observation: NetworkSnapshotObservation,
+    ):
+        """Snapshots not matching the initial one can't be written."""
+        snapshot = copy.deepcopy(mock_network_snapshot_observation)
+        snapshot.observations[0].bus_id = "BUS3"
+        with pytest.raises(ValueError, match="BUS3"):
+            layout.write(network_snapshot_observation=snapshot)
+        with pytest.raises(ValueError, match="observations for a layout"):
+            layout.write(
+                network_snapshot_observation=NetworkSnapshotObservation(
+                    observations=snapshot.observations[:2],
+                    timestamp=snapshot.timestamp,
+                )
+            )
+
+    def test_network_observations_use_the_layout(
+        self,
+        layout: ObservationLayout,
+        mock_one_hot_map: OneHotMap,
+        mock_network_snapshot_observations: list[NetworkSnapshotObservation],
+    ):
+        """With a layout, arrays and spaces of observations match those without one."""
+        observation = NetworkObservation(
+            history_length=3,
+            network_snapshot_observations=tuple(mock_network_snapshot_observations[:2]),
+        )
+        expected_array = observation.to_array(one_hot_map=mock_one_hot_map)
+        expected_space = observation.to_observation_space(one_hot_map=mock_one_hot_map)
+
+        mock_one_hot_map.layout = layout
+        array = observation.to_array(one_hot_map=mock_one_hot_map)
+        space = observation.to_observation_space(one_hot_map=mock_one_hot_map)
+
+        assert array.dtype == np.float32
+        np.testing.assert_array_equal(array, expected_array)
+        assert space.shape == expected_space.shape
+        assert space is observation.to_observation_space(one_hot_map=mock_one_hot_map)
@@ -11,7 +11,7 @@ from src.core.domain.models.elements_metadata.line import (
     LineStaticAttributes,
     LineSolvedAttributes,
 )
-from src.rl.observation.line import LineObservation
+from src.rl.observation.line import LineObservation, LineObservationWithOutage
 from src.rl.observation.network import NetworkSnapshotObservation
 from src.core.domain.enums import State, BranchSide, OperationalConstraintType
 from src.core.constants import DEFAULT_TIMEZONE
@@ -319,3 +319,31 @@ class TestLineObservation:
         expected_df = pd.DataFrame(data=expected_data)
         df = mock_line_observation_with_constraint.to_dataframe()
         pdt.assert_frame_equal(df, expected_df)
+
+    def test_to_array_is_cached_until_changed(
+        self, mock_line_observation: LineObservation, mock_one_hot_map: OneHotMap
+    ):
+        """Arrays are encoded again only once an attribute is set."""
+        array = mock_line_observation.to_array(one_hot_map=mock_one_hot_map)
+        assert mock_line_observation.to_array(one_hot_map=mock_one_hot_map) is array
+        assert not array.flags.writeable
+
+        mock_line_observation.p1 = 3.0
+        changed_array = mock_line_observation.to_array(one_hot_map=mock_one_hot_map)
+        assert changed_array is not array
+        assert changed_array[-2] == 3.0
+
+    def test_outage_array_follows_its_base_observation(
+        self, mock_line_observation: LineObservation, mock_one_hot_map: OneHotMap
+    ):
+        """Changes of the base observation are seen by the observation with outage."""
+        observation = LineObservationWithOutage(
+            base_observation=mock_line_observation, outage_probability=0.1
+        )
+        array = observation.to_array(one_hot_map=mock_one_hot_map)
+        assert array[-1] == pytest.approx(0.1)
+
+        mock_line_observation.p2 = 4.0
+        array = observation.to_array(one_hot_map=mock_one_hot_map)
+        assert array[-2] == 4.0
+        assert array[-1] == pytest.approx(0.1)
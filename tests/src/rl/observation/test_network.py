@@ -1,3 +1,4 @@
+import copy
 import pytest
 import numpy as np
 import pandas as pd
@@ -267,6 +268,37 @@ class TestNetworkSnapshotObservation:
         assert array.size > 0  # Should not be empty
         # TODO: Further testing of values in it
 
+    def test_to_array_is_memoised(
+        self,
+        mock_network_snapshot_observation: NetworkSnapshotObservation,
+        mock_one_hot_map: OneHotMap,
+    ):
+        """Arrays are encoded again only once an element observation changed."""
+
+        array = mock_network_snapshot_observation.to_array(mock_one_hot_map)
+        assert mock_network_snapshot_observation.to_array(mock_one_hot_map) is array
+        # Copies don't keep the memoised array.
+        assert copy.deepcopy(mock_network_snapshot_observation)._array_cache is None
+
+        mock_network_snapshot_observation.observations[2].active_power = 7.0
+        changed_array = mock_network_snapshot_observation.to_array(mock_one_hot_map)
+        assert changed_array is not array
+        np.testing.assert_array_equal(
+            changed_array,
+            np.concatenate(
+                [
+                    obs.to_array(mock_one_hot_map)
+                    for obs in mock_network_snapshot_observation.observations
+                ]
+            ),
+        )
+
+        out = np.zeros(array.size)
+        assert (
+            mock_network_snapshot_observation.to_array(mock_one_hot_map, out=out) is out
+        )
+        np.testing.assert_array_equal(out, changed_array)
+
     def test_to_dataframe(
         self, mock_network_snapshot_observation: NetworkSnapshotObservation
     ):
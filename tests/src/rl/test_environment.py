@@ -2,16 +2,18 @@ import pytest
 import os
 import json
 import requests_mock
-from datetime import datetime
+from datetime import datetime, timedelta
 from gym.spaces import Space, Box
 from src.rl.one_hot_map import OneHotMap
 from src.rl.reward.reward_handler import RewardHandler
 from src.rl.reward.base import BaseReward
 from src.rl.action.enums import DiscreteActionTypes
-from src.rl.repositories import LoadFlowSolverRepository
-from src.rl.repositories.network_transition_handler import NetworkTransitionHandler
+from src.core.domain.ports.loadflow_solver import LoadFlowSolver
+from src.rl.environment_helpers import NetworkTransitionHandler
 from src.rl.observation.network_observation_handler import NetworkObservationHandler
 from src.core.domain.models.network import Network
+from src.core.domain.models.network_delta import NetworkDelta
+from src.core.domain.models.injection_schedule import InjectionSchedule
 from src.core.domain.models.element import NetworkElement
 from src.core.infrastructure.settings import Settings
 from src.rl.observation.network_snapshot_observation_builder import (
@@ -25,7 +27,32 @@ from src.core.constants import (
     DEFAULT_TIMEZONE,
     SupportedNetworkElementTypes,
 )
-from src.rl.environment import NetworkEnvironment
+from src.rl.environment import NetworkEnvironment, make_env
+from src.rl.config_loaders.environment.config_loader import EnvironmentConfig
+from src.rl.repositories.action_space_builder import DefaultActionSpaceBuilder
+from src.rl.repositories.network_element_outage_handler_builder import (
+    DefaultNetworkElementOutageHandlerBuilder,
+)
+from src.rl.repositories.network_observation_handler import (
+    DefaultNetworkObservationHandler,
+)
+from src.rl.repositories.network_snapshot_observation_builder import (
+    SimpleNetworkSnapshotObservationBuilder,
+)
+from src.rl.repositories.network_transition_handler import (
+    SimpleNetworkTransitionHandler,
+)
+from src.rl.repositories.one_hot_map_builder import SimpleOneHotMapBuilder
+from src.rl.repositories.outage_handler_builder import DefaultOutageHandlerBuilder
+from src.rl.repositories.reward_handler import DefaultRewardHandler
+from src.core.infrastructure.adapters.network_builder import DefaultNetworkBuilder
+from tests.src.core.infrastructure.adapters.test_pypowsybl_loadflow_solver import (
+    TIMESTAMP,
+    _solver,
+    _toy_network,
+)
+from src.rl.repositories.outage_handler import DefaultOutageHandler
+from src.rl.outage.outage_handler import OutageHandler
 from src.rl.action_space import ActionSpace
 from src.rl.action.do_nothing import DoNothingAction
 from src.rl.observation.network import NetworkSnapshotObservation, NetworkObservation
@@ -216,6 +243,7 @@ def mock_observation_memory_length() -> int:
 @pytest.fixture
 def mock_action_space(mock_network: Network) -> ActionSpace:
     return ActionSpace(
+        action_types=[DiscreteActionTypes.DO_NOTHING],
         valid_actions=[DoNothingAction()],
         invalid_actions=[],
     )
@@ -271,7 +299,7 @@ class MockRewardHandler(RewardHandler):
         return MockReward()
 
 
-class MockLoadFlowSolver(LoadFlowSolverRepository):
+class MockLoadFlowSolver(LoadFlowSolver):
     def solve(self, network: Network, loadflow_type: LoadFlowType) -> Network:
         _ = loadflow_type
         for element in network.elements:
@@ -321,9 +349,11 @@ class MockNetworkSnapshotObservationBuilder(NetworkSnapshotObservationBuilder):
     def from_network(
         network: Network | None = None,
         timestamp: datetime | None = None,
+        outage_handler: OutageHandler | None = None,
     ) -> NetworkSnapshotObservation:
         _ = network
         _ = timestamp
+        _ = outage_handler
         return NetworkSnapshotObservation(
             observations=[
                 LoadObservation(
@@ -411,10 +441,12 @@ class MockNetworkObservationHandler(NetworkObservationHandler):
 class MockNetworkTransitionHandler(NetworkTransitionHandler):
     def build_next_network(
         self,
+        outage_handler: OutageHandler | None = None,
         current_network: Network | None = None,
-        next_network_no_action: Network | None = None,
+        delta: NetworkDelta | None = None,
         action: BaseAction | None = None,
     ) -> Network:
+        _ = outage_handler
         _ = action
         return Network(
             uid=generate_hash("some_id_2024-01-01T00:00:00+0000"),
@@ -459,6 +491,7 @@ def mock_network_environment(
 ) -> NetworkEnvironment:
     return NetworkEnvironment(
         network=mock_network,
+        injection_schedule=InjectionSchedule.from_network(network=mock_network),
         initial_observation=mock_initial_observation,
         initial_network=mock_initial_network,
         loadflow_solver=MockLoadFlowSolver(),
@@ -471,6 +504,7 @@ def mock_network_environment(
         network_snapshot_observation_builder=MockNetworkSnapshotObservationBuilder(),
         network_transition_handler=MockNetworkTransitionHandler(),
         network_observation_handler=MockNetworkObservationHandler(),
+        outage_handler=DefaultOutageHandler(network_element_outage_handlers=[]),
     )
 
 
@@ -487,6 +521,7 @@ class TestNetworkEnvironment:
     ):
         env = NetworkEnvironment(
             network=mock_network,
+            injection_schedule=InjectionSchedule.from_network(network=mock_network),
             initial_observation=mock_initial_observation,
             initial_network=mock_initial_network,
             loadflow_solver=MockLoadFlowSolver(),
@@ -499,6 +534,7 @@ class TestNetworkEnvironment:
             network_snapshot_observation_builder=MockNetworkSnapshotObservationBuilder(),
             network_transition_handler=MockNetworkTransitionHandler(),
             network_observation_handler=MockNetworkObservationHandler(),
+            outage_handler=DefaultOutageHandler(network_element_outage_handlers=[]),
         )
         assert isinstance(env, NetworkEnvironment)
         assert env.network == mock_network
@@ -606,14 +642,81 @@ class TestNetworkEnvironment:
         )
 
         # Assert current network has been set
+        next_network = MockNetworkTransitionHandler().build_next_network()
+        assert mock_network_environment.current_network.id == (
+            "some_id_2024-01-01T01:00:00+0000"
+        )
         assert (
-            mock_network_environment.current_network
-            == MockNetworkTransitionHandler().build_next_network()
+            mock_network_environment.current_network.elements == next_network.elements
         )
 
         assert reward == 0.0
         assert is_terminated is True
 
 
-#    def test_make_env():
-#        pass
+class MockNetworkRepository:
+    def __init__(self, network: Network) -> None:
+        self.network = network
+
+    def get(self, network_id: str) -> Network:
+        _ = network_id
+        return self.network
+
+
+class TestMakeEnv:
+    """Tests for environments built by `make_env`, solving a toy grid for real."""
+
+    def test_step_observes_the_network_solved_after_the_delta(self):
+        timestamps = [TIMESTAMP + timedelta(hours=k) for k in range(3)]
+        network = _toy_network(timestamps=timestamps, loads=[7.0, 8.0, 9.0])
+        env = make_env(
+            network_id="toy",
+            network_repository=MockNetworkRepository(network=network),
+            environment_config=EnvironmentConfig.from_yaml(
+                config_path="src/rl/configs/environment/simple.yaml"
+            ),
+            loadflow_solver=_solver(),
+            network_builder=DefaultNetworkBuilder(),
+            network_snapshot_observation_builder=SimpleNetworkSnapshotObservationBuilder(),
+            action_space_builder=DefaultActionSpaceBuilder(),
+            one_hot_map_builder=SimpleOneHotMapBuilder(),
+            network_observation_handler=DefaultNetworkObservationHandler(),
+            network_transition_handler=SimpleNetworkTransitionHandler(),
+            loadflow_type=LoadFlowType.DC,
+            reward_handler=DefaultRewardHandler(
+                aggregator_name="LinearRewardAggregator",
+                rewards=["LineOverloadReward"],
+            ),
+            action_types=[DiscreteActionTypes.DO_NOTHING],
+            observation_memory_length=2,
+            outage_handler_builder=DefaultOutageHandlerBuilder(),
+            network_element_outage_handler_builder=DefaultNetworkElementOutageHandlerBuilder(),
+        )
+        env.reset()
+
+        for k in range(1, len(timestamps)):
+            observation, _, done, _ = env.step(action=DoNothingAction())
+
+            expected = _solver().solve(
+                network=DefaultNetworkBuilder.from_elements(
+                    id="expected",
+                    elements=network.list_elements(timestamp=timestamps[k]),
+                ),
+                loadflow_type=LoadFlowType.DC,
+            )
+            snapshot = observation.list_network_snapshot_observations()[-1]
+            assert snapshot.timestamp == timestamps[k]
+            (load,) = [o for o in snapshot.observations if o.id == "load1"]
+            assert load.Pd == [7.0, 8.0, 9.0][k]
+            assert {
+                o.id: o.p1
+                for o in snapshot.observations
+                if o.type == SupportedNetworkElementTypes.LINE
+            } == pytest.approx(
+                {
+                    e.id: e.element_metadata.solved.p1
+                    for e in expected.elements
+                    if e.type == SupportedNetworkElementTypes.LINE
+                }
+            )
+        assert done
@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+from functools import partial
+from gym.spaces import Box
+from src.rl.action.do_nothing import DoNothingAction
+from src.rl.action.enums import DiscreteActionTypes
+from src.rl.action.switch import SwitchAction
+from src.rl.action_space import ActionSpace
+from src.rl.action_space_builder import ActionSpaceBuilder
+from src.rl.enums import VectorMode
+from src.rl.vector_environment import VectorNetworkEnvironment
+
+ACTIONS = [DoNothingAction(), SwitchAction(element_id="line1")]
+
+
+class MockObservation:
+    def __init__(self, step: int) -> None:
+        self.step = step
+
+    def to_array(self, one_hot_map: dict | None = None) -> np.ndarray:
+        return np.full(3, self.step, dtype=np.float32)
+
+
+class MockEnvironment:
+    """Env whose episodes last 'length' steps, observing the step number."""
+
+    def __init__(self, length: int) -> None:
+        self.length = length
+        self.action_space = ActionSpace(
+            action_types=[DiscreteActionTypes.DO_NOTHING, DiscreteActionTypes.SWITCH],
+            valid_actions=ACTIONS,
+            invalid_actions=[],
+        )
+        self.observation_space = Box(low=-np.inf, high=np.inf, shape=(3,))
+        self.one_hot_map = {}
+        self.outage_handler = None
+        self.closed = False
+
+    def reset(self) -> tuple[MockObservation, dict]:
+        self.current_network = 0
+        return MockObservation(step=0), {}
+
+    def step(self, action) -> tuple[MockObservation, float, bool, dict]:
+        self.current_network += 1
+        reward = float(ACTIONS.index(action))
+        done = self.current_network == self.length
+        return MockObservation(step=self.current_network), reward, done, {}
+
+    def close(self) -> None:
+        self.closed = True
+
+    def splitting_actions(self, actions) -> set:
+        """Switching splits the grid from the 3rd step on."""
+        return set(actions[1:]) if self.current_network >= 3 else set()
+
+
+class MockActionSpaceBuilder(ActionSpaceBuilder):
+    @staticmethod
+    def from_action_types(action_types, network, outage_handler) -> ActionSpace:
+        """Switching is only valid at odd steps."""
+        return ActionSpace(
+            action_types=action_types,
+            valid_actions=ACTIONS if network % 2 else ACTIONS[:1],
+            invalid_actions=[],
+        )
+
+
+def _vector_env(mode: VectorMode, lengths: list[int]) -> VectorNetworkEnvironment:
+    return VectorNetworkEnvironment(
+        env_fns=[partial(MockEnvironment, length=length) for length in lengths],
+        action_space_builder=MockActionSpaceBuilder(),
+        mode=mode,
+    )
+
+
+class TestVectorNetworkEnvironment:
+    """Tests for the `VectorNetworkEnvironment`, in process and in subprocesses."""
+
+    @pytest.mark.parametrize("mode", [VectorMode.IN_PROCESS, VectorMode.SUBPROCESS])
+    def test_step_batches_envs_and_resets_finished_ones(self, mode):
+        with _vector_env(mode=mode, lengths=[2, 3]) as env:
+            observations, action_masks = env.reset()
+            assert observations.shape == (2, 3)
+            assert observations.dtype == np.float32
+            assert action_masks.tolist() == [[True, False], [True, False]]
+
+            env.step(np.array([0, 0]))
+            observations, rewards, dones, action_masks, infos = env.step(
+                np.array([1, 0])
+            )
+
+        assert observations[:, 0].tolist() == [0.0, 2.0]
+        assert rewards.tolist() == [1.0, 0.0]
+        assert dones.tolist() == [True, False]
+        assert action_masks.tolist() == [[True, False], [True, False]]
+        assert infos[0]["final_observation"].tolist() == [2.0] * 3
+        assert "final_observation" not in infos[1]
+
+    def test_actions_splitting_the_grid_are_masked(self):
+        env = _vector_env(mode=VectorMode.IN_PROCESS, lengths=[5])
+        env.reset()
+
+        action_masks = [env.step(np.array([0]))[3].tolist() for _ in range(3)]
+
+        assert action_masks == [[[True, True]], [[True, False]], [[True, False]]]
+
+    def test_step_needs_an_action_per_env(self):
+        env = _vector_env(mode=VectorMode.IN_PROCESS, lengths=[2, 2])
+        env.reset()
+        with pytest.raises(ValueError):
+            env.step(np.array([0]))
+
+    def test_worker_errors_are_raised(self):
+        with _vector_env(mode=VectorMode.SUBPROCESS, lengths=[2]) as env:
+            env.reset()
+            with pytest.raises(RuntimeError, match="IndexError"):
+                env.step(np.array([len(ACTIONS)]))
+
+    def test_close_closes_the_envs(self):
+        env = _vector_env(mode=VectorMode.IN_PROCESS, lengths=[2, 2])
+        env.close()
+        env.close()
+
+        assert all(e.closed for e in env.envs)